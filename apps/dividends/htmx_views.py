@@ -937,4 +937,52 @@ def dividend_period_detail_stats(request, period_id):
         'payment_count': DividendPayment.objects.filter(disbursement__dividend_period=period).count(),
     }
     
-    return JsonResponse(stats)
\ No newline at end of file
+    return JsonResponse(stats)
+
+# =============================================================================
+# DIVIDEND SIMULATION
+# =============================================================================
+
+@require_http_methods(["GET"])
+def dividend_period_simulation(request, period_id):
+    """
+    Compare dividend scenarios for a period without writing anything.
+    
+    Query parameters:
+        method: Calculation method, repeatable (defaults to the period's method)
+        pool: Total dividend pool, repeatable (defaults to the period's pool)
+        rate: Flat dividend rate override
+        tax_rate: Withholding tax rate override
+    
+    Every method is evaluated against every pool size.
+    """
+    from .services import DividendSimulationService
+    
+    period = get_object_or_404(DividendPeriod, id=period_id)
+    
+    methods = [m for m in request.GET.getlist('method') if m] or [None]
+    pools = [p for p in request.GET.getlist('pool') if p] or [None]
+    filters = parse_filters(request, ['rate', 'tax_rate'])
+    
+    try:
+        scenarios = [
+            DividendSimulationService.build_scenario(
+                period,
+                method=method,
+                total_dividend_amount=pool,
+                dividend_rate=filters['rate'],
+                withholding_tax_rate=filters['tax_rate']
+            )
+            for method in methods
+            for pool in pools
+        ]
+    except (ArithmeticError, ValueError):
+        return HttpResponse('Invalid pool or rate value', status=400)
+    
+    results = DividendSimulationService.simulate(period, scenarios)
+    
+    return render(request, 'dividends/periods/_simulation_results.html', {
+        'period': period,
+        'results': results,
+        'methods': DividendPeriod.CALCULATION_METHOD_CHOICES,
+    })
@@ -0,0 +1,105 @@
+# dividends/management/commands/process_dividend_disbursements.py
+
+"""
+Process dividend disbursement batches in chunks.
+
+Payments are created and savings credits posted chunk by chunk, each chunk
+committed on its own. If a run is interrupted, rerunning the command resumes
+the PROCESSING batch where it stopped.
+
+USAGE EXAMPLES:
+===============
+
+# Process every pending or in-progress batch for all SACCO databases
+python manage.py process_dividend_disbursements --all
+
+# Process (or resume) one batch
+python manage.py process_dividend_disbursements --sacco tumaini_sacco --batch DIV-20250115-0001
+
+# Use smaller chunks
+python manage.py process_dividend_disbursements --sacco tumaini_sacco --chunk-size 200
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Process (or resume) dividend disbursement batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--batch',
+            type=str,
+            help='Batch number of a single disbursement to process'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Rows per chunk'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from dividends.models import DividendDisbursement
+        from dividends.services import DividendDisbursementService
+
+        def report(stage, done, total):
+            self.stdout.write(f"    {stage}: {done}/{total}")
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    disbursements = DividendDisbursement.objects.select_related(
+                        'dividend_period'
+                    ).filter(status__in=['PENDING', 'PROCESSING'])
+                    if options['batch']:
+                        disbursements = disbursements.filter(batch_number=options['batch'])
+
+                    for disbursement in disbursements.order_by('disbursement_date'):
+                        self.stdout.write(f"{db_name}: {disbursement.batch_number}")
+                        results = DividendDisbursementService.process_disbursement(
+                            disbursement,
+                            chunk_size=options['chunk_size'],
+                            progress_callback=report
+                        )
+
+                        style = self.style.SUCCESS if results['success'] else self.style.WARNING
+                        self.stdout.write(style(
+                            f"{'✓' if results['success'] else '✗'} {disbursement.batch_number}: "
+                            f"{results['processed']} payments, {results['posted']} posted, "
+                            f"{results['failed']} failed"
+                        ))
+                        for error in results['errors']:
+                            self.stdout.write(f"    ✗ {error}")
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error processing dividend disbursements for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Dividend disbursement failed for {error_count} database(s)')
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dividends', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dividendperiod',
+            name='calculation_method',
+            field=models.CharField(choices=[('FLAT_RATE', 'Flat Rate'), ('WEIGHTED_AVERAGE', 'Weighted Average'), ('TIERED', 'Tiered By Share Amount'), ('PRO_RATA', 'Pro Rata Distribution'), ('SHARE_DAYS', 'Time-Weighted (Share-Days)')], default='FLAT_RATE', max_length=20, verbose_name='Calculation Method'),
+        ),
+    ]
@@ -38,6 +38,7 @@ class DividendPeriod(BaseModel):
         ('WEIGHTED_AVERAGE', 'Weighted Average'),
         ('TIERED', 'Tiered By Share Amount'),
         ('PRO_RATA', 'Pro Rata Distribution'),
+        ('SHARE_DAYS', 'Time-Weighted (Share-Days)'),
     ]
     
     # Basic Information
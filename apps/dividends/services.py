@@ -6,6 +6,7 @@ Dividends Business Logic Services
 Contains complex business logic that shouldn't be in views or models:
 - Dividend period management
 - Dividend calculation workflows
+- Side-effect-free scenario simulation
 - Disbursement processing
 - Payment processing
 - Member preference management
@@ -21,7 +22,7 @@ WHY SERVICES.PY?
 
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Sum, Count
+from django.db.models import Sum, Count, F
 from decimal import Decimal
 import logging
 
@@ -38,14 +39,17 @@ from .utils import (
     calculate_flat_rate_dividend,
     calculate_weighted_average_dividend,
     calculate_tiered_dividend,
+    get_dividend_tier_index,
     calculate_pro_rata_dividend,
     calculate_withholding_tax,
     calculate_net_dividend,
+    calculate_dividend_yield,
     calculate_total_shares_value,
     can_calculate_dividends,
     can_approve_dividend_period,
     can_disburse_dividends,
     get_eligible_members,
+    get_share_days_positions,
     validate_total_dividend_allocation,
 )
 
@@ -213,6 +217,36 @@ class DividendPeriodService:
         except Exception as e:
             logger.error(f"Error approving period: {e}", exc_info=True)
             return False, f"Error approving period: {str(e)}"
+    
+    @staticmethod
+    def refresh_statistics(period):
+        """
+        Recompute period totals from its member dividends in one aggregate.
+        
+        Args:
+            period: DividendPeriod instance
+        
+        Returns:
+            dict: {'total_members', 'total_shares', 'total_shares_value'}
+        """
+        stats = period.member_dividends.aggregate(
+            total_members=Count('id'),
+            total_shares=Sum('shares_count'),
+            total_value=Sum('shares_value')
+        )
+        
+        totals = {
+            'total_members': stats['total_members'] or 0,
+            'total_shares': stats['total_shares'] or 0,
+            'total_shares_value': stats['total_value'] or Decimal('0.00'),
+        }
+        
+        DividendPeriod.objects.filter(pk=period.pk).update(**totals)
+        
+        for field, value in totals.items():
+            setattr(period, field, value)
+        
+        return totals
 
 
 # =============================================================================
@@ -222,6 +256,13 @@ class DividendPeriodService:
 class DividendCalculationService:
     """Handle dividend calculation workflows"""
     
+    CHUNK_SIZE = 1000
+    
+    UPSERT_FIELDS = [
+        'shares_count', 'shares_value', 'gross_dividend', 'tax_amount',
+        'net_dividend', 'applied_rate', 'status', 'updated_at',
+    ]
+    
     @staticmethod
     @transaction.atomic
     def calculate_dividends(period):
@@ -257,8 +298,11 @@ class DividendCalculationService:
             period.status = 'CALCULATING'
             period.save(update_fields=['status'])
             
-            # Get eligible members
-            eligible_members = get_eligible_members(period)
+            # Get eligible members (time-weighted holdings for SHARE_DAYS)
+            if period.calculation_method == 'SHARE_DAYS':
+                eligible_members = get_share_days_positions(period)
+            else:
+                eligible_members = get_eligible_members(period)
             
             if not eligible_members:
                 period.status = 'OPEN'
@@ -284,6 +328,9 @@ class DividendCalculationService:
             elif period.calculation_method == 'PRO_RATA':
                 result = DividendCalculationService._calculate_pro_rata(period, eligible_members)
             
+            elif period.calculation_method == 'SHARE_DAYS':
+                result = DividendCalculationService._calculate_share_days(period, eligible_members)
+            
             else:
                 result = {
                     'success': False,
@@ -324,84 +371,143 @@ class DividendCalculationService:
                 'errors': [str(e)]
             }
     
+    @staticmethod
+    def _build_member_dividend(period, member_id, shares_count, shares_value,
+                               gross_dividend, applied_rate):
+        """Build an unsaved MemberDividend with tax and net worked out in memory"""
+        tax_amount = Decimal('0.00')
+        if period.apply_withholding_tax:
+            tax_amount = calculate_withholding_tax(
+                gross_dividend,
+                period.withholding_tax_rate
+            )
+        
+        return MemberDividend(
+            dividend_period=period,
+            member_id=member_id,
+            shares_count=shares_count,
+            shares_value=shares_value,
+            gross_dividend=gross_dividend,
+            tax_amount=tax_amount,
+            net_dividend=calculate_net_dividend(gross_dividend, tax_amount),
+            applied_rate=applied_rate,
+            status='CALCULATED'
+        )
+    
+    @staticmethod
+    def _save_member_dividends(period, member_dividends):
+        """
+        Upsert calculated member dividends in chunks.
+        
+        Rows are written with bulk INSERT ... ON CONFLICT UPDATE keyed on
+        (dividend_period, member), the per-row statistics signal is suspended
+        and the period totals are refreshed once at the end.
+        
+        Args:
+            period: DividendPeriod instance
+            member_dividends: Unsaved MemberDividend instances
+        
+        Returns:
+            int: Number of newly created member dividends
+        """
+        from utils.utils import bulk_upsert, chunked
+        from .signals import suspend_statistics_refresh
+        
+        existing_members = set(
+            period.member_dividends.values_list('member_id', flat=True)
+        )
+        created_count = sum(
+            1 for md in member_dividends if md.member_id not in existing_members
+        )
+        
+        now = timezone.now()
+        for md in member_dividends:
+            md.created_at = now
+            md.updated_at = now
+        
+        with suspend_statistics_refresh():
+            for chunk in chunked(member_dividends, DividendCalculationService.CHUNK_SIZE):
+                bulk_upsert(
+                    MemberDividend,
+                    chunk,
+                    unique_fields=['dividend_period', 'member'],
+                    update_fields=DividendCalculationService.UPSERT_FIELDS,
+                    batch_size=DividendCalculationService.CHUNK_SIZE
+                )
+        
+        DividendPeriodService.refresh_statistics(period)
+        
+        return created_count
+    
+    @staticmethod
+    def _finalize(period, member_dividends, total_members, errors):
+        """Persist calculated rows and build the calculation result"""
+        created_count = DividendCalculationService._save_member_dividends(
+            period, member_dividends
+        )
+        total_calculated = sum(
+            (md.net_dividend for md in member_dividends), Decimal('0.00')
+        )
+        
+        return {
+            'success': len(errors) == 0 or len(member_dividends) > 0,
+            'message': (
+                f'Calculated dividends for {len(member_dividends)} members '
+                f'({created_count} new)'
+            ),
+            'total_members': total_members,
+            'total_calculated': total_calculated,
+            'errors': errors
+        }
+    
     @staticmethod
     def _calculate_flat_rate(period, eligible_members):
         """Calculate dividends using flat rate method"""
-        total_calculated = Decimal('0.00')
+        member_dividends = []
         errors = []
-        created_count = 0
         
         for member_info in eligible_members:
             try:
-                member = member_info['member']
-                shares_value = member_info['shares_value']
-                shares_count = member_info['shares_count']
+                member_id, shares_count, shares_value = member_info
                 
-                # Calculate gross dividend
                 gross_dividend = calculate_flat_rate_dividend(
                     shares_value,
                     period.dividend_rate
                 )
                 
-                # Calculate tax
-                tax_amount = Decimal('0.00')
-                if period.apply_withholding_tax:
-                    tax_amount = calculate_withholding_tax(
-                        gross_dividend,
-                        period.withholding_tax_rate
+                member_dividends.append(
+                    DividendCalculationService._build_member_dividend(
+                        period, member_id, shares_count, shares_value,
+                        gross_dividend, period.dividend_rate
                     )
-                
-                # Calculate net
-                net_dividend = calculate_net_dividend(gross_dividend, tax_amount)
-                
-                # Create or update member dividend
-                member_dividend, created = MemberDividend.objects.update_or_create(
-                    dividend_period=period,
-                    member=member,
-                    defaults={
-                        'shares_count': shares_count,
-                        'shares_value': shares_value,
-                        'gross_dividend': gross_dividend,
-                        'tax_amount': tax_amount,
-                        'net_dividend': net_dividend,
-                        'applied_rate': period.dividend_rate,
-                        'status': 'CALCULATED'
-                    }
                 )
                 
-                if created:
-                    created_count += 1
-                
-                total_calculated += net_dividend
-                
             except Exception as e:
-                error_msg = f"Error calculating dividend for {member.get_full_name()}: {str(e)}"
+                error_msg = f"Error calculating dividend for member {member_info.member_id}: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
         
+        result = DividendCalculationService._finalize(
+            period, member_dividends, len(eligible_members), errors
+        )
+        
         # Validate total allocation
         is_valid, diff, msg = validate_total_dividend_allocation(
-            total_calculated,
+            result['total_calculated'],
             period.total_dividend_amount
         )
         
         if not is_valid:
             errors.append(msg)
         
-        return {
-            'success': len(errors) == 0 or created_count > 0,
-            'message': f'Calculated dividends for {created_count} members',
-            'total_members': len(eligible_members),
-            'total_calculated': total_calculated,
-            'errors': errors
-        }
+        return result
     
     @staticmethod
     def _calculate_weighted_average(period, eligible_members):
         """Calculate dividends using weighted average method"""
         # Calculate total shares value
         total_shares_value = sum(
-            m['shares_value'] for m in eligible_members
+            m.shares_value for m in eligible_members
         )
         
         if total_shares_value <= 0:
@@ -413,17 +519,13 @@ class DividendCalculationService:
                 'errors': ['Total shares value is zero']
             }
         
-        total_calculated = Decimal('0.00')
+        member_dividends = []
         errors = []
-        created_count = 0
         
         for member_info in eligible_members:
             try:
-                member = member_info['member']
-                shares_value = member_info['shares_value']
-                shares_count = member_info['shares_count']
+                member_id, shares_count, shares_value = member_info
                 
-                # Calculate gross dividend
                 gross_dividend = calculate_weighted_average_dividend(
                     shares_value,
                     total_shares_value,
@@ -431,60 +533,29 @@ class DividendCalculationService:
                 )
                 
                 # Calculate yield (as applied rate)
-                from .utils import calculate_dividend_yield
                 applied_rate = calculate_dividend_yield(gross_dividend, shares_value)
                 
-                # Calculate tax
-                tax_amount = Decimal('0.00')
-                if period.apply_withholding_tax:
-                    tax_amount = calculate_withholding_tax(
-                        gross_dividend,
-                        period.withholding_tax_rate
+                member_dividends.append(
+                    DividendCalculationService._build_member_dividend(
+                        period, member_id, shares_count, shares_value,
+                        gross_dividend, applied_rate
                     )
-                
-                # Calculate net
-                net_dividend = calculate_net_dividend(gross_dividend, tax_amount)
-                
-                # Create or update member dividend
-                member_dividend, created = MemberDividend.objects.update_or_create(
-                    dividend_period=period,
-                    member=member,
-                    defaults={
-                        'shares_count': shares_count,
-                        'shares_value': shares_value,
-                        'gross_dividend': gross_dividend,
-                        'tax_amount': tax_amount,
-                        'net_dividend': net_dividend,
-                        'applied_rate': applied_rate,
-                        'status': 'CALCULATED'
-                    }
                 )
                 
-                if created:
-                    created_count += 1
-                
-                total_calculated += net_dividend
-                
             except Exception as e:
-                error_msg = f"Error calculating dividend for {member.get_full_name()}: {str(e)}"
+                error_msg = f"Error calculating dividend for member {member_info.member_id}: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
         
-        return {
-            'success': len(errors) == 0 or created_count > 0,
-            'message': f'Calculated dividends for {created_count} members',
-            'total_members': len(eligible_members),
-            'total_calculated': total_calculated,
-            'errors': errors
-        }
+        return DividendCalculationService._finalize(
+            period, member_dividends, len(eligible_members), errors
+        )
     
     @staticmethod
     def _calculate_tiered(period, eligible_members):
         """Calculate dividends using tiered rates"""
         # Get dividend rates for this period
-        dividend_rates = list(period.dividend_rates.filter(is_active=True).values(
-            'min_shares', 'max_shares', 'min_value', 'max_value', 'rate'
-        ))
+        dividend_rates = get_dividend_tier_index(period)
         
         if not dividend_rates:
             return {
@@ -495,66 +566,34 @@ class DividendCalculationService:
                 'errors': ['No active dividend rate tiers']
             }
         
-        total_calculated = Decimal('0.00')
+        member_dividends = []
         errors = []
-        created_count = 0
         
         for member_info in eligible_members:
             try:
-                member = member_info['member']
-                shares_value = member_info['shares_value']
-                shares_count = member_info['shares_count']
+                member_id, shares_count, shares_value = member_info
                 
-                # Calculate tiered dividend
                 gross_dividend, applied_rate = calculate_tiered_dividend(
                     shares_value,
                     shares_count,
                     dividend_rates
                 )
                 
-                # Calculate tax
-                tax_amount = Decimal('0.00')
-                if period.apply_withholding_tax:
-                    tax_amount = calculate_withholding_tax(
-                        gross_dividend,
-                        period.withholding_tax_rate
+                member_dividends.append(
+                    DividendCalculationService._build_member_dividend(
+                        period, member_id, shares_count, shares_value,
+                        gross_dividend, applied_rate
                     )
-                
-                # Calculate net
-                net_dividend = calculate_net_dividend(gross_dividend, tax_amount)
-                
-                # Create or update member dividend
-                member_dividend, created = MemberDividend.objects.update_or_create(
-                    dividend_period=period,
-                    member=member,
-                    defaults={
-                        'shares_count': shares_count,
-                        'shares_value': shares_value,
-                        'gross_dividend': gross_dividend,
-                        'tax_amount': tax_amount,
-                        'net_dividend': net_dividend,
-                        'applied_rate': applied_rate,
-                        'status': 'CALCULATED'
-                    }
                 )
                 
-                if created:
-                    created_count += 1
-                
-                total_calculated += net_dividend
-                
             except Exception as e:
-                error_msg = f"Error calculating dividend for {member.get_full_name()}: {str(e)}"
+                error_msg = f"Error calculating dividend for member {member_info.member_id}: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
         
-        return {
-            'success': len(errors) == 0 or created_count > 0,
-            'message': f'Calculated dividends for {created_count} members',
-            'total_members': len(eligible_members),
-            'total_calculated': total_calculated,
-            'errors': errors
-        }
+        return DividendCalculationService._finalize(
+            period, member_dividends, len(eligible_members), errors
+        )
     
     @staticmethod
     def _calculate_pro_rata(period, eligible_members):
@@ -562,6 +601,63 @@ class DividendCalculationService:
         # Similar to weighted average but with minimum payout threshold
         return DividendCalculationService._calculate_weighted_average(period, eligible_members)
     
+    @staticmethod
+    def _calculate_share_days(period, positions):
+        """
+        Calculate dividends weighted by share-days held during the period.
+        
+        Each member's gross dividend is their share of the pool in proportion
+        to share-days; shares value is the average holding over the period.
+        """
+        total_share_days = sum(p.share_days for p in positions)
+        
+        if total_share_days <= 0:
+            return {
+                'success': False,
+                'message': 'Total share-days is zero',
+                'total_members': 0,
+                'total_calculated': Decimal('0.00'),
+                'errors': ['Total share-days is zero']
+            }
+        
+        from shares.models import ShareCapital
+        
+        share_capital = ShareCapital.get_active_share_capital()
+        share_price = share_capital.share_price if share_capital else Decimal('0.00')
+        
+        member_dividends = []
+        errors = []
+        
+        for position in positions:
+            try:
+                gross_dividend = calculate_weighted_average_dividend(
+                    position.share_days,
+                    total_share_days,
+                    period.total_dividend_amount
+                )
+                
+                shares_value = calculate_total_shares_value(
+                    position.average_shares,
+                    share_price
+                )
+                applied_rate = calculate_dividend_yield(gross_dividend, shares_value)
+                
+                member_dividends.append(
+                    DividendCalculationService._build_member_dividend(
+                        period, position.member_id, max(position.shares_count, 0),
+                        shares_value, gross_dividend, applied_rate
+                    )
+                )
+                
+            except Exception as e:
+                error_msg = f"Error calculating dividend for member {position.member_id}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+        
+        return DividendCalculationService._finalize(
+            period, member_dividends, len(positions), errors
+        )
+    
     @staticmethod
     @transaction.atomic
     def recalculate_dividends(period):
@@ -575,8 +671,12 @@ class DividendCalculationService:
             dict: Calculation results
         """
         try:
-            # Delete existing member dividends
-            deleted_count = period.member_dividends.all().delete()[0]
+            from .signals import suspend_statistics_refresh
+            
+            # Delete existing member dividends, refreshing totals once
+            with suspend_statistics_refresh():
+                deleted_count = period.member_dividends.all().delete()[0]
+            DividendPeriodService.refresh_statistics(period)
             
             logger.info(f"Deleted {deleted_count} existing member dividends for period {period.name}")
             
@@ -594,6 +694,251 @@ class DividendCalculationService:
             }
 
 
+# =============================================================================
+# DIVIDEND SIMULATION SERVICES
+# =============================================================================
+
+class DividendSimulationService:
+    """
+    Compare dividend scenarios for a period without writing anything.
+    
+    Eligibility is loaded once per request and every scenario is evaluated in
+    memory with the same calculators the calculation service uses. Summaries
+    are cached per (SACCO database, period, scenario) so boards can flip
+    between options quickly; editing the period changes its updated_at and
+    therefore the cache key.
+    """
+    
+    CACHE_TIMEOUT = 60 * 10
+    
+    PERCENTILES = (10, 25, 50, 75, 90)
+    
+    TOP_RECIPIENTS = 10
+    
+    SIMULATED_METHODS = ('FLAT_RATE', 'WEIGHTED_AVERAGE', 'TIERED', 'PRO_RATA', 'SHARE_DAYS')
+    
+    @staticmethod
+    def build_scenario(period, method=None, total_dividend_amount=None,
+                       dividend_rate=None, withholding_tax_rate=None,
+                       apply_withholding_tax=None):
+        """
+        Build a scenario dict, defaulting every option to the period's value.
+        
+        Returns:
+            dict: Normalized scenario
+        """
+        def as_decimal(value, default):
+            return Decimal(str(value)) if value not in (None, '') else default
+        
+        return {
+            'method': method or period.calculation_method,
+            'total_dividend_amount': as_decimal(total_dividend_amount, period.total_dividend_amount),
+            'dividend_rate': as_decimal(dividend_rate, period.dividend_rate),
+            'withholding_tax_rate': as_decimal(withholding_tax_rate, period.withholding_tax_rate),
+            'apply_withholding_tax': (
+                period.apply_withholding_tax if apply_withholding_tax is None
+                else bool(apply_withholding_tax)
+            ),
+        }
+    
+    @staticmethod
+    def _cache_key(period, scenario):
+        """Cache key for one (period, scenario) pair on the current SACCO database"""
+        import hashlib
+        from kojenasacco.managers import get_current_db
+        
+        fingerprint = '|'.join(f"{key}={scenario[key]}" for key in sorted(scenario))
+        digest = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+        version = period.updated_at.timestamp() if period.updated_at else 0
+        
+        return f"dividend_sim:{get_current_db() or 'default'}:{period.pk}:{version}:{digest}"
+    
+    @staticmethod
+    def simulate(period, scenarios):
+        """
+        Evaluate several dividend scenarios for a period.
+        
+        Args:
+            period: DividendPeriod instance
+            scenarios: List of scenario dicts (see build_scenario)
+        
+        Returns:
+            list: One summary dict per scenario, in input order
+        
+        Example:
+            >>> scenarios = [
+            ...     DividendSimulationService.build_scenario(period, method='FLAT_RATE'),
+            ...     DividendSimulationService.build_scenario(period, method='TIERED'),
+            ... ]
+            >>> for summary in DividendSimulationService.simulate(period, scenarios):
+            ...     print(summary['scenario']['method'], summary['total_net'])
+        """
+        from django.core.cache import cache
+        
+        keys = [DividendSimulationService._cache_key(period, s) for s in scenarios]
+        cached = cache.get_many(keys)
+        
+        missing = [
+            (key, scenario) for key, scenario in zip(keys, scenarios)
+            if key not in cached
+        ]
+        
+        if missing:
+            positions = {}
+            dividend_rates = None
+            share_price = None
+            
+            for key, scenario in missing:
+                basis = 'SHARE_DAYS' if scenario['method'] == 'SHARE_DAYS' else 'RECORD_DATE'
+                if basis not in positions:
+                    positions[basis] = (
+                        get_share_days_positions(period) if basis == 'SHARE_DAYS'
+                        else get_eligible_members(period)
+                    )
+                
+                if scenario['method'] == 'TIERED' and dividend_rates is None:
+                    dividend_rates = get_dividend_tier_index(period)
+                
+                if basis == 'SHARE_DAYS' and share_price is None:
+                    from shares.models import ShareCapital
+                    share_capital = ShareCapital.get_active_share_capital()
+                    share_price = share_capital.share_price if share_capital else Decimal('0.00')
+                
+                cached[key] = DividendSimulationService._evaluate(
+                    period, scenario, positions[basis], dividend_rates or [], share_price
+                )
+            
+            DividendSimulationService._describe_recipients(
+                [cached[key] for key, _ in missing]
+            )
+            
+            cache.set_many(
+                {key: cached[key] for key, _ in missing},
+                DividendSimulationService.CACHE_TIMEOUT
+            )
+        
+        return [cached[key] for key in keys]
+    
+    @staticmethod
+    def _evaluate(period, scenario, positions, dividend_rates, share_price=None):
+        """Evaluate one scenario in memory and summarize the distribution"""
+        method = scenario['method']
+        pool = scenario['total_dividend_amount']
+        
+        if method not in DividendSimulationService.SIMULATED_METHODS:
+            return {'scenario': scenario, 'success': False,
+                    'message': f'Unknown calculation method: {method}'}
+        
+        if method == 'SHARE_DAYS':
+            rows = [
+                (p.member_id, p.share_days,
+                 calculate_total_shares_value(p.average_shares, share_price))
+                for p in positions
+            ]
+        else:
+            rows = [(m.member_id, m.shares_count, m.shares_value) for m in positions]
+        
+        if method == 'SHARE_DAYS':
+            total_weight = sum((weight for _, weight, _ in rows), Decimal('0.00'))
+        else:
+            total_weight = sum((value for _, _, value in rows), Decimal('0.00'))
+        
+        results = []
+        below_minimum = 0
+        
+        for member_id, shares_or_days, shares_value in rows:
+            if method == 'FLAT_RATE':
+                gross = calculate_flat_rate_dividend(shares_value, scenario['dividend_rate'])
+            elif method == 'TIERED':
+                gross, _ = calculate_tiered_dividend(shares_value, shares_or_days, dividend_rates)
+            elif method == 'PRO_RATA':
+                gross, meets_minimum = calculate_pro_rata_dividend(
+                    shares_value, total_weight, pool, period.minimum_payout_amount
+                )
+                if not meets_minimum:
+                    below_minimum += 1
+            elif method == 'SHARE_DAYS':
+                gross = calculate_weighted_average_dividend(shares_or_days, total_weight, pool)
+            else:
+                gross = calculate_weighted_average_dividend(shares_value, total_weight, pool)
+            
+            tax = Decimal('0.00')
+            if scenario['apply_withholding_tax']:
+                tax = calculate_withholding_tax(gross, scenario['withholding_tax_rate'])
+            
+            results.append((calculate_net_dividend(gross, tax), gross, tax, member_id))
+        
+        results.sort(key=lambda r: r[0])
+        
+        total_gross = sum((r[1] for r in results), Decimal('0.00'))
+        total_tax = sum((r[2] for r in results), Decimal('0.00'))
+        total_net = sum((r[0] for r in results), Decimal('0.00'))
+        
+        is_valid, difference, allocation_message = validate_total_dividend_allocation(
+            total_net, pool
+        )
+        
+        percentiles = {}
+        for pct in DividendSimulationService.PERCENTILES:
+            if results:
+                # Nearest-rank percentile over the sorted net amounts
+                index = max(0, -(-pct * len(results) // 100) - 1)
+                percentiles[f'p{pct}'] = results[index][0]
+            else:
+                percentiles[f'p{pct}'] = Decimal('0.00')
+        
+        top = results[-DividendSimulationService.TOP_RECIPIENTS:][::-1]
+        
+        return {
+            'scenario': scenario,
+            'success': True,
+            'total_members': len(results),
+            'total_gross': total_gross,
+            'total_tax': total_tax,
+            'total_net': total_net,
+            'min_net': results[0][0] if results else Decimal('0.00'),
+            'max_net': results[-1][0] if results else Decimal('0.00'),
+            'average_net': (
+                (total_net / len(results)).quantize(Decimal('0.01')) if results
+                else Decimal('0.00')
+            ),
+            'percentiles': percentiles,
+            'below_minimum': below_minimum,
+            'top_recipients': [
+                {
+                    'member_id': member_id,
+                    'gross_dividend': gross,
+                    'tax_amount': tax,
+                    'net_dividend': net,
+                }
+                for net, gross, tax, member_id in top
+            ],
+            'allocation_valid': is_valid,
+            'allocation_difference': difference,
+            'allocation_message': allocation_message,
+        }
+    
+    @staticmethod
+    def _describe_recipients(summaries):
+        """Attach member number and name to top recipients with one query"""
+        from members.models import Member
+        
+        recipients = [
+            r for summary in summaries for r in summary.get('top_recipients', [])
+        ]
+        
+        members = {
+            m['id']: m for m in Member.objects.filter(
+                pk__in={r['member_id'] for r in recipients}
+            ).values('id', 'member_number', 'first_name', 'last_name')
+        }
+        
+        for recipient in recipients:
+            member = members.get(recipient['member_id'], {})
+            recipient['member_number'] = member.get('member_number')
+            recipient['name'] = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip()
+
+
 # =============================================================================
 # DIVIDEND DISBURSEMENT SERVICES
 # =============================================================================
@@ -601,6 +946,8 @@ class DividendCalculationService:
 class DividendDisbursementService:
     """Handle dividend disbursement workflows"""
     
+    CHUNK_SIZE = 500
+    
     @staticmethod
     @transaction.atomic
     def create_disbursement_batch(period, disbursement_date, disbursement_method,
@@ -660,98 +1007,205 @@ class DividendDisbursementService:
             return False, f"Error creating disbursement: {str(e)}"
     
     @staticmethod
-    @transaction.atomic
-    def process_disbursement(disbursement):
+    def refresh_statistics(disbursement):
+        """
+        Recompute disbursement progress from its payments in one aggregate.
+        
+        Args:
+            disbursement: DividendDisbursement instance
+        
+        Returns:
+            dict: Updated statistics fields
+        """
+        from django.db.models import Q
+        
+        stats = disbursement.payments.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='COMPLETED')),
+            failed=Count('id', filter=Q(status='FAILED')),
+            processed_amount=Sum('amount', filter=Q(status='COMPLETED'))
+        )
+        
+        totals = {
+            'processed_members': stats['total'] or 0,
+            'successful_members': stats['completed'] or 0,
+            'failed_members': stats['failed'] or 0,
+            'processed_amount': stats['processed_amount'] or Decimal('0.00'),
+        }
+        
+        DividendDisbursement.objects.filter(pk=disbursement.pk).update(**totals)
+        
+        for field, value in totals.items():
+            setattr(disbursement, field, value)
+        
+        return totals
+    
+    @staticmethod
+    def process_disbursement(disbursement, chunk_size=None, progress_callback=None):
         """
         Process dividend disbursement batch.
         
-        Creates individual payment records for each member.
+        Creates payment records for every approved member dividend and, for
+        savings account disbursements, posts all DIVIDEND credits in batched
+        ledger operations. Work is committed chunk by chunk, so a run that is
+        interrupted can be resumed by calling this again on the PROCESSING
+        disbursement: only still-APPROVED dividends and still-PENDING payments
+        are picked up.
         
         Args:
-            disbursement: DividendDisbursement instance
+            disbursement: DividendDisbursement instance (PENDING or PROCESSING)
+            chunk_size (int, optional): Rows per chunk
+            progress_callback (callable, optional): Called as
+                progress_callback(stage, done, total) after every chunk, where
+                stage is 'payments' or 'postings'
         
         Returns:
             dict: Processing results
         """
-        if disbursement.status != 'PENDING':
+        from utils.utils import chunked
+        
+        chunk_size = chunk_size or DividendDisbursementService.CHUNK_SIZE
+        
+        if disbursement.status not in ('PENDING', 'PROCESSING'):
             return {
                 'success': False,
                 'message': f'Cannot process disbursement with status: {disbursement.get_status_display()}',
                 'processed': 0,
+                'posted': 0,
+                'failed': 0,
                 'errors': []
             }
         
+        processed = posted = failed = 0
+        errors = []
+        
         try:
-            # Start processing
-            success, message = disbursement.start_processing()
-            if not success:
-                return {
-                    'success': False,
-                    'message': message,
-                    'processed': 0,
-                    'errors': []
-                }
+            if disbursement.status == 'PENDING':
+                success, message = disbursement.start_processing()
+                if not success:
+                    return {
+                        'success': False,
+                        'message': message,
+                        'processed': 0,
+                        'posted': 0,
+                        'failed': 0,
+                        'errors': []
+                    }
             
-            # Get approved member dividends
-            member_dividends = disbursement.dividend_period.member_dividends.filter(
-                status='APPROVED'
+            # Stage 1: one payment per approved member dividend
+            dividend_ids = list(
+                disbursement.dividend_period.member_dividends.filter(
+                    status='APPROVED'
+                ).order_by('pk').values_list('pk', flat=True)
             )
             
-            processed = 0
-            errors = []
-            
-            for member_dividend in member_dividends:
-                try:
-                    # Create payment record
-                    payment = DividendPayment.objects.create(
-                        member_dividend=member_dividend,
-                        disbursement=disbursement,
-                        payment_date=timezone.now(),
-                        amount=member_dividend.net_dividend,
-                        status='PENDING',
-                        savings_account=member_dividend.disbursement_account
-                    )
-                    
-                    # Update member dividend status
-                    member_dividend.status = 'PROCESSING'
-                    member_dividend.save(update_fields=['status'])
-                    
-                    processed += 1
+            for chunk in chunked(dividend_ids, chunk_size):
+                processed += DividendDisbursementService._create_payments(disbursement, chunk)
+                DividendDisbursementService.refresh_statistics(disbursement)
+                
+                if progress_callback:
+                    progress_callback('payments', processed, len(dividend_ids))
+            
+            # Stage 2: post pending payments to savings
+            if disbursement.disbursement_method == 'SAVINGS_ACCOUNT':
+                payment_ids = list(
+                    disbursement.payments.filter(
+                        status='PENDING'
+                    ).order_by('pk').values_list('pk', flat=True)
+                )
+                
+                done = 0
+                for chunk in chunked(payment_ids, chunk_size):
+                    result = DividendPaymentService.post_payments_to_savings(chunk, disbursement)
+                    posted += result['completed']
+                    failed += result['failed']
+                    errors.extend(result['errors'])
+                    done += len(chunk)
+                    DividendDisbursementService.refresh_statistics(disbursement)
                     
-                except Exception as e:
-                    error_msg = f"Error creating payment for {member_dividend.member.get_full_name()}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+                    if progress_callback:
+                        progress_callback('postings', done, len(payment_ids))
             
             # Complete processing
             disbursement.complete_processing()
             
             logger.info(
                 f"Disbursement batch processed: {disbursement.batch_number} | "
-                f"Processed: {processed} | "
-                f"Errors: {len(errors)}"
+                f"Payments: {processed} | "
+                f"Posted: {posted} | "
+                f"Failed: {failed}"
             )
             
             return {
-                'success': processed > 0,
-                'message': f'Processed {processed} payments',
+                'success': processed > 0 or posted > 0,
+                'message': f'Processed {processed} payments, posted {posted} to savings',
                 'processed': processed,
+                'posted': posted,
+                'failed': failed,
                 'errors': errors
             }
             
         except Exception as e:
-            logger.error(f"Error processing disbursement: {e}", exc_info=True)
-            
-            # Mark as failed
-            disbursement.status = 'FAILED'
-            disbursement.save(update_fields=['status'])
+            logger.error(
+                f"Error processing disbursement {disbursement.batch_number}, "
+                f"committed chunks are kept and the run can be resumed: {e}",
+                exc_info=True
+            )
             
             return {
                 'success': False,
                 'message': f'Error processing disbursement: {str(e)}',
-                'processed': 0,
-                'errors': [str(e)]
+                'processed': processed,
+                'posted': posted,
+                'failed': failed,
+                'errors': errors + [str(e)]
             }
+    
+    @staticmethod
+    @transaction.atomic
+    def _create_payments(disbursement, dividend_ids):
+        """
+        Create payments for one chunk of member dividends.
+        
+        Dividends are locked and re-checked as APPROVED so a concurrent or
+        resumed run never pays the same dividend twice.
+        
+        Returns:
+            int: Number of payments created
+        """
+        rows = list(
+            MemberDividend.objects.select_for_update().filter(
+                pk__in=dividend_ids,
+                status='APPROVED'
+            ).order_by('pk').values_list('pk', 'net_dividend', 'disbursement_account_id')
+        )
+        
+        if not rows:
+            return 0
+        
+        now = timezone.now()
+        
+        DividendPayment.objects.bulk_create([
+            DividendPayment(
+                member_dividend_id=dividend_id,
+                disbursement=disbursement,
+                payment_date=now,
+                amount=net_dividend,
+                status='PENDING',
+                savings_account_id=account_id
+            )
+            for dividend_id, net_dividend, account_id in rows
+        ])
+        
+        MemberDividend.objects.filter(
+            pk__in=[dividend_id for dividend_id, _, _ in rows]
+        ).update(
+            status='PROCESSING',
+            disbursement_method=disbursement.disbursement_method,
+            updated_at=now
+        )
+        
+        return len(rows)
 
 
 # =============================================================================
@@ -762,7 +1216,180 @@ class DividendPaymentService:
     """Handle individual dividend payments"""
     
     @staticmethod
-    @transaction.atomic
+    def post_payments_to_savings(payment_ids, disbursement):
+        """
+        Post a chunk of pending dividend payments to savings in one batch.
+        
+        Payments and their savings accounts are locked in primary key order,
+        every credit is validated in memory against the locked balances, then
+        all DIVIDEND transactions are inserted with one bulk insert using a
+        block of reserved transaction IDs and balances are written with one
+        grouped UPDATE. Payment and member dividend statuses are updated in
+        bulk as well.
+        
+        Args:
+            payment_ids: DividendPayment primary keys
+            disbursement: DividendDisbursement the payments belong to
+        
+        Returns:
+            dict: {'completed': int, 'failed': int, 'amount': Decimal, 'errors': list}
+        """
+        from savings.models import SavingsAccount, SavingsTransaction
+        from savings.utils import (
+            validate_deposit,
+            generate_transaction_id_block,
+            calculate_available_balance,
+            bulk_set_account_balances,
+        )
+        from core.utils import get_active_fiscal_period
+        from members.services import MemberFinancialSummaryService
+        
+        result = {
+            'completed': 0,
+            'failed': 0,
+            'amount': Decimal('0.00'),
+            'errors': [],
+        }
+        
+        with transaction.atomic():
+            payments = list(
+                DividendPayment.objects.select_for_update().filter(
+                    pk__in=payment_ids,
+                    status='PENDING'
+                ).order_by('pk')
+            )
+            
+            if not payments:
+                return result
+            
+            accounts = SavingsAccount.objects.select_related('savings_product').in_bulk(
+                {p.savings_account_id for p in payments if p.savings_account_id}
+            )
+            
+            locked = {
+                pk: (balance, hold)
+                for pk, balance, hold in SavingsAccount.objects.select_for_update().filter(
+                    pk__in=list(accounts)
+                ).order_by('pk').values_list('pk', 'current_balance', 'hold_amount')
+            }
+            running = {pk: balance for pk, (balance, _hold) in locked.items()}
+            
+            # Validate in memory
+            accepted = []
+            rejected = []
+            for payment in payments:
+                account = accounts.get(payment.savings_account_id)
+                if account is None:
+                    rejected.append((payment, "No savings account specified"))
+                    continue
+                
+                account.current_balance = running[account.pk]
+                is_valid, message = validate_deposit(account, payment.amount)
+                if not is_valid:
+                    rejected.append((payment, f"Deposit failed: {message}"))
+                    continue
+                
+                running[account.pk] += payment.amount
+                accepted.append((payment, account, running[account.pk]))
+            
+            now = timezone.now()
+            today = timezone.localdate()
+            period = disbursement.dividend_period
+            
+            if accepted:
+                transaction_ids = generate_transaction_id_block('DIV', len(accepted))
+                financial_period = get_active_fiscal_period()
+                
+                SavingsTransaction.objects.bulk_create([
+                    SavingsTransaction(
+                        transaction_id=txn_id,
+                        account=account,
+                        transaction_type='DIVIDEND',
+                        amount=payment.amount,
+                        transaction_date=now,
+                        post_date=today,
+                        value_date=today,
+                        reference_number=disbursement.batch_number,
+                        description=f"Dividend payment from {period.name}",
+                        running_balance=running_balance,
+                        financial_period=financial_period,
+                    )
+                    for txn_id, (payment, account, running_balance) in zip(transaction_ids, accepted)
+                ])
+                
+                touched = {account.pk for _payment, account, _balance in accepted}
+                bulk_set_account_balances({
+                    pk: (running[pk], calculate_available_balance(running[pk], locked[pk][1]))
+                    for pk in touched
+                }, activity_at=now)
+                
+                for (payment, _account, _balance), txn_id in zip(accepted, transaction_ids):
+                    payment.status = 'COMPLETED'
+                    payment.transaction_id = txn_id
+                    payment.transaction_date = now
+                    payment.updated_at = now
+                
+                paid_dividends = MemberDividend.objects.filter(
+                    pk__in=[payment.member_dividend_id for payment, _, _ in accepted]
+                )
+                
+                dividend_deltas = {}
+                for member_id, status, net_dividend in paid_dividends.values_list('member_id', 'status', 'net_dividend'):
+                    if status == 'PAID':
+                        continue
+                    changes = dividend_deltas.setdefault(member_id, {'dividends_paid': Decimal('0.00')})
+                    changes['dividends_paid'] += net_dividend or Decimal('0.00')
+                
+                paid_dividends.update(
+                    status='PAID',
+                    payment_date=now,
+                    payment_notes=f"Paid via {disbursement.batch_number}",
+                    updated_at=now
+                )
+                MemberFinancialSummaryService.apply_deltas(dividend_deltas)
+                
+                # Approve pending accounts that now meet the opening balance
+                for account in {account.pk: account for _payment, account, _balance in accepted}.values():
+                    if account.status == 'PENDING_APPROVAL':
+                        account.current_balance = running[account.pk]
+                        if account.current_balance >= account.savings_product.minimum_opening_balance:
+                            account.approve_account()
+            
+            reasons = {}
+            for payment, reason in rejected:
+                payment.status = 'FAILED'
+                payment.failure_reason = reason
+                payment.retry_count += 1
+                payment.last_retry_date = now
+                payment.updated_at = now
+                reasons.setdefault(reason, []).append(payment.member_dividend_id)
+                result['errors'].append(f"Payment {payment.pk}: {reason}")
+            
+            for reason, dividend_ids in reasons.items():
+                MemberDividend.objects.filter(pk__in=dividend_ids).update(
+                    status='FAILED',
+                    failure_reason=reason,
+                    retry_count=F('retry_count') + 1,
+                    updated_at=now
+                )
+            
+            DividendPayment.objects.bulk_update(payments, [
+                'status', 'transaction_id', 'transaction_date', 'failure_reason',
+                'retry_count', 'last_retry_date', 'updated_at',
+            ])
+        
+        result['completed'] = len(accepted)
+        result['failed'] = len(rejected)
+        result['amount'] = sum((payment.amount for payment, _, _ in accepted), Decimal('0.00'))
+        
+        logger.info(
+            f"Dividend savings postings for {disbursement.batch_number}: "
+            f"{result['completed']} posted ({result['amount']}), {result['failed']} failed"
+        )
+        
+        return result
+    
+    @staticmethod
     def process_payment_to_savings(payment):
         """
         Process payment to member's savings account.
@@ -777,40 +1404,17 @@ class DividendPaymentService:
             return False, f"Cannot process payment with status: {payment.get_status_display()}"
         
         try:
-            # Get savings account
-            savings_account = payment.savings_account
-            
-            if not savings_account:
-                return payment.mark_as_failed("No savings account specified")
-            
-            # Create deposit transaction in savings
-            from savings.services import TransactionService
-            
-            success, result = TransactionService.process_deposit(
-                account=savings_account,
-                amount=payment.amount,
-                payment_method='INTERNAL_TRANSFER',
-                description=f"Dividend payment from {payment.disbursement.dividend_period.name}",
-                reference_number=payment.disbursement.batch_number
+            result = DividendPaymentService.post_payments_to_savings(
+                [payment.pk], payment.disbursement
             )
             
-            if success:
-                transaction = result
-                
-                # Mark payment as completed
-                payment.mark_as_completed(transaction_id=transaction.transaction_id)
-                
-                logger.info(
-                    f"Dividend paid to savings: {payment.member_dividend.member.get_full_name()} | "
-                    f"Amount: {payment.amount} | "
-                    f"Account: {savings_account.account_number}"
-                )
-                
+            DividendDisbursementService.refresh_statistics(payment.disbursement)
+            payment.refresh_from_db()
+            
+            if result['completed']:
                 return True, "Payment completed successfully"
-            else:
-                # Mark as failed
-                payment.mark_as_failed(f"Deposit failed: {result}")
-                return False, result
+            
+            return False, payment.failure_reason or "Payment was not processed"
             
         except Exception as e:
             error_msg = f"Error processing payment: {str(e)}"
@@ -7,6 +7,7 @@ Handles automatic operations on model save/delete:
 - Batch number generation
 - Status updates
 - Statistics calculations
+- Member financial summary deltas
 - Automatic field population
 - Net dividend calculation
 - Validation
@@ -20,7 +21,9 @@ from django.utils import timezone
 from django.db import transaction as db_transaction
 from decimal import Decimal
 from django.db.models import Q
+from contextlib import contextmanager
 import logging
+import threading
 
 from .models import (
     DividendPeriod,
@@ -33,6 +36,37 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+_state = threading.local()
+
+
+@contextmanager
+def suspend_statistics_refresh():
+    """
+    Skip the per-row statistics refresh inside this block.
+    
+    Bulk calculation and disbursement paths write many MemberDividend or
+    DividendPayment rows at once and refresh DividendPeriod/DividendDisbursement
+    totals a single time afterwards, instead of re-aggregating on every
+    save/delete. The flag is thread-local so other requests keep their normal
+    behaviour.
+    
+    Usage:
+        with suspend_statistics_refresh():
+            # ... write member dividends ...
+        DividendPeriodService.refresh_statistics(period)
+    """
+    previous = getattr(_state, 'suspended', False)
+    _state.suspended = True
+    try:
+        yield
+    finally:
+        _state.suspended = previous
+
+
+def statistics_refresh_suspended():
+    """Check whether statistics refresh is suspended for this thread"""
+    return getattr(_state, 'suspended', False)
+
 
 # =============================================================================
 # DIVIDEND PERIOD SIGNALS
@@ -147,24 +181,12 @@ def update_period_statistics_on_dividend_change(sender, instance, **kwargs):
     """
     Update dividend period statistics when member dividends change.
     """
+    if statistics_refresh_suspended():
+        return
+    
     try:
-        period = instance.dividend_period
-        
-        # Calculate totals from all member dividends
-        from django.db.models import Sum, Count
-        
-        stats = period.member_dividends.aggregate(
-            total_members=Count('id'),
-            total_shares=Sum('shares_count'),
-            total_value=Sum('shares_value')
-        )
-        
-        # Update period
-        DividendPeriod.objects.filter(pk=period.pk).update(
-            total_members=stats['total_members'] or 0,
-            total_shares=stats['total_shares'] or 0,
-            total_shares_value=stats['total_value'] or Decimal('0.00')
-        )
+        from .services import DividendPeriodService
+        DividendPeriodService.refresh_statistics(instance.dividend_period)
         
     except Exception as e:
         logger.error(f"Error updating period statistics: {e}")
@@ -175,28 +197,74 @@ def update_period_statistics_on_dividend_delete(sender, instance, **kwargs):
     """
     Update dividend period statistics when member dividend is deleted.
     """
+    if statistics_refresh_suspended():
+        return
+    
     try:
-        period = instance.dividend_period
-        
-        # Recalculate statistics
-        from django.db.models import Sum, Count
-        
-        stats = period.member_dividends.aggregate(
-            total_members=Count('id'),
-            total_shares=Sum('shares_count'),
-            total_value=Sum('shares_value')
-        )
-        
-        DividendPeriod.objects.filter(pk=period.pk).update(
-            total_members=stats['total_members'] or 0,
-            total_shares=stats['total_shares'] or 0,
-            total_shares_value=stats['total_value'] or Decimal('0.00')
-        )
+        from .services import DividendPeriodService
+        DividendPeriodService.refresh_statistics(instance.dividend_period)
         
     except Exception as e:
         logger.error(f"Error updating period statistics after delete: {e}")
 
 
+@receiver(pre_save, sender=MemberDividend)
+def remember_paid_dividend(sender, instance, **kwargs):
+    """
+    Remember the stored member, status and net dividend so post_save can
+    apply only the change to the member's financial summary.
+    """
+    instance._previous_paid_dividend = None
+    
+    if instance._state.adding:
+        return
+    
+    previous = MemberDividend.objects.filter(pk=instance.pk).values_list(
+        'member_id', 'status', 'net_dividend'
+    ).first()
+    
+    if previous:
+        instance._previous_paid_dividend = previous
+
+
+@receiver(post_save, sender=MemberDividend)
+def update_member_financial_summary_on_dividend_change(sender, instance, **kwargs):
+    """
+    Apply the dividend's change in dividends paid to the member's summary.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    previous_member_id, previous_status, previous_net = (
+        getattr(instance, '_previous_paid_dividend', None) or (None, None, Decimal('0.00'))
+    )
+    
+    deltas = {}
+    if previous_member_id is not None and previous_status == 'PAID':
+        deltas[previous_member_id] = {'dividends_paid': -(previous_net or Decimal('0.00'))}
+    if instance.status == 'PAID':
+        changes = deltas.setdefault(instance.member_id, {'dividends_paid': Decimal('0.00')})
+        changes['dividends_paid'] += instance.net_dividend or Decimal('0.00')
+    
+    try:
+        MemberFinancialSummaryService.apply_deltas(deltas)
+    except Exception as e:
+        logger.error(f"Error updating member financial summary for dividend {instance.pk}: {e}")
+
+
+@receiver(post_delete, sender=MemberDividend)
+def update_member_financial_summary_on_dividend_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted paid dividend from the member's summary.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    if instance.status == 'PAID' and instance.net_dividend:
+        try:
+            MemberFinancialSummaryService.apply_delta(instance.member_id, dividends_paid=-instance.net_dividend)
+        except Exception as e:
+            logger.error(f"Error updating member financial summary after dividend delete: {e}")
+
+
 # =============================================================================
 # DIVIDEND RATE SIGNALS
 # =============================================================================
@@ -215,6 +283,19 @@ def log_dividend_rate_creation(sender, instance, created, **kwargs):
         )
 
 
+@receiver(post_save, sender=DividendRate)
+@receiver(post_delete, sender=DividendRate)
+def invalidate_dividend_tier_index_on_change(sender, instance, **kwargs):
+    """
+    Drop the cached tier index of the rate's period when a tier changes.
+    """
+    from kojenasacco.managers import get_current_db
+    from .utils import invalidate_dividend_tier_index
+    
+    invalidate_dividend_tier_index(instance._state.db, instance.dividend_period_id)
+    invalidate_dividend_tier_index(get_current_db(), instance.dividend_period_id)
+
+
 # =============================================================================
 # DIVIDEND DISBURSEMENT SIGNALS
 # =============================================================================
@@ -302,26 +383,12 @@ def update_disbursement_statistics_on_payment(sender, instance, **kwargs):
     """
     Update disbursement statistics when payment status changes.
     """
+    if statistics_refresh_suspended():
+        return
+    
     try:
-        disbursement = instance.disbursement
-        
-        # Count payments by status
-        from django.db.models import Count, Sum
-        
-        stats = disbursement.payments.aggregate(
-            total=Count('id'),
-            completed=Count('id', filter=Q(status='COMPLETED')),
-            failed=Count('id', filter=Q(status='FAILED')),
-            processed_amount=Sum('amount', filter=Q(status='COMPLETED'))
-        )
-        
-        # Update disbursement
-        DividendDisbursement.objects.filter(pk=disbursement.pk).update(
-            processed_members=stats['total'] or 0,
-            successful_members=stats['completed'] or 0,
-            failed_members=stats['failed'] or 0,
-            processed_amount=stats['processed_amount'] or Decimal('0.00')
-        )
+        from .services import DividendDisbursementService
+        DividendDisbursementService.refresh_statistics(instance.disbursement)
         
     except Exception as e:
         logger.error(f"Error updating disbursement statistics: {e}")
@@ -444,9 +511,14 @@ def disable_dividend_signals():
         (post_save, log_member_dividend_creation, MemberDividend),
         (post_save, update_period_statistics_on_dividend_change, MemberDividend),
         (post_delete, update_period_statistics_on_dividend_delete, MemberDividend),
+        (pre_save, remember_paid_dividend, MemberDividend),
+        (post_save, update_member_financial_summary_on_dividend_change, MemberDividend),
+        (post_delete, update_member_financial_summary_on_dividend_delete, MemberDividend),
         
         # Rate signals
         (post_save, log_dividend_rate_creation, DividendRate),
+        (post_save, invalidate_dividend_tier_index_on_change, DividendRate),
+        (post_delete, invalidate_dividend_tier_index_on_change, DividendRate),
         
         # Disbursement signals
         (pre_save, generate_batch_number, DividendDisbursement),
@@ -488,9 +560,14 @@ def enable_dividend_signals():
         (post_save, log_member_dividend_creation, MemberDividend),
         (post_save, update_period_statistics_on_dividend_change, MemberDividend),
         (post_delete, update_period_statistics_on_dividend_delete, MemberDividend),
+        (pre_save, remember_paid_dividend, MemberDividend),
+        (post_save, update_member_financial_summary_on_dividend_change, MemberDividend),
+        (post_delete, update_member_financial_summary_on_dividend_delete, MemberDividend),
         
         # Rate signals
         (post_save, log_dividend_rate_creation, DividendRate),
+        (post_save, invalidate_dividend_tier_index_on_change, DividendRate),
+        (post_delete, invalidate_dividend_tier_index_on_change, DividendRate),
         
         # Disbursement signals
         (pre_save, generate_batch_number, DividendDisbursement),
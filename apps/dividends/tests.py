@@ -1,3 +1,182 @@
+from datetime import date
+from decimal import Decimal
+
+from django.conf import settings
 from django.test import TestCase
 
-# Create your tests here.
+from kojenasacco.managers import DatabaseContext
+
+from core.models import FiscalPeriod, FiscalYear
+from members.models import Member
+from savings.models import SavingsAccount, SavingsProduct, SavingsTransaction
+
+from .models import DividendDisbursement, DividendPayment, DividendPeriod, MemberDividend
+from .services import DividendDisbursementService, DividendPaymentService
+
+# First SACCO database: dividend tables only exist outside 'default'
+SACCO_DB = next(alias for alias in settings.DATABASES if alias != 'default')
+
+
+class Interrupted(Exception):
+    pass
+
+
+class DividendDisbursementTests(TestCase):
+    """Posting of dividend disbursements to savings"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        fiscal_year = FiscalYear.objects.create(
+            name='FY 2025',
+            code='FY2025',
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            description='Financial year 2025',
+        )
+        period = DividendPeriod.objects.create(
+            name='FY 2025 Dividends',
+            financial_period=FiscalPeriod.objects.create(
+                fiscal_year=fiscal_year,
+                name='Q4 2025',
+                period_number=4,
+                start_date=date(2025, 10, 1),
+                end_date=date(2025, 12, 31),
+                description='Fourth quarter',
+            ),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            record_date=date(2025, 12, 31),
+            dividend_rate=Decimal('10.00'),
+        )
+        product = SavingsProduct.objects.create(
+            name='Ordinary Savings',
+            code='ORD',
+            description='Ordinary savings',
+            interest_rate=Decimal('0.00'),
+        )
+
+        self.accounts = []
+        self.dividends = []
+        for number in range(1, 4):
+            member = Member.objects.create(
+                member_number=f'MEM000{number}',
+                id_number=f'ID000{number}',
+                first_name='Jane',
+                last_name='Doe',
+                date_of_birth=date(1990, 1, 1),
+                gender='FEMALE',
+                marital_status='SINGLE',
+                membership_date=date(2020, 1, 1),
+                employment_status='EMPLOYED',
+                phone_primary=f'070000000{number}',
+                physical_address='Kampala',
+                status='ACTIVE',
+            )
+            account = SavingsAccount.objects.create(
+                account_number=f'SAV000{number}',
+                member=member,
+                savings_product=product,
+                status='ACTIVE',
+                current_balance=Decimal('1000.00'),
+                available_balance=Decimal('1000.00'),
+            )
+            self.accounts.append(account)
+            self.dividends.append(MemberDividend.objects.create(
+                dividend_period=period,
+                member=member,
+                gross_dividend=Decimal(100 * number),
+                status='APPROVED',
+                disbursement_account=account,
+            ))
+
+        self.disbursement = DividendDisbursement.objects.create(
+            dividend_period=period,
+            disbursement_date=date(2026, 1, 15),
+            disbursement_method='SAVINGS_ACCOUNT',
+        )
+
+    def balances(self):
+        return [
+            SavingsAccount.objects.values_list('current_balance', 'available_balance').get(pk=account.pk)
+            for account in self.accounts
+        ]
+
+    def assertPaidOnce(self):
+        self.assertEqual(self.balances(), [
+            (Decimal('1100.00'), Decimal('1100.00')),
+            (Decimal('1200.00'), Decimal('1200.00')),
+            (Decimal('1300.00'), Decimal('1300.00')),
+        ])
+
+        transactions = SavingsTransaction.objects.filter(transaction_type='DIVIDEND')
+        self.assertEqual(
+            sorted(transactions.values_list('account_id', 'amount', 'reference_number')),
+            sorted(
+                (account.pk, Decimal(100 * number), self.disbursement.batch_number)
+                for number, account in enumerate(self.accounts, start=1)
+            )
+        )
+
+        payments = DividendPayment.objects.filter(disbursement=self.disbursement)
+        self.assertEqual(
+            sorted(payments.values_list('member_dividend_id', 'status', 'transaction_id')),
+            sorted(
+                (dividend.pk, 'COMPLETED', transactions.get(account=dividend.disbursement_account_id).transaction_id)
+                for dividend in self.dividends
+            )
+        )
+        self.assertEqual(
+            set(MemberDividend.objects.values_list('status', flat=True)), {'PAID'}
+        )
+
+    def test_post_payments_to_savings(self):
+        self.disbursement.start_processing()
+        DividendDisbursementService._create_payments(
+            self.disbursement, [dividend.pk for dividend in self.dividends]
+        )
+
+        result = DividendPaymentService.post_payments_to_savings(
+            list(self.disbursement.payments.values_list('pk', flat=True)), self.disbursement
+        )
+
+        self.assertEqual((result['completed'], result['failed']), (3, 0), result['errors'])
+        self.assertEqual(result['amount'], Decimal('600.00'))
+        self.assertPaidOnce()
+
+    def test_process_disbursement(self):
+        result = DividendDisbursementService.process_disbursement(self.disbursement)
+
+        self.assertTrue(result['success'], result['errors'])
+        self.assertEqual((result['processed'], result['posted'], result['failed']), (3, 3, 0))
+        self.assertPaidOnce()
+        self.disbursement.refresh_from_db()
+        self.assertEqual(self.disbursement.status, 'COMPLETED')
+
+    def test_interrupted_disbursement_resumes_without_double_posting(self):
+        def interrupt(stage, done, total):
+            if stage == 'postings':
+                raise Interrupted
+
+        with self.assertLogs('dividends.services', 'ERROR'):
+            result = DividendDisbursementService.process_disbursement(
+                self.disbursement, chunk_size=1, progress_callback=interrupt
+            )
+
+        # The first posting chunk is committed, the rest is left pending
+        self.assertFalse(result['success'])
+        self.assertEqual(result['posted'], 1)
+        self.disbursement.refresh_from_db()
+        self.assertEqual(self.disbursement.status, 'PROCESSING')
+        self.assertEqual(SavingsTransaction.objects.filter(transaction_type='DIVIDEND').count(), 1)
+
+        result = DividendDisbursementService.process_disbursement(self.disbursement, chunk_size=1)
+
+        self.assertEqual((result['processed'], result['posted'], result['failed']), (0, 2, 0))
+        self.assertPaidOnce()
+        self.disbursement.refresh_from_db()
+        self.assertEqual(self.disbursement.status, 'COMPLETED')
@@ -45,6 +45,7 @@ urlpatterns = [
     path('periods/htmx/search/', htmx_views.dividend_period_search, name='period_search'),
     path('periods/htmx/quick-stats/', htmx_views.dividend_period_quick_stats, name='period_quick_stats'),
     path('periods/<uuid:period_id>/htmx/stats/', htmx_views.dividend_period_detail_stats, name='period_detail_stats'),
+    path('periods/<uuid:period_id>/htmx/simulate/', htmx_views.dividend_period_simulation, name='period_simulation'),
     
     # =============================================================================
     # DIVIDEND RATES
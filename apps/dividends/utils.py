@@ -5,6 +5,7 @@ Dividends Utility Functions
 
 Pure utility functions with NO side effects (no database writes):
 - Dividend calculation methods (flat rate, weighted average, tiered, pro-rata)
+- Cached dividend rate tier index
 - Tax calculations
 - Share value calculations
 - Distribution validations
@@ -20,7 +21,13 @@ from django.db.models import Max, Sum
 from django.utils import timezone
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
 from datetime import timedelta, date
+from bisect import bisect_right
+from typing import NamedTuple
 import logging
+import math
+import time
+
+from shares.utils import SHARE_INFLOW_TYPES, SHARE_OUTFLOW_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +125,8 @@ def calculate_tiered_dividend(shares_value, shares_count, dividend_rates):
     Args:
         shares_value (Decimal): Member's shares value
         shares_count (int): Member's share count
-        dividend_rates (list): List of tier dictionaries with structure:
+        dividend_rates (list or DividendTierIndex): List of tier dictionaries
+            with structure:
             [
                 {
                     'min_shares': int,
@@ -129,6 +137,7 @@ def calculate_tiered_dividend(shares_value, shares_count, dividend_rates):
                 },
                 ...
             ]
+            or an index built from them once (see get_dividend_tier_index())
     
     Returns:
         tuple: (dividend_amount: Decimal, applied_rate: Decimal)
@@ -149,41 +158,11 @@ def calculate_tiered_dividend(shares_value, shares_count, dividend_rates):
             logger.warning("No dividend rates provided for tiered calculation")
             return Decimal('0.00'), Decimal('0.00')
         
-        # Find applicable tier
-        applicable_rate = None
+        if not isinstance(dividend_rates, DividendTierIndex):
+            dividend_rates = DividendTierIndex(dividend_rates)
         
-        for tier in sorted(dividend_rates, key=lambda x: x.get('min_shares', 0)):
-            # Check share count criteria
-            if 'min_shares' in tier and 'max_shares' in tier:
-                min_shares = tier['min_shares']
-                max_shares = tier['max_shares']
-                
-                if max_shares is None:
-                    # No upper limit
-                    if count >= min_shares:
-                        applicable_rate = Decimal(str(tier['rate']))
-                        break
-                else:
-                    # Has upper limit
-                    if min_shares <= count <= max_shares:
-                        applicable_rate = Decimal(str(tier['rate']))
-                        break
-            
-            # Check value criteria
-            elif 'min_value' in tier and tier['min_value'] is not None:
-                min_value = Decimal(str(tier['min_value']))
-                max_value = Decimal(str(tier['max_value'])) if tier.get('max_value') else None
-                
-                if max_value is None:
-                    # No upper limit
-                    if value >= min_value:
-                        applicable_rate = Decimal(str(tier['rate']))
-                        break
-                else:
-                    # Has upper limit
-                    if min_value <= value <= max_value:
-                        applicable_rate = Decimal(str(tier['rate']))
-                        break
+        # Find applicable tier
+        applicable_rate = dividend_rates.rate_for(count, value)
         
         if applicable_rate is None:
             logger.warning(f"No applicable tier found for shares: {count}, value: {value}")
@@ -199,6 +178,134 @@ def calculate_tiered_dividend(shares_value, shares_count, dividend_rates):
         return Decimal('0.00'), Decimal('0.00')
 
 
+class DividendTierIndex:
+    """
+    Dividend rate tiers prepared for bisect lookups.
+    
+    Tiers are matched as before: in ascending min_shares order, the first
+    share tier whose [min_shares, max_shares] range holds the share count
+    wins, and value tiers met earlier in that order are tried by value.
+    The share count axis is cut once into intervals where the same tiers
+    apply; each lookup bisects to its interval and checks at most the
+    value tiers that precede the winning share tier.
+    """
+    
+    def __init__(self, dividend_rates):
+        tiers = sorted(dividend_rates, key=lambda x: x.get('min_shares', 0))
+        self._size = len(tiers)
+        
+        share_tiers = []
+        bounds = set()
+        for tier in tiers:
+            if 'min_shares' in tier and 'max_shares' in tier:
+                low = math.ceil(tier['min_shares'])
+                high = math.floor(tier['max_shares']) + 1 if tier['max_shares'] is not None else None
+                bounds.add(low)
+                if high is not None:
+                    bounds.add(high)
+                share_tiers.append((tier, low, high))
+        
+        self._starts = sorted(bounds)
+        
+        # A representative share count for each interval: before the first
+        # bound, then from each bound onwards
+        representatives = [self._starts[0] - 1 if self._starts else 0] + self._starts
+        share_ranges = {id(tier): (low, high) for tier, low, high in share_tiers}
+        
+        self._candidates = []
+        for count in representatives:
+            candidates = []
+            for tier in tiers:
+                if id(tier) in share_ranges:
+                    low, high = share_ranges[id(tier)]
+                    if low <= count and (high is None or count < high):
+                        candidates.append((None, None, Decimal(str(tier['rate']))))
+                        break
+                elif 'min_value' in tier and tier['min_value'] is not None:
+                    candidates.append((
+                        Decimal(str(tier['min_value'])),
+                        Decimal(str(tier['max_value'])) if tier.get('max_value') else None,
+                        Decimal(str(tier['rate']))
+                    ))
+            self._candidates.append(candidates)
+    
+    def __len__(self):
+        return self._size
+    
+    def rate_for(self, shares_count, shares_value):
+        """
+        Rate of the tier that applies to a holding.
+        
+        Args:
+            shares_count (int): Member's share count
+            shares_value (Decimal): Member's shares value
+        
+        Returns:
+            Decimal or None: Tier rate, or None when no tier applies
+        """
+        count = int(shares_count)
+        value = Decimal(str(shares_value))
+        
+        for min_value, max_value, rate in self._candidates[bisect_right(self._starts, count)]:
+            if min_value is None:
+                return rate
+            if value >= min_value and (max_value is None or value <= max_value):
+                return rate
+        
+        return None
+
+
+# Seconds a tier index is trusted before reloading. DividendRate save signals
+# invalidate it in the process that made the change.
+DIVIDEND_TIER_INDEX_TTL = 300
+
+# {(db_alias, period_id): (loaded_at, DividendTierIndex)}
+_dividend_tier_indexes = {}
+
+
+def get_dividend_tier_index(dividend_period):
+    """
+    Get the active rate tiers of a dividend period as a cached index.
+    
+    Indexes are kept in-process per tenant database and period, so repeated
+    calculations and simulations do not re-read the tiers.
+    
+    Args:
+        dividend_period: DividendPeriod instance
+    
+    Returns:
+        DividendTierIndex: Empty (falsy) when the period has no active tiers
+    """
+    from kojenasacco.managers import get_current_db
+    from dividends.models import DividendRate
+    
+    key = (get_current_db(), dividend_period.pk)
+    entry = _dividend_tier_indexes.get(key)
+    
+    if entry is None or time.monotonic() - entry[0] > DIVIDEND_TIER_INDEX_TTL:
+        rates = DividendRate.objects.filter(
+            dividend_period_id=dividend_period.pk,
+            is_active=True
+        ).values('min_shares', 'max_shares', 'min_value', 'max_value', 'rate')
+        entry = (time.monotonic(), DividendTierIndex(list(rates)))
+        _dividend_tier_indexes[key] = entry
+    
+    return entry[1]
+
+
+def invalidate_dividend_tier_index(db_alias=None, period_id=None):
+    """
+    Drop cached dividend tier indexes.
+    
+    Args:
+        db_alias (str, optional): Tenant database (defaults to all)
+        period_id (optional): Dividend period (defaults to all periods)
+    """
+    for key in list(_dividend_tier_indexes):
+        if (db_alias is None or key[0] == db_alias) and (period_id is None or key[1] == period_id):
+            _dividend_tier_indexes.pop(key, None)
+
+
 def calculate_pro_rata_dividend(shares_value, total_shares_value, 
                                 total_dividend_pool, minimum_payout=None):
     """
@@ -601,6 +708,71 @@ def generate_disbursement_batch_number():
 # HELPER FUNCTIONS
 # =============================================================================
 
+class EligibleMember(NamedTuple):
+    """Record-date share position of a single dividend-eligible member."""
+    member_id: object
+    shares_count: Decimal
+    shares_value: Decimal
+
+
+def iter_eligible_members(dividend_period, share_capital=None, chunk_size=2000):
+    """
+    Stream the record-date share position of every eligible member.
+    
+    Positions are read from the share register snapshot at the record date
+    (each ACTIVE member's latest cumulative balance), or straight from
+    ShareHolding when the record date is today or later. Share capital is
+    read once.
+    
+    Args:
+        dividend_period: DividendPeriod instance
+        share_capital: Optional ShareCapital to value shares with
+            (defaults to the active share capital)
+        chunk_size (int): Rows fetched per database round trip
+    
+    Yields:
+        EligibleMember: (member_id, shares_count, shares_value) for every
+            member holding a positive number of shares
+    
+    Example:
+        >>> for row in iter_eligible_members(period):
+        ...     print(row.member_id, row.shares_count, row.shares_value)
+    """
+    from shares.models import ShareCapital, ShareHolding
+    from shares.utils import iter_register_snapshot
+    
+    if share_capital is None:
+        share_capital = ShareCapital.objects.filter(
+            is_active=True
+        ).order_by('-effective_date').first()
+    
+    if not share_capital:
+        logger.warning("No active share capital configured; no members are eligible")
+        return
+    
+    if dividend_period.record_date >= timezone.localdate():
+        # Record date not in the past: current holdings are the position
+        positions = ShareHolding.objects.filter(
+            member__status='ACTIVE',
+            shares_count__gt=0
+        ).order_by().values_list('member_id', 'shares_count').iterator(chunk_size=chunk_size)
+    else:
+        # Past record date: snapshot of the share register
+        positions = (
+            (position.member_id, position.shares_count)
+            for position in iter_register_snapshot(
+                dividend_period.record_date, active_only=True, chunk_size=chunk_size
+            )
+        )
+    
+    for member_id, shares_count in positions:
+        yield EligibleMember(
+            member_id,
+            shares_count,
+            calculate_total_shares_value(shares_count, share_capital.share_price)
+        )
+
+
 def get_eligible_members(dividend_period):
     """
     Get members eligible for dividends based on record date.
@@ -609,66 +781,11 @@ def get_eligible_members(dividend_period):
         dividend_period: DividendPeriod instance
     
     Returns:
-        list: List of dictionaries with member and share info
-            [
-                {
-                    'member': Member instance,
-                    'shares_count': int,
-                    'shares_value': Decimal
-                },
-                ...
-            ]
+        list: EligibleMember tuples (member_id, shares_count, shares_value),
+            see iter_eligible_members()
     """
-    from members.models import Member
-    from shares.models import ShareTransaction
-    
     try:
-        eligible_members = []
-        
-        # Get all active members
-        members = Member.objects.filter(status='ACTIVE')
-        
-        for member in members:
-            # Calculate shares as of record date
-            shares_transactions = ShareTransaction.objects.filter(
-                member=member,
-                transaction_date__lte=dividend_period.record_date,
-                is_reversed=False
-            )
-            
-            # Calculate total shares
-            shares_bought = shares_transactions.filter(
-                transaction_type='BUY'
-            ).aggregate(
-                total=Sum('shares_count')
-            )['total'] or 0
-            
-            shares_sold = shares_transactions.filter(
-                transaction_type='SELL'
-            ).aggregate(
-                total=Sum('shares_count')
-            )['total'] or 0
-            
-            net_shares = shares_bought - shares_sold
-            
-            if net_shares > 0:
-                # Get share price (you may need to adjust this based on your setup)
-                from shares.models import ShareCapital
-                share_capital = ShareCapital.objects.filter(
-                    is_active=True
-                ).first()
-                
-                if share_capital:
-                    shares_value = calculate_total_shares_value(
-                        net_shares,
-                        share_capital.share_price
-                    )
-                    
-                    eligible_members.append({
-                        'member': member,
-                        'shares_count': net_shares,
-                        'shares_value': shares_value
-                    })
+        eligible_members = list(iter_eligible_members(dividend_period))
         
         logger.info(f"Found {len(eligible_members)} eligible members for dividend period {dividend_period.name}")
         
@@ -679,6 +796,142 @@ def get_eligible_members(dividend_period):
         return []
 
 
+class ShareDaysPosition(NamedTuple):
+    """Time-weighted share holding of a single member over a dividend period."""
+    member_id: object
+    shares_count: Decimal
+    share_days: Decimal
+    average_shares: Decimal
+
+
+def iter_share_days(dividend_period, chunk_size=2000):
+    """
+    Stream the share-days held by every ACTIVE member over a dividend period.
+    
+    Share-days are the integral of a member's share balance over
+    [start_date, end_date], both inclusive: a transaction dated on day d
+    counts towards the balance from day d onwards. Opening balances come from
+    the share register snapshot on the eve of start_date, then a single
+    sweep over in-period transactions ordered by (member, date) accumulates
+    balance x days between consecutive changes. Work is O(transactions in the
+    period) regardless of how long the history is.
+    
+    Args:
+        dividend_period: DividendPeriod instance
+        chunk_size (int): Rows fetched per database round trip
+    
+    Yields:
+        ShareDaysPosition: (member_id, shares_count at end_date, share_days,
+            average_shares) for members with positive share-days
+    
+    Example:
+        >>> # 100 shares all year, bought 100 more on day 183 of 365
+        >>> [p.share_days for p in iter_share_days(period)]
+        [Decimal('54800.00')]
+    """
+    from shares.models import ShareTransaction
+    from shares.utils import iter_register_snapshot
+    
+    start_date = dividend_period.start_date
+    end_date = dividend_period.end_date
+    period_days = (end_date - start_date).days + 1
+    
+    if period_days <= 0:
+        return
+    
+    base = ShareTransaction.objects.filter(
+        member__status='ACTIVE',
+        status='COMPLETED',
+        is_reversed=False
+    )
+    
+    opening = {
+        position.member_id: position.shares_count
+        for position in iter_register_snapshot(
+            start_date - timedelta(days=1),
+            active_only=True,
+            positive_only=False,
+            chunk_size=chunk_size
+        )
+    }
+    
+    movements = base.filter(
+        transaction_date__date__gte=start_date,
+        transaction_date__date__lte=end_date,
+        transaction_type__in=SHARE_INFLOW_TYPES + SHARE_OUTFLOW_TYPES
+    ).order_by('member_id', 'transaction_date').values_list(
+        'member_id', 'transaction_date', 'transaction_type', 'shares_count'
+    )
+    
+    def close(member_id, balance, day_index, share_days):
+        share_days += max(balance, 0) * (period_days - day_index)
+        if share_days > 0:
+            return ShareDaysPosition(
+                member_id,
+                balance,
+                share_days,
+                (share_days / period_days).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            )
+        return None
+    
+    current = None
+    balance = share_days = Decimal('0.00')
+    day_index = 0
+    
+    for member_id, txn_date, txn_type, shares_count in movements.iterator(chunk_size=chunk_size):
+        if member_id != current:
+            if current is not None:
+                position = close(current, balance, day_index, share_days)
+                if position:
+                    yield position
+            current = member_id
+            balance = opening.pop(member_id, None) or Decimal('0.00')
+            share_days = Decimal('0.00')
+            day_index = 0
+        
+        txn_day = (timezone.localtime(txn_date).date() - start_date).days
+        share_days += max(balance, 0) * (txn_day - day_index)
+        day_index = txn_day
+        
+        if txn_type in SHARE_INFLOW_TYPES:
+            balance += shares_count
+        else:
+            balance -= shares_count
+    
+    if current is not None:
+        position = close(current, balance, day_index, share_days)
+        if position:
+            yield position
+    
+    # Members whose holding did not move during the period
+    for member_id, balance in opening.items():
+        position = close(member_id, balance or Decimal('0.00'), 0, Decimal('0.00'))
+        if position:
+            yield position
+
+
+def get_share_days_positions(dividend_period):
+    """
+    Get time-weighted share positions for a dividend period.
+    
+    Args:
+        dividend_period: DividendPeriod instance
+    
+    Returns:
+        list: ShareDaysPosition tuples, see iter_share_days()
+    """
+    try:
+        positions = list(iter_share_days(dividend_period))
+        
+        logger.info(f"Computed share-days for {len(positions)} members for dividend period {dividend_period.name}")
+        
+        return positions
+        
+    except Exception as e:
+        logger.error(f"Error computing share-days: {e}")
+        return []
+
+
 def calculate_period_statistics(member_dividends):
     """
     Calculate statistics for dividend period from member dividends.
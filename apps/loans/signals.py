@@ -8,6 +8,7 @@ Handles automatic operations on model save/delete:
 - Loan number generation
 - Payment number generation
 - Balance updates after payments
+- Member financial summary deltas
 - Status changes
 - Schedule generation
 - Automatic field population
@@ -224,6 +225,61 @@ def set_loan_financial_period(sender, instance, **kwargs):
             logger.warning(f"Could not set financial period for loan: {e}")
 
 
+@receiver(pre_save, sender=Loan)
+def remember_loan_exposure(sender, instance, **kwargs):
+    """
+    Remember the stored member, status and outstanding total of the loan so
+    post_save can apply only the change to the member's financial summary.
+    """
+    instance._previous_loan_exposure = None
+    
+    if instance._state.adding:
+        return
+    
+    previous = Loan.objects.filter(pk=instance.pk).values_list(
+        'member_id', 'status', 'outstanding_total'
+    ).first()
+    
+    if previous:
+        instance._previous_loan_exposure = previous
+
+
+@receiver(post_save, sender=Loan)
+def update_member_financial_summary_on_loan_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Apply the loan's change in exposure and active count to the member's summary.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    previous_member_id, previous_status, previous_outstanding = (
+        getattr(instance, '_previous_loan_exposure', None) or (None, None, Decimal('0.00'))
+    )
+    
+    def written(field, value, stored):
+        return value if update_fields is None or field in update_fields else stored
+    
+    member_id = written('member', instance.member_id, previous_member_id)
+    previous_exposure, previous_count = MemberFinancialSummaryService.loan_contribution(
+        previous_status, previous_outstanding
+    )
+    exposure, count = MemberFinancialSummaryService.loan_contribution(
+        written('status', instance.status, previous_status),
+        written('outstanding_total', instance.outstanding_total, previous_outstanding)
+    )
+    
+    deltas = {}
+    if previous_member_id is not None:
+        deltas[previous_member_id] = {'loan_exposure': -previous_exposure, 'active_loans_count': -previous_count}
+    changes = deltas.setdefault(member_id, {'loan_exposure': Decimal('0.00'), 'active_loans_count': 0})
+    changes['loan_exposure'] += exposure
+    changes['active_loans_count'] += count
+    
+    try:
+        MemberFinancialSummaryService.apply_deltas(deltas)
+    except Exception as e:
+        logger.error(f"Error updating member financial summary for loan {instance.loan_number}: {e}")
+
+
 @receiver(post_save, sender=Loan)
 def generate_loan_schedule_on_creation(sender, instance, created, **kwargs):
     """
@@ -488,6 +544,20 @@ def update_loan_schedule_after_payment(sender, instance, created, **kwargs):
         logger.debug(f"Updated loan schedule after payment {instance.payment_number}")
 
 
+@receiver(post_save, sender=LoanPayment)
+def record_member_activity_after_payment(sender, instance, created, **kwargs):
+    """
+    Record a repayment as financial activity of the borrower.
+    """
+    if created and not instance.is_reversed:
+        from members.services import MemberActivityService
+        
+        try:
+            MemberActivityService.record({instance.loan.member_id: instance.payment_date})
+        except Exception as e:
+            logger.error(f"Error recording member activity for payment {instance.payment_number}: {e}")
+
+
 @receiver(post_save, sender=LoanPayment)
 def log_payment_creation(sender, instance, created, **kwargs):
     """
@@ -685,6 +755,24 @@ def log_loan_deletion(sender, instance, **kwargs):
     )
 
 
+@receiver(post_delete, sender=Loan)
+def update_member_financial_summary_on_loan_deletion(sender, instance, **kwargs):
+    """
+    Remove a deleted loan's exposure from the member's summary.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    exposure, count = MemberFinancialSummaryService.loan_contribution(instance.status, instance.outstanding_total)
+    
+    if count:
+        try:
+            MemberFinancialSummaryService.apply_delta(
+                instance.member_id, loan_exposure=-exposure, active_loans_count=-count
+            )
+        except Exception as e:
+            logger.error(f"Error updating member financial summary after loan delete: {e}")
+
+
 @receiver(post_delete, sender=LoanPayment)
 def log_payment_deletion(sender, instance, **kwargs):
     """
@@ -731,6 +819,9 @@ def disable_loan_signals():
         (post_save, generate_loan_schedule_on_creation, Loan),
         (post_save, link_application_to_loan, Loan),
         (post_save, log_loan_creation, Loan),
+        (pre_save, remember_loan_exposure, Loan),
+        (post_save, update_member_financial_summary_on_loan_save, Loan),
+        (post_delete, update_member_financial_summary_on_loan_deletion, Loan),
         
         # Payment signals
         (pre_save, generate_payment_number, LoanPayment),
@@ -738,6 +829,7 @@ def disable_loan_signals():
         (pre_save, set_payment_financial_period, LoanPayment),
         (post_save, update_loan_balances_after_payment, LoanPayment),
         (post_save, update_loan_schedule_after_payment, LoanPayment),
+        (post_save, record_member_activity_after_payment, LoanPayment),
         (post_save, log_payment_creation, LoanPayment),
         
         # Schedule signals
@@ -786,6 +878,9 @@ def enable_loan_signals():
         (post_save, generate_loan_schedule_on_creation, Loan),
         (post_save, link_application_to_loan, Loan),
         (post_save, log_loan_creation, Loan),
+        (pre_save, remember_loan_exposure, Loan),
+        (post_save, update_member_financial_summary_on_loan_save, Loan),
+        (post_delete, update_member_financial_summary_on_loan_deletion, Loan),
         
         # Payment signals
         (pre_save, generate_payment_number, LoanPayment),
@@ -793,6 +888,7 @@ def enable_loan_signals():
         (pre_save, set_payment_financial_period, LoanPayment),
         (post_save, update_loan_balances_after_payment, LoanPayment),
         (post_save, update_loan_schedule_after_payment, LoanPayment),
+        (post_save, record_member_activity_after_payment, LoanPayment),
         (post_save, log_payment_creation, LoanPayment),
         
         # Schedule signals
@@ -11,9 +11,11 @@ from .models import (
     MemberGroup,
     GroupMembership
 )
+from .search import search_members
+from .photos import member_photo_url
 from utils.utils import parse_filters, paginate_queryset
 from .stats import (
-    get_member_statistics,
+    get_member_search_stats,
     get_payment_method_statistics,
     get_next_of_kin_statistics,
     get_group_statistics,
@@ -52,18 +54,6 @@ def member_search(request):
     # Start with all members
     members = Member.objects.all().select_related().order_by('-created_at')
 
-    # Apply text search
-    if query:
-        members = members.filter(
-            Q(member_number__icontains=query) |
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(middle_name__icontains=query) |
-            Q(id_number__icontains=query) |
-            Q(phone_primary__icontains=query) |
-            Q(personal_email__icontains=query)
-        )
-
     # Apply filters
     if status:
         members = members.filter(status=status)
@@ -99,40 +89,18 @@ def member_search(request):
         except (ValueError, TypeError):
             pass
 
-    # Get comprehensive statistics using statistics module
-    stats_filters = {}
-    if status:
-        stats_filters['status'] = status
-    if member_category:
-        stats_filters['member_category'] = member_category
-    if membership_plan:
-        stats_filters['membership_plan'] = membership_plan
-    if gender:
-        stats_filters['gender'] = gender
-    if employment_status:
-        stats_filters['employment_status'] = employment_status
-    if kyc_status:
-        stats_filters['kyc_status'] = kyc_status
-    if risk_rating:
-        stats_filters['risk_rating'] = risk_rating
-    if min_age:
-        try:
-            stats_filters['min_age'] = int(min_age)
-        except (ValueError, TypeError):
-            pass
-    if max_age:
-        try:
-            stats_filters['max_age'] = int(max_age)
-        except (ValueError, TypeError):
-            pass
-    
+    # Apply ranked text search within the filtered members
+    if query:
+        members = search_members(query, queryset=members)
+
+    # Single-pass stats over the filtered members, cached per filter set
     try:
-        stats = get_member_statistics(filters=stats_filters if stats_filters else None)
+        stats = get_member_search_stats(members, filters, scope='ajax')
     except Exception as e:
         logger.error(f"Error getting member statistics: {e}")
         stats = {
-            'total_members': members.count(),
-            'active_members': 0,
+            'total': members.count(),
+            'active': 0,
             'pending_approval': 0,
         }
 
@@ -269,7 +237,7 @@ def serialize_member_data(m):
         'risk_display': risk_display,
         'is_active': m.is_active,
         'is_kyc_verified': m.is_kyc_verified,
-        'member_photo': m.member_photo.url if m.member_photo else None,
+        'member_photo': member_photo_url(m, 'avatar') or None,
     }
 
 
@@ -906,4 +874,22 @@ def member_retention_analysis(request):
         return JsonResponse({
             'error': 'Failed to retrieve retention analysis',
             'message': str(e)
-        }, status=500)
\ No newline at end of file
+        }, status=500)
+
+
+def member_cohort_activity(request):
+    """
+    Get join-month x activity-month cohort matrix
+    """
+    try:
+        from .cohorts import get_cohort_activity_matrix
+        months = int(request.GET.get('months', 12))
+        
+        matrix = get_cohort_activity_matrix(months=months)
+        return JsonResponse(matrix)
+    except Exception as e:
+        logger.error(f"Error getting cohort activity: {e}")
+        return JsonResponse({
+            'error': 'Failed to retrieve cohort activity',
+            'message': str(e)
+        }, status=500)
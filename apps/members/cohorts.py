@@ -0,0 +1,323 @@
+# members/cohorts.py
+
+"""
+Member Cohort Analytics
+
+Calendar-month cohort charts for the members dashboard:
+- Join month x status (retention)
+- Join month x last financial activity month (activity curves)
+- New and cumulative members per month (growth)
+- New and active group memberships per month (group trends)
+
+Each chart is one GROUP BY over the tenant's members, folded into a
+matrix in Python. Results are cached per tenant database under a version
+number that is bumped whenever members join, leave or change status, so a
+chart is recomputed at most once per change or COHORT_CACHE_TTL.
+"""
+
+from datetime import date, datetime
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds a computed chart is served from cache. Activity curves move with
+# every posting and are only refreshed by this TTL.
+COHORT_CACHE_TTL = 3600
+
+# Member columns the cached charts depend on; saves touching none of them
+# leave the cache alone
+COHORT_FIELDS = ('membership_date', 'status', 'last_financial_activity_at')
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+def _version_key(db_alias):
+    return f"member_cohorts_version:{db_alias or 'default'}"
+
+
+def _cache_key(chart, *params):
+    """Cache key for one chart on the current SACCO database"""
+    from kojenasacco.managers import get_current_db
+
+    db_alias = get_current_db()
+    version = cache.get(_version_key(db_alias), 0)
+
+    return f"member_cohorts:{db_alias or 'default'}:{version}:{chart}:" + ':'.join(str(p) for p in params)
+
+
+def _cached(chart, params, build):
+    """Serve a chart from cache, building and storing it on a miss"""
+    key = _cache_key(chart, *params)
+
+    result = cache.get(key)
+    if result is None:
+        result = build()
+        cache.set(key, result, COHORT_CACHE_TTL)
+
+    return result
+
+
+def invalidate_cohort_cache(db_alias=None):
+    """
+    Drop cached cohort charts of a tenant.
+
+    Bumps the tenant's version number, so existing entries are never read
+    again and expire on their own.
+
+    Args:
+        db_alias (str, optional): Tenant database (defaults to the current one)
+    """
+    if db_alias is None:
+        from kojenasacco.managers import get_current_db
+        db_alias = get_current_db()
+
+    key = _version_key(db_alias)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, None)
+
+
+# =============================================================================
+# CALENDAR MONTHS
+# =============================================================================
+
+def _month_start(value):
+    """First day of the month of a date or datetime"""
+    if isinstance(value, datetime):
+        value = timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    return value.replace(day=1)
+
+
+def _add_months(month, count):
+    """Shift a first-of-month date by whole months"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_window(months):
+    """The last `months` calendar months, oldest first, ending this month"""
+    current = _month_start(timezone.now().date())
+    return [_add_months(current, offset) for offset in range(1 - months, 1)]
+
+
+# =============================================================================
+# COHORT CHARTS
+# =============================================================================
+
+def get_cohort_status_matrix(months=12):
+    """
+    Join-month x status matrix of members who joined in the last months.
+
+    Args:
+        months (int): Calendar months to analyze, including the current one
+
+    Returns:
+        dict: months_analyzed, statuses, data (one row per month with
+            joined, retained, retention_rate and by_status) and
+            average_retention_rate. Retained members are those still ACTIVE.
+    """
+    return _cached('status', (months,), lambda: _build_status_matrix(months))
+
+
+def _build_status_matrix(months):
+    from .models import Member
+
+    window = _month_window(months)
+
+    counts = {}
+    for cohort, status, count in Member.objects.filter(
+        membership_date__gte=window[0]
+    ).annotate(
+        cohort=TruncMonth('membership_date')
+    ).values_list('cohort', 'status').annotate(count=Count('pk')).order_by():
+        counts.setdefault(_month_start(cohort), {})[status] = count
+
+    data = []
+    for month in window:
+        by_status = counts.get(month, {})
+        joined = sum(by_status.values())
+        retained = by_status.get('ACTIVE', 0)
+        data.append({
+            'period': month.strftime('%Y-%m'),
+            'joined': joined,
+            'retained': retained,
+            'retention_rate': (retained / joined * 100) if joined > 0 else 0,
+            'by_status': by_status,
+        })
+
+    return {
+        'months_analyzed': months,
+        'statuses': [code for code, _label in Member.STATUS_CHOICES],
+        'data': data,
+        'average_retention_rate': sum(d['retention_rate'] for d in data) / len(data) if data else 0,
+    }
+
+
+def get_cohort_activity_matrix(months=12):
+    """
+    Join-month x activity-month matrix of members who joined in the last months.
+
+    For each join cohort, active[k] counts members whose last financial
+    activity falls in the k-th month after joining or later, i.e. who were
+    still transacting k months in.
+
+    Args:
+        months (int): Calendar months to analyze, including the current one
+
+    Returns:
+        dict: months_analyzed and data, one row per cohort with size,
+            never_active, active and rates (percent of size) per month offset
+    """
+    return _cached('activity', (months,), lambda: _build_activity_matrix(months))
+
+
+def _build_activity_matrix(months):
+    from .models import Member
+
+    window = _month_window(months)
+
+    counts = {}
+    for cohort, last_active, count in Member.objects.filter(
+        membership_date__gte=window[0]
+    ).annotate(
+        cohort=TruncMonth('membership_date'),
+        last_active=TruncMonth('last_financial_activity_at')
+    ).values_list('cohort', 'last_active').annotate(count=Count('pk')).order_by():
+        cohort = _month_start(cohort)
+        last_active = _month_start(last_active) if last_active is not None else None
+        counts.setdefault(cohort, {})
+        counts[cohort][last_active] = counts[cohort].get(last_active, 0) + count
+
+    data = []
+    for position, month in enumerate(window):
+        by_last_active = counts.get(month, {})
+        size = sum(by_last_active.values())
+
+        active = []
+        for offset in range(len(window) - position):
+            since = _add_months(month, offset)
+            active.append(sum(
+                count for last_active, count in by_last_active.items()
+                if last_active is not None and last_active >= since
+            ))
+
+        data.append({
+            'cohort': month.strftime('%Y-%m'),
+            'size': size,
+            'never_active': by_last_active.get(None, 0),
+            'active': active,
+            'rates': [(count / size * 100) if size > 0 else 0 for count in active],
+        })
+
+    return {
+        'months_analyzed': months,
+        'data': data,
+    }
+
+
+def get_member_growth(months=12):
+    """
+    New and cumulative members per calendar month.
+
+    Members who joined before the window are counted into the cumulative
+    total of the first month, from the same grouped query.
+
+    Args:
+        months (int): Calendar months to return, including the current one
+
+    Returns:
+        dict: period ('month'), data (period, new_members,
+            cumulative_members) and total_periods
+    """
+    return _cached('growth', (months,), lambda: _build_member_growth(months))
+
+
+def _build_member_growth(months):
+    from .models import Member
+
+    window = _month_window(months)
+
+    earlier = 0
+    new_members = {}
+    for month, count in Member.objects.filter(
+        membership_date__isnull=False
+    ).annotate(
+        month=TruncMonth('membership_date')
+    ).values_list('month').annotate(count=Count('pk')).order_by():
+        month = _month_start(month)
+        if month < window[0]:
+            earlier += count
+        else:
+            new_members[month] = new_members.get(month, 0) + count
+
+    data = []
+    cumulative = earlier
+    for month in window:
+        cumulative += new_members.get(month, 0)
+        data.append({
+            'period': month.strftime('%Y-%m-%d'),
+            'new_members': new_members.get(month, 0),
+            'cumulative_members': cumulative,
+        })
+
+    return {
+        'period': 'month',
+        'data': data,
+        'total_periods': len(data),
+    }
+
+
+def get_group_membership_growth(months=12):
+    """
+    New group memberships per calendar month, with how many are still active.
+
+    Args:
+        months (int): Calendar months to return, including the current one
+
+    Returns:
+        dict: period ('month'), data (period, new_memberships,
+            active_memberships) and total_periods
+    """
+    return _cached('groups', (months,), lambda: _build_group_membership_growth(months))
+
+
+def _build_group_membership_growth(months):
+    from .models import GroupMembership
+
+    window = _month_window(months)
+
+    counts = {}
+    for month, new_memberships, active_memberships in GroupMembership.objects.filter(
+        join_date__gte=window[0]
+    ).annotate(
+        month=TruncMonth('join_date')
+    ).values_list('month').annotate(
+        new_memberships=Count('pk'),
+        active_memberships=Count('pk', filter=Q(is_active=True))
+    ).order_by():
+        counts[_month_start(month)] = (new_memberships, active_memberships)
+
+    data = []
+    for month in window:
+        new_memberships, active_memberships = counts.get(month, (0, 0))
+        data.append({
+            'period': month.strftime('%Y-%m-%d'),
+            'new_memberships': new_memberships,
+            'active_memberships': active_memberships,
+        })
+
+    return {
+        'period': 'month',
+        'data': data,
+        'total_periods': len(data),
+    }
@@ -1220,4 +1220,48 @@ class GroupMembershipForm(BootstrapFormMixin, MoneyFieldsMixin, forms.ModelForm)
                     'member': f"{member.get_full_name()} is already an active member of {group.name}."
                 })
         
-        return cleaned_data
\ No newline at end of file
+        return cleaned_data
+
+# =============================================================================
+# MEMBER IMPORT FORM
+# =============================================================================
+
+class MemberImportForm(BootstrapFormMixin, forms.Form):
+    """Form for uploading a bulk member registration file"""
+    
+    import_file = forms.FileField(
+        label='Member File',
+        widget=forms.ClearableFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx'
+        }),
+        help_text=(
+            'CSV or Excel file with id_number, first_name, last_name, date_of_birth, gender, '
+            'phone_primary and physical_address columns, plus optional member, next of kin '
+            '(next_of_kin_name, ...) and payment method (payment_method_type, ...) columns'
+        )
+    )
+    
+    status = forms.ChoiceField(
+        label='Member Status',
+        choices=(
+            ('PENDING_APPROVAL', 'Pending Approval'),
+            ('ACTIVE', 'Active'),
+        ),
+        initial='PENDING_APPROVAL',
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        help_text='Status given to every imported member'
+    )
+    
+    dry_run = forms.BooleanField(
+        label='Dry run: validate the file and report errors without importing',
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+    
+    def clean_import_file(self):
+        import_file = self.cleaned_data['import_file']
+        if not import_file.name.lower().endswith(('.csv', '.xlsx', '.xlsm')):
+            raise ValidationError("Upload a .csv or .xlsx file")
+        return import_file
@@ -2,7 +2,8 @@
 
 from django.http import JsonResponse, HttpResponse
 from django.shortcuts import render, get_object_or_404
-from django.db.models import Q, Count, Sum, Avg, F, DecimalField, Case, When, Max, Min, IntegerField
+from django.db.models import Q, Count, Sum, Avg, F, DecimalField, Case, When, Max, Min, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.views.decorators.http import require_http_methods
 from datetime import timedelta
@@ -17,6 +18,9 @@ from .models import (
     MemberGroup,
     GroupMembership
 )
+from .search import search_members
+from .stats import get_member_search_stats
+from .typeahead import typeahead_members
 from core.utils import parse_filters, paginate_queryset, format_money
 
 logger = logging.getLogger(__name__)
@@ -26,17 +30,20 @@ logger = logging.getLogger(__name__)
 # MEMBER SEARCH
 # =============================================================================
 
-def member_search(request):
-    """HTMX-compatible member search with pagination and stats"""
+MEMBER_SEARCH_FILTERS = [
+    'q', 'status', 'member_category', 'membership_plan', 'gender',
+    'marital_status', 'employment_status', 'kyc_status', 'risk_rating',
+    'membership_date_from', 'membership_date_to', 'min_age', 'max_age',
+    'min_income', 'max_income', 'min_credit_score', 'max_credit_score',
+    'has_kyc_documents', 'tax_exemption', 'nationality'
+]
+
+
+def _filtered_members(request):
+    """Members matching the search panel's filters and search text"""
     
     # Parse filters
-    filters = parse_filters(request, [
-        'q', 'status', 'member_category', 'membership_plan', 'gender',
-        'marital_status', 'employment_status', 'kyc_status', 'risk_rating',
-        'membership_date_from', 'membership_date_to', 'min_age', 'max_age',
-        'min_income', 'max_income', 'min_credit_score', 'max_credit_score',
-        'has_kyc_documents', 'tax_exemption', 'nationality'
-    ])
+    filters = parse_filters(request, MEMBER_SEARCH_FILTERS)
     
     query = filters['q']
     status = filters['status']
@@ -60,45 +67,7 @@ def member_search(request):
     nationality = filters['nationality']
     
     # Build queryset
-    members = Member.objects.annotate(
-        savings_account_count=Count('savings_accounts', distinct=True),
-        active_loan_count=Count(
-            'loans',
-            filter=Q(loans__status='ACTIVE'),
-            distinct=True
-        ),
-        group_membership_count=Count(
-            'groupmembership',  
-            filter=Q(groupmembership__is_active=True),
-            distinct=True
-        ),
-        payment_method_count=Count('payment_methods', distinct=True),
-        next_of_kin_count=Count('next_of_kin', distinct=True)
-    ).order_by('-membership_date', 'member_number')
-    
-    # Apply text search with multi-word support
-    if query:
-        # Split query into words and search for each word across fields
-        words = query.strip().split()
-        
-        if words:
-            # Build combined query: each word must match at least one field
-            combined_q = Q()
-            
-            for word in words:
-                word_q = (
-                    Q(member_number__icontains=word) |
-                    Q(first_name__icontains=word) |
-                    Q(last_name__icontains=word) |
-                    Q(middle_name__icontains=word) |
-                    Q(id_number__icontains=word) |
-                    Q(phone_primary__icontains=word) |
-                    Q(personal_email__icontains=word) |
-                    Q(tax_id__icontains=word)
-                )
-                combined_q &= word_q
-            
-            members = members.filter(combined_q)
+    members = Member.objects.order_by('-membership_date', 'member_number')
     
     # Apply filters
     if status:
@@ -187,56 +156,82 @@ def member_search(request):
     if tax_exemption is not None:
         members = members.filter(tax_exemption_status=(tax_exemption.lower() == 'true'))
     
-    # Paginate
-    members_page, paginator = paginate_queryset(request, members, per_page=20)
-    
-    # Calculate stats
-    total = members.count()
+    # Apply ranked text search within the filtered members
+    if query:
+        members = search_members(query, queryset=members)
     
-    aggregates = members.aggregate(
-        avg_age=Avg(
-            Case(
-                When(
-                    date_of_birth__isnull=False,
-                    then=timezone.now().year - F('date_of_birth__year')
-                ),
-                output_field=DecimalField()
-            )
+    return members, filters
+
+
+def _related_count(queryset):
+    """Correlated subquery counting a member's related rows"""
+    return Coalesce(
+        Subquery(
+            queryset.filter(member=OuterRef('pk'))
+            .order_by()
+            .values('member')
+            .annotate(count=Count('pk'))
+            .values('count')[:1],
+            output_field=IntegerField()
         ),
-        avg_credit_score=Avg('credit_score'),
-        avg_income=Avg('monthly_income'),
-        total_income=Sum('monthly_income')
+        0
+    )
+
+
+def member_search(request):
+    """HTMX-compatible member search with pagination (stats load separately)"""
+    from savings.models import SavingsAccount
+    from loans.models import Loan
+    
+    members, filters = _filtered_members(request)
+    
+    # Per-row counts as correlated subqueries: evaluated for the page rows
+    # only, no multi-join DISTINCT
+    members = members.annotate(
+        savings_account_count=_related_count(SavingsAccount.objects.all()),
+        active_loan_count=_related_count(Loan.objects.filter(status='ACTIVE')),
+        group_membership_count=_related_count(GroupMembership.objects.filter(is_active=True)),
+        payment_method_count=_related_count(MemberPaymentMethod.objects.all()),
+        next_of_kin_count=_related_count(NextOfKin.objects.all())
     )
     
-    stats = {
-        'total': total,
-        'active': members.filter(status='ACTIVE').count(),
-        'pending_approval': members.filter(status='PENDING_APPROVAL').count(),
-        'dormant': members.filter(status='DORMANT').count(),
-        'suspended': members.filter(status='SUSPENDED').count(),
-        'blacklisted': members.filter(status='BLACKLISTED').count(),
-        'male': members.filter(gender='MALE').count(),
-        'female': members.filter(gender='FEMALE').count(),
-        'kyc_verified': members.filter(kyc_status='VERIFIED').count(),
-        'kyc_pending': members.filter(kyc_status='PENDING').count(),
-        'high_risk': members.filter(risk_rating__in=['HIGH', 'VERY_HIGH']).count(),
-        'low_risk': members.filter(risk_rating__in=['LOW', 'VERY_LOW']).count(),
-        'avg_age': round(aggregates['avg_age'] or 0, 1),
-        'avg_credit_score': round(aggregates['avg_credit_score'] or 0),
-        'avg_income': aggregates['avg_income'] or Decimal('0.00'),
-        'total_income': aggregates['total_income'] or Decimal('0.00'),
-    }
-    
-    # Format money in stats
-    stats['avg_income_formatted'] = format_money(stats['avg_income'])
-    stats['total_income_formatted'] = format_money(stats['total_income'])
+    # Paginate
+    members_page, paginator = paginate_queryset(request, members, per_page=20)
     
     return render(request, 'members/_member_results.html', {
         'members_page': members_page,
+        'stats_query': request.GET.urlencode(),
+    })
+
+
+def member_search_stats(request):
+    """HTMX fragment with the search panel's stats cards, loaded after results"""
+    
+    filters = parse_filters(request, MEMBER_SEARCH_FILTERS)
+    
+    stats = get_member_search_stats(lambda: _filtered_members(request)[0], filters)
+    
+    return render(request, 'members/_member_stats.html', {
         'stats': stats,
     })
 
 
+def member_typeahead(request):
+    """Typeahead member lookup for the "find member" box, served from memory"""
+    
+    query = request.GET.get('q', '').strip()
+    
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 25)
+    except (ValueError, TypeError):
+        limit = 10
+    
+    return JsonResponse({
+        'query': query,
+        'results': typeahead_members(query, limit=limit),
+    })
+
+
 # =============================================================================
 # MEMBER PAYMENT METHOD SEARCH
 # =============================================================================
@@ -913,7 +908,7 @@ def member_group_quick_stats(request):
 def member_detail_stats(request, member_id):
     """Get detailed statistics for a specific member"""
     
-    member = get_object_or_404(Member, id=member_id)
+    member = get_object_or_404(Member.objects.select_related('financial_summary'), id=member_id)
     
     stats = {
         'member_number': member.member_number,
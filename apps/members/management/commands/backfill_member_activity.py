@@ -0,0 +1,73 @@
+# members/management/commands/backfill_member_activity.py
+
+"""
+One-off backfill of Member.last_financial_activity_at from the ledgers.
+
+Takes the latest savings, loan repayment and share transaction of every
+member with one grouped query per ledger. Run once after deploying the
+column; afterwards the posting paths keep it current.
+
+USAGE EXAMPLES:
+===============
+
+# Backfill all SACCO databases
+python manage.py backfill_member_activity --all
+
+# Backfill one SACCO in batches of 1000 members
+python manage.py backfill_member_activity --sacco tumaini_sacco --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Populate member last financial activity from the ledgers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Members updated per statement (default: 2000)'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from members.services import MemberActivityService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    updated = MemberActivityService.backfill(batch_size=options['batch_size'])
+                self.stdout.write(self.style.SUCCESS(f"✓ {db_name}: {updated} members with activity"))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error backfilling member activity for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Backfill failed for {error_count} database(s)')
@@ -0,0 +1,140 @@
+# members/management/commands/benchmark_member_typeahead.py
+
+"""
+Benchmark the in-memory member typeahead index on synthetic members.
+
+Builds a MemberTypeaheadIndex from generated member rows (no database
+access) and reports build time, memory, lookup latency and incremental
+update cost.
+
+USAGE EXAMPLES:
+===============
+
+# Benchmark 100,000 members (default)
+python manage.py benchmark_member_typeahead
+
+# Larger tenant, more queries
+python manage.py benchmark_member_typeahead --members 250000 --queries 20000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+import random
+import time
+import tracemalloc
+import uuid
+
+FIRST_NAMES = [
+    'Aisha', 'Brian', 'Christine', 'David', 'Esther', 'Francis', 'Grace', 'Henry',
+    'Irene', 'Joseph', 'Kevin', 'Lydia', 'Moses', 'Noah', 'Olivia', 'Patrick',
+    'Rebecca', 'Samuel', 'Teddy', 'Violet', 'Wilson', 'Yusuf', 'Zainab', 'Joan',
+]
+LAST_NAMES = [
+    'Akello', 'Byaruhanga', 'Mugisha', 'Nakato', 'Okello', 'Ssempala', 'Tumusiime',
+    'Wasswa', 'Kato', 'Namubiru', 'Opio', 'Atim', 'Kiggundu', 'Nansubuga', 'Ochieng',
+    'Mukasa', 'Auma', 'Lubega', 'Nabirye', 'Ouma',
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the in-memory member typeahead index on synthetic members'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--members',
+            type=int,
+            default=100000,
+            help='Synthetic members to index'
+        )
+        parser.add_argument(
+            '--queries',
+            type=int,
+            default=5000,
+            help='Lookups to time'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed'
+        )
+
+    def handle(self, *args, **options):
+        from members.typeahead import MemberTypeaheadIndex
+
+        if options['members'] < 1 or options['queries'] < 1:
+            raise CommandError("--members and --queries must be positive")
+
+        rng = random.Random(options['seed'])
+        rows = [self._member_row(rng, number) for number in range(1, options['members'] + 1)]
+
+        started = time.perf_counter()
+        index = MemberTypeaheadIndex.build(rows)
+        build_seconds = time.perf_counter() - started
+
+        # Measured on a second build: tracing slows the build several times
+        tracemalloc.start()
+        traced = MemberTypeaheadIndex.build(rows)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del traced
+
+        self.stdout.write(
+            f"Index: {len(index):,} members built in {build_seconds:.2f}s, "
+            f"{memory / (1024 * 1024):.1f} MiB"
+        )
+
+        queries = [self._query(rng, rng.choice(rows)) for _ in range(options['queries'])]
+        timings = []
+        found = 0
+        for query in queries:
+            started = time.perf_counter()
+            found += bool(index.search(query, limit=10))
+            timings.append(time.perf_counter() - started)
+
+        timings.sort()
+        self.stdout.write(
+            f"Lookups: {len(queries):,} queries, {found / len(queries):.0%} with results | "
+            f"p50 {self._ms(timings, 0.50)} | p95 {self._ms(timings, 0.95)} | "
+            f"p99 {self._ms(timings, 0.99)} | max {timings[-1] * 1000:.2f}ms"
+        )
+
+        updates = [list(rng.choice(rows)) for _ in range(min(1000, len(rows)))]
+        started = time.perf_counter()
+        for row in updates:
+            row[4] = rng.choice(LAST_NAMES)
+            index.upsert(tuple(row))
+        update_seconds = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Updates: {len(updates):,} upserts, "
+            f"{update_seconds / len(updates) * 1000:.3f}ms each"
+        ))
+
+    @staticmethod
+    def _member_row(rng, number):
+        """Synthetic row ordered as TYPEAHEAD_FIELDS"""
+        return (
+            uuid.UUID(int=rng.getrandbits(128)),
+            f"MEM{number:06d}",
+            rng.choice(FIRST_NAMES),
+            rng.choice(FIRST_NAMES) if rng.random() < 0.3 else None,
+            rng.choice(LAST_NAMES),
+            f"07{rng.randint(0, 99999999):08d}",
+            rng.choice(['ACTIVE', 'ACTIVE', 'ACTIVE', 'DORMANT', 'PENDING_APPROVAL']),
+        )
+
+    @staticmethod
+    def _query(rng, row):
+        """A teller-style query for a member: number, phone or partial names"""
+        style = rng.random()
+        if style < 0.3:
+            return row[1][:rng.randint(4, len(row[1]))]
+        if style < 0.6:
+            return row[5][:rng.randint(4, len(row[5]))]
+        if style < 0.8:
+            return row[2][:rng.randint(2, len(row[2]))]
+        return f"{row[2][:3]} {row[4][:rng.randint(2, len(row[4]))]}"
+
+    @staticmethod
+    def _ms(timings, quantile):
+        return f"{timings[min(len(timings) - 1, int(len(timings) * quantile))] * 1000:.2f}ms"
@@ -0,0 +1,87 @@
+# members/management/commands/build_member_photo_renditions.py
+
+"""
+Build the avatar and profile renditions of existing member photos.
+
+New uploads are rendered by the background worker; run this once after
+deploying the image pipeline or adding or dropping a rendition, and with
+--force after changing rendition dimensions or encoder settings.
+
+USAGE EXAMPLES:
+===============
+
+# Render photos of all SACCO databases
+python manage.py build_member_photo_renditions --all
+
+# Re-render every photo of one SACCO with 8 worker threads
+python manage.py build_member_photo_renditions --sacco tumaini_sacco --workers 8 --force
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Build resized WebP/JPEG renditions of member photos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Photos rendered in parallel (default: 4)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render photos whose renditions are already current'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from members.photos import build_all_renditions
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    results = build_all_renditions(
+                        force=options['force'],
+                        max_workers=options['workers']
+                    )
+                style = self.style.WARNING if results['failed'] else self.style.SUCCESS
+                self.stdout.write(style(
+                    f"✓ {db_name}: {results['built']} photos rendered, "
+                    f"{results['skipped']} already current, {results['failed']} failed"
+                ))
+                for error in results['errors'][:10]:
+                    self.stderr.write(f"    {error}")
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error building member photo renditions for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Rendering failed for {error_count} database(s)')
@@ -0,0 +1,115 @@
+# members/management/commands/import_members.py
+
+"""
+Import members in bulk from a CSV or Excel file into one SACCO.
+
+Rows are validated in memory and inserted chunk by chunk. Each committed
+chunk is checkpointed, so running the command again with the same file
+after an interruption continues after the last imported chunk. Run with
+--dry-run first to get the error report without writing any member.
+
+USAGE EXAMPLES:
+===============
+
+# Validate a file and write the error report
+python manage.py import_members members.xlsx --sacco tumaini_sacco --dry-run --errors rejected.csv
+
+# Import as active members
+python manage.py import_members members.xlsx --sacco tumaini_sacco --status ACTIVE
+
+# Start over instead of resuming an interrupted import of the same file
+python manage.py import_members members.csv --sacco tumaini_sacco --no-resume
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import csv
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Import members in bulk from a CSV or Excel file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'file',
+            type=str,
+            help='Path to a .csv or .xlsx member file'
+        )
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            required=True,
+            help='Database alias of SACCO to import into (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate every row and report errors without importing'
+        )
+        parser.add_argument(
+            '--status',
+            type=str,
+            default='PENDING_APPROVAL',
+            help='Status given to imported members (default: PENDING_APPROVAL)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Rows per chunk'
+        )
+        parser.add_argument(
+            '--no-resume',
+            action='store_true',
+            help='Start a new import even if this file was interrupted before'
+        )
+        parser.add_argument(
+            '--errors',
+            type=str,
+            help='Write rejected rows to this CSV file'
+        )
+
+    def handle(self, *args, **options):
+        if options['sacco'] not in settings.DATABASES:
+            raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        if not os.path.exists(options['file']):
+            raise CommandError(f"File '{options['file']}' not found")
+
+        from members.services import MemberImportService
+
+        with DatabaseContext(options['sacco']), open(options['file'], 'rb') as uploaded_file:
+            success, result = MemberImportService.import_file(
+                uploaded_file,
+                dry_run=options['dry_run'],
+                status=options['status'],
+                chunk_size=options['chunk_size'],
+                resume=not options['no_resume']
+            )
+
+        if not success:
+            raise CommandError(f"✗ {options['sacco']}: {result}")
+
+        if options['errors'] and result.rejections:
+            with open(options['errors'], 'w', newline='', encoding='utf-8') as report:
+                writer = csv.writer(report)
+                writer.writerow(['Line', 'ID Number', 'Name', 'Reason'])
+                for rejection in result.rejections:
+                    writer.writerow([
+                        rejection['line'],
+                        rejection['id_number'] or '',
+                        rejection['name'] or '',
+                        rejection['reason'],
+                    ])
+
+        style = self.style.WARNING if result.rejected_count else self.style.SUCCESS
+        self.stdout.write(style(
+            f"✓ {options['sacco']}: {result.total_rows} row(s) read, "
+            f"{result.imported_count} {'can be imported' if result.dry_run else 'imported'}, "
+            f"{result.rejected_count} rejected"
+            + (f" (report: {options['errors']})" if options['errors'] and result.rejections else "")
+        ))
@@ -0,0 +1,94 @@
+# members/management/commands/rebuild_member_search_index.py
+
+"""
+Rebuild the member search token index.
+
+Tokens are normally kept current by the Member post_save signal. Run this
+after deploying the search index, after bulk imports done with signals
+disabled, or when the tokenization rules change.
+
+USAGE EXAMPLES:
+===============
+
+# Rebuild the index for all SACCO databases
+python manage.py rebuild_member_search_index --all
+
+# Rebuild the index for a specific SACCO
+python manage.py rebuild_member_search_index --sacco tumaini_sacco
+
+# Reindex a single member
+python manage.py rebuild_member_search_index --sacco tumaini_sacco --member MEM0001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the member search token index'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--member',
+            type=str,
+            help='Member number of a single member to reindex'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Members per delete/insert round'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from members.models import Member
+        from members.search import rebuild_search_index
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    members = Member.objects.all()
+                    if options['member']:
+                        members = members.filter(member_number=options['member'])
+                        if not members.exists():
+                            raise CommandError(f"Member '{options['member']}' not found")
+
+                    member_count, token_count = rebuild_search_index(
+                        members,
+                        batch_size=options['batch_size']
+                    )
+                    self.stdout.write(self.style.SUCCESS(
+                        f"✓ {db_name}: {member_count} member(s) indexed, "
+                        f"{token_count} token(s) written"
+                    ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error rebuilding member search index for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Member search index rebuild failed for {error_count} database(s)')
@@ -0,0 +1,102 @@
+# members/management/commands/reconcile_member_financial_summaries.py
+
+"""
+Reconcile materialized member financial summaries against the savings,
+loan, share and dividend ledgers.
+
+Summaries are normally kept current by deltas from the posting paths. Run
+this nightly to seed members without a summary and repair any drift, for
+example after bulk imports done with signals disabled. Drifted members are
+logged with their stored and recomputed values.
+
+USAGE EXAMPLES:
+===============
+
+# Reconcile all SACCO databases (nightly cron)
+python manage.py reconcile_member_financial_summaries --all
+
+# Reconcile a specific SACCO
+python manage.py reconcile_member_financial_summaries --sacco tumaini_sacco
+
+# Reconcile a single member
+python manage.py reconcile_member_financial_summaries --sacco tumaini_sacco --member MEM0001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Reconcile member financial summaries against the savings, loan, share and dividend ledgers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--member',
+            type=str,
+            help='Member number of a single member to reconcile'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Members per reconciliation chunk'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from members.models import Member
+        from members.services import MemberFinancialSummaryService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    member_ids = None
+                    if options['member']:
+                        member_ids = list(
+                            Member.objects.filter(
+                                member_number=options['member']
+                            ).values_list('pk', flat=True)
+                        )
+                        if not member_ids:
+                            raise CommandError(f"Member '{options['member']}' not found")
+
+                    result = MemberFinancialSummaryService.rebuild(
+                        member_ids=member_ids,
+                        batch_size=options['batch_size']
+                    )
+                    style = self.style.WARNING if result['corrected'] else self.style.SUCCESS
+                    self.stdout.write(style(
+                        f"✓ {db_name}: {result['members']} member(s) reconciled, "
+                        f"{result['created']} summary(ies) created, "
+                        f"{result['corrected']} drifted summary(ies) corrected"
+                    ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error reconciling member financial summaries for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Member financial summary reconciliation failed for {error_count} database(s)')
@@ -0,0 +1,87 @@
+# members/management/commands/sweep_dormant_members.py
+
+"""
+Daily job that marks active members without recent financial activity as
+dormant.
+
+Runs a single UPDATE against the indexed last_financial_activity_at column.
+Members who never transacted are judged by their membership date.
+
+USAGE EXAMPLES:
+===============
+
+# Sweep all SACCO databases with the default 6 months of inactivity
+python manage.py sweep_dormant_members --all
+
+# Sweep one SACCO with 12 months of inactivity as of a specific date
+python manage.py sweep_dormant_members --sacco tumaini_sacco --months 12 --date 2025-01-15
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Mark members without recent financial activity as dormant'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--months',
+            type=int,
+            default=6,
+            help='Months without financial activity before dormancy (default: 6)'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='Reference date (YYYY-MM-DD), defaults to today'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        as_of = None
+        if options['date']:
+            try:
+                as_of = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("--date must be in YYYY-MM-DD format")
+
+        from members.services import MemberActivityService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    marked = MemberActivityService.sweep_dormant_members(options['months'], as_of)
+                self.stdout.write(self.style.SUCCESS(f"✓ {db_name}: {marked} members marked dormant"))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error sweeping dormant members for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Dormancy sweep failed for {error_count} database(s)')
@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-18 22:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(help_text='Lowercase alphanumeric value, prefix or trigram', max_length=32, verbose_name='Token')),
+                ('kind', models.CharField(choices=[('MEMBER_NUMBER', 'Member Number'), ('ID_NUMBER', 'ID Number'), ('PHONE', 'Phone Number'), ('TAX_ID', 'Tax ID'), ('EMAIL', 'Email'), ('NAME', 'Name'), ('TRIGRAM', 'Name Trigram')], max_length=15, verbose_name='Kind')),
+                ('is_exact', models.BooleanField(default=False, help_text='Token is the complete value rather than a prefix', verbose_name='Exact')),
+                ('member', models.ForeignKey(help_text='Member this token finds', on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Member Search Token',
+                'verbose_name_plural': 'Member Search Tokens',
+                'db_table': 'member_search_tokens',
+                'indexes': [models.Index(fields=['token', 'kind'], name='member_sear_token_bc30fb_idx')],
+            },
+        ),
+    ]
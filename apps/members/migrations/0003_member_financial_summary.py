@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-18 22:26
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_member_search_tokens'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberFinancialSummary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Updated At')),
+                ('created_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who created this record', max_length=50, null=True, verbose_name='Created By ID')),
+                ('updated_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who last updated this record', max_length=50, null=True, verbose_name='Updated By ID')),
+                ('created_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Created From IP')),
+                ('updated_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Updated From IP')),
+                ('change_reason', models.CharField(blank=True, max_length=255, null=True, verbose_name='Change Reason')),
+                ('total_savings', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Current balance of active and dormant savings accounts', max_digits=15, verbose_name='Total Savings')),
+                ('loan_exposure', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Outstanding total of active loans', max_digits=15, verbose_name='Loan Exposure')),
+                ('active_loans_count', models.IntegerField(default=0, verbose_name='Active Loans')),
+                ('total_shares', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text="Share capital value from the member's share holding", max_digits=15, verbose_name='Share Capital')),
+                ('dividends_paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Net dividends paid to the member', max_digits=15, verbose_name='Dividends Paid')),
+                ('last_activity_at', models.DateTimeField(blank=True, help_text='Latest posting applied to this summary', null=True, verbose_name='Last Activity')),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True, verbose_name='Last Reconciled')),
+                ('member', models.OneToOneField(help_text='Member this summary belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='financial_summary', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Member Financial Summary',
+                'verbose_name_plural': 'Member Financial Summaries',
+                'db_table': 'member_financial_summaries',
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-18 22:57
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0003_member_financial_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberImport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Updated At')),
+                ('created_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who created this record', max_length=50, null=True, verbose_name='Created By ID')),
+                ('updated_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who last updated this record', max_length=50, null=True, verbose_name='Updated By ID')),
+                ('created_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Created From IP')),
+                ('updated_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Updated From IP')),
+                ('change_reason', models.CharField(blank=True, max_length=255, null=True, verbose_name='Change Reason')),
+                ('file_name', models.CharField(max_length=255, verbose_name='File Name')),
+                ('file_hash', models.CharField(db_index=True, help_text='SHA-256 of the uploaded file, used to resume interrupted imports', max_length=64, verbose_name='File Hash')),
+                ('dry_run', models.BooleanField(default=False, help_text='Validated only, nothing written', verbose_name='Dry Run')),
+                ('status', models.CharField(choices=[('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='RUNNING', max_length=20, verbose_name='Status')),
+                ('total_rows', models.IntegerField(default=0, verbose_name='Rows Read')),
+                ('imported_count', models.IntegerField(default=0, verbose_name='Members Imported')),
+                ('rejected_count', models.IntegerField(default=0, verbose_name='Rows Rejected')),
+                ('last_line', models.IntegerField(default=0, help_text='File line of the last committed chunk (resume checkpoint)', verbose_name='Last Committed Line')),
+                ('rejections', models.JSONField(blank=True, default=list, help_text='Rejected rows with line, ID number, name and reason', verbose_name='Rejections')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='Error Message')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Completed At')),
+            ],
+            options={
+                'verbose_name': 'Member Import',
+                'verbose_name_plural': 'Member Imports',
+                'db_table': 'member_imports',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-18 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0004_member_import'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='last_financial_activity_at',
+            field=models.DateTimeField(blank=True, help_text='Latest member-initiated savings, loan repayment or share transaction, maintained by the posting paths', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['status', 'last_financial_activity_at'], name='members_status_7158eb_idx'),
+        ),
+    ]
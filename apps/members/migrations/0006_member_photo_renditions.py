@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 23:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0005_member_last_financial_activity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='photo_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of the photo, maintained by members.photos'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0006_member_photo_renditions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='memberfinancialsummary',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, help_text='Latest member-initiated financial activity, as Member.last_financial_activity_at', null=True, verbose_name='Last Activity'),
+        ),
+    ]
@@ -6,15 +6,48 @@ from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from utils.models import BaseModel
+from kojenasacco.managers import SaccoManager
 from decimal import Decimal
 from django.db.models import Q
+from contextlib import contextmanager
 import logging
+import threading
 
 # Import central utilities
 from core.utils import get_base_currency, format_money, get_active_fiscal_period
 
 logger = logging.getLogger(__name__)
 
+_validation_state = threading.local()
+
+
+@contextmanager
+def trusted_member_saves():
+    """
+    Skip Member.save() validation inside this block.
+    
+    For batch code whose values were already validated or computed by the
+    system (imports after their own checks, scoring and status jobs), where
+    full_clean() would add a SELECT per unique field on every save. The flag
+    is thread-local so other requests keep their normal validation.
+    
+    Usage:
+        with trusted_member_saves():
+            for member in members:
+                member.save(update_fields=['credit_score', 'updated_at'])
+    """
+    previous = getattr(_validation_state, 'trusted', False)
+    _validation_state.trusted = True
+    try:
+        yield
+    finally:
+        _validation_state.trusted = previous
+
+
+def member_validation_skipped():
+    """Check whether Member.save() validation is skipped for this thread"""
+    return getattr(_validation_state, 'trusted', False)
+
 
 # =============================================================================
 # CORE MEMBER MODEL
@@ -236,6 +269,13 @@ class Member(BaseModel):
     status_changed_date = models.DateTimeField(auto_now_add=True)
     status_changed_reason = models.TextField(blank=True, null=True)
     
+    last_financial_activity_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Latest member-initiated savings, loan repayment or share transaction, "
+                  "maintained by the posting paths"
+    )
+    
     # Membership benefits and limits
     maximum_loan_multiplier = models.DecimalField(
         max_digits=5, 
@@ -389,6 +429,13 @@ class Member(BaseModel):
         help_text="Member's photograph"
     )
     
+    photo_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies of the photo, maintained by members.photos"
+    )
+    
     # =============================================================================
     # PROPERTIES (INCLUDING MONETARY FORMATTING)
     # =============================================================================
@@ -460,8 +507,30 @@ class Member(BaseModel):
     # FINANCIAL AGGREGATION METHODS (WITH FORMATTING)
     # =============================================================================
     
+    def get_financial_summary(self):
+        """
+        Get the member's materialized financial summary.
+        
+        Load summaries for many members at once with
+        MemberFinancialSummaryService.prefetch().
+        
+        Returns:
+            MemberFinancialSummary or None: None until the summary is seeded
+                by a posting or reconciliation
+        """
+        from django.core.exceptions import ObjectDoesNotExist
+        
+        try:
+            return self.financial_summary
+        except ObjectDoesNotExist:
+            return None
+    
     def get_total_savings(self):
         """Get total savings across all savings accounts"""
+        summary = self.get_financial_summary()
+        if summary is not None:
+            return summary.total_savings
+        
         try:
             total = self.savings_accounts.filter(
                 status__in=['ACTIVE', 'DORMANT']
@@ -480,6 +549,10 @@ class Member(BaseModel):
     
     def get_total_loans(self):
         """Get total outstanding loan amount"""
+        summary = self.get_financial_summary()
+        if summary is not None:
+            return summary.loan_exposure
+        
         try:
             total = self.loans.filter(
                 status='ACTIVE'
@@ -498,13 +571,24 @@ class Member(BaseModel):
     
     def get_active_loans_count(self):
         """Get count of active loans"""
+        summary = self.get_financial_summary()
+        if summary is not None:
+            return summary.active_loans_count
+        
         return self.loans.filter(status='ACTIVE').count()
     
     def get_total_shares(self):
-        """Get total share capital value"""
-        # This would integrate with a shares model if you have one
-        # For now, return 0
-        return Decimal('0.00')
+        """Get total share capital value from the materialized share holding"""
+        from django.core.exceptions import ObjectDoesNotExist
+        
+        summary = self.get_financial_summary()
+        if summary is not None:
+            return summary.total_shares
+        
+        try:
+            return self.share_holding.total_value
+        except ObjectDoesNotExist:
+            return Decimal('0.00')
     
     @property
     def formatted_total_shares(self):
@@ -513,6 +597,10 @@ class Member(BaseModel):
     
     def get_total_dividends(self):
         """Get total dividends earned"""
+        summary = self.get_financial_summary()
+        if summary is not None:
+            return summary.dividends_paid
+        
         try:
             total = self.dividends.filter(
                 status='PAID'
@@ -626,17 +714,9 @@ class Member(BaseModel):
     
     def update_risk_rating(self):
         """Update risk rating based on credit score"""
-        if self.credit_score >= 800:
-            self.risk_rating = 'VERY_LOW'
-        elif self.credit_score >= 650:
-            self.risk_rating = 'LOW'
-        elif self.credit_score >= 500:
-            self.risk_rating = 'MEDIUM'
-        elif self.credit_score >= 350:
-            self.risk_rating = 'HIGH'
-        else:
-            self.risk_rating = 'VERY_HIGH'
+        from .utils import calculate_risk_rating
         
+        self.risk_rating = calculate_risk_rating(self.credit_score)
         self.risk_assessment_date = timezone.now()
         self.save(update_fields=['risk_rating', 'risk_assessment_date'])
     
@@ -705,6 +785,42 @@ class Member(BaseModel):
         if errors:
             raise ValidationError(errors)
     
+    def validate_fields(self, field_names):
+        """
+        Validate only the given fields.
+        
+        Field validation, unique checks and constraints run for the given
+        fields alone, so a save(update_fields=['credit_score']) costs no
+        uniqueness queries. clean() runs when an age-related date is written.
+        
+        Args:
+            field_names: Field names or attnames being written
+        
+        Raises:
+            ValidationError: With errors keyed by field
+        """
+        field_names = set(field_names)
+        exclude = {
+            field.name for field in self._meta.concrete_fields
+            if field.name not in field_names and field.attname not in field_names
+        }
+        
+        errors = {}
+        for validate in (self.clean_fields, self.validate_unique, self.validate_constraints):
+            try:
+                validate(exclude=exclude)
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+        
+        if field_names & {'date_of_birth', 'membership_date'}:
+            try:
+                self.clean()
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+        
+        if errors:
+            raise ValidationError(errors)
+    
     def save(self, *args, **kwargs):
         """Enhanced save with automatic calculations"""
         # Set basic defaults for new members
@@ -732,12 +848,23 @@ class Member(BaseModel):
                 
                 self.credit_score = min(1000, max(0, base_score))
         
-        # Validate before saving, but exclude member_number if it's not set yet
-        # (the pre_save signal will generate it)
-        if not self.member_number:
-            self.full_clean(exclude=['member_number'])
+        # Validation policy:
+        # - full saves (forms, service entry points) run full_clean()
+        # - save(update_fields=...) validates only the written fields
+        # - trusted_member_saves() blocks skip validation entirely
+        update_fields = kwargs.get('update_fields')
+        
+        if member_validation_skipped():
+            pass
+        elif update_fields is None:
+            # Exclude member_number if it's not set yet
+            # (the pre_save signal will generate it)
+            if not self.member_number:
+                self.full_clean(exclude=['member_number'])
+            else:
+                self.full_clean()
         else:
-            self.full_clean()
+            self.validate_fields(update_fields)
         
         # Call parent save
         super().save(*args, **kwargs)
@@ -771,6 +898,7 @@ class Member(BaseModel):
             models.Index(fields=['first_name', 'last_name']),
             models.Index(fields=['phone_primary']),
             models.Index(fields=['personal_email']),
+            models.Index(fields=['status', 'last_financial_activity_at']),
         ]
         
         constraints = [
@@ -1871,4 +1999,240 @@ class GroupMembership(BaseModel):
             models.Index(fields=['is_active']),
             models.Index(fields=['join_date']),
             models.Index(fields=['role']),
-        ]
\ No newline at end of file
+        ]
+
+
+# =============================================================================
+# MEMBER SEARCH TOKEN MODEL
+# =============================================================================
+
+class MemberSearchToken(models.Model):
+    """
+    Normalized search token for indexed member lookup.
+    
+    Each searchable member value (member number, ID, phone, tax ID, email,
+    names) is stored in full and as its prefixes, and names also as
+    trigrams for fuzzy matching, so every lookup is an indexed equality
+    match. Maintained by members.search on Member save; rebuild with
+    `manage.py rebuild_member_search_index`.
+    
+    Deliberately narrow - no BaseModel audit columns - since the table holds
+    dozens of rows per member.
+    """
+    
+    KIND_CHOICES = [
+        ('MEMBER_NUMBER', 'Member Number'),
+        ('ID_NUMBER', 'ID Number'),
+        ('PHONE', 'Phone Number'),
+        ('TAX_ID', 'Tax ID'),
+        ('EMAIL', 'Email'),
+        ('NAME', 'Name'),
+        ('TRIGRAM', 'Name Trigram'),
+    ]
+    
+    member = models.ForeignKey(
+        Member,
+        on_delete=models.CASCADE,
+        related_name='search_tokens',
+        help_text="Member this token finds"
+    )
+    
+    token = models.CharField(
+        "Token",
+        max_length=32,
+        help_text="Lowercase alphanumeric value, prefix or trigram"
+    )
+    
+    kind = models.CharField(
+        "Kind",
+        max_length=15,
+        choices=KIND_CHOICES
+    )
+    
+    is_exact = models.BooleanField(
+        "Exact",
+        default=False,
+        help_text="Token is the complete value rather than a prefix"
+    )
+    
+    # Use SaccoManager for automatic database routing
+    objects = SaccoManager()
+    
+    def __str__(self):
+        return f"{self.member_id}: {self.kind} {self.token}"
+    
+    class Meta:
+        db_table = 'member_search_tokens'
+        verbose_name = 'Member Search Token'
+        verbose_name_plural = 'Member Search Tokens'
+        indexes = [
+            models.Index(fields=['token', 'kind']),
+        ]
+
+
+# =============================================================================
+# MEMBER FINANCIAL SUMMARY MODEL
+# =============================================================================
+
+class MemberFinancialSummary(BaseModel):
+    """
+    Materialized financial position per member.
+    
+    Maintained with F-expression deltas by the savings, loan, share and
+    dividend posting paths, so member pages and lists read one row instead
+    of aggregating each ledger. Reconciled against the ledgers nightly with
+    `manage.py reconcile_member_financial_summaries`.
+    """
+    
+    member = models.OneToOneField(
+        Member,
+        on_delete=models.CASCADE,
+        related_name='financial_summary',
+        help_text="Member this summary belongs to"
+    )
+    
+    total_savings = models.DecimalField(
+        "Total Savings",
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Current balance of active and dormant savings accounts"
+    )
+    
+    loan_exposure = models.DecimalField(
+        "Loan Exposure",
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Outstanding total of active loans"
+    )
+    
+    active_loans_count = models.IntegerField(
+        "Active Loans",
+        default=0
+    )
+    
+    total_shares = models.DecimalField(
+        "Share Capital",
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Share capital value from the member's share holding"
+    )
+    
+    dividends_paid = models.DecimalField(
+        "Dividends Paid",
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Net dividends paid to the member"
+    )
+    
+    last_activity_at = models.DateTimeField(
+        "Last Activity",
+        null=True,
+        blank=True,
+        help_text="Latest member-initiated financial activity, as Member.last_financial_activity_at"
+    )
+    
+    reconciled_at = models.DateTimeField(
+        "Last Reconciled",
+        null=True,
+        blank=True
+    )
+    
+    def __str__(self):
+        return f"{self.member_id} - savings {self.total_savings}, loans {self.loan_exposure}"
+    
+    class Meta:
+        db_table = 'member_financial_summaries'
+        verbose_name = 'Member Financial Summary'
+        verbose_name_plural = 'Member Financial Summaries'
+
+
+# =============================================================================
+# MEMBER IMPORT MODEL
+# =============================================================================
+
+class MemberImport(BaseModel):
+    """
+    One bulk member import run, its rejection report and checkpoint.
+    
+    MemberImportService commits a file chunk by chunk and records the last
+    committed line after each chunk, so an interrupted import of the same
+    file resumes after it instead of starting over.
+    """
+    
+    STATUS_CHOICES = (
+        ('RUNNING', 'Running'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+    )
+    
+    file_name = models.CharField(
+        "File Name",
+        max_length=255
+    )
+    
+    file_hash = models.CharField(
+        "File Hash",
+        max_length=64,
+        db_index=True,
+        help_text="SHA-256 of the uploaded file, used to resume interrupted imports"
+    )
+    
+    dry_run = models.BooleanField(
+        "Dry Run",
+        default=False,
+        help_text="Validated only, nothing written"
+    )
+    
+    status = models.CharField(
+        "Status",
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='RUNNING'
+    )
+    
+    total_rows = models.IntegerField("Rows Read", default=0)
+    imported_count = models.IntegerField("Members Imported", default=0)
+    rejected_count = models.IntegerField("Rows Rejected", default=0)
+    
+    last_line = models.IntegerField(
+        "Last Committed Line",
+        default=0,
+        help_text="File line of the last committed chunk (resume checkpoint)"
+    )
+    
+    rejections = models.JSONField(
+        "Rejections",
+        default=list,
+        blank=True,
+        help_text="Rejected rows with line, ID number, name and reason"
+    )
+    
+    error_message = models.TextField(
+        "Error Message",
+        blank=True,
+        null=True
+    )
+    
+    completed_at = models.DateTimeField(
+        "Completed At",
+        null=True,
+        blank=True
+    )
+    
+    def __str__(self):
+        return f"{self.file_name} - {self.get_status_display()} ({self.imported_count} imported)"
+    
+    @property
+    def is_resumable(self):
+        """Whether this import stopped before the end of its file"""
+        return not self.dry_run and self.status in ('RUNNING', 'FAILED')
+    
+    class Meta:
+        db_table = 'member_imports'
+        verbose_name = 'Member Import'
+        verbose_name_plural = 'Member Imports'
+        ordering = ['-created_at']
@@ -0,0 +1,335 @@
+# members/photos.py
+
+"""
+Member Photo Renditions
+
+Fixed-size WebP and JPEG copies of member photos for the pages that show
+them:
+- avatar: member lists, search results and group rosters
+- profile: the member profile header
+
+Renditions are written next to the original under names carrying a hash of
+the original's content, so a replaced photo never reuses a cached URL and
+rebuilding an unchanged photo rewrites nothing. The names are recorded on
+Member.photo_renditions, which templates read through the member_photos
+tag library without touching storage. Files of the previously recorded
+renditions are deleted once the new ones are recorded.
+
+Uploads are rendered by a background worker thread after the saving
+transaction commits; `manage.py build_member_photo_renditions` renders
+existing photos in parallel.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Rendition name -> (width, height, crop). Cropped renditions are filled to
+# the exact box, the others are fitted inside it. Sizes are twice the CSS
+# size for high-density screens.
+PHOTO_RENDITIONS = {
+    'avatar': (96, 96, True),
+    'profile': (300, 300, True),
+}
+
+# Format -> (file extension, Pillow save options)
+PHOTO_FORMATS = {
+    'webp': ('webp', {'format': 'WEBP', 'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True}),
+}
+
+# Characters of the content hash kept in rendition names
+PHOTO_HASH_LENGTH = 12
+
+# Pending (db_alias, member_pk) jobs for the background worker
+_rendition_queue = queue.Queue()
+_worker_lock = threading.Lock()
+_worker = None
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def photo_content_hash(photo):
+    """Short SHA-256 of a stored photo's content"""
+    digest = hashlib.sha256()
+
+    photo.open('rb')
+    try:
+        for block in photo.chunks():
+            digest.update(block)
+    finally:
+        photo.close()
+
+    return digest.hexdigest()[:PHOTO_HASH_LENGTH]
+
+
+def rendition_name(source_name, content_hash, size, fmt):
+    """Storage name of one rendition, next to the original"""
+    directory, filename = os.path.split(source_name)
+    stem = os.path.splitext(filename)[0]
+    extension = PHOTO_FORMATS[fmt][0]
+
+    return os.path.join(directory, f"{stem}-{content_hash}-{size}.{extension}").replace(os.sep, '/')
+
+
+def render_photo(image, size, fmt):
+    """
+    Encode one rendition of an opened photo.
+
+    Args:
+        image (PIL.Image.Image): Upright RGB photo
+        size (str): Key of PHOTO_RENDITIONS
+        fmt (str): Key of PHOTO_FORMATS
+
+    Returns:
+        bytes: Encoded image
+    """
+    from PIL import Image, ImageOps
+
+    width, height, crop = PHOTO_RENDITIONS[size]
+
+    if crop:
+        rendition = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+    else:
+        rendition = image.copy()
+        rendition.thumbnail((width, height), Image.Resampling.LANCZOS)
+
+    output = io.BytesIO()
+    rendition.save(output, **PHOTO_FORMATS[fmt][1])
+    return output.getvalue()
+
+
+def build_member_renditions(member, force=False):
+    """
+    Write every rendition of a member's photo and record them on the member.
+
+    Renditions already present in storage are kept unless force is set.
+    Files recorded for the member before and no longer part of the new
+    renditions (a replaced photo or a dropped size) are deleted.
+
+    Args:
+        member (Member): Member with a photo
+        force (bool): Re-encode renditions that already exist
+
+    Returns:
+        dict: The recorded photo_renditions value
+    """
+    from django.core.files.base import ContentFile
+    from PIL import Image, ImageOps
+    from .models import Member
+
+    photo = member.member_photo
+    if not photo:
+        return {}
+
+    storage = photo.storage
+    content_hash = photo_content_hash(photo)
+
+    names = {
+        size: {fmt: rendition_name(photo.name, content_hash, size, fmt) for fmt in PHOTO_FORMATS}
+        for size in PHOTO_RENDITIONS
+    }
+    missing = [
+        (size, fmt, name)
+        for size, formats in names.items()
+        for fmt, name in formats.items()
+        if force or not storage.exists(name)
+    ]
+
+    if missing:
+        photo.open('rb')
+        try:
+            image = ImageOps.exif_transpose(Image.open(photo))
+            image = image.convert('RGB')
+        finally:
+            photo.close()
+
+        for size, fmt, name in missing:
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(render_photo(image, size, fmt)))
+
+    renditions = {
+        'source': photo.name,
+        'hash': content_hash,
+        'files': names,
+    }
+
+    previous = (member.photo_renditions or {}).get('files', {})
+
+    # Queryset update: no signals, so the post_save hook does not re-queue
+    Member.objects.filter(pk=member.pk).update(photo_renditions=renditions)
+    member.photo_renditions = renditions
+
+    current = {name for formats in names.values() for name in formats.values()}
+    for formats in previous.values():
+        for name in formats.values():
+            if name in current:
+                continue
+            try:
+                storage.delete(name)
+            except Exception as e:
+                logger.warning(f"Could not delete old photo rendition {name}: {e}")
+
+    return renditions
+
+
+def renditions_current(member):
+    """True when the recorded renditions belong to the member's current photo and sizes"""
+    renditions = member.photo_renditions or {}
+    return bool(member.member_photo) and renditions.get('source') == member.member_photo.name \
+        and set(renditions.get('files', {})) == set(PHOTO_RENDITIONS)
+
+
+def member_photo_url(member, size='avatar', fmt='jpeg'):
+    """
+    URL of a member photo rendition.
+
+    Falls back to the original photo for JPEG until renditions are built,
+    and returns '' for WebP so templates can omit the <source>.
+
+    Args:
+        member (Member): Member to show
+        size (str): Key of PHOTO_RENDITIONS
+        fmt (str): Key of PHOTO_FORMATS
+
+    Returns:
+        str: URL, or '' when there is nothing to show
+    """
+    if not member.member_photo:
+        return ''
+
+    if renditions_current(member):
+        name = member.photo_renditions['files'].get(size, {}).get(fmt)
+        if name:
+            return member.member_photo.storage.url(name)
+
+    return member.member_photo.url if fmt == 'jpeg' else ''
+
+
+def build_all_renditions(force=False, max_workers=4):
+    """
+    Build renditions for every member photo of the current tenant in parallel.
+
+    Pillow releases the GIL while resizing and encoding, so worker threads
+    render several photos at once. Each worker runs against the caller's
+    tenant database.
+
+    Args:
+        force (bool): Rebuild members whose renditions are already current
+        max_workers (int): Worker threads
+
+    Returns:
+        dict: {'built', 'skipped', 'failed', 'errors'}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from kojenasacco.managers import get_current_db
+    from .models import Member
+
+    members = list(Member.objects.exclude(
+        member_photo__isnull=True
+    ).exclude(
+        member_photo=''
+    ).only('pk', 'member_number', 'member_photo', 'photo_renditions').order_by('pk'))
+
+    pending = [member for member in members if force or not renditions_current(member)]
+    results = {
+        'built': 0,
+        'skipped': len(members) - len(pending),
+        'failed': 0,
+        'errors': [],
+    }
+
+    db_name = get_current_db()
+
+    def work(member):
+        from django.db import connections
+        from kojenasacco.managers import DatabaseContext
+
+        try:
+            # Worker threads do not inherit the caller's tenant database
+            if db_name:
+                with DatabaseContext(db_name):
+                    build_member_renditions(member, force=force)
+            else:
+                build_member_renditions(member, force=force)
+            return None
+        except Exception as e:
+            logger.error(f"Error building photo renditions for {member.member_number}: {e}")
+            return f"{member.member_number}: {e}"
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+        for error in pool.map(work, pending):
+            if error:
+                results['failed'] += 1
+                results['errors'].append(error)
+            else:
+                results['built'] += 1
+
+    return results
+
+
+# =============================================================================
+# BACKGROUND WORKER
+# =============================================================================
+
+def queue_member_renditions(member_pk, db_alias=None):
+    """
+    Queue a member's photo for rendering by the background worker.
+
+    Args:
+        member_pk: Member primary key
+        db_alias (str, optional): Tenant database of the member
+    """
+    global _worker
+
+    _rendition_queue.put((db_alias, member_pk))
+
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_rendition_worker, name='member-photo-renditions', daemon=True
+            )
+            _worker.start()
+
+
+def _rendition_worker():
+    """Render queued member photos one at a time, for the life of the process"""
+    from contextlib import nullcontext
+    from django.db import close_old_connections
+    from kojenasacco.managers import DatabaseContext
+
+    while True:
+        db_alias, member_pk = _rendition_queue.get()
+        try:
+            close_old_connections()
+            with DatabaseContext(db_alias) if db_alias else nullcontext():
+                _render_queued_member(member_pk)
+        except Exception as e:
+            logger.error(f"Error building photo renditions for member {member_pk}: {e}")
+        finally:
+            close_old_connections()
+            _rendition_queue.task_done()
+
+
+def _render_queued_member(member_pk):
+    from .models import Member
+
+    member = Member.objects.filter(pk=member_pk).first()
+    if member is not None and member.member_photo and not renditions_current(member):
+        build_member_renditions(member)
+        logger.debug(f"Built photo renditions for {member.member_number}")
+
+
+def wait_for_renditions():
+    """Block until every queued photo has been rendered (tests, commands)"""
+    _rendition_queue.join()
@@ -0,0 +1,426 @@
+# members/search.py
+
+"""
+Member Search
+
+Indexed member lookup shared by every member search view:
+- Token generation (prefix tokens, name trigrams, normalized phone numbers)
+- Token index maintenance on Member save and bulk rebuilds
+- Ranked search (exact member number > ID > phone > name prefix > fuzzy)
+
+All lookups are equality matches on the indexed MemberSearchToken.token
+column, so they behave the same on every database backend and never scan the
+members table. Until a tenant's index has been built, searches fall back to
+substring matching on the members table.
+"""
+
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Shortest prefix indexed and searched
+MIN_PREFIX_LENGTH = 2
+
+# Longest token stored (matches MemberSearchToken.token)
+MAX_TOKEN_LENGTH = 32
+
+# Fuzzy matching runs when fewer members than this matched by prefix
+FUZZY_FALLBACK_RESULTS = 20
+
+# Share of a word's trigrams a name must contain to match fuzzily
+FUZZY_THRESHOLD = 0.5
+
+# Best fuzzy candidates considered per word
+FUZZY_CANDIDATES = 200
+
+# Rank per matched word by token kind; exact values add EXACT_BONUS
+KIND_WEIGHTS = {
+    'MEMBER_NUMBER': 60,
+    'ID_NUMBER': 50,
+    'PHONE': 40,
+    'TAX_ID': 35,
+    'EMAIL': 30,
+    'NAME': 20,
+}
+EXACT_BONUS = 100
+FUZZY_WEIGHT = 10
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]')
+_NON_DIGIT = re.compile(r'\D')
+
+# Member fields feeding the index: saves touching none of them skip reindexing
+SEARCH_FIELDS = (
+    'member_number', 'id_number', 'phone_primary', 'tax_id',
+    'personal_email', 'first_name', 'middle_name', 'last_name',
+)
+
+
+# =============================================================================
+# TOKENS
+# =============================================================================
+
+def normalize_token(value):
+    """
+    Lowercase a value and strip everything but letters and digits.
+
+    Args:
+        value (str): Raw value
+
+    Returns:
+        str: Normalized token, truncated to MAX_TOKEN_LENGTH
+
+    Example:
+        >>> normalize_token('MEM-2024/001')
+        'mem2024001'
+    """
+    return _NON_ALNUM.sub('', (value or '').lower())[:MAX_TOKEN_LENGTH]
+
+
+def normalize_phone(value):
+    """
+    Normalize a phone number to its international digits.
+
+    Args:
+        value (str): Phone number in any common format
+
+    Returns:
+        str: Digits with country code, or '' if there are none
+
+    Example:
+        >>> normalize_phone('0700 123 456')
+        '256700123456'
+    """
+    from .utils import format_phone_number
+
+    if not value or not _NON_DIGIT.sub('', value):
+        return ''
+    return _NON_DIGIT.sub('', format_phone_number(value))[:MAX_TOKEN_LENGTH]
+
+
+def trigrams(word):
+    """
+    Padded trigrams of a word, used for fuzzy name matching.
+
+    Example:
+        >>> sorted(trigrams('ann'))
+        ['  a', ' an', 'ann', 'nn ']
+    """
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _prefix_tokens(token, kind):
+    """(token, kind, is_exact) for a value and each of its prefixes"""
+    rows = [(token, kind, True)]
+    rows.extend(
+        (token[:length], kind, False)
+        for length in range(MIN_PREFIX_LENGTH, len(token))
+    )
+    return rows
+
+
+def build_member_tokens(member):
+    """
+    Search tokens for a member.
+
+    Args:
+        member: Member instance
+
+    Returns:
+        list: Unsaved MemberSearchToken instances
+    """
+    from .models import MemberSearchToken
+
+    rows = []
+
+    for kind, value in (
+        ('MEMBER_NUMBER', normalize_token(member.member_number)),
+        ('ID_NUMBER', normalize_token(member.id_number)),
+        ('PHONE', normalize_phone(member.phone_primary)),
+        ('TAX_ID', normalize_token(member.tax_id)),
+        ('EMAIL', normalize_token(member.personal_email)),
+        ('EMAIL', normalize_token((member.personal_email or '').split('@')[0])),
+    ):
+        if value:
+            rows.extend(_prefix_tokens(value, kind))
+
+    for name in (member.first_name, member.middle_name, member.last_name):
+        for word in (name or '').split():
+            word = normalize_token(word)
+            if word:
+                rows.extend(_prefix_tokens(word, 'NAME'))
+                rows.extend((gram, 'TRIGRAM', False) for gram in trigrams(word))
+
+    # One row per (token, kind), exact wins over prefix
+    tokens = {}
+    for token, kind, is_exact in rows:
+        tokens[(token, kind)] = tokens.get((token, kind), False) or is_exact
+
+    return [
+        MemberSearchToken(member_id=member.pk, token=token, kind=kind, is_exact=is_exact)
+        for (token, kind), is_exact in tokens.items()
+    ]
+
+
+# =============================================================================
+# INDEX MAINTENANCE
+# =============================================================================
+
+def index_member(member):
+    """
+    Replace a member's search tokens.
+
+    Args:
+        member: Member instance
+
+    Returns:
+        int: Tokens written
+    """
+    from .models import MemberSearchToken
+
+    tokens = build_member_tokens(member)
+    MemberSearchToken.objects.filter(member_id=member.pk).delete()
+    MemberSearchToken.objects.bulk_create(tokens, batch_size=1000)
+    return len(tokens)
+
+
+def rebuild_search_index(queryset=None, batch_size=1000):
+    """
+    Rebuild search tokens for many members.
+
+    Args:
+        queryset (optional): Members to index (defaults to all)
+        batch_size (int): Members per delete/insert round
+
+    Returns:
+        tuple: (members_indexed: int, tokens_written: int)
+    """
+    from django.db import transaction
+    from utils.utils import chunked
+    from .models import Member, MemberSearchToken
+
+    if queryset is None:
+        queryset = Member.objects.all()
+
+    members = queryset.only(
+        'pk', *SEARCH_FIELDS
+    ).order_by('pk').iterator(chunk_size=batch_size)
+
+    member_count = 0
+    token_count = 0
+
+    for batch in chunked(members, batch_size):
+        tokens = [token for member in batch for token in build_member_tokens(member)]
+
+        with transaction.atomic():
+            MemberSearchToken.objects.filter(
+                member_id__in=[member.pk for member in batch]
+            ).delete()
+            MemberSearchToken.objects.bulk_create(tokens, batch_size=batch_size)
+
+        member_count += len(batch)
+        token_count += len(tokens)
+
+    logger.info(f"Rebuilt member search index: {member_count} members, {token_count} tokens")
+
+    return member_count, token_count
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+def _query_words(q):
+    """
+    Search variants for each usable word of a query.
+
+    Returns:
+        list: [(normalized word, set of token variants)]
+    """
+    words = []
+
+    for raw in (q or '').split():
+        word = normalize_token(raw)
+        if len(word) < MIN_PREFIX_LENGTH:
+            continue
+
+        variants = {word}
+        if re.fullmatch(r'[\d+\-()]+', raw):
+            phone = normalize_phone(raw)
+            if len(phone) >= MIN_PREFIX_LENGTH:
+                variants.add(phone)
+
+        words.append((word, variants))
+
+    return words
+
+
+def _fuzzy_matches(word, candidates):
+    """
+    Members whose names contain most of a word's trigrams.
+
+    Returns:
+        dict: {member_id: score}
+    """
+    from .models import MemberSearchToken
+
+    grams = trigrams(word)
+    required = max(1, int(len(grams) * FUZZY_THRESHOLD + 0.5))
+
+    matches = candidates.filter(
+        kind='TRIGRAM',
+        token__in=grams
+    ).values('member_id').annotate(
+        hits=Count('token', distinct=True)
+    ).filter(
+        hits__gte=required
+    ).order_by('-hits')[:FUZZY_CANDIDATES]
+
+    return {
+        row['member_id']: max(1, FUZZY_WEIGHT * row['hits'] // len(grams) - 1)
+        for row in matches
+    }
+
+
+def rank_members(q, queryset=None, limit=None):
+    """
+    Rank members matching a search query.
+
+    Every word must match a member: by exact value or prefix of the member
+    number, ID, phone, tax ID, email or a name, or fuzzily by name trigrams
+    when prefix matching finds few members. A member's rank is the sum of
+    its best score for each word.
+
+    Args:
+        q (str): Search text
+        queryset (optional): Members to search within (defaults to all)
+        limit (int, optional): Maximum results (defaults to all matches)
+
+    Returns:
+        list: [(member_id, rank)] best first, or None if the query has no
+            searchable words
+    """
+    from .models import MemberSearchToken
+
+    words = _query_words(q)
+    if not words:
+        return None
+
+    candidates = MemberSearchToken.objects.all()
+    if queryset is not None and queryset.query.has_filters():
+        candidates = candidates.filter(member_id__in=queryset.values('pk'))
+
+    token_words = {}
+    for index, (word, variants) in enumerate(words):
+        for variant in variants:
+            token_words.setdefault(variant, []).append(index)
+
+    # Exact and prefix matches: one indexed lookup for all words
+    scores = {}
+    rows = candidates.filter(
+        token__in=list(token_words)
+    ).exclude(
+        kind='TRIGRAM'
+    ).values_list('member_id', 'token', 'kind', 'is_exact')
+
+    for member_id, token, kind, is_exact in rows:
+        score = KIND_WEIGHTS[kind] + (EXACT_BONUS if is_exact else 0)
+        member_scores = scores.setdefault(member_id, [0] * len(words))
+        for index in token_words[token]:
+            member_scores[index] = max(member_scores[index], score)
+
+    matched = sum(1 for member_scores in scores.values() if all(member_scores))
+
+    # Fuzzy name matches for typos, only when prefixes found too few
+    if matched < min(limit or FUZZY_FALLBACK_RESULTS, FUZZY_FALLBACK_RESULTS):
+        for index, (word, variants) in enumerate(words):
+            if len(word) < 3 or word.isdigit():
+                continue
+            for member_id, score in _fuzzy_matches(word, candidates).items():
+                member_scores = scores.setdefault(member_id, [0] * len(words))
+                member_scores[index] = max(member_scores[index], score)
+
+    ranked = [
+        (member_id, sum(member_scores))
+        for member_id, member_scores in scores.items()
+        if all(member_scores)
+    ]
+    ranked.sort(key=lambda item: (-item[1], str(item[0])))
+
+    return ranked[:limit] if limit else ranked
+
+
+def _substring_search(q, queryset):
+    """Members containing every word of a query, for an unbuilt index"""
+    for word in q.split():
+        queryset = queryset.filter(
+            Q(member_number__icontains=word) |
+            Q(id_number__icontains=word) |
+            Q(first_name__icontains=word) |
+            Q(middle_name__icontains=word) |
+            Q(last_name__icontains=word) |
+            Q(phone_primary__icontains=word) |
+            Q(personal_email__icontains=word)
+        )
+    return queryset
+
+
+def search_members(q, limit=None, queryset=None):
+    """
+    Search members, best matches first.
+
+    The shared entry point for member search views. Apply other filters to
+    the queryset before searching so the limit applies to filtered results.
+    List views leave the limit unset and paginate the result; typeahead
+    passes a small limit.
+
+    Args:
+        q (str): Search text (member number, ID, phone, email, names)
+        limit (int, optional): Maximum results (defaults to all matches)
+        queryset (optional): Members to search within (defaults to all)
+
+    Returns:
+        QuerySet: Matching members annotated with search_rank and ordered
+            by it, then by the queryset's own ordering. The queryset is
+            returned unchanged when q has no searchable words.
+
+    Example:
+        >>> search_members('0700123456', limit=10)
+        <QuerySet [<Member: John Doe - MEM0001>]>
+    """
+    from .models import Member, MemberSearchToken
+
+    if queryset is None:
+        queryset = Member.objects.all()
+
+    ranked = rank_members(q, queryset=queryset, limit=limit)
+
+    if ranked is None:
+        return queryset[:limit] if limit else queryset
+
+    if not ranked:
+        if MemberSearchToken.objects.exists():
+            return queryset.none()
+
+        # Index not built for this tenant yet
+        matches = _substring_search(q, queryset)
+        return matches[:limit] if limit else matches
+
+    ordering = queryset.query.order_by or Member._meta.ordering
+
+    # One WHEN per distinct rank rather than per member
+    by_rank = {}
+    for member_id, rank in ranked:
+        by_rank.setdefault(rank, []).append(member_id)
+
+    return queryset.filter(
+        pk__in=[member_id for member_id, rank in ranked]
+    ).annotate(
+        search_rank=Case(
+            *[When(pk__in=member_ids, then=Value(rank)) for rank, member_ids in by_rank.items()],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+    ).order_by('-search_rank', *ordering)
@@ -9,6 +9,9 @@ Handles automatic operations on model save/delete:
 - Risk rating updates
 - Status change tracking
 - KYC expiry monitoring
+- Search and typeahead index maintenance
+- Cohort chart cache invalidation
+- Photo rendition queueing
 - Group membership updates
 - Automatic field population
 - Validation
@@ -202,29 +205,65 @@ def create_default_payment_method(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=Member)
-def update_shares_balance_reference(sender, instance, **kwargs):
+def update_member_search_index(sender, instance, created, update_fields=None, **kwargs):
     """
-    Update member's share balance if shares app integration exists.
-    
-    Note: This is a placeholder for shares integration.
+    Refresh the member's search tokens when a searchable field changes.
     """
+    from .search import SEARCH_FIELDS, index_member
+    
+    if not created and update_fields is not None and not set(update_fields) & set(SEARCH_FIELDS):
+        return
+    
     try:
-        # Check if shares app is installed
-        from django.apps import apps
-        if apps.is_installed('shares'):
-            from shares.utils import calculate_member_share_balance
-            
-            balance_info = calculate_member_share_balance(instance)
-            
-            # Update if member has shares_balance field
-            if hasattr(instance, 'shares_balance'):
-                Member.objects.filter(pk=instance.pk).update(
-                    shares_balance=balance_info['net_shares'],
-                    shares_value=balance_info['total_value']
-                )
+        index_member(instance)
     except Exception as e:
-        # Silently pass if shares app not installed
-        pass
+        logger.error(f"Error updating search index for member {instance.member_number}: {e}")
+
+
+@receiver(post_save, sender=Member)
+def refresh_typeahead_on_member_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Refresh the member in this process's typeahead index, if built.
+    """
+    from kojenasacco.managers import get_current_db
+    from .typeahead import TYPEAHEAD_FIELDS, refresh_typeahead_member
+    
+    if update_fields is not None and not set(update_fields) & set(TYPEAHEAD_FIELDS):
+        return
+    
+    refresh_typeahead_member(instance, get_current_db())
+
+
+@receiver(post_save, sender=Member)
+def queue_photo_renditions_on_member_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Queue a new or replaced photo for rendering once the save commits.
+    """
+    from kojenasacco.managers import get_current_db
+    from .photos import queue_member_renditions, renditions_current
+    
+    if update_fields is not None and 'member_photo' not in update_fields:
+        return
+    
+    if instance.member_photo and not renditions_current(instance):
+        member_pk, db_alias = instance.pk, get_current_db()
+        db_transaction.on_commit(
+            lambda: queue_member_renditions(member_pk, db_alias),
+            using=db_alias or 'default'
+        )
+
+
+@receiver(post_save, sender=Member)
+def invalidate_cohorts_on_member_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop cached cohort charts when a member's cohort, status or activity changes.
+    """
+    from .cohorts import COHORT_FIELDS, invalidate_cohort_cache
+    
+    if update_fields is not None and not set(update_fields) & set(COHORT_FIELDS):
+        return
+    
+    invalidate_cohort_cache()
 
 
 # =============================================================================
@@ -495,6 +534,17 @@ def update_leadership_roles(sender, instance, **kwargs):
             logger.error(f"Error updating group leadership: {e}")
 
 
+@receiver(post_save, sender=GroupMembership)
+@receiver(post_delete, sender=GroupMembership)
+def invalidate_cohorts_on_group_membership_change(sender, instance, **kwargs):
+    """
+    Drop cached cohort charts when group memberships change.
+    """
+    from .cohorts import invalidate_cohort_cache
+    
+    invalidate_cohort_cache()
+
+
 @receiver(post_delete, sender=GroupMembership)
 def update_group_after_membership_deletion(sender, instance, **kwargs):
     """
@@ -537,6 +587,27 @@ def log_member_deletion(sender, instance, **kwargs):
     )
 
 
+@receiver(post_delete, sender=Member)
+def refresh_typeahead_on_member_delete(sender, instance, **kwargs):
+    """
+    Drop a deleted member from this process's typeahead index, if built.
+    """
+    from kojenasacco.managers import get_current_db
+    from .typeahead import refresh_typeahead_member
+    
+    refresh_typeahead_member(instance, get_current_db(), deleted=True)
+
+
+@receiver(post_delete, sender=Member)
+def invalidate_cohorts_on_member_delete(sender, instance, **kwargs):
+    """
+    Drop cached cohort charts when a member is deleted.
+    """
+    from .cohorts import invalidate_cohort_cache
+    
+    invalidate_cohort_cache()
+
+
 @receiver(post_delete, sender=NextOfKin)
 def log_next_of_kin_deletion(sender, instance, **kwargs):
     """
@@ -575,7 +646,12 @@ def disable_member_signals():
         (pre_save, update_kyc_status, Member),
         (post_save, log_member_creation, Member),
         (post_save, create_default_payment_method, Member),
-        (post_save, update_shares_balance_reference, Member),
+        (post_save, update_member_search_index, Member),
+        (post_save, refresh_typeahead_on_member_save, Member),
+        (post_delete, refresh_typeahead_on_member_delete, Member),
+        (post_save, queue_photo_renditions_on_member_save, Member),
+        (post_save, invalidate_cohorts_on_member_save, Member),
+        (post_delete, invalidate_cohorts_on_member_delete, Member),
         
         # Payment method signals
         (pre_save, ensure_single_primary_payment_method, MemberPaymentMethod),
@@ -603,6 +679,8 @@ def disable_member_signals():
         (post_save, update_group_full_status_after_membership_change, GroupMembership),
         (post_save, update_leadership_roles, GroupMembership),
         (post_delete, update_group_after_membership_deletion, GroupMembership),
+        (post_save, invalidate_cohorts_on_group_membership_change, GroupMembership),
+        (post_delete, invalidate_cohorts_on_group_membership_change, GroupMembership),
     ]
     
     for signal, handler, model in signals_to_disconnect:
@@ -627,7 +705,12 @@ def enable_member_signals():
         (pre_save, update_kyc_status, Member),
         (post_save, log_member_creation, Member),
         (post_save, create_default_payment_method, Member),
-        (post_save, update_shares_balance_reference, Member),
+        (post_save, update_member_search_index, Member),
+        (post_save, refresh_typeahead_on_member_save, Member),
+        (post_delete, refresh_typeahead_on_member_delete, Member),
+        (post_save, queue_photo_renditions_on_member_save, Member),
+        (post_save, invalidate_cohorts_on_member_save, Member),
+        (post_delete, invalidate_cohorts_on_member_delete, Member),
         
         # Payment method signals
         (pre_save, ensure_single_primary_payment_method, MemberPaymentMethod),
@@ -655,6 +738,8 @@ def enable_member_signals():
         (post_save, update_group_full_status_after_membership_change, GroupMembership),
         (post_save, update_leadership_roles, GroupMembership),
         (post_delete, update_group_after_membership_deletion, GroupMembership),
+        (post_save, invalidate_cohorts_on_group_membership_change, GroupMembership),
+        (post_delete, invalidate_cohorts_on_group_membership_change, GroupMembership),
     ]
     
     for signal, handler, model in signals_to_reconnect:
@@ -331,6 +331,9 @@ def get_member_growth_trends(period='month', limit=12):
     """
     Get member growth trends over time
     
+    Monthly trends are calendar-month cohorts from members.cohorts, cached
+    per tenant.
+    
     Args:
         period (str): 'day', 'week', 'month', or 'year'
         limit (int): Number of periods to return
@@ -340,6 +343,10 @@ def get_member_growth_trends(period='month', limit=12):
     """
     from .models import Member
     
+    if period not in ('day', 'week', 'year'):
+        from .cohorts import get_member_growth
+        return get_member_growth(months=limit)
+    
     members = Member.objects.filter(membership_date__isnull=False)
     
     # Select appropriate truncation function
@@ -382,6 +389,106 @@ def get_member_growth_trends(period='month', limit=12):
     }
 
 
+# =============================================================================
+# MEMBER SEARCH STATISTICS
+# =============================================================================
+
+# Seconds search panel stats are cached per (tenant, filters)
+MEMBER_SEARCH_STATS_TTL = 60
+
+
+def _search_stats_cache_key(filters, scope):
+    """Cache key for one set of search filters on the current SACCO database"""
+    import hashlib
+    from kojenasacco.managers import get_current_db
+    
+    fingerprint = '|'.join(
+        f"{key}={filters[key]}" for key in sorted(filters)
+        if filters[key] not in (None, '') and key != 'page'
+    )
+    digest = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+    
+    return f"member_search_stats:{get_current_db() or 'default'}:{scope}:{digest}"
+
+
+def get_member_search_stats(members, filters=None, scope='panel'):
+    """
+    Stats cards for the member search panel, in one aggregate query.
+    
+    Every count is a conditional aggregate (Count with filter=Q(...)) over
+    the filtered members, so the panel costs a single query, cached for
+    MEMBER_SEARCH_STATS_TTL seconds.
+    
+    Args:
+        members (QuerySet or callable): Filtered (and searched) members, or
+            a callable building them, so cache hits skip the search
+        filters (dict, optional): The filters that produced the queryset,
+            used as the cache key. Results are not cached when omitted.
+        scope (str): Name of the view applying the filters, so views that
+            interpret the same filters differently never share entries
+    
+    Returns:
+        dict: Counts, averages and formatted income totals
+    """
+    from django.core.cache import cache
+    from django.db.models import Case, DecimalField, F, When
+    from core.utils import format_money
+    from decimal import Decimal
+    
+    cache_key = _search_stats_cache_key(filters, scope) if filters is not None else None
+    if cache_key:
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
+    
+    if callable(members):
+        members = members()
+    
+    aggregates = members.order_by().aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(status='ACTIVE')),
+        pending_approval=Count('pk', filter=Q(status='PENDING_APPROVAL')),
+        dormant=Count('pk', filter=Q(status='DORMANT')),
+        suspended=Count('pk', filter=Q(status='SUSPENDED')),
+        blacklisted=Count('pk', filter=Q(status='BLACKLISTED')),
+        male=Count('pk', filter=Q(gender='MALE')),
+        female=Count('pk', filter=Q(gender='FEMALE')),
+        kyc_verified=Count('pk', filter=Q(kyc_status='VERIFIED')),
+        kyc_pending=Count('pk', filter=Q(kyc_status='PENDING')),
+        high_risk=Count('pk', filter=Q(risk_rating__in=['HIGH', 'VERY_HIGH'])),
+        low_risk=Count('pk', filter=Q(risk_rating__in=['LOW', 'VERY_LOW'])),
+        avg_age=Avg(
+            Case(
+                When(
+                    date_of_birth__isnull=False,
+                    then=timezone.now().year - F('date_of_birth__year')
+                ),
+                output_field=DecimalField()
+            )
+        ),
+        avg_credit_score=Avg('credit_score'),
+        avg_income=Avg('monthly_income'),
+        total_income=Sum('monthly_income')
+    )
+    
+    stats = dict(aggregates)
+    stats.update({
+        'avg_age': round(aggregates['avg_age'] or 0, 1),
+        'avg_credit_score': round(aggregates['avg_credit_score'] or 0),
+        'avg_income': aggregates['avg_income'] or Decimal('0.00'),
+        'total_income': aggregates['total_income'] or Decimal('0.00'),
+    })
+    
+    # Format money in stats
+    stats['avg_income_formatted'] = format_money(stats['avg_income'])
+    stats['total_income_formatted'] = format_money(stats['total_income'])
+    
+    if cache_key:
+        cache.set(cache_key, stats, MEMBER_SEARCH_STATS_TTL)
+    
+    return stats
+
+
 # =============================================================================
 # PAYMENT METHOD STATISTICS
 # =============================================================================
@@ -667,6 +774,9 @@ def get_group_membership_trends(period='month', limit=12):
     """
     Get group membership trends over time
     
+    Monthly trends are calendar-month cohorts from members.cohorts, cached
+    per tenant.
+    
     Args:
         period (str): 'day', 'week', 'month', or 'year'
         limit (int): Number of periods to return
@@ -676,6 +786,10 @@ def get_group_membership_trends(period='month', limit=12):
     """
     from .models import GroupMembership
     
+    if period not in ('day', 'week', 'year'):
+        from .cohorts import get_group_membership_growth
+        return get_group_membership_growth(months=limit)
+    
     # Select appropriate truncation function
     trunc_functions = {
         'day': TruncDate,
@@ -777,44 +891,15 @@ def get_member_retention_analysis(months=12):
     """
     Analyze member retention over time
     
+    Calendar-month join cohorts by status, one grouped query cached per
+    tenant (see members.cohorts).
+    
     Args:
         months (int): Number of months to analyze
     
     Returns:
         dict: Retention analysis data
     """
-    from .models import Member
+    from .cohorts import get_cohort_status_matrix
     
-    current_date = timezone.now().date()
-    start_date = current_date - timedelta(days=months * 30)
-    
-    members = Member.objects.filter(membership_date__gte=start_date)
-    
-    retention_data = []
-    
-    for i in range(months):
-        period_start = start_date + timedelta(days=i * 30)
-        period_end = period_start + timedelta(days=30)
-        
-        joined_in_period = members.filter(
-            membership_date__gte=period_start,
-            membership_date__lt=period_end
-        )
-        
-        still_active = joined_in_period.filter(status='ACTIVE')
-        
-        total = joined_in_period.count()
-        retained = still_active.count()
-        
-        retention_data.append({
-            'period': period_start.strftime('%Y-%m'),
-            'joined': total,
-            'retained': retained,
-            'retention_rate': (retained / total * 100) if total > 0 else 0,
-        })
-    
-    return {
-        'months_analyzed': months,
-        'data': retention_data,
-        'average_retention_rate': sum(d['retention_rate'] for d in retention_data) / len(retention_data) if retention_data else 0,
-    }
\ No newline at end of file
+    return get_cohort_status_matrix(months=months)
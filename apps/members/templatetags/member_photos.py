@@ -0,0 +1,20 @@
+# members/templatetags/member_photos.py
+
+from django import template
+
+from members.photos import member_photo_url as rendition_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def member_photo_url(member, size='avatar', fmt='jpeg'):
+    """
+    URL of a member photo rendition.
+
+    Usage:
+        {% member_photo_url member 'avatar' 'webp' as webp_url %}
+        {% if webp_url %}<source srcset="{{ webp_url }}" type="image/webp">{% endif %}
+        <img src="{% member_photo_url member 'avatar' %}">
+    """
+    return rendition_url(member, size, fmt)
@@ -1,3 +1,300 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from datetime import date
 
-# Create your tests here.
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from kojenasacco.managers import DatabaseContext
+
+from .models import Member, MemberSearchToken, trusted_member_saves
+from .photos import build_member_renditions, renditions_current
+from .search import search_members
+from .services import MemberActivityService
+from .typeahead import invalidate_typeahead_index, typeahead_members
+
+# First SACCO database: members tables only exist outside 'default'
+SACCO_DB = next(alias for alias in settings.DATABASES if alias != 'default')
+
+
+class MemberSaveValidationTests(TestCase):
+    """Query cost of the Member.save() validation policy"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        self.member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+        )
+
+    def unique_checks(self, save):
+        """Uniqueness lookups against the members table issued by save()"""
+        with CaptureQueriesContext(connections[SACCO_DB]) as queries:
+            save()
+        return [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT 1 AS "a" FROM "members"')
+        ]
+
+    def test_full_save_runs_unique_checks(self):
+        self.member.first_name = 'Janet'
+        checks = self.unique_checks(self.member.save)
+
+        self.assertEqual(len(checks), 2)
+
+    def test_update_fields_save_skips_unrelated_unique_checks(self):
+        self.member.credit_score = 720
+        checks = self.unique_checks(
+            lambda: self.member.save(update_fields=['credit_score', 'updated_at'])
+        )
+
+        self.assertEqual(checks, [])
+
+    def test_update_fields_save_checks_written_unique_field(self):
+        self.member.id_number = 'ID0002'
+        checks = self.unique_checks(
+            lambda: self.member.save(update_fields=['id_number', 'updated_at'])
+        )
+
+        self.assertEqual(len(checks), 1)
+
+    def test_update_fields_save_validates_written_fields(self):
+        self.member.date_of_birth = date.today()
+
+        with self.assertRaises(ValidationError) as raised:
+            self.member.save(update_fields=['date_of_birth'])
+
+        self.assertIn('date_of_birth', raised.exception.message_dict)
+
+    def test_common_update_paths_query_count(self):
+        # Old-instance reads (three pre_save signals and the audit diff),
+        # the UPDATE and the audit log INSERT: no validation queries
+        with self.assertNumQueries(6, using=SACCO_DB):
+            self.member.update_risk_rating()
+
+        with self.assertNumQueries(6, using=SACCO_DB):
+            self.member.suspend('Test suspension')
+
+    def test_trusted_saves_skip_validation(self):
+        self.member.first_name = 'Janet'
+
+        with trusted_member_saves():
+            checks = self.unique_checks(self.member.save)
+
+        self.assertEqual(checks, [])
+
+    def test_trusted_full_save_query_count(self):
+        self.member.first_name = 'Janet'
+
+        # Old-instance reads, the UPDATE, the search token refresh for the
+        # new name and the audit log INSERT: no validation queries
+        with trusted_member_saves(), self.assertNumQueries(8, using=SACCO_DB):
+            self.member.save()
+
+
+class MemberSearchTests(TestCase):
+    """Ranked member search and its fallback before indexing"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        for number in range(1, 4):
+            Member.objects.create(
+                member_number=f'MEM000{number}',
+                id_number=f'ID000{number}',
+                first_name='Jane',
+                last_name=f'Doe{number}',
+                date_of_birth=date(1990, 1, 1),
+                gender='FEMALE',
+                marital_status='SINGLE',
+                membership_date=date(2020, 1, 1),
+                employment_status='EMPLOYED',
+                phone_primary=f'070000000{number}',
+                physical_address='Kampala',
+            )
+
+    def test_search_ranks_exact_member_number_first(self):
+        results = list(search_members('jane mem0002').values_list('member_number', flat=True))
+
+        self.assertEqual(results[0], 'MEM0002')
+
+    def test_search_is_unbounded_without_limit(self):
+        self.assertEqual(search_members('jane').count(), 3)
+        self.assertEqual(len(search_members('jane', limit=2)), 2)
+
+    def test_search_falls_back_before_index_is_built(self):
+        MemberSearchToken.objects.all().delete()
+
+        results = search_members('doe2')
+
+        self.assertEqual(list(results.values_list('member_number', flat=True)), ['MEM0002'])
+
+
+class DormancySweepTests(TestCase):
+    """sweep_dormant_members before and after activity is recorded"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        self.members = [
+            Member.objects.create(
+                member_number=f'MEM000{number}',
+                id_number=f'ID000{number}',
+                first_name='Jane',
+                last_name=f'Doe{number}',
+                date_of_birth=date(1990, 1, 1),
+                gender='FEMALE',
+                marital_status='SINGLE',
+                membership_date=date(2020, 1, 1),
+                employment_status='EMPLOYED',
+                phone_primary=f'070000000{number}',
+                physical_address='Kampala',
+                status='ACTIVE',
+            )
+            for number in range(1, 3)
+        ]
+        invalidate_typeahead_index(SACCO_DB)
+        self.addCleanup(invalidate_typeahead_index, SACCO_DB)
+
+    def test_sweep_checks_ledgers_of_unrecorded_members(self):
+        from decimal import Decimal
+        from shares.models import ShareCapital, ShareTransaction
+
+        active, idle = self.members
+        ShareTransaction.objects.create(
+            transaction_number='SHT0001',
+            member=active,
+            share_capital=ShareCapital.objects.create(
+                name='Ordinary Shares',
+                share_price=Decimal('100.00'),
+                effective_date=date(2020, 1, 1),
+            ),
+            transaction_type='BUY',
+            shares_count=Decimal('5'),
+            price_per_share=Decimal('100.00'),
+            status='COMPLETED',
+        )
+        # As if the activity column was added after the purchase
+        Member.objects.update(last_financial_activity_at=None)
+
+        marked = MemberActivityService.sweep_dormant_members(6)
+
+        self.assertEqual(marked, 1)
+        self.assertEqual(
+            dict(Member.objects.values_list('member_number', 'status')),
+            {active.member_number: 'ACTIVE', idle.member_number: 'DORMANT'}
+        )
+
+    def test_sweep_refreshes_typeahead(self):
+        self.assertEqual(
+            {row['status'] for row in typeahead_members('jane')}, {'ACTIVE'}
+        )
+
+        MemberActivityService.sweep_dormant_members(6)
+
+        self.assertEqual(
+            {row['status'] for row in typeahead_members('jane')}, {'DORMANT'}
+        )
+
+
+class MemberPhotoRenditionTests(TestCase):
+    """Rendition files written and cleaned up by build_member_renditions"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        self.member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+        )
+
+    def set_photo(self, color):
+        from io import BytesIO
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from PIL import Image
+
+        output = BytesIO()
+        Image.new('RGB', (400, 400), color).save(output, format='PNG')
+        self.member.member_photo = SimpleUploadedFile('photo.png', output.getvalue(), content_type='image/png')
+        self.member.save()
+
+    def rendition_files(self):
+        return [
+            name
+            for formats in self.member.photo_renditions['files'].values()
+            for name in formats.values()
+        ]
+
+    def test_replaced_photo_deletes_old_renditions(self):
+        storage = self.member.member_photo.storage
+
+        self.set_photo('red')
+        build_member_renditions(self.member)
+        old_files = self.rendition_files()
+
+        self.set_photo('blue')
+        build_member_renditions(self.member)
+
+        self.assertTrue(all(storage.exists(name) for name in self.rendition_files()))
+        self.assertFalse(any(storage.exists(name) for name in old_files))
+
+    def test_dropped_size_is_rebuilt_and_deleted(self):
+        from django.core.files.base import ContentFile
+
+        storage = self.member.member_photo.storage
+
+        self.set_photo('red')
+        build_member_renditions(self.member)
+
+        dropped = storage.save('members/photo-print.jpg', ContentFile(b'old'))
+        self.member.photo_renditions['files']['print'] = {'jpeg': dropped}
+        self.assertFalse(renditions_current(self.member))
+
+        build_member_renditions(self.member)
+
+        self.assertTrue(renditions_current(self.member))
+        self.assertFalse(storage.exists(dropped))
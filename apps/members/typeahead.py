@@ -0,0 +1,383 @@
+# members/typeahead.py
+
+"""
+Member Typeahead Index
+
+Compact in-process index behind the teller "find member" box:
+- Sorted arrays of normalized member numbers, phone numbers and name words
+  mapped to member slots, searched by prefix with bisect
+- Built lazily per tenant database, refreshed incrementally from Member
+  post_save/post_delete and reloaded after a TTL
+- Bounded memory: a member cap per tenant and a cap on cached tenants
+
+Lookups touch no database. Tenants over the member cap fall back to the
+token index in members.search.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+from .search import normalize_phone, normalize_token
+
+logger = logging.getLogger(__name__)
+
+# Seconds an index is trusted before reloading. Member save/delete signals
+# refresh it in the process that made the change.
+TYPEAHEAD_INDEX_TTL = 900
+
+# Tenants larger than this are served from the database token index instead.
+# An index takes roughly 0.7 KB per member (65 MiB for 100k members, see
+# `manage.py benchmark_member_typeahead`).
+TYPEAHEAD_MAX_MEMBERS = 200000
+
+# Tenant indexes kept in memory, least recently used dropped first
+TYPEAHEAD_MAX_TENANTS = 3
+
+# Shortest query answered
+TYPEAHEAD_MIN_QUERY_LENGTH = 2
+
+# Keys scanned per array for one lookup
+TYPEAHEAD_SCAN_LIMIT = 2000
+
+# Member columns loaded into the index
+TYPEAHEAD_FIELDS = (
+    'pk', 'member_number', 'first_name', 'middle_name', 'last_name',
+    'phone_primary', 'status',
+)
+
+# {db_alias: (loaded_at, MemberTypeaheadIndex or None)}
+_typeahead_indexes = OrderedDict()
+_build_lock = threading.Lock()
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class MemberTypeaheadIndex:
+    """
+    Prefix index over member numbers, phone numbers and name words.
+
+    Each key array is a sorted list of normalized strings with a parallel
+    array of member slots. Members are stored once per slot as a small
+    tuple holding exactly what the dropdown shows. Arrays are searched in
+    rank order (member number, phone, name), so lookups stop as soon as
+    enough members are found.
+    """
+
+    KINDS = ('member_number', 'phone', 'name')
+
+    def __init__(self):
+        self._keys = {kind: [] for kind in self.KINDS}
+        self._slots = {kind: array('I') for kind in self.KINDS}
+        self._members = []
+        self._slot_of = {}
+        self._free_slots = []
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, rows):
+        """
+        Build an index in one pass.
+
+        Args:
+            rows: Iterable of tuples ordered as TYPEAHEAD_FIELDS
+
+        Returns:
+            MemberTypeaheadIndex
+        """
+        index = cls()
+        entries = {kind: [] for kind in cls.KINDS}
+
+        for row in rows:
+            record = cls._record(row)
+            slot = len(index._members)
+            index._members.append(record)
+            index._slot_of[record[0]] = slot
+            for kind, key in cls._record_keys(record):
+                entries[kind].append((key, slot))
+
+        for kind in cls.KINDS:
+            entries[kind].sort()
+            index._keys[kind] = [key for key, slot in entries[kind]]
+            index._slots[kind] = array('I', (slot for key, slot in entries[kind]))
+
+        return index
+
+    @staticmethod
+    def _record(row):
+        """
+        (id, member_number, name, phone, status, keys) from a TYPEAHEAD_FIELDS
+        row, where keys holds the normalized member number, phone and name
+        words in that order
+        """
+        pk, member_number, first_name, middle_name, last_name, phone, status = row
+        name = ' '.join(part for part in (first_name, middle_name, last_name) if part)
+        names = sorted(set(filter(None, (normalize_token(word) for word in name.split()))))
+        keys = (normalize_token(member_number), normalize_phone(phone), *names)
+
+        return (str(pk), member_number or '', name, phone or '', status or '', keys)
+
+    @staticmethod
+    def _record_keys(record):
+        """(kind, key) pairs a member record is found by"""
+        keys = record[5]
+        if keys[0]:
+            yield 'member_number', keys[0]
+        if keys[1]:
+            yield 'phone', keys[1]
+        for word in keys[2:]:
+            yield 'name', word
+
+    def _position(self, kind, key, slot):
+        """Position of (key, slot) in a key array, kept sorted by both"""
+        keys = self._keys[kind]
+        low = bisect_left(keys, key)
+        high = bisect_right(keys, key, low)
+        return bisect_left(self._slots[kind], slot, low, high)
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, member_id):
+        return str(member_id) in self._slot_of
+
+    # -------------------------------------------------------------------------
+    # INCREMENTAL UPDATES
+    # -------------------------------------------------------------------------
+
+    def upsert(self, row):
+        """
+        Add or refresh one member.
+
+        Args:
+            row (tuple): Ordered as TYPEAHEAD_FIELDS
+        """
+        record = self._record(row)
+
+        with self._lock:
+            self.remove(record[0])
+
+            slot = self._free_slots.pop() if self._free_slots else len(self._members)
+            if slot == len(self._members):
+                self._members.append(record)
+            else:
+                self._members[slot] = record
+            self._slot_of[record[0]] = slot
+
+            for kind, key in self._record_keys(record):
+                position = self._position(kind, key, slot)
+                self._keys[kind].insert(position, key)
+                self._slots[kind].insert(position, slot)
+
+    def remove(self, member_id):
+        """
+        Drop one member if indexed.
+
+        Args:
+            member_id: Member primary key
+        """
+        with self._lock:
+            slot = self._slot_of.pop(str(member_id), None)
+            if slot is None:
+                return
+
+            for kind, key in self._record_keys(self._members[slot]):
+                keys = self._keys[kind]
+                slots = self._slots[kind]
+                position = self._position(kind, key, slot)
+                if position < len(keys) and keys[position] == key and slots[position] == slot:
+                    del keys[position]
+                    del slots[position]
+
+            self._members[slot] = None
+            self._free_slots.append(slot)
+
+    # -------------------------------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------------------------------
+
+    def search(self, q, limit=10):
+        """
+        Members whose keys start with every word of a query.
+
+        The longest word is looked up in the key arrays; the others must
+        prefix one of the found member's keys.
+
+        Args:
+            q (str): Query text
+            limit (int): Maximum results
+
+        Returns:
+            list: Dicts with id, member_number, name, phone and status, best
+                match first
+        """
+        words = []
+        for raw in (q or '').split():
+            variants = {normalize_token(raw)}
+            if raw.lstrip('+').replace('-', '').isdigit():
+                variants.add(normalize_phone(raw))
+            variants.discard('')
+            if variants:
+                words.append(sorted(variants, key=len, reverse=True))
+
+        # Longest word first: it narrows the scan the most
+        words.sort(key=lambda variants: -len(variants[0]))
+        if not words or len(words[0][0]) < TYPEAHEAD_MIN_QUERY_LENGTH:
+            return []
+
+        with self._lock:
+            return self._search(words[0], words[1:], limit)
+
+    def _search(self, primary, others, limit):
+        """Scan the key arrays in rank order for the primary word"""
+        results = []
+        seen = set()
+
+        for kind in self.KINDS:
+            keys = self._keys[kind]
+            slots = self._slots[kind]
+
+            for prefix in primary:
+                position = bisect_left(keys, prefix)
+                end = min(len(keys), position + TYPEAHEAD_SCAN_LIMIT)
+
+                while position < end and keys[position].startswith(prefix):
+                    slot = slots[position]
+                    position += 1
+                    if slot in seen:
+                        continue
+                    seen.add(slot)
+
+                    record = self._members[slot]
+                    if others and not self._matches_all(record, others):
+                        continue
+
+                    results.append({
+                        'id': record[0],
+                        'member_number': record[1],
+                        'name': record[2],
+                        'phone': record[3],
+                        'status': record[4],
+                    })
+                    if len(results) >= limit:
+                        return results
+
+        return results
+
+    def _matches_all(self, record, words):
+        """Whether every word prefixes one of the record's keys"""
+        return all(
+            any(key.startswith(variant) for key in record[5] if key for variant in variants)
+            for variants in words
+        )
+
+
+# =============================================================================
+# TENANT INDEXES
+# =============================================================================
+
+def get_typeahead_index():
+    """
+    Get the current tenant's typeahead index, building it if needed.
+
+    Returns:
+        MemberTypeaheadIndex or None: None when the tenant has more than
+            TYPEAHEAD_MAX_MEMBERS members
+    """
+    from kojenasacco.managers import get_current_db
+    from .models import Member
+
+    db_alias = get_current_db()
+    entry = _typeahead_indexes.get(db_alias)
+
+    if entry is None or time.monotonic() - entry[0] > TYPEAHEAD_INDEX_TTL:
+        with _build_lock:
+            entry = _typeahead_indexes.get(db_alias)
+            if entry is None or time.monotonic() - entry[0] > TYPEAHEAD_INDEX_TTL:
+                index = None
+                if Member.objects.count() <= TYPEAHEAD_MAX_MEMBERS:
+                    started = time.monotonic()
+                    index = MemberTypeaheadIndex.build(
+                        Member.objects.order_by().values_list(*TYPEAHEAD_FIELDS).iterator(chunk_size=5000)
+                    )
+                    logger.info(
+                        f"Built member typeahead index for {db_alias}: {len(index)} members "
+                        f"in {time.monotonic() - started:.2f}s"
+                    )
+                entry = (time.monotonic(), index)
+                _typeahead_indexes[db_alias] = entry
+
+                while len(_typeahead_indexes) > TYPEAHEAD_MAX_TENANTS:
+                    _typeahead_indexes.popitem(last=False)
+
+    _typeahead_indexes.move_to_end(db_alias)
+    return entry[1]
+
+
+def refresh_typeahead_member(member, db_alias, deleted=False):
+    """
+    Apply one member change to an already built index.
+
+    Args:
+        member: Member instance
+        db_alias (str): Tenant database of the index
+        deleted (bool): Remove the member instead of refreshing it
+    """
+    entry = _typeahead_indexes.get(db_alias)
+    if entry is None or entry[1] is None:
+        return
+
+    if deleted:
+        entry[1].remove(member.pk)
+    else:
+        entry[1].upsert(tuple(
+            member.pk if field == 'pk' else getattr(member, field)
+            for field in TYPEAHEAD_FIELDS
+        ))
+
+
+def invalidate_typeahead_index(db_alias=None):
+    """
+    Drop cached typeahead indexes.
+
+    Args:
+        db_alias (str, optional): Tenant database (defaults to all)
+    """
+    if db_alias is None:
+        _typeahead_indexes.clear()
+    else:
+        _typeahead_indexes.pop(db_alias, None)
+
+
+def typeahead_members(q, limit=10):
+    """
+    Typeahead member lookup for the current tenant.
+
+    Args:
+        q (str): Query text
+        limit (int): Maximum results
+
+    Returns:
+        list: Dicts with id, member_number, name, phone and status
+    """
+    index = get_typeahead_index()
+    if index is not None:
+        return index.search(q, limit=limit)
+
+    from .search import search_members
+
+    return [
+        {
+            'id': str(row[0]),
+            'member_number': row[1],
+            'name': ' '.join(part for part in row[2:5] if part),
+            'phone': row[5] or '',
+            'status': row[6],
+        }
+        for row in search_members(q, limit=limit).values_list(*TYPEAHEAD_FIELDS)
+    ]
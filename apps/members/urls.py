@@ -35,6 +35,8 @@ urlpatterns = [
     path('members/<uuid:pk>/suspend/', views.member_suspend, name='member_suspend'),
     #path('members/<uuid:pk>/deactivate/', views.member_deactivate, name='member_deactivate'),
     path('print/', views.member_print_view, name='member_print_view'),
+    path('members/import/', views.member_import, name='member_import'),
+    path('members/import/<uuid:pk>/rejections/', views.member_import_rejections_export, name='member_import_rejections_export'),
 
     # Modal Views 
     path('members/<uuid:pk>/modal/activate/', modal_views.member_activate_modal, name='member_activate_modal'),
@@ -48,6 +50,8 @@ urlpatterns = [
 
     # HTMX Views 
     path('members/htmx/search/', htmx_views.member_search, name='member_search'),
+    path('members/htmx/search/stats/', htmx_views.member_search_stats, name='member_search_stats'),
+    path('members/htmx/typeahead/', htmx_views.member_typeahead, name='member_typeahead'),
     path('members/<uuid:member_id>/htmx/stats/', htmx_views.member_detail_stats, name='member_detail_stats'),
     path('members/htmx/quick-stats/', htmx_views.member_quick_stats, name='member_quick_stats'),
     
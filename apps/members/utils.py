@@ -63,6 +63,57 @@ def generate_member_number(prefix='MBR', width=4):
         return member_number
 
 
+def generate_member_number_block(prefix='MEM', count=1, width=4):
+    """
+    Reserve a block of consecutive member numbers in one query.
+
+    Bulk imports use this instead of calling generate_member_number once per
+    member. Numbers continue after the highest one already issued with the
+    prefix, compared numerically so MEM10000 follows MEM9999.
+
+    Args:
+        prefix (str): Member number prefix
+        count (int): Number of member numbers to reserve
+        width (int): Minimum zero-padded width of the counter
+
+    Returns:
+        list: Member numbers in ascending order
+
+    Example:
+        >>> generate_member_number_block('MEM', 3)
+        ['MEM0101', 'MEM0102', 'MEM0103']
+    """
+    from django.db.models.functions import Length
+    from members.models import Member
+
+    if count <= 0:
+        return []
+
+    with transaction.atomic():
+        last_number = (
+            Member.objects
+            .select_for_update()
+            .filter(member_number__startswith=prefix)
+            .annotate(number_length=Length('member_number'))
+            .order_by('-number_length', '-member_number')
+            .values_list('member_number', flat=True)
+            .first()
+        )
+
+    try:
+        next_number = int(last_number[len(prefix):]) + 1 if last_number else 1
+    except ValueError:
+        next_number = 1
+
+    member_numbers = [
+        f"{prefix}{str(number).zfill(width)}"
+        for number in range(next_number, next_number + count)
+    ]
+
+    logger.info(f"Reserved {count} member numbers from {member_numbers[0]}")
+    return member_numbers
+
+
 # =============================================================================
 # CREDIT SCORE CALCULATIONS
 # =============================================================================
@@ -230,10 +281,112 @@ def calculate_simple_credit_score(age, employment_status, monthly_income):
     return max(0, min(1000, base_score))
 
 
+def calculate_credit_scores(columns):
+    """
+    Calculate credit scores for a whole population at once.
+    
+    Vectorized calculate_credit_score(): the same rules applied with NumPy
+    to one array per input, so scoring 100k members takes milliseconds.
+    
+    Args:
+        columns (dict): Equal-length sequences keyed like the
+            calculate_credit_score() member_data dict
+            {
+                'age': ints,
+                'employment_status': strs,
+                'monthly_income': floats,
+                'membership_years': floats,
+                'kyc_verified': bools,
+                'savings_balance': floats,
+                'loans_count': ints,
+                'loan_defaults': ints,
+                'payment_history_score': ints (0-100)
+            }
+    
+    Returns:
+        numpy.ndarray: Credit scores (0-1000) as int32
+    
+    Example:
+        >>> calculate_credit_scores({'age': [35], 'employment_status': ['EMPLOYED'], ...})
+        array([750], dtype=int32)
+    """
+    import numpy as np
+    
+    age = np.asarray(columns['age'], dtype=np.int32)
+    employment = np.asarray(columns['employment_status'], dtype=object)
+    income = np.asarray(columns['monthly_income'], dtype=np.float64)
+    years = np.asarray(columns['membership_years'], dtype=np.float64)
+    kyc_verified = np.asarray(columns['kyc_verified'], dtype=bool)
+    savings = np.asarray(columns['savings_balance'], dtype=np.float64)
+    loans_count = np.asarray(columns['loans_count'], dtype=np.int32)
+    loan_defaults = np.asarray(columns['loan_defaults'], dtype=np.int32)
+    payment_score = np.asarray(columns['payment_history_score'], dtype=np.int32)
+    
+    score = np.full(age.shape, 500, dtype=np.int32)
+    
+    # Age-based scoring (max 50 points)
+    score += np.select(
+        [(age >= 25) & (age <= 55), (age >= 18) & (age < 25), (age > 55) & (age <= 65)],
+        [50, 30, 40], 0
+    ).astype(np.int32)
+    
+    # Employment status (max 75 points)
+    score += np.select(
+        [employment == 'EMPLOYED', employment == 'SELF_EMPLOYED',
+         employment == 'RETIRED', employment == 'STUDENT'],
+        [75, 50, 40, 20], 0
+    ).astype(np.int32)
+    
+    # Income level (max 100 points)
+    score += np.select(
+        [income >= 2000000, income >= 1000000, income >= 500000, income >= 200000],
+        [100, 75, 50, 25], 0
+    ).astype(np.int32)
+    
+    # Membership duration (max 75 points)
+    score += np.select(
+        [years >= 5, years >= 3, years >= 2, years >= 1],
+        [75, 60, 50, 25], 0
+    ).astype(np.int32)
+    
+    # KYC verification (50 points)
+    score += np.where(kyc_verified, 50, 0).astype(np.int32)
+    
+    # Savings balance (max 100 points)
+    score += np.select(
+        [savings >= 10000000, savings >= 5000000, savings >= 2000000, savings >= 1000000],
+        [100, 75, 50, 25], 0
+    ).astype(np.int32)
+    
+    # Loan history (max 100 points)
+    score += np.where(
+        loans_count > 0,
+        np.select([loan_defaults == 0, loan_defaults == 1, loan_defaults == 2], [100, 50, 25], -50),
+        0
+    ).astype(np.int32)
+    
+    # Payment history (max 50 points)
+    score += np.select(
+        [payment_score >= 90, payment_score >= 80, payment_score >= 70, payment_score >= 60],
+        [50, 40, 30, 20], 0
+    ).astype(np.int32)
+    
+    return np.clip(score, 0, 1000)
+
+
 # =============================================================================
 # RISK RATING CALCULATIONS
 # =============================================================================
 
+# (minimum credit score, rating), best first; anything lower is VERY_HIGH
+RISK_RATING_THRESHOLDS = (
+    (800, 'VERY_LOW'),
+    (650, 'LOW'),
+    (500, 'MEDIUM'),
+    (350, 'HIGH'),
+)
+
+
 def calculate_risk_rating(credit_score):
     """
     Calculate risk rating based on credit score.
@@ -253,16 +406,37 @@ def calculate_risk_rating(credit_score):
         >>> calculate_risk_rating(750)
         'LOW'
     """
-    if credit_score >= 800:
-        return 'VERY_LOW'
-    elif credit_score >= 650:
-        return 'LOW'
-    elif credit_score >= 500:
-        return 'MEDIUM'
-    elif credit_score >= 350:
-        return 'HIGH'
-    else:
-        return 'VERY_HIGH'
+    for threshold, rating in RISK_RATING_THRESHOLDS:
+        if credit_score >= threshold:
+            return rating
+    return 'VERY_HIGH'
+
+
+def calculate_risk_ratings(credit_scores):
+    """
+    Calculate risk ratings for many credit scores at once.
+    
+    Vectorized calculate_risk_rating() over the same thresholds.
+    
+    Args:
+        credit_scores: Sequence or array of credit scores
+    
+    Returns:
+        numpy.ndarray: Risk ratings as an object array of str
+    
+    Example:
+        >>> calculate_risk_ratings([820, 400])
+        array(['VERY_LOW', 'HIGH'], dtype=object)
+    """
+    import numpy as np
+    
+    scores = np.asarray(credit_scores)
+    
+    return np.select(
+        [scores >= threshold for threshold, _rating in RISK_RATING_THRESHOLDS],
+        [rating for _threshold, rating in RISK_RATING_THRESHOLDS],
+        'VERY_HIGH'
+    ).astype(object)
 
 
 # =============================================================================
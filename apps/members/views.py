@@ -48,6 +48,7 @@ from .models import (
     MemberAdditionalContact,
     MemberGroup,
     GroupMembership,
+    MemberImport,
 )
 
 from .forms import (
@@ -64,6 +65,7 @@ from .forms import (
     NextOfKinFilterForm,
     MemberGroupFilterForm,
     GroupMembershipFilterForm,
+    MemberImportForm,
 )
 
 # Import services
@@ -73,10 +75,13 @@ from .services import (
     PaymentMethodService,
     NextOfKinService,
     GroupMembershipService,
+    MemberFinancialSummaryService,
+    MemberImportService,
 )
 
 # Import stats functions
 from . import stats as member_stats
+from .search import search_members
 
 from core.utils import format_money
 
@@ -209,19 +214,12 @@ def member_print_view(request):
     risk_rating = request.GET.get('risk_rating', '')
     employment_status = request.GET.get('employment_status', '')
     
-    # Build queryset
-    members = Member.objects.select_related().order_by('member_number')
+    # Build queryset (financial columns read the prefetched summaries)
+    members = MemberFinancialSummaryService.prefetch(
+        Member.objects.select_related().order_by('member_number')
+    )
     
     # Apply filters (same as member_search)
-    if query:
-        members = members.filter(
-            Q(member_number__icontains=query) |
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(phone_primary__icontains=query) |
-            Q(personal_email__icontains=query)
-        )
-    
     if status:
         members = members.filter(status=status)
     
@@ -243,6 +241,10 @@ def member_print_view(request):
     if employment_status:
         members = members.filter(employment_status=employment_status)
     
+    # Apply ranked text search within the filtered members
+    if query:
+        members = search_members(query, queryset=members)
+    
     # Calculate stats only if requested
     stats = None
     if include_stats:
@@ -280,6 +282,9 @@ def member_print_view(request):
         'risk_rating': 'Risk Rating',
         'monthly_income': 'Monthly Income',
         'employment_status': 'Employment',
+        'total_savings': 'Total Savings',
+        'total_loans': 'Loan Balance',
+        'total_shares': 'Share Capital',
     }
     
     # Create ordered list of field display names for template
@@ -559,7 +564,7 @@ def member_edit(request, pk):
 def member_profile(request, pk):
     """View member profile with all related information - USES stats.py"""
     member = get_object_or_404(
-        Member.objects.prefetch_related(
+        Member.objects.select_related('financial_summary').prefetch_related(
             Prefetch(
                 'payment_methods',
                 queryset=MemberPaymentMethod.objects.order_by('-is_primary', 'provider')
@@ -793,6 +798,99 @@ def member_reject_kyc(request, pk):
     return redirect('members:member_profile', pk=member.pk)
 
 
+# =============================================================================
+# MEMBER IMPORT VIEWS
+# =============================================================================
+
+@login_required
+def member_import(request):
+    """Upload a bulk member registration file - USES MemberImportService"""
+    
+    member_import = None
+    
+    if request.method == "POST":
+        form = MemberImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Use MemberImportService for business logic
+            success, result = MemberImportService.import_file(
+                uploaded_file=form.cleaned_data['import_file'],
+                dry_run=form.cleaned_data['dry_run'],
+                status=form.cleaned_data['status'],
+                imported_by=request.user
+            )
+            
+            if not success:
+                messages.error(
+                    request,
+                    f"Could not import member file: {result}",
+                    extra_tags='sweetalert-error'
+                )
+            else:
+                member_import = result
+                
+                if member_import.dry_run:
+                    messages.info(
+                        request,
+                        f"Dry run: {member_import.imported_count} of {member_import.total_rows} row(s) "
+                        f"can be imported, {member_import.rejected_count} rejected",
+                        extra_tags='sweetalert'
+                    )
+                elif member_import.imported_count > 0:
+                    messages.success(
+                        request,
+                        f"Imported {member_import.imported_count} member(s)" +
+                        (f". {member_import.rejected_count} row(s) rejected." if member_import.rejected_count > 0 else ""),
+                        extra_tags='sweetalert'
+                    )
+                else:
+                    messages.warning(
+                        request,
+                        f"No members imported. {member_import.rejected_count} row(s) rejected.",
+                        extra_tags='sweetalert'
+                    )
+        else:
+            messages.error(
+                request,
+                "Please correct the errors in the form",
+                extra_tags='sweetalert-error'
+            )
+    else:
+        form = MemberImportForm()
+    
+    context = {
+        'form': form,
+        'member_import': member_import,
+        'recent_imports': MemberImport.objects.defer('rejections')[:10],
+        'title': 'Import Members',
+    }
+    return render(request, 'members/import.html', context)
+
+
+@login_required
+def member_import_rejections_export(request, pk):
+    """Download the rejected rows of a member import as CSV"""
+    import csv
+    
+    member_import = get_object_or_404(MemberImport, pk=pk)
+    
+    response = HttpResponse(content_type='text/csv')
+    response['Content-Disposition'] = (
+        f'attachment; filename="member_import_rejections_{member_import.created_at.strftime("%Y%m%d_%H%M%S")}.csv"'
+    )
+    
+    writer = csv.writer(response)
+    writer.writerow(['Line', 'ID Number', 'Name', 'Reason'])
+    for rejection in member_import.rejections:
+        writer.writerow([
+            rejection['line'],
+            rejection['id_number'] or '',
+            rejection['name'] or '',
+            rejection['reason'],
+        ])
+    
+    return response
+
+
 # =============================================================================
 # PAYMENT METHOD VIEWS
 # =============================================================================
@@ -1181,6 +1181,64 @@ class BulkInterestPostingForm(BootstrapFormMixin, forms.Form):
             self.fields['posting_date'].initial = timezone.now().date()
 
 
+class BulkDepositUploadForm(BootstrapFormMixin, forms.Form):
+    """Form for uploading payroll / check-off deposit files"""
+
+    deposit_file = forms.FileField(
+        label=_('Deposit File'),
+        widget=forms.ClearableFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx'
+        }),
+        help_text=_('CSV or Excel file with account_number, amount and optional reference_number, description columns')
+    )
+
+    payment_method = forms.ModelChoiceField(
+        label=_('Payment Method'),
+        queryset=None,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
+    posting_date = forms.DateField(
+        label=_('Posting Date'),
+        widget=DatePickerInput()
+    )
+
+    description = forms.CharField(
+        label=_('Default Description'),
+        required=False,
+        max_length=255,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': _('e.g. March payroll check-off')
+        })
+    )
+
+    confirm_posting = forms.BooleanField(
+        label=_('I confirm that I want to post these deposits'),
+        required=True,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        from core.models import PaymentMethod
+        self.fields['payment_method'].queryset = PaymentMethod.objects.filter(
+            is_active=True
+        )
+
+        # Set default posting date
+        if not self.is_bound:
+            self.fields['posting_date'].initial = timezone.now().date()
+
+    def clean_deposit_file(self):
+        deposit_file = self.cleaned_data.get('deposit_file')
+        if deposit_file and not deposit_file.name.lower().endswith(('.csv', '.xlsx')):
+            raise ValidationError(_('Upload a .csv or .xlsx file'))
+        return deposit_file
+
+
 # =============================================================================
 # REPORTING FORMS
 # =============================================================================
@@ -179,7 +179,7 @@ def savings_account_search(request):
         'q', 'status', 'savings_product', 'member', 'group',
         'is_fixed_deposit', 'min_balance', 'max_balance',
         'opening_date_from', 'opening_date_to', 'has_overdraft',
-        'dormant', 'needs_approval', 'matured'
+        'dormant', 'needs_approval', 'matured', 'sort'
     ])
     
     query = filters['q']
@@ -196,6 +196,7 @@ def savings_account_search(request):
     dormant = filters['dormant']
     needs_approval = filters['needs_approval']
     matured = filters['matured']
+    sort = filters['sort']
     
     # Build queryset
     accounts = SavingsAccount.objects.select_related(
@@ -204,7 +205,6 @@ def savings_account_search(request):
         'group'
     ).annotate(
         transaction_count=Count('transactions', distinct=True),
-        last_transaction_date=Max('transactions__transaction_date'),
         total_deposits=Sum(
             'transactions__amount',
             filter=Q(transactions__transaction_type='DEPOSIT')
@@ -292,6 +292,12 @@ def savings_account_search(request):
                 Q(maturity_date__isnull=True)
             )
     
+    # Sorting by activity reads the indexed last_activity_at column
+    if sort == 'recent_activity':
+        accounts = accounts.order_by(F('last_activity_at').desc(nulls_last=True), 'account_number')
+    elif sort == 'least_activity':
+        accounts = accounts.order_by(F('last_activity_at').asc(nulls_first=True), 'account_number')
+    
     # Paginate
     accounts_page, paginator = paginate_queryset(request, accounts, per_page=20)
     
@@ -1088,6 +1094,42 @@ def account_detail_stats(request, account_id):
     
     return JsonResponse(stats)
 
+def account_balance_history(request, account_id):
+    """Daily closing balance series for the account balance chart"""
+    
+    account = get_object_or_404(SavingsAccount, id=account_id)
+    
+    try:
+        days = min(max(int(request.GET.get('days', 90)), 1), 366)
+    except (TypeError, ValueError):
+        days = 90
+    
+    from .stats import get_account_balance_history
+    
+    return JsonResponse(get_account_balance_history(account, days=days))
+
+
+@require_http_methods(["GET"])
+def savings_balance_trends(request):
+    """Total savings closing balance per period for the balance trend chart"""
+    
+    period = request.GET.get('period', 'monthly')
+    if period not in ('daily', 'weekly', 'monthly', 'quarterly', 'yearly'):
+        period = 'monthly'
+    
+    try:
+        months = min(max(int(request.GET.get('months', 12)), 1), 120)
+    except (TypeError, ValueError):
+        months = 12
+    
+    from .stats import get_balance_trends
+    
+    return JsonResponse(get_balance_trends(
+        period=period,
+        months=months,
+        product_id=request.GET.get('product') or None
+    ))
+
 # =============================================================================
 # AJAX/API VIEWS FOR DYNAMIC DATA
 # =============================================================================
@@ -0,0 +1,72 @@
+# savings/management/commands/backfill_account_activity.py
+
+"""
+One-off backfill of SavingsAccount.last_activity_at from transaction history.
+
+Run once after deploying the column; afterwards the ledger posting path
+keeps it current.
+
+USAGE EXAMPLES:
+===============
+
+# Backfill all SACCO databases
+python manage.py backfill_account_activity --all
+
+# Backfill one SACCO in batches of 2000 accounts
+python manage.py backfill_account_activity --sacco tumaini_sacco --batch-size 2000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Populate savings account last activity from transaction history'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Accounts updated per statement (default: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from savings.services import AccountService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    updated = AccountService.backfill_last_activity(batch_size=options['batch_size'])
+                self.stdout.write(self.style.SUCCESS(f"✓ {db_name}: {updated} accounts updated"))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error backfilling account activity for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Backfill failed for {error_count} database(s)')
@@ -0,0 +1,94 @@
+# savings/management/commands/backfill_daily_balances.py
+
+"""
+Rebuild DailyAccountBalance rows from savings transaction history.
+
+Run once after deploying the snapshot table, or over a date range after
+correcting historical transactions. Existing rows in the range are
+overwritten.
+
+USAGE EXAMPLES:
+===============
+
+# Rebuild the full history for all SACCO databases
+python manage.py backfill_daily_balances --all
+
+# Rebuild a date range for one SACCO
+python manage.py backfill_daily_balances --sacco tumaini_sacco --from 2024-01-01 --to 2024-12-31
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild end-of-day savings balances from transaction history'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--from',
+            dest='date_from',
+            type=str,
+            help='First day to rebuild (YYYY-MM-DD), defaults to the first transaction'
+        )
+        parser.add_argument(
+            '--to',
+            dest='date_to',
+            type=str,
+            help='Last day to rebuild (YYYY-MM-DD), defaults to yesterday'
+        )
+
+    def _parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f"{option} must be in YYYY-MM-DD format")
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        start_date = self._parse_date(options['date_from'], '--from')
+        end_date = self._parse_date(options['date_to'], '--to')
+
+        from savings.services import BalanceSnapshotService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    results = BalanceSnapshotService.backfill(start_date, end_date)
+                self.stdout.write(self.style.SUCCESS(
+                    f"✓ {db_name}: {results['rows_written']} rows for {results['accounts']} accounts"
+                ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error backfilling daily balances for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Backfill failed for {error_count} database(s)')
@@ -0,0 +1,91 @@
+# savings/management/commands/execute_standing_orders.py
+
+"""
+Daily job that executes due standing orders.
+
+Each order is recorded once per run date, so the command can be rerun
+safely after a partial failure - orders that already succeeded are skipped.
+
+USAGE EXAMPLES:
+===============
+
+# Execute today's due orders for all SACCO databases
+python manage.py execute_standing_orders --all
+
+# Execute for one SACCO as of a specific date with 8 worker threads
+python manage.py execute_standing_orders --sacco tumaini_sacco --date 2025-01-15 --workers 8
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Execute due standing orders'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='Run date (YYYY-MM-DD), defaults to today'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of parallel worker threads'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        execution_date = None
+        if options['date']:
+            try:
+                execution_date = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("--date must be in YYYY-MM-DD format")
+
+        from savings.services import StandingOrderExecutor
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    results = StandingOrderExecutor.run(execution_date, max_workers=options['workers'])
+                self.stdout.write(self.style.SUCCESS(
+                    f"✓ {db_name}: {results['successful']} executed, {results['failed']} failed, "
+                    f"{results['skipped']} already executed"
+                ))
+                for error in results['errors']:
+                    self.stdout.write(f"    ✗ {error['order_id']}: {error['error']}")
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error executing standing orders for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Standing order execution failed for {error_count} database(s)')
@@ -0,0 +1,84 @@
+# savings/management/commands/snapshot_daily_balances.py
+
+"""
+End-of-day job that records closing balances for accounts with activity.
+
+Only accounts that transacted on the day get a DailyAccountBalance row;
+everyone else carries their previous closing balance forward.
+
+USAGE EXAMPLES:
+===============
+
+# Snapshot today for all SACCO databases (schedule this at end of day)
+python manage.py snapshot_daily_balances --all
+
+# Snapshot a specific day for one SACCO
+python manage.py snapshot_daily_balances --sacco tumaini_sacco --date 2025-01-15
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Record end-of-day balances for savings accounts with activity'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='Business day to snapshot (YYYY-MM-DD), defaults to today'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        balance_date = None
+        if options['date']:
+            try:
+                balance_date = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("--date must be in YYYY-MM-DD format")
+
+        from savings.services import BalanceSnapshotService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    results = BalanceSnapshotService.snapshot_day(balance_date)
+                self.stdout.write(self.style.SUCCESS(
+                    f"✓ {db_name}: {results['rows_written']} balances recorded for {results['balance_date']}"
+                    + (f" ({results['gap_rows_written']} missed-day balances backfilled)"
+                       if results['gap_rows_written'] else "")
+                ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error snapshotting daily balances for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Snapshot failed for {error_count} database(s)')
@@ -0,0 +1,83 @@
+# savings/management/commands/sweep_dormant_accounts.py
+
+"""
+Daily job that marks inactive savings accounts as dormant.
+
+Runs one UPDATE per dormancy rule (products sharing a dormancy period)
+against the indexed last_activity_at column.
+
+USAGE EXAMPLES:
+===============
+
+# Sweep all SACCO databases as of today
+python manage.py sweep_dormant_accounts --all
+
+# Sweep one SACCO as of a specific date
+python manage.py sweep_dormant_accounts --sacco tumaini_sacco --date 2025-01-15
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Mark savings accounts inactive beyond their dormancy period as dormant'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='Reference date (YYYY-MM-DD), defaults to today'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        as_of = None
+        if options['date']:
+            try:
+                as_of = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("--date must be in YYYY-MM-DD format")
+
+        from savings.services import AccountService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    results = AccountService.sweep_dormant_accounts(as_of)
+                self.stdout.write(self.style.SUCCESS(
+                    f"✓ {db_name}: {results['accounts_marked']} accounts marked dormant "
+                    f"({results['rules']} rules)"
+                ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error sweeping dormant accounts for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Dormancy sweep failed for {error_count} database(s)')
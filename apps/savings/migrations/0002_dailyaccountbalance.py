@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 21:28
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyAccountBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('balance_date', models.DateField(help_text='Business day (SACCO timezone) this balance closes', verbose_name='Balance Date')),
+                ('closing_balance', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=15, verbose_name='Closing Balance')),
+                ('total_credits', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=15, verbose_name='Total Credits')),
+                ('total_debits', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Debits including fees and taxes', max_digits=15, verbose_name='Total Debits')),
+                ('transaction_count', models.PositiveIntegerField(default=0, verbose_name='Transaction Count')),
+                ('account', models.ForeignKey(help_text='Savings account this balance belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='daily_balances', to='savings.savingsaccount')),
+            ],
+            options={
+                'verbose_name': 'Daily Account Balance',
+                'verbose_name_plural': 'Daily Account Balances',
+                'ordering': ['account', '-balance_date'],
+                'indexes': [models.Index(fields=['balance_date'], name='savings_dai_balance_776152_idx')],
+                'constraints': [models.UniqueConstraint(fields=('account', 'balance_date'), name='unique_daily_balance_per_account')],
+            },
+        ),
+    ]
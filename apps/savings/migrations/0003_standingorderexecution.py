@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 21:35
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0002_dailyaccountbalance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingOrderExecution',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Updated At')),
+                ('created_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who created this record', max_length=50, null=True, verbose_name='Created By ID')),
+                ('updated_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who last updated this record', max_length=50, null=True, verbose_name='Updated By ID')),
+                ('created_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Created From IP')),
+                ('updated_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Updated From IP')),
+                ('change_reason', models.CharField(blank=True, max_length=255, null=True, verbose_name='Change Reason')),
+                ('run_date', models.DateField(verbose_name='Run Date')),
+                ('idempotency_key', models.CharField(help_text='<standing order id>:<run date>', max_length=64, unique=True, verbose_name='Idempotency Key')),
+                ('status', models.CharField(choices=[('SUCCESS', 'Success'), ('FAILED', 'Failed')], db_index=True, max_length=10, verbose_name='Status')),
+                ('amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=15, verbose_name='Amount')),
+                ('failure_reason', models.TextField(blank=True, null=True, verbose_name='Failure Reason')),
+                ('credit_transaction', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='savings.savingstransaction')),
+                ('debit_transaction', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='savings.savingstransaction')),
+                ('standing_order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='executions', to='savings.standingorder')),
+            ],
+            options={
+                'verbose_name': 'Standing Order Execution',
+                'verbose_name_plural': 'Standing Order Executions',
+                'ordering': ['-run_date'],
+                'indexes': [models.Index(fields=['run_date', 'status'], name='savings_sta_run_dat_e860a4_idx')],
+            },
+        ),
+    ]
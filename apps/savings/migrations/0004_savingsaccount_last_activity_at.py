@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 21:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('savings', '0003_standingorderexecution'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savingsaccount',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='Date of the latest transaction, maintained by the ledger posting path', null=True, verbose_name='Last Activity'),
+        ),
+        migrations.AddIndex(
+            model_name='savingsaccount',
+            index=models.Index(fields=['savings_product', 'status', 'last_activity_at'], name='savings_sav_savings_4d8366_idx'),
+        ),
+    ]
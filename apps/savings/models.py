@@ -13,6 +13,7 @@ from dateutil.relativedelta import relativedelta
 from django.db.models import Q, Sum, Count, F
 
 from utils.models import BaseModel
+from kojenasacco.managers import SaccoManager
 from core.utils import get_base_currency, format_money, get_active_fiscal_period
 
 import logging
@@ -628,6 +629,14 @@ class SavingsAccount(BaseModel):
         help_text=_("For fixed deposits - when deposit matures")
     )
     
+    last_activity_at = models.DateTimeField(
+        _("Last Activity"),
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("Date of the latest transaction, maintained by the ledger posting path")
+    )
+    
     # Interest Tracking
     last_interest_calculated_date = models.DateField(
         _("Last Interest Calculated"),
@@ -722,8 +731,9 @@ class SavingsAccount(BaseModel):
     @property
     def last_transaction_date(self):
         """Get last transaction date for this account"""
-        last_transaction = self.transactions.order_by('-transaction_date').first()
-        return last_transaction.transaction_date.date() if last_transaction else None
+        if not self.last_activity_at:
+            return None
+        return timezone.localtime(self.last_activity_at).date()
     
     @property
     def effective_status(self):
@@ -869,8 +879,14 @@ class SavingsAccount(BaseModel):
     
     def update_available_balance(self):
         """Update available balance based on current balance and holds"""
-        self.available_balance = max(self.current_balance - self.hold_amount, Decimal('0.00'))
-        self.save(update_fields=['available_balance'])
+        from .utils import available_balance_expression
+        
+        # Computed in the database from the stored balances, not from this
+        # (possibly stale) instance
+        SavingsAccount.objects.filter(pk=self.pk).update(
+            available_balance=available_balance_expression()
+        )
+        self.refresh_from_db(fields=['current_balance', 'hold_amount', 'available_balance'])
     
     def __str__(self):
         return f"{self.account_number} - {self.member.get_full_name()}"
@@ -884,6 +900,7 @@ class SavingsAccount(BaseModel):
             models.Index(fields=['member', 'status']),
             models.Index(fields=['savings_product', 'is_fixed_deposit']),
             models.Index(fields=['status', 'opening_date']),
+            models.Index(fields=['savings_product', 'status', 'last_activity_at']),
         ]
 
 
@@ -1135,6 +1152,92 @@ class SavingsTransaction(BaseModel):
         ]
 
 
+# =============================================================================
+# DAILY ACCOUNT BALANCES
+# =============================================================================
+
+class DailyAccountBalance(models.Model):
+    """
+    End-of-day closing balance per savings account.
+
+    A row is only written for days on which the account had activity. The
+    balance on any other day is the closing balance of the latest row on or
+    before that day (range semantics), so quiet accounts cost nothing.
+
+    Deliberately narrow - no BaseModel audit columns - since the table holds
+    one row per active account per business day.
+    """
+
+    account = models.ForeignKey(
+        SavingsAccount,
+        on_delete=models.CASCADE,
+        related_name='daily_balances',
+        help_text=_("Savings account this balance belongs to")
+    )
+
+    balance_date = models.DateField(
+        _("Balance Date"),
+        help_text=_("Business day (SACCO timezone) this balance closes")
+    )
+
+    closing_balance = models.DecimalField(
+        _("Closing Balance"),
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+
+    total_credits = models.DecimalField(
+        _("Total Credits"),
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+
+    total_debits = models.DecimalField(
+        _("Total Debits"),
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_("Debits including fees and taxes")
+    )
+
+    transaction_count = models.PositiveIntegerField(
+        _("Transaction Count"),
+        default=0
+    )
+
+    # Use SaccoManager for automatic database routing
+    objects = SaccoManager()
+
+    @property
+    def opening_balance(self):
+        """Balance carried into the day"""
+        return self.closing_balance - self.total_credits + self.total_debits
+
+    @property
+    def net_change(self):
+        """Net movement for the day"""
+        return self.total_credits - self.total_debits
+
+    def __str__(self):
+        return f"{self.account_id} @ {self.balance_date}: {self.closing_balance}"
+
+    class Meta:
+        verbose_name = _("Daily Account Balance")
+        verbose_name_plural = _("Daily Account Balances")
+        ordering = ['account', '-balance_date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['account', 'balance_date'],
+                name='unique_daily_balance_per_account'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['balance_date']),
+        ]
+
+
 # =============================================================================
 # INTEREST CALCULATIONS
 # =============================================================================
@@ -1487,6 +1590,90 @@ class StandingOrder(BaseModel):
         ]
 
 
+class StandingOrderExecution(BaseModel):
+    """
+    One execution attempt of a standing order for a run date.
+
+    The idempotency key (order, run date) is unique, so a rerun of the
+    executor - or two executors racing - can never post the same order twice
+    for the same day. Failed attempts are replaced when the order is retried.
+    """
+
+    STATUS_CHOICES = [
+        ('SUCCESS', _('Success')),
+        ('FAILED', _('Failed')),
+    ]
+
+    standing_order = models.ForeignKey(
+        StandingOrder,
+        on_delete=models.CASCADE,
+        related_name='executions'
+    )
+
+    run_date = models.DateField(
+        _("Run Date")
+    )
+
+    idempotency_key = models.CharField(
+        _("Idempotency Key"),
+        max_length=64,
+        unique=True,
+        help_text=_("<standing order id>:<run date>")
+    )
+
+    status = models.CharField(
+        _("Status"),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        db_index=True
+    )
+
+    amount = models.DecimalField(
+        _("Amount"),
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+
+    debit_transaction = models.ForeignKey(
+        SavingsTransaction,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+
+    credit_transaction = models.ForeignKey(
+        SavingsTransaction,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+
+    failure_reason = models.TextField(
+        _("Failure Reason"),
+        null=True,
+        blank=True
+    )
+
+    @staticmethod
+    def build_idempotency_key(standing_order_id, run_date):
+        """Idempotency key for an order on a run date"""
+        return f"{standing_order_id}:{run_date.isoformat()}"
+
+    def __str__(self):
+        return f"{self.idempotency_key} ({self.status})"
+
+    class Meta:
+        verbose_name = _("Standing Order Execution")
+        verbose_name_plural = _("Standing Order Executions")
+        ordering = ['-run_date']
+        indexes = [
+            models.Index(fields=['run_date', 'status']),
+        ]
+
+
 # =============================================================================
 # SAVINGS GOALS
 # =============================================================================
@@ -22,7 +22,7 @@ from django.db import transaction
 from django.utils import timezone
 from decimal import Decimal
 from datetime import timedelta
-from django.db.models import Q
+from django.db.models import Q, F
 import logging
 
 from .models import (
@@ -249,6 +249,321 @@ class TransactionService:
             return False, str(e)
 
 
+# =============================================================================
+# BULK POSTING SERVICES
+# =============================================================================
+
+class BulkDepositService:
+    """
+    Post payroll and check-off deposit files in bulk.
+
+    Lines are processed in chunks. Each chunk resolves its account numbers
+    with one IN query, validates every line in memory against balances read
+    under a row lock, inserts the accepted deposits with bulk_create and
+    writes the new balances with one grouped UPDATE. A chunk is all-or-nothing:
+    if any write fails, every line in it is reported as rejected.
+
+    bulk_create bypasses the SavingsTransaction signals, so this service
+    assigns transaction IDs, running balances and the fiscal period itself.
+    """
+
+    CHUNK_SIZE = 500
+
+    @staticmethod
+    def _parse_amount(value):
+        """Parse an amount cell, returning None if it is not a number"""
+        from decimal import InvalidOperation
+
+        if value is None:
+            return None
+        try:
+            return Decimal(str(value).replace(',', '').strip()).quantize(Decimal('0.01'))
+        except (InvalidOperation, ValueError):
+            return None
+
+    @staticmethod
+    def _cell(row, *names):
+        """First non-empty value among the given column names"""
+        for name in names:
+            value = row.get(name)
+            if value not in (None, ''):
+                return str(value).strip()
+        return None
+
+    @staticmethod
+    def post_file(uploaded_file, payment_method=None, posting_date=None,
+                  description=None, processed_by=None, chunk_size=None):
+        """
+        Parse a CSV/XLSX deposit file and post it.
+
+        Expected columns: account_number, amount and optionally
+        reference_number (or reference) and description.
+
+        Rows are read lazily, so a file that turns out to be unreadable
+        part-way through has already posted its earlier chunks. The summary
+        then carries 'read_error' and 'last_line', the last line of the last
+        committed chunk.
+
+        Returns:
+            tuple: (success, summary_dict_or_error_message). success is False
+                only when the file could not be read before anything was
+                committed.
+        """
+        from utils.utils import iter_tabular_rows
+
+        try:
+            summary = BulkDepositService.post_lines(
+                iter_tabular_rows(uploaded_file),
+                payment_method=payment_method,
+                posting_date=posting_date,
+                description=description,
+                processed_by=processed_by,
+                chunk_size=chunk_size,
+            )
+        except ValueError as e:
+            return False, str(e)
+
+        if summary['read_error'] and summary['last_line'] is None:
+            return False, summary['read_error']
+
+        return True, summary
+
+    @staticmethod
+    def post_lines(lines, payment_method=None, posting_date=None,
+                   description=None, processed_by=None, chunk_size=None):
+        """
+        Post deposit lines chunk by chunk.
+
+        Args:
+            lines: Iterable of (line_number, row_dict)
+            payment_method: PaymentMethod applied to every deposit
+            posting_date: Post/value date (defaults to today)
+            description: Default narration for lines without one
+            processed_by: User posting the file
+            chunk_size: Lines per chunk (defaults to CHUNK_SIZE)
+
+        Returns:
+            dict: Totals plus a per-line 'rejections' list, 'last_line' (last
+                line of the last committed chunk) and 'read_error' (message of
+                a ValueError raised while reading lines, which stops posting
+                before the unread chunk)
+        """
+        from utils.utils import chunked
+        from core.utils import get_active_fiscal_period
+
+        summary = {
+            'total_lines': 0,
+            'posted': 0,
+            'rejected': 0,
+            'total_amount': Decimal('0.00'),
+            'accounts': 0,
+            'rejections': [],
+            'last_line': None,
+            'read_error': None,
+        }
+
+        context = {
+            'payment_method': payment_method,
+            'posting_date': posting_date or timezone.now().date(),
+            'description': description or 'Deposit',
+            'processed_by_id': str(processed_by.id) if processed_by else None,
+            'financial_period': get_active_fiscal_period(),
+        }
+
+        chunks = chunked(lines, chunk_size or BulkDepositService.CHUNK_SIZE)
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                break
+            except ValueError as e:
+                # Earlier chunks are committed: report them with the error
+                summary['read_error'] = str(e)
+                logger.warning(f"Bulk deposit stopped after line {summary['last_line']}: {e}")
+                break
+
+            result = BulkDepositService._post_chunk(chunk, context)
+
+            summary['total_lines'] += len(chunk)
+            summary['posted'] += result['posted']
+            summary['total_amount'] += result['total_amount']
+            summary['accounts'] += result['accounts']
+            summary['rejections'].extend(result['rejections'])
+            summary['last_line'] = chunk[-1][0]
+
+        summary['rejections'].sort(key=lambda rejection: rejection['line'])
+        summary['rejected'] = len(summary['rejections'])
+
+        logger.info(
+            f"Bulk deposit: {summary['posted']} of {summary['total_lines']} lines posted, "
+            f"total {summary['total_amount']}, {summary['rejected']} rejected"
+        )
+        return summary
+
+    @staticmethod
+    def _post_chunk(chunk, context):
+        """Validate and post one chunk of lines atomically"""
+        from .utils import (
+            generate_transaction_id_block,
+            calculate_available_balance,
+            bulk_set_account_balances,
+        )
+        from members.services import MemberActivityService
+
+        result = {
+            'posted': 0,
+            'total_amount': Decimal('0.00'),
+            'accounts': 0,
+            'rejections': [],
+        }
+
+        def reject(line, reason):
+            result['rejections'].append({
+                'line': line['line'],
+                'account_number': line['account_number'],
+                'amount': line['raw_amount'],
+                'reference_number': line['reference_number'],
+                'reason': reason,
+            })
+
+        # Parse lines
+        lines = []
+        for line_number, row in chunk:
+            line = {
+                'line': line_number,
+                'account_number': BulkDepositService._cell(row, 'account_number', 'account_no', 'account'),
+                'raw_amount': BulkDepositService._cell(row, 'amount'),
+                'reference_number': BulkDepositService._cell(row, 'reference_number', 'reference'),
+                'description': BulkDepositService._cell(row, 'description', 'narration'),
+            }
+            line['amount'] = BulkDepositService._parse_amount(line['raw_amount'])
+
+            if not line['account_number']:
+                reject(line, "Missing account number")
+            elif line['amount'] is None or line['amount'] <= 0:
+                reject(line, "Invalid amount")
+            else:
+                lines.append(line)
+
+        if not lines:
+            return result
+
+        # Resolve accounts with one indexed IN query
+        accounts = {
+            account.account_number: account
+            for account in SavingsAccount.objects.select_related(
+                'savings_product', 'member'
+            ).filter(
+                account_number__in={line['account_number'] for line in lines}
+            )
+        }
+
+        # References already posted, so a re-uploaded file is not posted twice
+        references = {line['reference_number'] for line in lines if line['reference_number']}
+        posted_references = set()
+        if references and accounts:
+            posted_references = set(
+                SavingsTransaction.objects.filter(
+                    account__in=list(accounts.values()),
+                    transaction_type='DEPOSIT',
+                    reference_number__in=references,
+                    is_reversed=False
+                ).values_list('account_id', 'reference_number')
+            )
+
+        try:
+            with transaction.atomic():
+                # Lock touched accounts in primary key order and read fresh balances
+                locked = {
+                    pk: (balance, hold)
+                    for pk, balance, hold in SavingsAccount.objects.select_for_update().filter(
+                        pk__in=[account.pk for account in accounts.values()]
+                    ).order_by('pk').values_list('pk', 'current_balance', 'hold_amount')
+                }
+                running = {pk: balance for pk, (balance, _hold) in locked.items()}
+
+                # Validate in memory
+                accepted = []
+                for line in lines:
+                    account = accounts.get(line['account_number'])
+                    if account is None:
+                        reject(line, "Account not found")
+                        continue
+
+                    key = (account.pk, line['reference_number'])
+                    if line['reference_number'] and key in posted_references:
+                        reject(line, "Duplicate reference number for this account")
+                        continue
+
+                    account.current_balance = running[account.pk]
+                    is_valid, message = validate_deposit(account, line['amount'])
+                    if not is_valid:
+                        reject(line, message)
+                        continue
+
+                    running[account.pk] += line['amount']
+                    if line['reference_number']:
+                        posted_references.add(key)
+                    accepted.append((line, account, running[account.pk]))
+
+                if not accepted:
+                    return result
+
+                # Bulk insert the deposits
+                now = timezone.now()
+                transaction_ids = generate_transaction_id_block('DEP', len(accepted))
+                transactions = [
+                    SavingsTransaction(
+                        transaction_id=txn_id,
+                        account=account,
+                        transaction_type='DEPOSIT',
+                        amount=line['amount'],
+                        fees=account.savings_product.calculate_deposit_fee(line['amount']),
+                        transaction_date=now,
+                        post_date=context['posting_date'],
+                        value_date=context['posting_date'],
+                        payment_method=context['payment_method'],
+                        reference_number=line['reference_number'],
+                        description=line['description'] or context['description'],
+                        running_balance=running_balance,
+                        financial_period=context['financial_period'],
+                        created_by_id=context['processed_by_id'],
+                        updated_by_id=context['processed_by_id'],
+                    )
+                    for txn_id, (line, account, running_balance) in zip(transaction_ids, accepted)
+                ]
+                SavingsTransaction.objects.bulk_create(transactions)
+
+                # One grouped UPDATE for every touched account
+                touched = {account.pk for _line, account, _balance in accepted}
+                bulk_set_account_balances({
+                    pk: (running[pk], calculate_available_balance(running[pk], locked[pk][1]))
+                    for pk in touched
+                }, activity_at=now)
+                MemberActivityService.record({account.member_id: now for _line, account, _balance in accepted})
+
+                # Approve pending accounts that now meet the opening balance
+                for account in {account.pk: account for _line, account, _balance in accepted}.values():
+                    if account.status == 'PENDING_APPROVAL':
+                        account.current_balance = running[account.pk]
+                        if account.current_balance >= account.savings_product.minimum_opening_balance:
+                            account.approve_account()
+
+        except Exception as e:
+            logger.error(f"Bulk deposit chunk starting at line {chunk[0][0]} rolled back: {e}")
+            already_rejected = {rejection['line'] for rejection in result['rejections']}
+            for line in lines:
+                if line['line'] not in already_rejected:
+                    reject(line, f"Chunk rolled back: {e}")
+            result['total_amount'] = Decimal('0.00')
+            return result
+
+        result['posted'] = len(accepted)
+        result['total_amount'] = sum((line['amount'] for line, _account, _balance in accepted), Decimal('0.00'))
+        result['accounts'] = len(touched)
+        return result
+
+
 # =============================================================================
 # INTEREST SERVICES
 # =============================================================================
@@ -462,75 +777,461 @@ class StandingOrderService:
             order.save()
             return False, "Standing order has ended"
         
-        try:
-            # Execute transfer
-            success, result = TransactionService.process_transfer(
-                source_account=order.source_account,
-                destination_account=order.destination_account,
-                amount=order.amount,
-                description=f"Standing order: {order.description or 'Automated transfer'}"
-            )
-            
-            if success:
-                # Update order
-                order.execution_count += 1
-                order.last_execution_date = today
-                order.last_execution_status = 'SUCCESS'
-                order.next_run_date = calculate_next_frequency_date(today, order.frequency)
-                order.save()
-                
-                logger.info(f"Executed standing order {order.id}")
-                return True, result
-            else:
-                # Record failure
-                order.last_execution_status = 'FAILED'
-                order.last_failure_reason = result
-                order.save()
-                
-                return False, result
-                
-        except Exception as e:
-            logger.error(f"Error executing standing order {order.id}: {e}")
-            order.last_execution_status = 'FAILED'
-            order.last_failure_reason = str(e)
-            order.save()
-            return False, str(e)
+        # Execute through the batch executor so manual runs share its
+        # locking order and idempotency key
+        outcome = StandingOrderExecutor.execute_unit([order], today)
+        
+        if outcome['transactions']:
+            order.refresh_from_db()
+            logger.info(f"Executed standing order {order.id}")
+            return True, outcome['transactions'][0]
+        
+        if outcome['errors']:
+            order.refresh_from_db()
+            return False, outcome['errors'][0]['error']
+        
+        return False, "Standing order has already been executed today"
     
     @staticmethod
-    def execute_due_standing_orders(execution_date=None):
+    def execute_due_standing_orders(execution_date=None, max_workers=None):
         """
         Execute all due standing orders.
         
+        Delegates to StandingOrderExecutor, which batches the transfer legs,
+        locks accounts in primary key order and records an idempotent
+        execution per (order, run date).
+        
         Returns:
             dict: Execution summary
         """
+        return StandingOrderExecutor.run(execution_date, max_workers=max_workers)
+
+
+class StandingOrderExecutor:
+    """
+    Batch executor for due standing orders.
+    
+    Due orders are loaded once with their accounts and grouped by source
+    account. Groups that share any account are merged into one unit of work,
+    so units are independent and can run in parallel worker threads. Each
+    unit locks its accounts in primary key order (no lock-order deadlocks),
+    validates the orders in memory against the locked balances, bulk-inserts
+    both transfer legs and writes all balances with one grouped UPDATE.
+    Transaction IDs for every pending order are reserved once before the
+    units are dispatched, so parallel units never draw the same counter.
+    
+    Every attempt is recorded as a StandingOrderExecution keyed by
+    (order, run date); orders that already succeeded for the run date are
+    skipped, so reruns are safe.
+    """
+    
+    MAX_WORKERS = 4
+    
+    @staticmethod
+    def run(execution_date=None, max_workers=None):
+        """
+        Execute every due standing order for a run date.
+        
+        Args:
+            execution_date: Run date (defaults to today)
+            max_workers: Parallel worker threads (defaults to MAX_WORKERS)
+        
+        Returns:
+            dict: {'total', 'successful', 'failed', 'skipped', 'transactions', 'errors'}
+        """
+        from .models import StandingOrderExecution
+        
         if execution_date is None:
             execution_date = timezone.now().date()
         
-        due_orders = StandingOrder.get_due_standing_orders(execution_date)
+        due_orders = list(
+            StandingOrder.get_due_standing_orders(execution_date).select_related(
+                'source_account__savings_product',
+                'source_account__member',
+                'destination_account__savings_product',
+                'destination_account__member',
+            )
+        )
         
         results = {
-            'total': due_orders.count(),
+            'total': len(due_orders),
             'successful': 0,
             'failed': 0,
+            'skipped': 0,
             'transactions': [],
             'errors': [],
         }
         
-        for order in due_orders:
-            success, result = StandingOrderService.execute_standing_order(order)
-            
-            if success:
-                results['successful'] += 1
-                results['transactions'].append(result)
-            else:
-                results['failed'] += 1
-                results['errors'].append({
-                    'order_id': order.id,
-                    'error': result
-                })
+        if not due_orders:
+            return results
+        
+        # Orders already executed for this run date
+        executed = set(
+            StandingOrderExecution.objects.filter(
+                run_date=execution_date,
+                status='SUCCESS',
+                standing_order__in=due_orders
+            ).values_list('standing_order_id', flat=True)
+        )
         
+        # Orders past their end date are completed in one UPDATE
+        ended = [
+            order for order in due_orders
+            if order.pk not in executed and order.end_date and execution_date > order.end_date
+        ]
+        if ended:
+            StandingOrder.objects.filter(pk__in=[order.pk for order in ended]).update(
+                status='COMPLETED',
+                updated_at=timezone.now()
+            )
+            for order in ended:
+                results['failed'] += 1
+                results['errors'].append({'order_id': order.id, 'error': "Standing order has ended"})
+        
+        ended_ids = {order.pk for order in ended}
+        pending = [
+            order for order in due_orders
+            if order.pk not in executed and order.pk not in ended_ids
+        ]
+        results['skipped'] = len(executed)
+        
+        transaction_ids = StandingOrderExecutor.reserve_transaction_ids(pending)
+        units = StandingOrderExecutor.group_orders(pending)
+        for outcome in StandingOrderExecutor._run_units(units, execution_date, max_workers, transaction_ids):
+            results['successful'] += len(outcome['transactions'])
+            results['transactions'].extend(outcome['transactions'])
+            results['failed'] += len(outcome['errors'])
+            results['errors'].extend(outcome['errors'])
+        
+        logger.info(
+            f"Standing orders for {execution_date}: {results['successful']} executed, "
+            f"{results['failed']} failed, {results['skipped']} already executed"
+        )
         return results
+    
+    @staticmethod
+    def group_orders(orders):
+        """
+        Group orders by source account, merging groups that touch a common account.
+        
+        Returns:
+            list: Lists of orders; no account appears in more than one list
+        """
+        parent = {}
+        
+        def find(account_id):
+            parent.setdefault(account_id, account_id)
+            while parent[account_id] != account_id:
+                parent[account_id] = parent[parent[account_id]]
+                account_id = parent[account_id]
+            return account_id
+        
+        for order in orders:
+            root = find(order.source_account_id)
+            if order.destination_account_id:
+                parent[find(order.destination_account_id)] = root
+        
+        units = {}
+        for order in orders:
+            units.setdefault(find(order.source_account_id), []).append(order)
+        
+        return list(units.values())
+    
+    @staticmethod
+    def reserve_transaction_ids(orders):
+        """
+        Reserve debit and credit leg IDs for orders in one block per leg type.
+        
+        Orders rejected during validation leave gaps in the counters.
+        
+        Returns:
+            dict: {order_pk: (debit_id, credit_id)}
+        """
+        from .utils import generate_transaction_id_block
+        
+        out_ids = generate_transaction_id_block('TFO', len(orders))
+        in_ids = generate_transaction_id_block('TFI', len(orders))
+        
+        return {
+            order.pk: (out_id, in_id)
+            for order, out_id, in_id in zip(orders, out_ids, in_ids)
+        }
+    
+    @staticmethod
+    def _run_units(units, execution_date, max_workers=None, transaction_ids=None):
+        """Run units inline or across worker threads"""
+        from concurrent.futures import ThreadPoolExecutor
+        from kojenasacco.managers import get_current_db
+        
+        max_workers = max_workers or StandingOrderExecutor.MAX_WORKERS
+        if max_workers <= 1 or len(units) <= 1:
+            return [
+                StandingOrderExecutor.execute_unit(unit, execution_date, transaction_ids)
+                for unit in units
+            ]
+        
+        db_name = get_current_db()
+        
+        def work(unit):
+            from django.db import connections
+            from kojenasacco.managers import DatabaseContext
+            
+            try:
+                # Worker threads do not inherit the caller's tenant database
+                if db_name:
+                    with DatabaseContext(db_name):
+                        return StandingOrderExecutor.execute_unit(unit, execution_date, transaction_ids)
+                return StandingOrderExecutor.execute_unit(unit, execution_date, transaction_ids)
+            finally:
+                connections.close_all()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(work, units))
+    
+    @staticmethod
+    def execute_unit(orders, execution_date, transaction_ids=None):
+        """
+        Execute one independent group of orders in a single transaction.
+        
+        Args:
+            orders (list): StandingOrder instances of one unit
+            execution_date: Run date
+            transaction_ids (dict, optional): {order_pk: (debit_id, credit_id)}
+                from reserve_transaction_ids(); reserved here when omitted
+        
+        Returns:
+            dict: {'transactions': [(txn_out, txn_in), ...], 'errors': [...]}
+        """
+        from .models import StandingOrderExecution
+        
+        outcome = {'transactions': [], 'errors': []}
+        keys = {
+            order.pk: StandingOrderExecution.build_idempotency_key(order.pk, execution_date)
+            for order in orders
+        }
+        
+        try:
+            with transaction.atomic():
+                failures, posted = StandingOrderExecutor._post_unit(
+                    orders, execution_date, keys, transaction_ids
+                )
+        except Exception as e:
+            logger.error(f"Standing order batch rolled back: {e}")
+            # Record the failure outside the rolled-back transaction
+            StandingOrderExecutor._record_failures(
+                {order.pk: str(e) for order in orders}, orders, execution_date, keys
+            )
+            outcome['errors'] = [{'order_id': order.id, 'error': str(e)} for order in orders]
+            return outcome
+        
+        outcome['transactions'] = posted
+        outcome['errors'] = [
+            {'order_id': order.id, 'error': failures[order.pk]}
+            for order in orders if order.pk in failures
+        ]
+        return outcome
+    
+    @staticmethod
+    def _post_unit(orders, execution_date, keys, transaction_ids=None):
+        """Lock, validate and post a unit. Must run inside transaction.atomic()."""
+        from .models import StandingOrderExecution
+        from .utils import calculate_available_balance, bulk_set_account_balances
+        from members.services import MemberActivityService
+        
+        # One in-memory instance per account, shared by all orders touching it
+        accounts = {}
+        for order in orders:
+            accounts.setdefault(order.source_account_id, order.source_account)
+            if order.destination_account_id:
+                accounts.setdefault(order.destination_account_id, order.destination_account)
+        
+        # Lock every account in the unit in primary key order
+        locked = SavingsAccount.objects.select_for_update().filter(
+            pk__in=list(accounts)
+        ).order_by('pk').values_list('pk', 'current_balance', 'hold_amount')
+        holds = {}
+        for pk, balance, hold in locked:
+            accounts[pk].current_balance = balance
+            accounts[pk].available_balance = calculate_available_balance(balance, hold)
+            holds[pk] = hold
+        
+        # Re-check under the lock in case another run finished these orders
+        already_done = set(
+            StandingOrderExecution.objects.filter(
+                idempotency_key__in=list(keys.values()),
+                status='SUCCESS'
+            ).values_list('standing_order_id', flat=True)
+        )
+        
+        failures = {}
+        accepted = []
+        for order in sorted(orders, key=lambda o: (o.source_account_id, o.next_run_date, o.pk)):
+            if order.pk in already_done:
+                continue
+            if not order.destination_account_id:
+                failures[order.pk] = "Standing order has no destination account"
+                continue
+            
+            source = accounts[order.source_account_id]
+            destination = accounts[order.destination_account_id]
+            is_valid, message = validate_transfer(source, destination, order.amount)
+            if not is_valid:
+                failures[order.pk] = message
+                continue
+            
+            source.current_balance -= order.amount
+            source.available_balance = calculate_available_balance(source.current_balance, holds[source.pk])
+            destination.current_balance += order.amount
+            destination.available_balance = calculate_available_balance(destination.current_balance, holds[destination.pk])
+            accepted.append((order, source.current_balance, destination.current_balance))
+        
+        posted = []
+        executions = []
+        now = timezone.now()
+        
+        if accepted:
+            from core.utils import get_active_fiscal_period
+            financial_period = get_active_fiscal_period()
+            
+            if transaction_ids is None:
+                transaction_ids = StandingOrderExecutor.reserve_transaction_ids(
+                    [order for order, _s, _d in accepted]
+                )
+            
+            legs_out = []
+            legs_in = []
+            for order, source_balance, destination_balance in accepted:
+                out_id, in_id = transaction_ids[order.pk]
+                description = f"Standing order: {order.description or 'Automated transfer'}"
+                txn_out = SavingsTransaction(
+                    transaction_id=out_id,
+                    account_id=order.source_account_id,
+                    transaction_type='TRANSFER_OUT',
+                    amount=order.amount,
+                    transaction_date=now,
+                    post_date=execution_date,
+                    value_date=execution_date,
+                    linked_account_id=order.destination_account_id,
+                    description=description,
+                    running_balance=source_balance,
+                    financial_period=financial_period,
+                )
+                txn_in = SavingsTransaction(
+                    transaction_id=in_id,
+                    account_id=order.destination_account_id,
+                    transaction_type='TRANSFER_IN',
+                    amount=order.amount,
+                    transaction_date=now,
+                    post_date=execution_date,
+                    value_date=execution_date,
+                    linked_account_id=order.source_account_id,
+                    linked_transaction=txn_out,
+                    description=description,
+                    running_balance=destination_balance,
+                    financial_period=financial_period,
+                )
+                legs_out.append(txn_out)
+                legs_in.append(txn_in)
+                posted.append((txn_out, txn_in))
+            
+            # Debit legs first so the credit legs can reference them, then
+            # link the debit legs back in one UPDATE
+            SavingsTransaction.objects.bulk_create(legs_out)
+            SavingsTransaction.objects.bulk_create(legs_in)
+            for txn_out, txn_in in posted:
+                txn_out.linked_transaction = txn_in
+            SavingsTransaction.objects.bulk_update(legs_out, ['linked_transaction'])
+            
+            touched = {pk for order, _s, _d in accepted for pk in (order.source_account_id, order.destination_account_id)}
+            bulk_set_account_balances({
+                pk: (accounts[pk].current_balance, accounts[pk].available_balance)
+                for pk in touched
+            }, activity_at=now)
+            MemberActivityService.record({accounts[pk].member_id: now for pk in touched})
+            
+            for (order, _s, _d), (txn_out, txn_in) in zip(accepted, posted):
+                order.execution_count += 1
+                order.last_execution_date = execution_date
+                order.last_execution_status = 'SUCCESS'
+                order.last_failure_reason = None
+                order.next_run_date = calculate_next_frequency_date(execution_date, order.frequency)
+                order.updated_at = now
+                executions.append(StandingOrderExecution(
+                    standing_order=order,
+                    run_date=execution_date,
+                    idempotency_key=keys[order.pk],
+                    status='SUCCESS',
+                    amount=order.amount,
+                    debit_transaction=txn_out,
+                    credit_transaction=txn_in,
+                ))
+            
+            StandingOrder.objects.bulk_update(
+                [order for order, _s, _d in accepted],
+                ['execution_count', 'last_execution_date', 'last_execution_status',
+                 'last_failure_reason', 'next_run_date', 'updated_at']
+            )
+        
+        # Replace earlier failed attempts; the unique key rejects any duplicate success
+        StandingOrderExecution.objects.filter(
+            idempotency_key__in=[keys[order.pk] for order, _s, _d in accepted] + [keys[pk] for pk in failures],
+            status='FAILED'
+        ).delete()
+        StandingOrderExecution.objects.bulk_create(executions + [
+            StandingOrderExecution(
+                standing_order_id=pk,
+                run_date=execution_date,
+                idempotency_key=keys[pk],
+                status='FAILED',
+                failure_reason=reason,
+            )
+            for pk, reason in failures.items()
+        ])
+        
+        if failures:
+            StandingOrderExecutor._mark_orders_failed(failures, orders)
+        
+        return failures, posted
+    
+    @staticmethod
+    def _mark_orders_failed(failures, orders):
+        """Record the last failure on each failed order"""
+        failed_orders = []
+        for order in orders:
+            if order.pk in failures:
+                order.last_execution_status = 'FAILED'
+                order.last_failure_reason = failures[order.pk]
+                order.updated_at = timezone.now()
+                failed_orders.append(order)
+        
+        StandingOrder.objects.bulk_update(
+            failed_orders, ['last_execution_status', 'last_failure_reason', 'updated_at']
+        )
+    
+    @staticmethod
+    def _record_failures(failures, orders, execution_date, keys):
+        """Record failed attempts after a unit was rolled back"""
+        from .models import StandingOrderExecution
+        
+        try:
+            with transaction.atomic():
+                StandingOrderExecution.objects.filter(
+                    idempotency_key__in=[keys[pk] for pk in failures],
+                    status='FAILED'
+                ).delete()
+                StandingOrderExecution.objects.bulk_create([
+                    StandingOrderExecution(
+                        standing_order_id=pk,
+                        run_date=execution_date,
+                        idempotency_key=keys[pk],
+                        status='FAILED',
+                        failure_reason=reason,
+                    )
+                    for pk, reason in failures.items()
+                ], ignore_conflicts=True)
+                StandingOrderExecutor._mark_orders_failed(failures, orders)
+        except Exception as e:
+            logger.error(f"Could not record standing order failures: {e}")
 
 
 # =============================================================================
@@ -921,16 +1622,25 @@ class AccountService:
         if amount <= 0:
             return False, "Hold amount must be greater than zero"
         
-        if amount > account.available_balance:
-            from core.utils import format_money
-            return False, f"Insufficient available balance. Available: {format_money(account.available_balance)}"
+        from .utils import available_balance_expression
         
         try:
-            # Increase hold amount
-            account.hold_amount += amount
-            account.save(update_fields=['hold_amount', 'updated_at'])
+            # Atomic F-expression update; the filter refuses the hold if
+            # another teller has already used the funds
+            updated = SavingsAccount.objects.filter(
+                pk=account.pk,
+                current_balance__gte=F('hold_amount') + amount
+            ).update(
+                available_balance=available_balance_expression(hold_delta=amount),
+                hold_amount=F('hold_amount') + amount,
+                updated_at=timezone.now()
+            )
             
-            # Available balance will be auto-updated by signal
+            account.refresh_from_db(fields=['current_balance', 'hold_amount', 'available_balance'])
+            
+            if not updated:
+                from core.utils import format_money
+                return False, f"Insufficient available balance. Available: {format_money(account.available_balance)}"
             
             logger.info(
                 f"Placed hold on account {account.account_number} | "
@@ -970,16 +1680,25 @@ class AccountService:
         if amount <= 0:
             return False, "Release amount must be greater than zero"
         
-        if amount > account.hold_amount:
-            from core.utils import format_money
-            return False, f"Release amount exceeds total holds. Current holds: {format_money(account.hold_amount)}"
+        from .utils import available_balance_expression
         
         try:
-            # Decrease hold amount
-            account.hold_amount -= amount
-            account.save(update_fields=['hold_amount', 'updated_at'])
+            # Atomic F-expression update; the filter refuses releasing more
+            # than is currently held
+            updated = SavingsAccount.objects.filter(
+                pk=account.pk,
+                hold_amount__gte=amount
+            ).update(
+                available_balance=available_balance_expression(hold_delta=-amount),
+                hold_amount=F('hold_amount') - amount,
+                updated_at=timezone.now()
+            )
             
-            # Available balance will be auto-updated by signal
+            account.refresh_from_db(fields=['current_balance', 'hold_amount', 'available_balance'])
+            
+            if not updated:
+                from core.utils import format_money
+                return False, f"Release amount exceeds total holds. Current holds: {format_money(account.hold_amount)}"
             
             logger.info(
                 f"Released hold on account {account.account_number} | "
@@ -1061,7 +1780,79 @@ class AccountService:
         except Exception as e:
             logger.error(f"Error marking account {account.account_number} as dormant: {e}", exc_info=True)
             return False, f"Error marking account as dormant: {str(e)}"
-    
+
+    @staticmethod
+    def sweep_dormant_accounts(as_of=None):
+        """
+        Mark every eligible active account as dormant.
+
+        Set-based: products sharing a dormancy period form one rule, and each
+        rule is applied with a single UPDATE on the indexed last_activity_at
+        column instead of checking accounts one by one.
+
+        Args:
+            as_of: Reference date (defaults to today)
+
+        Returns:
+            dict: {'as_of', 'rules', 'accounts_marked'}
+        """
+        from .utils import get_dormancy_rules, dormancy_eligible_filter
+
+        as_of = as_of or timezone.now().date()
+        rules = get_dormancy_rules()
+
+        accounts_marked = 0
+        for days, product_ids in rules.items():
+            marked = SavingsAccount.objects.filter(
+                dormancy_eligible_filter(as_of, {days: product_ids}),
+                status='ACTIVE'
+            ).update(
+                status='DORMANT',
+                updated_at=timezone.now()
+            )
+            accounts_marked += marked
+
+            if marked:
+                logger.info(f"Dormancy sweep: {marked} account(s) inactive for {days}+ days marked DORMANT")
+
+        return {
+            'as_of': as_of,
+            'rules': len(rules),
+            'accounts_marked': accounts_marked,
+        }
+
+    @staticmethod
+    def backfill_last_activity(batch_size=5000):
+        """
+        Populate last_activity_at from transaction history.
+
+        Each batch of accounts is updated with one UPDATE ... SET = (subquery)
+        using the (account, transaction_date) index.
+
+        Args:
+            batch_size: Accounts per UPDATE
+
+        Returns:
+            int: Number of accounts updated
+        """
+        from django.db.models import OuterRef, Subquery
+        from utils.utils import chunked
+
+        latest_activity = SavingsTransaction.objects.filter(
+            account=OuterRef('pk')
+        ).order_by('-transaction_date').values('transaction_date')[:1]
+
+        account_ids = list(SavingsAccount.objects.order_by('pk').values_list('pk', flat=True))
+
+        updated = 0
+        for batch in chunked(account_ids, batch_size):
+            updated += SavingsAccount.objects.filter(pk__in=batch).update(
+                last_activity_at=Subquery(latest_activity)
+            )
+
+        logger.info(f"Backfilled last activity for {updated} account(s)")
+        return updated
+
     @staticmethod
     def get_account_summary(account):
         """
@@ -1150,3 +1941,275 @@ class AccountService:
         
         return summary
 
+
+
+# =============================================================================
+# BALANCE SNAPSHOT SERVICES
+# =============================================================================
+
+class BalanceSnapshotService:
+    """
+    Maintain end-of-day DailyAccountBalance rows.
+
+    Only accounts with activity on a day get a row for it; every other
+    account carries its previous closing balance forward (range semantics).
+    """
+    
+    CHUNK_SIZE = 1000
+    
+    @staticmethod
+    def _ledger_totals(transactions, group_fields):
+        """Grouped credit/debit/count totals for a transaction queryset"""
+        from django.db.models import Sum, Count
+        from .utils import ledger_credit_expression, ledger_debit_expression
+        
+        return transactions.values(*group_fields).annotate(
+            credits=Sum(ledger_credit_expression()),
+            debits=Sum(ledger_debit_expression()),
+            txn_count=Count('id'),
+        ).order_by(*group_fields)
+    
+    @staticmethod
+    def _replayed_balances(account_ids, before):
+        """Balances replayed from the ledger for transactions before a datetime"""
+        totals = BalanceSnapshotService._ledger_totals(
+            SavingsTransaction.objects.filter(
+                account_id__in=account_ids,
+                transaction_date__lt=before
+            ),
+            ['account_id']
+        )
+        return {
+            row['account_id']: (row['credits'] or Decimal('0.00')) - (row['debits'] or Decimal('0.00'))
+            for row in totals
+        }
+    
+    @staticmethod
+    def _carried_balances(account_ids, balance_date, day_start):
+        """
+        Closing balance carried into balance_date for each account.
+        
+        Read from the latest earlier snapshot in one query; accounts without
+        any earlier snapshot fall back to a single grouped ledger replay.
+        """
+        from django.db.models import OuterRef, Subquery
+        from .models import DailyAccountBalance
+        
+        latest = DailyAccountBalance.objects.filter(
+            account=OuterRef('pk'),
+            balance_date__lt=balance_date
+        ).order_by('-balance_date').values('closing_balance')[:1]
+        
+        carried = dict(
+            SavingsAccount.objects.filter(pk__in=account_ids).annotate(
+                carried=Subquery(latest)
+            ).values_list('pk', 'carried')
+        )
+        
+        missing = [pk for pk, balance in carried.items() if balance is None]
+        if missing:
+            replayed = BalanceSnapshotService._replayed_balances(missing, day_start)
+            for pk in missing:
+                carried[pk] = replayed.get(pk, Decimal('0.00'))
+        
+        return carried
+    
+    @staticmethod
+    def snapshot_day(balance_date=None):
+        """
+        Write closing balances for every account with activity on a day.
+        
+        Intended to run once at end of day; safe to re-run since rows are
+        upserted on (account, balance_date). Days with transactions since
+        the latest earlier snapshot (a missed run) are backfilled first, so
+        the balances carried into this day are never stale.
+        
+        Args:
+            balance_date (date, optional): Business day, defaults to today
+        
+        Returns:
+            dict: Run summary
+        """
+        from datetime import timedelta
+        from django.db.models import Max
+        from core.utils import get_sacco_today
+        from utils.utils import chunked, bulk_upsert
+        from .models import DailyAccountBalance
+        from .utils import get_business_day_bounds
+        
+        if balance_date is None:
+            balance_date = get_sacco_today()
+        
+        day_start, day_end = get_business_day_bounds(balance_date)
+        
+        last_snapshot = DailyAccountBalance.objects.filter(
+            balance_date__lt=balance_date
+        ).aggregate(last=Max('balance_date'))['last']
+        
+        gap_filled = None
+        if last_snapshot is not None and last_snapshot < balance_date - timedelta(days=1):
+            gap_start = last_snapshot + timedelta(days=1)
+            if SavingsTransaction.objects.filter(
+                transaction_date__gte=get_business_day_bounds(gap_start)[0],
+                transaction_date__lt=day_start
+            ).exists():
+                logger.warning(f"Daily balance snapshots missing since {last_snapshot}, backfilling")
+                gap_filled = BalanceSnapshotService.backfill(
+                    start_date=gap_start,
+                    end_date=balance_date - timedelta(days=1)
+                )['rows_written']
+        
+        activity = BalanceSnapshotService._ledger_totals(
+            SavingsTransaction.objects.filter(
+                transaction_date__gte=day_start,
+                transaction_date__lt=day_end
+            ),
+            ['account_id']
+        )
+        
+        results = {
+            'balance_date': balance_date,
+            'accounts': 0,
+            'rows_written': 0,
+            'gap_rows_written': gap_filled or 0,
+        }
+        
+        for chunk in chunked(activity.iterator(), BalanceSnapshotService.CHUNK_SIZE):
+            carried = BalanceSnapshotService._carried_balances(
+                [row['account_id'] for row in chunk],
+                balance_date,
+                day_start
+            )
+            
+            rows = []
+            for row in chunk:
+                credits = row['credits'] or Decimal('0.00')
+                debits = row['debits'] or Decimal('0.00')
+                rows.append(DailyAccountBalance(
+                    account_id=row['account_id'],
+                    balance_date=balance_date,
+                    closing_balance=carried.get(row['account_id'], Decimal('0.00')) + credits - debits,
+                    total_credits=credits,
+                    total_debits=debits,
+                    transaction_count=row['txn_count'],
+                ))
+            
+            with transaction.atomic():
+                results['rows_written'] += bulk_upsert(
+                    DailyAccountBalance,
+                    rows,
+                    unique_fields=['account', 'balance_date'],
+                    update_fields=['closing_balance', 'total_credits', 'total_debits', 'transaction_count'],
+                    batch_size=BalanceSnapshotService.CHUNK_SIZE,
+                )
+            results['accounts'] += len(chunk)
+        
+        logger.info(
+            f"Snapshot of daily balances for {balance_date}: "
+            f"{results['rows_written']} accounts with activity"
+        )
+        return results
+    
+    @staticmethod
+    def backfill(start_date=None, end_date=None, account_ids=None):
+        """
+        Rebuild DailyAccountBalance rows from transaction history.
+        
+        Runs a single grouped pass over the ledger ordered by account and day,
+        accumulating closing balances in memory and writing rows in chunks.
+        
+        Args:
+            start_date (date, optional): First day to rebuild, defaults to the
+                first transaction on record
+            end_date (date, optional): Last day to rebuild, defaults to yesterday
+            account_ids (list, optional): Restrict to these accounts
+        
+        Returns:
+            dict: Run summary
+        """
+        from datetime import timedelta
+        from django.db.models.functions import TruncDate
+        from core.utils import get_sacco_today, get_sacco_timezone
+        from utils.utils import bulk_upsert
+        from .models import DailyAccountBalance
+        from .utils import get_business_day_bounds
+        
+        if end_date is None:
+            end_date = get_sacco_today() - timedelta(days=1)
+        
+        transactions = SavingsTransaction.objects.all()
+        if account_ids is not None:
+            transactions = transactions.filter(account_id__in=account_ids)
+        
+        opening = {}
+        if start_date is not None:
+            range_start = get_business_day_bounds(start_date)[0]
+            transactions = transactions.filter(transaction_date__gte=range_start)
+            
+            base = SavingsTransaction.objects.filter(transaction_date__lt=range_start)
+            if account_ids is not None:
+                base = base.filter(account_id__in=account_ids)
+            opening = {
+                row['account_id']: (row['credits'] or Decimal('0.00')) - (row['debits'] or Decimal('0.00'))
+                for row in BalanceSnapshotService._ledger_totals(base, ['account_id'])
+            }
+        
+        range_end = get_business_day_bounds(end_date)[1]
+        transactions = transactions.filter(transaction_date__lt=range_end).annotate(
+            day=TruncDate('transaction_date', tzinfo=get_sacco_timezone())
+        )
+        
+        daily = BalanceSnapshotService._ledger_totals(transactions, ['account_id', 'day'])
+        
+        results = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'accounts': 0,
+            'rows_written': 0,
+        }
+        
+        def flush(rows):
+            with transaction.atomic():
+                results['rows_written'] += bulk_upsert(
+                    DailyAccountBalance,
+                    rows,
+                    unique_fields=['account', 'balance_date'],
+                    update_fields=['closing_balance', 'total_credits', 'total_debits', 'transaction_count'],
+                    batch_size=BalanceSnapshotService.CHUNK_SIZE,
+                )
+        
+        rows = []
+        current_account = None
+        balance = Decimal('0.00')
+        
+        for row in daily.iterator(chunk_size=BalanceSnapshotService.CHUNK_SIZE):
+            if row['account_id'] != current_account:
+                current_account = row['account_id']
+                balance = opening.get(current_account, Decimal('0.00'))
+                results['accounts'] += 1
+            
+            credits = row['credits'] or Decimal('0.00')
+            debits = row['debits'] or Decimal('0.00')
+            balance += credits - debits
+            
+            rows.append(DailyAccountBalance(
+                account_id=current_account,
+                balance_date=row['day'],
+                closing_balance=balance,
+                total_credits=credits,
+                total_debits=debits,
+                transaction_count=row['txn_count'],
+            ))
+            
+            if len(rows) >= BalanceSnapshotService.CHUNK_SIZE:
+                flush(rows)
+                rows = []
+        
+        if rows:
+            flush(rows)
+        
+        logger.info(
+            f"Backfilled {results['rows_written']} daily balance rows "
+            f"for {results['accounts']} accounts up to {end_date}"
+        )
+        return results
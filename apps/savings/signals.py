@@ -7,6 +7,7 @@ Handles automatic operations on model save/delete:
 - Account number generation
 - Transaction ID generation
 - Balance updates
+- Member financial summary deltas
 - Status changes
 - Interest posting automation
 - Standing order date calculation
@@ -133,6 +134,61 @@ def log_account_creation(sender, instance, created, **kwargs):
         )
 
 
+@receiver(pre_save, sender=SavingsAccount)
+def remember_savings_contribution(sender, instance, **kwargs):
+    """
+    Remember the stored member, status and balance of the account so
+    post_save can apply only the change to the member's financial summary.
+    """
+    instance._previous_savings_contribution = None
+    
+    if instance._state.adding:
+        return
+    
+    previous = SavingsAccount.objects.filter(pk=instance.pk).values_list(
+        'member_id', 'status', 'current_balance'
+    ).first()
+    
+    if previous:
+        instance._previous_savings_contribution = previous
+
+
+@receiver(post_save, sender=SavingsAccount)
+def update_member_financial_summary_on_account_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Apply the account's change in total savings to the member's summary.
+    
+    Fields left out of update_fields keep their stored values, so saving a
+    stale instance with update_fields=['status'] uses the stored balance.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    previous_member_id, previous_status, previous_balance = (
+        getattr(instance, '_previous_savings_contribution', None) or (None, None, Decimal('0.00'))
+    )
+    
+    def written(field, value, stored):
+        return value if update_fields is None or field in update_fields else stored
+    
+    member_id = written('member', instance.member_id, previous_member_id)
+    previous_contribution = MemberFinancialSummaryService.savings_contribution(previous_status, previous_balance)
+    contribution = MemberFinancialSummaryService.savings_contribution(
+        written('status', instance.status, previous_status),
+        written('current_balance', instance.current_balance, previous_balance)
+    )
+    
+    deltas = {}
+    if previous_member_id is not None:
+        deltas[previous_member_id] = {'total_savings': -previous_contribution}
+    deltas.setdefault(member_id, {'total_savings': Decimal('0.00')})
+    deltas[member_id]['total_savings'] += contribution
+    
+    try:
+        MemberFinancialSummaryService.apply_deltas(deltas)
+    except Exception as e:
+        logger.error(f"Error updating member financial summary for account {instance.account_number}: {e}")
+
+
 # =============================================================================
 # SAVINGS TRANSACTION SIGNALS
 # =============================================================================
@@ -257,12 +313,31 @@ def update_account_balance_after_transaction(sender, instance, created, **kwargs
             from .utils import calculate_available_balance
             new_available = calculate_available_balance(new_balance, account.hold_amount)
             
+            # Keep the denormalized last activity in step with the ledger
+            last_activity_at = instance.transaction_date
+            if account.last_activity_at and account.last_activity_at > last_activity_at:
+                last_activity_at = account.last_activity_at
+            
             SavingsAccount.objects.filter(pk=account.pk).update(
                 current_balance=new_balance,
                 available_balance=new_available,
+                last_activity_at=last_activity_at,
                 updated_at=timezone.now()
             )
             
+            from members.services import MemberFinancialSummaryService, MemberActivityService
+            
+            MemberFinancialSummaryService.apply_delta(
+                account.member_id,
+                total_savings=(
+                    MemberFinancialSummaryService.savings_contribution(account.status, new_balance) -
+                    MemberFinancialSummaryService.savings_contribution(account.status, account.current_balance)
+                )
+            )
+            
+            if instance.transaction_type in MemberActivityService.SAVINGS_ACTIVITY_TYPES:
+                MemberActivityService.record({account.member_id: instance.transaction_date})
+            
             logger.info(
                 f"Updated account {account.account_number} balance: "
                 f"{account.current_balance} → {new_balance} | "
@@ -495,6 +570,22 @@ def log_account_deletion(sender, instance, **kwargs):
     )
 
 
+@receiver(post_delete, sender=SavingsAccount)
+def update_member_financial_summary_on_account_deletion(sender, instance, **kwargs):
+    """
+    Remove a deleted account's balance from the member's summary.
+    """
+    from members.services import MemberFinancialSummaryService
+    
+    contribution = MemberFinancialSummaryService.savings_contribution(instance.status, instance.current_balance)
+    
+    if contribution:
+        try:
+            MemberFinancialSummaryService.apply_delta(instance.member_id, total_savings=-contribution)
+        except Exception as e:
+            logger.error(f"Error updating member financial summary after account delete: {e}")
+
+
 @receiver(post_delete, sender=SavingsTransaction)
 def log_transaction_deletion(sender, instance, **kwargs):
     """
@@ -531,6 +622,9 @@ def disable_savings_signals():
         (pre_save, update_available_balance_on_save, SavingsAccount),
         (post_save, set_activated_date, SavingsAccount),
         (post_save, log_account_creation, SavingsAccount),
+        (pre_save, remember_savings_contribution, SavingsAccount),
+        (post_save, update_member_financial_summary_on_account_save, SavingsAccount),
+        (post_delete, update_member_financial_summary_on_account_deletion, SavingsAccount),
         (pre_save, generate_savings_transaction_id, SavingsTransaction),
         (pre_save, calculate_transaction_running_balance, SavingsTransaction),
         (pre_save, set_financial_period, SavingsTransaction),
@@ -564,6 +658,9 @@ def enable_savings_signals():
         (pre_save, update_available_balance_on_save, SavingsAccount),
         (post_save, set_activated_date, SavingsAccount),
         (post_save, log_account_creation, SavingsAccount),
+        (pre_save, remember_savings_contribution, SavingsAccount),
+        (post_save, update_member_financial_summary_on_account_save, SavingsAccount),
+        (post_delete, update_member_financial_summary_on_account_deletion, SavingsAccount),
         (pre_save, generate_savings_transaction_id, SavingsTransaction),
         (pre_save, calculate_transaction_running_balance, SavingsTransaction),
         (pre_save, set_financial_period, SavingsTransaction),
@@ -373,6 +373,7 @@ def get_account_statistics(filters=None):
             - is_fixed_deposit: Filter fixed deposit accounts
             - date_from: Filter accounts opened from date
             - date_to: Filter accounts opened to date
+            - as_of_date: Also report balances as they stood on this date
     
     Returns:
         dict: Account statistics
@@ -539,16 +540,40 @@ def get_account_statistics(filters=None):
     stats['account_age_distribution'] = age_ranges
     
     # Dormancy analysis
-    dormant_eligible = 0
-    for account in active_accounts.filter(status='ACTIVE'):
-        if account.is_dormant_eligible:
-            dormant_eligible += 1
+    from .utils import dormancy_eligible_filter
+    dormant_eligible = active_accounts.filter(
+        dormancy_eligible_filter(),
+        status='ACTIVE'
+    ).count()
     
     stats['dormancy'] = {
         'dormant_accounts': accounts.filter(status='DORMANT').count(),
         'eligible_for_dormancy': dormant_eligible,
     }
     
+    # Historical balances from end-of-day snapshots
+    if filters and filters.get('as_of_date'):
+        from .utils import annotate_balance_as_of
+        
+        as_of_date = filters['as_of_date']
+        historical = annotate_balance_as_of(
+            accounts.filter(opening_date__lte=as_of_date),
+            as_of_date
+        ).aggregate(
+            total_balance=Sum('balance_as_of'),
+            avg_balance=Avg('balance_as_of'),
+            max_balance=Max('balance_as_of'),
+            funded_accounts=Count('id', filter=Q(balance_as_of__gt=0)),
+        )
+        
+        stats['balances_as_of'] = {
+            'as_of_date': as_of_date.isoformat() if hasattr(as_of_date, 'isoformat') else str(as_of_date),
+            'total_balance': float(historical['total_balance'] or 0),
+            'average_balance': float(historical['avg_balance'] or 0),
+            'highest_balance': float(historical['max_balance'] or 0),
+            'funded_accounts': historical['funded_accounts'] or 0,
+        }
+    
     # Recent activity
     now = timezone.now()
     stats['recent_activity'] = {
@@ -869,6 +894,147 @@ def get_transaction_trends(period='monthly', months=12):
     }
 
 
+def get_balance_trends(period='monthly', months=12, product_id=None):
+    """
+    Get total savings balance over time from end-of-day snapshots
+    
+    Reads DailyAccountBalance instead of replaying transactions: one
+    aggregate for the balance carried into the window and one grouped
+    query for the movement in each period. Assumes snapshots have been
+    backfilled from the start of history.
+    
+    Args:
+        period: 'daily', 'weekly', 'monthly', 'quarterly', 'yearly'
+        months: Number of months to analyze
+        product_id: Optional savings product to restrict to
+    
+    Returns:
+        dict: Balance trend data (closing balance per period)
+    """
+    from .models import DailyAccountBalance
+    from core.utils import get_sacco_today
+    
+    end_date = get_sacco_today()
+    
+    if period == 'monthly':
+        start_date = end_date - timedelta(days=30 * months)
+        trunc_func = TruncMonth
+    elif period == 'weekly':
+        start_date = end_date - timedelta(weeks=months * 4)
+        trunc_func = TruncWeek
+    elif period == 'quarterly':
+        start_date = end_date - timedelta(days=90 * months)
+        trunc_func = TruncQuarter
+    elif period == 'yearly':
+        start_date = end_date - timedelta(days=365 * months)
+        trunc_func = TruncYear
+    else:  # daily
+        start_date = end_date - timedelta(days=months * 30)
+        trunc_func = None  # balance_date is already a calendar day
+    
+    snapshots = DailyAccountBalance.objects.all()
+    if product_id:
+        snapshots = snapshots.filter(account__savings_product_id=product_id)
+    
+    net_change = F('total_credits') - F('total_debits')
+    
+    carried = snapshots.filter(balance_date__lt=start_date).aggregate(
+        total=Sum(net_change)
+    )['total'] or Decimal('0.00')
+    
+    trends = snapshots.filter(
+        balance_date__gte=start_date,
+        balance_date__lte=end_date
+    ).annotate(
+        period=trunc_func('balance_date') if trunc_func else F('balance_date')
+    ).values('period').annotate(
+        credits=Sum('total_credits'),
+        debits=Sum('total_debits'),
+        transactions=Sum('transaction_count'),
+        active_accounts=Count('account', distinct=True),
+    ).order_by('period')
+    
+    running_balance = carried
+    trend_data = []
+    for item in trends:
+        credits = item['credits'] or Decimal('0.00')
+        debits = item['debits'] or Decimal('0.00')
+        running_balance += credits - debits
+        trend_data.append({
+            'period': item['period'].isoformat() if hasattr(item['period'], 'isoformat') else str(item['period']),
+            'closing_balance': float(running_balance),
+            'credits': float(credits),
+            'debits': float(debits),
+            'net_change': float(credits - debits),
+            'transactions': item['transactions'] or 0,
+            'active_accounts': item['active_accounts'],
+        })
+    
+    return {
+        'period': period,
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+        'opening_balance': float(carried),
+        'data': trend_data,
+    }
+
+
+def get_account_balance_history(account, days=90):
+    """
+    Get an account's daily closing balance series from snapshots
+    
+    Days without a snapshot carry the previous closing balance forward,
+    so the series has one point per day without touching transactions.
+    
+    Args:
+        account: SavingsAccount instance
+        days: Number of days to cover, ending today
+    
+    Returns:
+        dict: Daily balance series
+    """
+    from .models import DailyAccountBalance
+    from .utils import get_account_balance_as_of
+    from core.utils import get_sacco_today
+    
+    end_date = get_sacco_today()
+    start_date = end_date - timedelta(days=days - 1)
+    
+    balance = get_account_balance_as_of(account, start_date - timedelta(days=1)) or Decimal('0.00')
+    
+    snapshots = {
+        row['balance_date']: row['closing_balance']
+        for row in DailyAccountBalance.objects.filter(
+            account=account,
+            balance_date__gte=start_date,
+            balance_date__lt=end_date
+        ).values('balance_date', 'closing_balance')
+    }
+    
+    series = []
+    current_date = start_date
+    while current_date < end_date:
+        balance = snapshots.get(current_date, balance)
+        series.append({
+            'date': current_date.isoformat(),
+            'balance': float(balance),
+        })
+        current_date += timedelta(days=1)
+    
+    # Today's snapshot is only written at end of day
+    series.append({
+        'date': end_date.isoformat(),
+        'balance': float(account.current_balance),
+    })
+    
+    return {
+        'account_number': account.account_number,
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+        'data': series,
+    }
+
+
 # =============================================================================
 # INTEREST CALCULATION STATISTICS
 # =============================================================================
@@ -1,3 +1,253 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connections
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from kojenasacco.managers import DatabaseContext
+
+from members.models import Member
+
+from .models import SavingsAccount, SavingsProduct, SavingsTransaction, StandingOrder, StandingOrderExecution
+from .services import AccountService, BulkDepositService, StandingOrderExecutor
+
+# First SACCO database: savings tables only exist outside 'default'
+SACCO_DB = next(alias for alias in settings.DATABASES if alias != 'default')
+
+
+class StandingOrderExecutorTests(TransactionTestCase):
+    """Batch standing order runs, committed as in production"""
+
+    databases = '__all__'
+
+    # Flushed between tests. utils is left out: its audit log tables in the
+    # SACCO databases reference content types that only exist in 'default'.
+    available_apps = [
+        'django.contrib.auth', 'django.contrib.contenttypes', 'core', 'accounts',
+        'members', 'savings', 'dividends', 'loans', 'shares', 'projects',
+    ]
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        self.run_date = date.today()
+        self.member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+            status='ACTIVE',
+        )
+        self.product = SavingsProduct.objects.create(
+            name='Ordinary Savings',
+            code='ORD',
+            description='Ordinary savings',
+            interest_rate=Decimal('0.00'),
+        )
+
+        # Two orders on disjoint accounts: two independent units
+        self.accounts = [self.account(number) for number in range(1, 5)]
+        self.orders = [
+            StandingOrder.objects.create(
+                source_account=self.accounts[source],
+                destination_account=self.accounts[source + 1],
+                amount=Decimal('1000.00'),
+                frequency='MONTHLY',
+                start_date=self.run_date,
+                next_run_date=self.run_date,
+                status='ACTIVE',
+            )
+            for source in (0, 2)
+        ]
+
+    def account(self, number):
+        return SavingsAccount.objects.create(
+            account_number=f'SAV000{number}',
+            member=self.member,
+            savings_product=self.product,
+            status='ACTIVE',
+            current_balance=Decimal('5000.00'),
+            available_balance=Decimal('5000.00'),
+        )
+
+    def balances(self):
+        return [
+            SavingsAccount.objects.values_list('current_balance', 'available_balance').get(pk=account.pk)
+            for account in self.accounts
+        ]
+
+    def test_parallel_units_post_both_orders(self):
+        connection = connections[SACCO_DB]
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest("Shared-cache in-memory SQLite fails concurrent writers instead of waiting")
+
+        results = StandingOrderExecutor.run(self.run_date, max_workers=2)
+
+        self.assertEqual((results['successful'], results['failed']), (2, 0), results['errors'])
+        self.assertEqual(
+            SavingsTransaction.objects.filter(transaction_type__in=['TRANSFER_OUT', 'TRANSFER_IN']).count(), 4
+        )
+        self.assertEqual(self.balances(), [
+            (Decimal('4000.00'), Decimal('4000.00')),
+            (Decimal('6000.00'), Decimal('6000.00')),
+            (Decimal('4000.00'), Decimal('4000.00')),
+            (Decimal('6000.00'), Decimal('6000.00')),
+        ])
+
+    def test_rerun_of_run_date_is_a_no_op(self):
+        StandingOrderExecutor.run(self.run_date, max_workers=1)
+        balances = self.balances()
+
+        # Due again, as if next_run_date had not moved
+        StandingOrder.objects.update(next_run_date=self.run_date)
+        results = StandingOrderExecutor.run(self.run_date, max_workers=2)
+
+        self.assertEqual((results['successful'], results['skipped']), (0, 2))
+        self.assertEqual(self.balances(), balances)
+        self.assertEqual(StandingOrderExecution.objects.filter(status='SUCCESS').count(), 2)
+
+
+class BulkDepositServiceTests(TestCase):
+    """Chunked posting of deposit files"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+            status='ACTIVE',
+        )
+        self.account = SavingsAccount.objects.create(
+            account_number='SAV0001',
+            member=member,
+            savings_product=SavingsProduct.objects.create(
+                name='Ordinary Savings',
+                code='ORD',
+                description='Ordinary savings',
+                interest_rate=Decimal('0.00'),
+            ),
+            status='ACTIVE',
+        )
+
+    def upload(self, content):
+        return SimpleUploadedFile('deposits.csv', content, content_type='text/csv')
+
+    def test_chunks_post_valid_lines_and_report_rejections(self):
+        success, summary = BulkDepositService.post_file(
+            self.upload(
+                b'account_number,amount,reference_number\n'
+                b'SAV0001,100,R1\n'
+                b'SAV9999,100,R2\n'
+                b'SAV0001,abc,R3\n'
+                b'SAV0001,250,R4\n'
+            ),
+            chunk_size=2,
+        )
+
+        self.assertTrue(success)
+        self.assertEqual((summary['posted'], summary['rejected']), (2, 2))
+        self.assertEqual([rejection['line'] for rejection in summary['rejections']], [3, 4])
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal('350.00'))
+        self.assertEqual(self.account.available_balance, Decimal('350.00'))
+
+    def test_unreadable_tail_keeps_committed_summary(self):
+        # Enough valid lines to fill the decoder's first block
+        rows = b''.join(b'SAV0001,1,R%d\n' % number for number in range(1, 1001))
+        success, summary = BulkDepositService.post_file(
+            self.upload(b'account_number,amount,reference_number\n' + rows + b'SAV0001,\xff\xfe,BAD\n'),
+            chunk_size=100,
+        )
+
+        self.assertTrue(success)
+        self.assertTrue(summary['read_error'])
+        self.assertEqual(summary['posted'], (summary['last_line'] - 1))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal(summary['posted']))
+
+    def test_unreadable_file_posts_nothing(self):
+        success, result = BulkDepositService.post_file(
+            self.upload(b'account_number,amount\nSAV0001,\xff\xfe\n')
+        )
+
+        self.assertFalse(success)
+        self.assertIn('not a valid UTF-8 CSV', result)
+
+
+class DormancySweepTests(TestCase):
+    """Set-based account dormancy sweep"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+            status='ACTIVE',
+        )
+        product = SavingsProduct.objects.create(
+            name='Ordinary Savings',
+            code='ORD',
+            description='Ordinary savings',
+            interest_rate=Decimal('0.00'),
+            dormancy_period_days=90,
+        )
+        now = timezone.now()
+        self.accounts = {
+            days: SavingsAccount.objects.create(
+                account_number=f'SAV{days:04d}',
+                member=member,
+                savings_product=product,
+                status='ACTIVE',
+                last_activity_at=now - timedelta(days=days),
+            )
+            for days in (10, 89, 90, 200)
+        }
+
+    def test_sweep_marks_accounts_inactive_for_the_dormancy_period(self):
+        results = AccountService.sweep_dormant_accounts()
+
+        self.assertEqual(results['accounts_marked'], 2)
+        self.assertEqual(
+            {days: SavingsAccount.objects.get(pk=account.pk).status for days, account in self.accounts.items()},
+            {10: 'ACTIVE', 89: 'ACTIVE', 90: 'DORMANT', 200: 'DORMANT'}
+        )
@@ -85,7 +85,9 @@ urlpatterns = [
     # HTMX Views 
     path('accounts/htmx/search/', htmx_views.savings_account_search, name='account_search'),
     path('accounts/<uuid:account_id>/htmx/stats/', htmx_views.account_detail_stats, name='account_detail_stats'),
+    path('accounts/<uuid:account_id>/htmx/balance-history/', htmx_views.account_balance_history, name='account_balance_history'),
     path('accounts/htmx/quick-stats/', htmx_views.savings_account_quick_stats, name='account_quick_stats'),
+    path('accounts/htmx/balance-trends/', htmx_views.savings_balance_trends, name='balance_trends'),
 
     # =============================================================================
     # TRANSACTIONS 
@@ -98,6 +100,8 @@ urlpatterns = [
     path('transactions/deposit/', views.deposit, name='deposit'),
     path('transactions/withdrawal/', views.withdrawal, name='withdrawal'),
     path('transactions/transfer/', views.transfer, name='transfer'),
+    path('transactions/bulk-deposit/', views.bulk_deposit_upload, name='bulk_deposit_upload'),
+    path('transactions/bulk-deposit/rejections/', views.bulk_deposit_rejections_export, name='bulk_deposit_rejections_export'),
 
     # Modal Views 
     path('transactions/<uuid:pk>/modal/reverse/', modal_views.transaction_reverse_modal, name='transaction_reverse_modal'),
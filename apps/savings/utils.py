@@ -221,6 +221,55 @@ def generate_transaction_id(txn_type='SAV'):
         return transaction_id
 
 
+def generate_transaction_id_block(txn_type='SAV', count=1):
+    """
+    Reserve a block of consecutive transaction IDs in one query.
+
+    Bulk posting paths use this instead of calling generate_transaction_id
+    once per row. IDs share the TYPE-YYYYMMDDHHMMSS prefix and continue the
+    counter after the highest one already used for that second.
+
+    Args:
+        txn_type (str): Transaction type prefix (e.g., 'DEP', 'DIV')
+        count (int): Number of IDs to reserve
+
+    Returns:
+        list: Transaction IDs in ascending counter order
+
+    Example:
+        >>> generate_transaction_id_block('DEP', 3)
+        ['DEP-20250115143025-0001', 'DEP-20250115143025-0002', 'DEP-20250115143025-0003']
+    """
+    from savings.models import SavingsTransaction
+
+    if count <= 0:
+        return []
+
+    txn_type = txn_type.strip().upper() or 'SAV'
+    timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
+    base_id = f"{txn_type}-{timestamp}"
+
+    with transaction.atomic():
+        existing_ids = SavingsTransaction.objects.filter(
+            transaction_id__startswith=base_id
+        ).select_for_update().values_list('transaction_id', flat=True)
+
+        max_counter = 0
+        for txn_id in existing_ids:
+            try:
+                max_counter = max(max_counter, int(txn_id.split('-')[-1]))
+            except (ValueError, IndexError):
+                continue
+
+    transaction_ids = [
+        f"{base_id}-{counter:04d}"
+        for counter in range(max_counter + 1, max_counter + count + 1)
+    ]
+
+    logger.info(f"Reserved {count} transaction IDs from {transaction_ids[0]}")
+    return transaction_ids
+
+
 # =============================================================================
 # BALANCE CALCULATIONS
 # =============================================================================
@@ -302,6 +351,204 @@ def calculate_running_balance(account, transaction_amount, transaction_type):
         return account.current_balance
 
 
+def bulk_set_account_balances(balances, activity_at=None):
+    """
+    Write new current/available balances for many accounts in one UPDATE.
+
+    Callers must hold row locks on the accounts (select_for_update) and pass
+    absolute balances computed under that lock. Absolute values are used
+    rather than F() deltas because MySQL evaluates SET assignments left to
+    right, so available_balance cannot safely reference current_balance in
+    the same statement.
+
+    The members' financial summaries receive the change in savings as one
+    more batched F-expression UPDATE.
+
+    Args:
+        balances (dict): {account_pk: (current_balance, available_balance)}
+        activity_at (datetime, optional): Transaction time of the posted
+            entries, written to last_activity_at
+
+    Returns:
+        int: Number of accounts updated
+    """
+    from django.db.models import Case, When, Value, DecimalField
+    from savings.models import SavingsAccount
+    from members.services import MemberFinancialSummaryService
+
+    if not balances:
+        return 0
+
+    amount_field = DecimalField(max_digits=15, decimal_places=2)
+
+    extra = {}
+    if activity_at is not None:
+        extra['last_activity_at'] = activity_at
+
+    # Balances before this write, already locked by the caller
+    savings_deltas = {}
+    for pk, member_id, status, previous in SavingsAccount.objects.filter(
+        pk__in=list(balances)
+    ).values_list('pk', 'member_id', 'status', 'current_balance'):
+        delta = (
+            MemberFinancialSummaryService.savings_contribution(status, balances[pk][0]) -
+            MemberFinancialSummaryService.savings_contribution(status, previous)
+        )
+        savings_deltas.setdefault(member_id, {'total_savings': Decimal('0.00')})
+        savings_deltas[member_id]['total_savings'] += delta
+
+    updated = SavingsAccount.objects.filter(pk__in=list(balances)).update(
+        **extra,
+        current_balance=Case(
+            *[When(pk=pk, then=Value(current)) for pk, (current, _available) in balances.items()],
+            output_field=amount_field
+        ),
+        available_balance=Case(
+            *[When(pk=pk, then=Value(available)) for pk, (_current, available) in balances.items()],
+            output_field=amount_field
+        ),
+        updated_at=timezone.now()
+    )
+
+    MemberFinancialSummaryService.apply_deltas(savings_deltas)
+
+    return updated
+
+
+# =============================================================================
+# LEDGER HELPERS
+# =============================================================================
+
+# Mirrors update_account_balance_after_transaction: credits add the amount,
+# debits remove amount + fees + tax, anything else leaves the balance alone.
+CREDIT_TRANSACTION_TYPES = ['DEPOSIT', 'TRANSFER_IN', 'INTEREST', 'DIVIDEND', 'ADJUSTMENT']
+DEBIT_TRANSACTION_TYPES = ['WITHDRAWAL', 'TRANSFER_OUT', 'FEE', 'TAX', 'MAINTENANCE_FEE']
+
+
+def ledger_credit_expression(prefix=''):
+    """
+    Database expression for the credit side of a savings transaction.
+
+    Args:
+        prefix (str): Lookup prefix when aggregating through a relation
+            (e.g. 'transactions__')
+
+    Returns:
+        Case: Amount for credit types, zero otherwise
+    """
+    from django.db.models import Case, When, F, Value, DecimalField
+
+    return Case(
+        When(**{f'{prefix}transaction_type__in': CREDIT_TRANSACTION_TYPES}, then=F(f'{prefix}amount')),
+        default=Value(Decimal('0.00')),
+        output_field=DecimalField(max_digits=15, decimal_places=2),
+    )
+
+
+def ledger_debit_expression(prefix=''):
+    """
+    Database expression for the debit side of a savings transaction.
+
+    Args:
+        prefix (str): Lookup prefix when aggregating through a relation
+
+    Returns:
+        Case: Amount + fees + tax for debit types, zero otherwise
+    """
+    from django.db.models import Case, When, F, Value, DecimalField
+
+    return Case(
+        When(
+            **{f'{prefix}transaction_type__in': DEBIT_TRANSACTION_TYPES},
+            then=F(f'{prefix}amount') + F(f'{prefix}fees') + F(f'{prefix}tax_amount')
+        ),
+        default=Value(Decimal('0.00')),
+        output_field=DecimalField(max_digits=15, decimal_places=2),
+    )
+
+
+def get_business_day_bounds(business_date):
+    """
+    Get the aware datetime range covering a business day in SACCO timezone.
+
+    Filtering transaction_date on this half-open range uses the
+    (account, transaction_date) index, unlike the __date lookup.
+
+    Args:
+        business_date (date): Business day
+
+    Returns:
+        tuple: (start_datetime, end_datetime) - end is exclusive
+    """
+    from datetime import datetime, time
+    from core.utils import get_sacco_timezone
+
+    tz = get_sacco_timezone()
+    start = datetime.combine(business_date, time.min, tzinfo=tz)
+    return start, start + timedelta(days=1)
+
+
+def get_account_balance_as_of(account, as_of_date):
+    """
+    Get an account's closing balance on a given day.
+
+    Reads the latest DailyAccountBalance row on or before the date instead
+    of replaying transaction history. Days on or after today come straight
+    from the account since today's snapshot is written at end of day.
+
+    Args:
+        account: SavingsAccount instance
+        as_of_date (date): Day to get the balance for
+
+    Returns:
+        Decimal or None: Closing balance, or None when no snapshot exists
+    """
+    from core.utils import get_sacco_today
+    from savings.models import DailyAccountBalance
+
+    if as_of_date >= get_sacco_today():
+        return account.current_balance
+
+    snapshot = DailyAccountBalance.objects.filter(
+        account=account,
+        balance_date__lte=as_of_date
+    ).order_by('-balance_date').values_list('closing_balance', flat=True).first()
+
+    return snapshot
+
+
+def annotate_balance_as_of(accounts, as_of_date):
+    """
+    Annotate a SavingsAccount queryset with its closing balance on a day.
+
+    One correlated subquery over the (account, balance_date) unique index,
+    so the whole queryset is resolved in a single statement.
+
+    Args:
+        accounts: SavingsAccount QuerySet
+        as_of_date (date): Day to get balances for
+
+    Returns:
+        QuerySet: Accounts annotated with ``balance_as_of``
+    """
+    from django.db.models import OuterRef, Subquery, Value, DecimalField
+    from django.db.models.functions import Coalesce
+    from savings.models import DailyAccountBalance
+
+    latest = DailyAccountBalance.objects.filter(
+        account=OuterRef('pk'),
+        balance_date__lte=as_of_date
+    ).order_by('-balance_date').values('closing_balance')[:1]
+
+    return accounts.annotate(
+        balance_as_of=Coalesce(
+            Subquery(latest),
+            Value(Decimal('0.00')),
+            output_field=DecimalField(max_digits=15, decimal_places=2),
+        )
+    )
+
+
 # =============================================================================
 # INTEREST CALCULATIONS
 # =============================================================================
@@ -974,20 +1221,25 @@ def format_account_statement(account, transactions, start_date, end_date):
     """
     from core.utils import format_money
     
-    # Get opening balance (balance before start_date)
-    opening_transactions = account.transactions.filter(
-        transaction_date__lt=start_date,
-        is_reversed=False
-    ).order_by('-transaction_date').first()
-    
-    opening_balance = opening_transactions.running_balance if opening_transactions else Decimal('0.00')
+    # Opening balance (closing balance of the day before start_date),
+    # read from end-of-day snapshots where available
+    opening_balance = get_account_balance_as_of(account, start_date - timedelta(days=1))
+    if opening_balance is None:
+        opening_transactions = account.transactions.filter(
+            transaction_date__lt=start_date,
+            is_reversed=False
+        ).order_by('-transaction_date').first()
+        
+        opening_balance = opening_transactions.running_balance if opening_transactions else Decimal('0.00')
     
     # Get closing balance
-    closing_transactions = transactions.filter(
-        transaction_date__lte=end_date
-    ).order_by('-transaction_date').first()
-    
-    closing_balance = closing_transactions.running_balance if closing_transactions else opening_balance
+    closing_balance = get_account_balance_as_of(account, end_date)
+    if closing_balance is None:
+        closing_transactions = transactions.filter(
+            transaction_date__lte=end_date
+        ).order_by('-transaction_date').first()
+        
+        closing_balance = closing_transactions.running_balance if closing_transactions else opening_balance
     
     # Get transaction summary
     summary = get_transaction_summary(transactions)
@@ -1042,29 +1294,65 @@ def get_accounts_for_interest_calculation(product=None, status_list=None):
     return accounts
 
 
-def batch_update_available_balances(accounts):
+def available_balance_expression(hold_delta=None):
+    """
+    Database expression for available balance: max(current - holds, 0).
+    
+    Args:
+        hold_delta (Decimal, optional): Change being applied to hold_amount in
+            the same UPDATE. The expression then reflects the new hold while
+            still reading the old column value.
+    
+    Returns:
+        Expression usable in QuerySet.update()
+    
+    Note:
+        MySQL evaluates SET assignments left to right, so in an UPDATE that
+        also changes hold_amount pass available_balance first - every backend
+        then computes it from the pre-update row.
+    """
+    from django.db.models import F, Value, DecimalField
+    from django.db.models.functions import Greatest
+    
+    amount_field = DecimalField(max_digits=15, decimal_places=2)
+    
+    available = F('current_balance') - F('hold_amount')
+    if hold_delta:
+        available = available - Value(hold_delta, output_field=amount_field)
+    
+    return Greatest(available, Value(Decimal('0.00'), output_field=amount_field), output_field=amount_field)
+
+
+def batch_update_available_balances(accounts=None, batch_size=1000):
     """
     Batch update available balances for multiple accounts.
     
+    Runs one UPDATE ... SET available_balance = current_balance - hold_amount
+    per chunk of accounts instead of saving each row.
+    
     Args:
-        accounts: QuerySet or list of SavingsAccount instances
+        accounts: QuerySet, list of SavingsAccount instances or primary keys
+            (None for every account)
+        batch_size: Accounts per UPDATE
     
     Returns:
         int: Number of accounts updated
     """
-    updated_count = 0
+    from savings.models import SavingsAccount
+    from utils.utils import chunked
     
-    for account in accounts:
-        try:
-            account.available_balance = calculate_available_balance(
-                account.current_balance,
-                account.hold_amount
-            )
-            account.save(update_fields=['available_balance'])
-            updated_count += 1
-        except Exception as e:
-            logger.error(f"Error updating available balance for account {account.account_number}: {e}")
-            continue
+    if accounts is None:
+        account_ids = SavingsAccount.objects.order_by('pk').values_list('pk', flat=True)
+    elif hasattr(accounts, 'values_list'):
+        account_ids = accounts.order_by('pk').values_list('pk', flat=True)
+    else:
+        account_ids = [getattr(account, 'pk', account) for account in accounts]
+    
+    updated_count = 0
+    for batch in chunked(list(account_ids), batch_size):
+        updated_count += SavingsAccount.objects.filter(pk__in=batch).update(
+            available_balance=available_balance_expression()
+        )
     
     return updated_count
 
@@ -1114,6 +1402,9 @@ def is_account_dormant(account):
     """
     Check if account should be marked as dormant.
     
+    Reads the denormalized last_activity_at column, so no query is made
+    beyond the (usually already loaded) savings product.
+    
     Args:
         account: SavingsAccount instance
     
@@ -1130,6 +1421,55 @@ def is_account_dormant(account):
     return days_inactive >= dormancy_threshold, days_inactive
 
 
+def get_dormancy_rules():
+    """
+    Group savings products by dormancy period.
+    
+    Returns:
+        dict: {dormancy_period_days: [product_id, ...]}
+    """
+    from savings.models import SavingsProduct
+    
+    rules = {}
+    for product_id, days in SavingsProduct.objects.values_list('id', 'dormancy_period_days'):
+        rules.setdefault(days, []).append(product_id)
+    return rules
+
+
+def dormancy_eligible_filter(as_of=None, rules=None):
+    """
+    Q object matching accounts inactive beyond their product's dormancy period.
+    
+    Uses the same whole-day arithmetic as is_account_dormant, expressed as a
+    range on the indexed last_activity_at column. Accounts with no recorded
+    activity are never eligible.
+    
+    Args:
+        as_of (date, optional): Reference date (defaults to today)
+        rules (dict, optional): Output of get_dormancy_rules()
+    
+    Returns:
+        Q: Filter for SavingsAccount querysets
+    
+    Example:
+        >>> SavingsAccount.objects.filter(dormancy_eligible_filter(), status='ACTIVE').count()
+        42
+    """
+    from datetime import datetime, time
+    
+    as_of = as_of or timezone.now().date()
+    rules = get_dormancy_rules() if rules is None else rules
+    
+    condition = Q(pk__in=[])
+    for days, product_ids in rules.items():
+        # Inactive for >= days whole days: last activity before the day after the cutoff
+        boundary = timezone.make_aware(
+            datetime.combine(as_of - timedelta(days=days) + timedelta(days=1), time.min)
+        )
+        condition |= Q(savings_product_id__in=product_ids, last_activity_at__lt=boundary)
+    return condition
+
+
 def can_close_account(account):
     """
     Check if account can be closed.
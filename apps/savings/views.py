@@ -65,6 +65,7 @@ from .forms import (
     SavingsGoalForm,
     BulkInterestCalculationForm,
     BulkInterestPostingForm,
+    BulkDepositUploadForm,
     SavingsReportForm,
     SavingsProductFilterForm,
     SavingsAccountFilterForm,
@@ -82,6 +83,7 @@ from .services import (
     InterestService,
     StandingOrderService,
     AccountService,
+    BulkDepositService,
 )
 
 from members.models import Member
@@ -1353,6 +1355,102 @@ def bulk_interest_posting(request):
     return render(request, 'savings/bulk_operations/post_interest.html', context)
 
 
+@login_required
+def bulk_deposit_upload(request):
+    """Upload and post a payroll / check-off deposit file - USES BulkDepositService"""
+    
+    report = None
+    
+    if request.method == "POST":
+        form = BulkDepositUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Use BulkDepositService for business logic
+            success, result = BulkDepositService.post_file(
+                uploaded_file=form.cleaned_data['deposit_file'],
+                payment_method=form.cleaned_data['payment_method'],
+                posting_date=form.cleaned_data['posting_date'],
+                description=form.cleaned_data.get('description'),
+                processed_by=request.user
+            )
+            
+            if not success:
+                form.add_error('deposit_file', result)
+                messages.error(
+                    request,
+                    f"Could not read deposit file: {result}",
+                    extra_tags='sweetalert-error'
+                )
+            else:
+                report = result
+                
+                # Keep the rejection report for the CSV download
+                request.session['bulk_deposit_rejections'] = report['rejections']
+                
+                if report['read_error']:
+                    form.add_error('deposit_file', report['read_error'])
+                    messages.warning(
+                        request,
+                        f"Stopped reading the file after line {report['last_line']}: {report['read_error']}. "
+                        f"Posted {report['posted']} deposit(s) totalling {format_money(report['total_amount'])} "
+                        f"from the lines before it; upload only the lines after line {report['last_line']}.",
+                        extra_tags='sweetalert'
+                    )
+                elif report['posted'] > 0:
+                    messages.success(
+                        request,
+                        f"Posted {report['posted']} deposit(s) totalling {format_money(report['total_amount'])}" +
+                        (f". {report['rejected']} line(s) rejected." if report['rejected'] > 0 else ""),
+                        extra_tags='sweetalert'
+                    )
+                else:
+                    messages.warning(
+                        request,
+                        f"No deposits posted. {report['rejected']} line(s) rejected.",
+                        extra_tags='sweetalert'
+                    )
+        else:
+            messages.error(
+                request,
+                "Please correct the errors in the form",
+                extra_tags='sweetalert-error'
+            )
+    else:
+        form = BulkDepositUploadForm()
+    
+    context = {
+        'form': form,
+        'report': report,
+        'title': 'Bulk Deposit Upload',
+    }
+    return render(request, 'savings/bulk_operations/bulk_deposit.html', context)
+
+
+@login_required
+def bulk_deposit_rejections_export(request):
+    """Download the rejection report from the last bulk deposit upload as CSV"""
+    import csv
+    
+    rejections = request.session.get('bulk_deposit_rejections', [])
+    
+    response = HttpResponse(content_type='text/csv')
+    response['Content-Disposition'] = (
+        f'attachment; filename="bulk_deposit_rejections_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    )
+    
+    writer = csv.writer(response)
+    writer.writerow(['Line', 'Account Number', 'Amount', 'Reference Number', 'Reason'])
+    for rejection in rejections:
+        writer.writerow([
+            rejection['line'],
+            rejection['account_number'] or '',
+            rejection['amount'] or '',
+            rejection['reference_number'] or '',
+            rejection['reason'],
+        ])
+    
+    return response
+
+
 @login_required
 def bulk_standing_order_execution(request):
     """Execute all due standing orders - USES StandingOrderService"""
@@ -0,0 +1,359 @@
+# shares/certificates.py
+
+"""
+Share Certificate Rendering
+
+Pure rendering functions for share certificate PDFs (NO database access):
+- Certificate payloads and content hashes
+- Worker initialisation with preloaded fonts and template resources
+- Single certificate rendering with QR and barcode verification stamps
+- Process pool batch rendering and PDF merging
+
+Payloads are plain dictionaries built in the parent process by
+ShareCertificateService, so worker processes never touch the ORM. Database
+and storage writes are handled by services.py.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Bump when the certificate layout changes so every certificate re-renders
+TEMPLATE_VERSION = '1'
+
+# Resources loaded once per worker process by init_worker()
+_RESOURCES = {}
+
+
+# =============================================================================
+# PAYLOADS AND HASHES
+# =============================================================================
+
+def build_certificate_payload(certificate, format_currency):
+    """
+    Flatten a certificate into the plain values printed on it.
+
+    Args:
+        certificate: ShareCertificate with member and share_capital loaded
+        format_currency: Callable formatting a money amount, looked up once
+            per batch (e.g. FinancialSettings.format_currency)
+
+    Returns:
+        dict: Picklable payload for render_certificate()
+    """
+    member = certificate.member
+
+    return {
+        'certificate_id': str(certificate.pk),
+        'certificate_number': certificate.certificate_number,
+        'member_name': member.get_full_name(),
+        'member_number': member.member_number,
+        'share_class': certificate.share_capital.name,
+        'shares_count': f"{certificate.shares_count:,.2f}",
+        'share_price': format_currency(certificate.share_price),
+        'total_value': format_currency(certificate.total_value),
+        'issue_date': certificate.issue_date.strftime('%d %B %Y'),
+        'status': certificate.status,
+    }
+
+
+def resources_fingerprint(resources):
+    """
+    Digest of the template resources that affect rendered output.
+
+    Args:
+        resources (dict): Resources passed to init_worker()
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update((resources.get('sacco_name') or '').encode('utf-8'))
+    digest.update(resources.get('logo') or b'')
+    for name, path in sorted((resources.get('fonts') or {}).items()):
+        digest.update(f"{name}={path}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def certificate_content_hash(payload, fingerprint):
+    """
+    Content hash of a certificate: payload, resources and template version.
+
+    Unchanged certificates keep the same hash, so they are not re-rendered.
+
+    Args:
+        payload (dict): Output of build_certificate_payload()
+        fingerprint (str): Output of resources_fingerprint()
+
+    Returns:
+        str: 64 character hex digest
+
+    Example:
+        >>> certificate_content_hash(payload, fingerprint)[:12]
+        '3f9a0c1b7e2d'
+    """
+    content = {key: value for key, value in payload.items() if key != 'certificate_id'}
+    digest = hashlib.sha256()
+    digest.update(TEMPLATE_VERSION.encode('utf-8'))
+    digest.update(fingerprint.encode('utf-8'))
+    digest.update(json.dumps(content, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+# =============================================================================
+# WORKER RESOURCES
+# =============================================================================
+
+def init_worker(resources):
+    """
+    Load fonts and template resources once per process.
+
+    Args:
+        resources (dict):
+            {
+                'sacco_name': str,
+                'logo': bytes or None,
+                'fonts': {'regular': path, 'bold': path} or None
+            }
+    """
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    fonts = {'regular': 'Times-Roman', 'bold': 'Times-Bold', 'sans': 'Helvetica'}
+
+    for role, path in (resources.get('fonts') or {}).items():
+        if path and os.path.exists(path):
+            font_name = f"Certificate-{role}"
+            pdfmetrics.registerFont(TTFont(font_name, path))
+            fonts[role] = font_name
+        else:
+            logger.warning(f"Certificate font not found, using built-in: {path}")
+
+    logo = None
+    if resources.get('logo'):
+        try:
+            logo = ImageReader(BytesIO(resources['logo']))
+        except Exception as e:
+            logger.warning(f"Could not load certificate logo: {e}")
+
+    _RESOURCES.clear()
+    _RESOURCES.update({
+        'sacco_name': resources.get('sacco_name') or '',
+        'logo': logo,
+        'fonts': fonts,
+        'fingerprint': resources_fingerprint(resources),
+    })
+
+
+def _qr_image(data):
+    """QR code stamp as a reportlab image"""
+    import qrcode
+    from reportlab.lib.utils import ImageReader
+
+    qr = qrcode.QRCode(border=1, box_size=4, error_correction=qrcode.constants.ERROR_CORRECT_M)
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = BytesIO()
+    qr.make_image(fill_color='black', back_color='white').save(buffer, format='PNG')
+    buffer.seek(0)
+    return ImageReader(buffer)
+
+
+def _barcode_image(value):
+    """Code 128 barcode of the certificate number as a reportlab image"""
+    from barcode import Code128
+    from barcode.writer import ImageWriter
+    from reportlab.lib.utils import ImageReader
+
+    buffer = BytesIO()
+    Code128(value, writer=ImageWriter()).write(
+        buffer, options={'module_height': 8.0, 'font_size': 6, 'text_distance': 3, 'quiet_zone': 2}
+    )
+    buffer.seek(0)
+    return ImageReader(buffer)
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def render_certificate(payload):
+    """
+    Render one certificate to PDF bytes.
+
+    Output is byte-for-byte reproducible for the same payload and resources.
+
+    Args:
+        payload (dict): Output of build_certificate_payload()
+
+    Returns:
+        tuple: (certificate_id: str, content_hash: str, pdf: bytes)
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    if not _RESOURCES:
+        init_worker({})
+
+    fonts = _RESOURCES['fonts']
+    content_hash = certificate_content_hash(payload, _RESOURCES['fingerprint'])
+    width, height = landscape(A4)
+
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=(width, height), invariant=1)
+    pdf.setTitle(f"Share Certificate {payload['certificate_number']}")
+
+    # Border
+    pdf.setStrokeColor(colors.HexColor('#1F3864'))
+    pdf.setLineWidth(4)
+    pdf.rect(12 * mm, 12 * mm, width - 24 * mm, height - 24 * mm)
+    pdf.setLineWidth(1)
+    pdf.rect(16 * mm, 16 * mm, width - 32 * mm, height - 32 * mm)
+
+    # Header
+    if _RESOURCES['logo']:
+        pdf.drawImage(
+            _RESOURCES['logo'], 24 * mm, height - 52 * mm, 28 * mm, 28 * mm,
+            preserveAspectRatio=True, mask='auto'
+        )
+
+    pdf.setFillColor(colors.HexColor('#1F3864'))
+    pdf.setFont(fonts['bold'], 22)
+    pdf.drawCentredString(width / 2, height - 36 * mm, _RESOURCES['sacco_name'].upper())
+    pdf.setFont(fonts['bold'], 30)
+    pdf.drawCentredString(width / 2, height - 54 * mm, 'SHARE CERTIFICATE')
+
+    pdf.setFillColor(colors.black)
+    pdf.setFont(fonts['sans'], 10)
+    pdf.drawRightString(width - 26 * mm, height - 28 * mm, f"No. {payload['certificate_number']}")
+
+    # Body
+    pdf.setFont(fonts['regular'], 15)
+    pdf.drawCentredString(width / 2, height - 78 * mm, 'This is to certify that')
+    pdf.setFont(fonts['bold'], 20)
+    pdf.drawCentredString(width / 2, height - 92 * mm, payload['member_name'])
+    pdf.setFont(fonts['regular'], 12)
+    pdf.drawCentredString(width / 2, height - 100 * mm, f"Member No. {payload['member_number']}")
+
+    pdf.setFont(fonts['regular'], 15)
+    pdf.drawCentredString(
+        width / 2, height - 116 * mm,
+        f"is the registered holder of {payload['shares_count']} {payload['share_class']} shares"
+    )
+    pdf.drawCentredString(
+        width / 2, height - 126 * mm,
+        f"at {payload['share_price']} per share, a total value of {payload['total_value']}."
+    )
+    pdf.setFont(fonts['regular'], 12)
+    pdf.drawCentredString(width / 2, height - 140 * mm, f"Issued on {payload['issue_date']}")
+
+    # Signatures
+    for x in (60 * mm, width - 60 * mm):
+        pdf.line(x - 35 * mm, 34 * mm, x + 35 * mm, 34 * mm)
+    pdf.setFont(fonts['sans'], 9)
+    pdf.drawCentredString(60 * mm, 29 * mm, 'Chairperson')
+    pdf.drawCentredString(width - 60 * mm, 29 * mm, 'Secretary')
+
+    # Verification stamps
+    verification = '|'.join([
+        payload['certificate_number'],
+        payload['member_number'],
+        payload['shares_count'],
+        payload['issue_date'],
+        content_hash[:16],
+    ])
+    pdf.drawImage(_qr_image(verification), width / 2 - 14 * mm, 22 * mm, 28 * mm, 28 * mm)
+    pdf.drawImage(
+        _barcode_image(payload['certificate_number']),
+        width / 2 - 30 * mm, height - 70 * mm, 60 * mm, 12 * mm,
+        preserveAspectRatio=True
+    )
+    pdf.setFont(fonts['sans'], 6)
+    pdf.drawCentredString(width / 2, 19 * mm, f"Verification: {content_hash[:16]}")
+
+    pdf.showPage()
+    pdf.save()
+
+    return payload['certificate_id'], content_hash, buffer.getvalue()
+
+
+def certificate_pool(resources, workers=None):
+    """
+    Process pool for certificate rendering.
+
+    Workers are spawned rather than forked so they never inherit open
+    database connections, and each loads fonts and template resources once
+    through init_worker().
+
+    Args:
+        resources (dict): Resources passed to init_worker()
+        workers (int, optional): Worker processes (defaults to CPU count)
+
+    Returns:
+        ProcessPoolExecutor: Use as a context manager
+    """
+    import multiprocessing
+
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_worker,
+        initargs=(resources,)
+    )
+
+
+def render_certificates(payloads, resources, executor=None, chunksize=8):
+    """
+    Render certificates, in a process pool when one is given.
+
+    Args:
+        payloads (list): Outputs of build_certificate_payload()
+        resources (dict): Resources passed to init_worker()
+        executor (optional): Pool from certificate_pool(); renders
+            in-process when omitted
+        chunksize (int): Payloads sent to a worker per round trip
+
+    Yields:
+        tuple: (certificate_id, content_hash, pdf bytes) in payload order
+    """
+    if executor is None:
+        if _RESOURCES.get('fingerprint') != resources_fingerprint(resources):
+            init_worker(resources)
+        for payload in payloads:
+            yield render_certificate(payload)
+        return
+
+    yield from executor.map(render_certificate, payloads, chunksize=chunksize)
+
+
+def merge_pdfs(documents):
+    """
+    Merge PDF documents into one.
+
+    Args:
+        documents: Iterable of PDF bytes
+
+    Returns:
+        bytes: Merged PDF
+    """
+    from PyPDF2 import PdfMerger
+
+    merger = PdfMerger()
+    try:
+        for document in documents:
+            merger.append(BytesIO(document))
+
+        output = BytesIO()
+        merger.write(output)
+        return output.getvalue()
+    finally:
+        merger.close()
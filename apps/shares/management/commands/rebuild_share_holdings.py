@@ -0,0 +1,103 @@
+# shares/management/commands/rebuild_share_holdings.py
+
+"""
+Rebuild materialized member share holdings and share register balances from
+the transaction history.
+
+Both are normally kept current by the ShareTransaction signals. Run this
+after bulk imports done with signals disabled, to backfill register balances
+on existing transactions, or to repair drift.
+
+USAGE EXAMPLES:
+===============
+
+# Rebuild holdings for all SACCO databases
+python manage.py rebuild_share_holdings --all
+
+# Rebuild holdings for a specific SACCO
+python manage.py rebuild_share_holdings --sacco tumaini_sacco
+
+# Rebuild a single member's holding
+python manage.py rebuild_share_holdings --sacco tumaini_sacco --member MEM0001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild member share holdings and register balances from share transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--member',
+            type=str,
+            help='Member number of a single member to rebuild'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per INSERT statement'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from members.models import Member
+        from shares.services import ShareHoldingService, ShareRegisterService
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    member_ids = None
+                    if options['member']:
+                        member_ids = list(
+                            Member.objects.filter(
+                                member_number=options['member']
+                            ).values_list('pk', flat=True)
+                        )
+                        if not member_ids:
+                            raise CommandError(f"Member '{options['member']}' not found")
+
+                    written = ShareHoldingService.rebuild(
+                        member_ids=member_ids,
+                        batch_size=options['batch_size']
+                    )
+                    restated = ShareRegisterService.rebuild(
+                        member_ids=member_ids,
+                        batch_size=options['batch_size']
+                    )
+                    self.stdout.write(self.style.SUCCESS(
+                        f"✓ {db_name}: {written} holding(s) rebuilt, "
+                        f"{restated} register row(s) restated"
+                    ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error rebuilding share holdings for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Share holding rebuild failed for {error_count} database(s)')
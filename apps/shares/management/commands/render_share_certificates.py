@@ -0,0 +1,143 @@
+# shares/management/commands/render_share_certificates.py
+
+"""
+Render share certificates to PDF in batches.
+
+Each certificate is written to its own content-hashed PDF and the batch is
+merged into one printable PDF. Certificates whose content has not changed
+since they were last rendered are skipped.
+
+USAGE EXAMPLES:
+===============
+
+# Render all active certificates for all SACCO databases
+python manage.py render_share_certificates --all
+
+# Render certificates issued since a date with 8 worker processes
+python manage.py render_share_certificates --sacco tumaini_sacco --issued-since 2025-01-01 --workers 8
+
+# Re-render one member's certificates even if unchanged, without a merged PDF
+python manage.py render_share_certificates --sacco tumaini_sacco --member MEM0001 --force --no-merge
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Render share certificates to per-certificate and merged batch PDFs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--status',
+            type=str,
+            default='ACTIVE',
+            help='Certificate status to render (default: ACTIVE)'
+        )
+        parser.add_argument(
+            '--member',
+            type=str,
+            help='Member number of a single member'
+        )
+        parser.add_argument(
+            '--issued-since',
+            type=str,
+            help='Only certificates issued on or after this date (YYYY-MM-DD)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Worker processes (default: CPU count, 1 renders in-process)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render certificates even if unchanged'
+        )
+        parser.add_argument(
+            '--no-merge',
+            action='store_true',
+            help='Skip the merged batch PDF'
+        )
+        parser.add_argument(
+            '--label',
+            type=str,
+            default='certificates',
+            help='Merged batch file name prefix'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        issued_since = None
+        if options['issued_since']:
+            try:
+                issued_since = datetime.strptime(options['issued_since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("Invalid date format. Use YYYY-MM-DD")
+
+        from shares.models import ShareCertificate
+        from shares.services import ShareCertificateService
+
+        def report(done, total):
+            self.stdout.write(f"    {done}/{total}")
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    certificates = ShareCertificate.objects.filter(status=options['status'])
+                    if options['member']:
+                        certificates = certificates.filter(member__member_number=options['member'])
+                    if issued_since:
+                        certificates = certificates.filter(issue_date__gte=issued_since)
+
+                    results = ShareCertificateService.render_batch(
+                        certificates,
+                        workers=options['workers'],
+                        force=options['force'],
+                        merge=not options['no_merge'],
+                        label=options['label'],
+                        progress_callback=report
+                    )
+
+                    style = self.style.SUCCESS if not results['failed'] else self.style.WARNING
+                    self.stdout.write(style(
+                        f"{'✓' if not results['failed'] else '✗'} {db_name}: "
+                        f"{results['rendered']} rendered, {results['skipped']} unchanged, "
+                        f"{results['failed']} failed"
+                    ))
+                    if results['batch_file']:
+                        self.stdout.write(f"    Batch PDF: {results['batch_file']}")
+                    for error in results['errors']:
+                        self.stdout.write(f"    ✗ {error}")
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error rendering share certificates for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Certificate rendering failed for {error_count} database(s)')
@@ -0,0 +1,100 @@
+# shares/management/commands/settle_share_transfers.py
+
+"""
+Settle approved share transfer requests in batches.
+
+Each batch locks the requests and the members' holdings once, then writes
+every transfer's legs, holding changes and register balances together.
+
+USAGE EXAMPLES:
+===============
+
+# Settle all approved transfers for all SACCO databases
+python manage.py settle_share_transfers --all
+
+# Settle approved transfers for a specific SACCO in batches of 200
+python manage.py settle_share_transfers --sacco tumaini_sacco --batch-size 200
+
+# Settle a single request
+python manage.py settle_share_transfers --sacco tumaini_sacco --request STR-20250115-0001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from kojenasacco.managers import DatabaseContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Settle approved share transfer requests'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sacco',
+            type=str,
+            help='Database alias of SACCO to process (e.g., tumaini_sacco)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process all SACCO databases'
+        )
+        parser.add_argument(
+            '--request',
+            type=str,
+            help='Request number of a single transfer request'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Transfers settled per database transaction'
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            sacco_dbs = [db for db in settings.DATABASES.keys() if db != 'default']
+        elif options['sacco']:
+            sacco_dbs = [options['sacco']]
+            if options['sacco'] not in settings.DATABASES:
+                raise CommandError(f"Database '{options['sacco']}' not found in settings")
+        else:
+            raise CommandError("Must specify either --sacco or --all")
+
+        from shares.models import ShareTransferRequest
+        from shares.services import ShareTransferService
+        from utils.utils import chunked
+
+        error_count = 0
+        for db_name in sacco_dbs:
+            try:
+                with DatabaseContext(db_name):
+                    requests = ShareTransferRequest.objects.filter(status='APPROVED')
+                    if options['request']:
+                        requests = requests.filter(request_number=options['request'])
+
+                    request_ids = list(
+                        requests.order_by('approval_date', 'request_number').values_list('pk', flat=True)
+                    )
+
+                    settled = failed = 0
+                    for batch in chunked(request_ids, options['batch_size']):
+                        results = ShareTransferService.settle_transfers(batch)
+                        settled += results['settled']
+                        failed += results['failed']
+                        for error in results['errors']:
+                            self.stdout.write(f"    ✗ {error}")
+
+                    style = self.style.SUCCESS if not failed else self.style.WARNING
+                    self.stdout.write(style(
+                        f"{'✓' if not failed else '✗'} {db_name}: {settled} settled, {failed} failed"
+                    ))
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(self.style.ERROR(f"✗ {db_name}: {e}"))
+                logger.exception(f"Error settling share transfers for {db_name}")
+
+        if error_count > 0:
+            raise CommandError(f'Share transfer settlement failed for {error_count} database(s)')
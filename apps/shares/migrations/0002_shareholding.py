@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 21:52
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('shares', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShareHolding',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Updated At')),
+                ('created_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who created this record', max_length=50, null=True, verbose_name='Created By ID')),
+                ('updated_by_id', models.CharField(blank=True, db_index=True, help_text='ID of user who last updated this record', max_length=50, null=True, verbose_name='Updated By ID')),
+                ('created_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Created From IP')),
+                ('updated_from_ip', models.GenericIPAddressField(blank=True, null=True, verbose_name='Updated From IP')),
+                ('change_reason', models.CharField(blank=True, max_length=255, null=True, verbose_name='Change Reason')),
+                ('shares_count', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Net shares from completed, non-reversed transactions', max_digits=12, verbose_name='Shares Held')),
+                ('total_value', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Share capital paid in: purchases and transfers in, less sales and transfers out', max_digits=15, verbose_name='Share Capital Value')),
+                ('last_transaction_date', models.DateTimeField(blank=True, null=True, verbose_name='Last Transaction Date')),
+                ('last_transaction', models.ForeignKey(blank=True, help_text='Latest transaction applied to this holding', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='shares.sharetransaction')),
+                ('member', models.OneToOneField(help_text='Member owning the shares', on_delete=django.db.models.deletion.CASCADE, related_name='share_holding', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Share Holding',
+                'verbose_name_plural': 'Share Holdings',
+                'ordering': ['-shares_count'],
+                'indexes': [models.Index(fields=['shares_count'], name='shares_shar_shares__56e65f_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 21:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_saccoconfiguration_operational_timezone'),
+        ('members', '0001_initial'),
+        ('shares', '0002_shareholding'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sharetransaction',
+            name='acquired_after',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text="Member's cumulative shares bought or transferred in, up to this transaction", max_digits=12, null=True, verbose_name='Shares Acquired To Date'),
+        ),
+        migrations.AddField(
+            model_name='sharetransaction',
+            name='balance_after',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text="Member's cumulative share balance after this transaction (register rows only)", max_digits=12, null=True, verbose_name='Balance After'),
+        ),
+        migrations.AddIndex(
+            model_name='sharetransaction',
+            index=models.Index(fields=['member', 'transaction_date'], name='shares_shar_member__5d9bef_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 22:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shares', '0003_share_register'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sharecertificate',
+            name='certificate_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Content hash of the rendered certificate file', max_length=64, null=True, verbose_name='Certificate Hash'),
+        ),
+    ]
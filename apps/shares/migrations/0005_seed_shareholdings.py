@@ -0,0 +1,70 @@
+# Generated by Django 5.2 on 2026-10-18 23:40
+
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Case, DecimalField, F, Max, Sum, Value, When
+from django.utils import timezone
+
+SHARE_INFLOW_TYPES = ('BUY', 'TRANSFER_IN')
+SHARE_OUTFLOW_TYPES = ('SELL', 'TRANSFER_OUT')
+
+
+def signed_sum(field):
+    return Sum(
+        Case(
+            When(transaction_type__in=SHARE_INFLOW_TYPES, then=F(field)),
+            When(transaction_type__in=SHARE_OUTFLOW_TYPES, then=-F(field)),
+            default=Value(Decimal('0.00')),
+            output_field=DecimalField(max_digits=15, decimal_places=2)
+        )
+    )
+
+
+def seed_share_holdings(apps, schema_editor):
+    """Write a holding for every member with share history that has none"""
+    db_alias = schema_editor.connection.alias
+    ShareHolding = apps.get_model('shares', 'ShareHolding')
+    ShareTransaction = apps.get_model('shares', 'ShareTransaction')
+
+    completed = ShareTransaction.objects.using(db_alias).filter(
+        status='COMPLETED',
+        is_reversed=False,
+        transaction_type__in=SHARE_INFLOW_TYPES + SHARE_OUTFLOW_TYPES
+    ).exclude(
+        member_id__in=ShareHolding.objects.using(db_alias).values('member_id')
+    )
+
+    # Ordered by date, so each member's latest transaction is written last
+    latest = dict(completed.order_by('transaction_date').values_list('member_id', 'pk'))
+
+    now = timezone.now()
+    holdings = [
+        ShareHolding(
+            member_id=row['member_id'],
+            shares_count=row['net_shares'] or Decimal('0.00'),
+            total_value=row['net_value'] or Decimal('0.00'),
+            last_transaction_id=latest.get(row['member_id']),
+            last_transaction_date=row['last_date'],
+            created_at=now,
+            updated_at=now
+        )
+        for row in completed.values('member_id').annotate(
+            net_shares=signed_sum('shares_count'),
+            net_value=signed_sum('total_amount'),
+            last_date=Max('transaction_date')
+        ).order_by()
+    ]
+
+    ShareHolding.objects.using(db_alias).bulk_create(holdings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shares', '0004_sharecertificate_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_share_holdings, migrations.RunPython.noop),
+    ]
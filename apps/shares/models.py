@@ -227,11 +227,10 @@ class ShareCapital(BaseModel):
     
     @classmethod
     def get_active_share_capital(cls):
-        """Get currently active share capital configuration"""
-        return cls.objects.filter(
-            is_active=True,
-            effective_date__lte=timezone.now().date()
-        ).order_by('-effective_date').first()
+        """Get currently active share capital configuration (cached per tenant)"""
+        from .utils import get_share_capital_at
+        
+        return get_share_capital_at(timezone.now().date())
     
     def __str__(self):
         return f"{self.name} - {format_money(self.share_price)} per share"
@@ -458,6 +457,27 @@ class ShareTransaction(BaseModel):
         help_text="Financial period when transaction occurred"
     )
     
+    # Share Register
+    balance_after = models.DecimalField(
+        "Balance After",
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Member's cumulative share balance after this transaction (register rows only)"
+    )
+    
+    acquired_after = models.DecimalField(
+        "Shares Acquired To Date",
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Member's cumulative shares bought or transferred in, up to this transaction"
+    )
+    
     description = models.TextField(
         "Description",
         null=True,
@@ -594,6 +614,7 @@ class ShareTransaction(BaseModel):
             models.Index(fields=['transaction_date', 'status']),
             models.Index(fields=['status', 'is_reversed']),
             models.Index(fields=['transaction_number']),
+            models.Index(fields=['member', 'transaction_date']),
         ]
 
 
@@ -712,6 +733,15 @@ class ShareCertificate(BaseModel):
         help_text="Digital copy of the certificate"
     )
     
+    certificate_hash = models.CharField(
+        "Certificate Hash",
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Content hash of the rendered certificate file"
+    )
+    
     notes = models.TextField(
         "Notes",
         null=True,
@@ -967,6 +997,15 @@ class ShareTransferRequest(BaseModel):
         logger.info(f"Share transfer request {self.request_number} approved")
         return True, "Transfer request approved"
     
+    def complete(self):
+        """Settle approved transfer: write both legs and update holdings"""
+        if self.status != 'APPROVED':
+            return False, "Only approved requests can be completed"
+        
+        from .services import ShareTransferService
+        
+        return ShareTransferService.settle_transfer(self)
+    
     def reject(self, reason):
         """Reject transfer request"""
         if self.status != 'PENDING':
@@ -1002,4 +1041,71 @@ class ShareTransferRequest(BaseModel):
             models.Index(fields=['to_member', 'status']),
             models.Index(fields=['status', 'request_date']),
             models.Index(fields=['request_number']),
-        ]
\ No newline at end of file
+        ]
+
+# =============================================================================
+# SHARE HOLDING MODEL
+# =============================================================================
+
+class ShareHolding(BaseModel):
+    """
+    Materialized share position per member.
+    
+    Maintained with F-expression deltas whenever a share transaction starts or
+    stops affecting the balance (completed, reversed, deleted). Rebuild from
+    the transaction history with `manage.py rebuild_share_holdings`.
+    """
+    
+    member = models.OneToOneField(
+        'members.Member',
+        on_delete=models.CASCADE,
+        related_name='share_holding',
+        help_text="Member owning the shares"
+    )
+    
+    shares_count = models.DecimalField(
+        "Shares Held",
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Net shares from completed, non-reversed transactions"
+    )
+    
+    total_value = models.DecimalField(
+        "Share Capital Value",
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Share capital paid in: purchases and transfers in, less sales and transfers out"
+    )
+    
+    last_transaction = models.ForeignKey(
+        ShareTransaction,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Latest transaction applied to this holding"
+    )
+    
+    last_transaction_date = models.DateTimeField(
+        "Last Transaction Date",
+        null=True,
+        blank=True
+    )
+    
+    @property
+    def formatted_total_value(self):
+        """Get formatted share capital value"""
+        return format_money(self.total_value)
+    
+    def __str__(self):
+        return f"{self.member.get_full_name()} - {self.shares_count} shares ({format_money(self.total_value)})"
+    
+    class Meta:
+        verbose_name = 'Share Holding'
+        verbose_name_plural = 'Share Holdings'
+        ordering = ['-shares_count']
+        indexes = [
+            models.Index(fields=['shares_count']),
+        ]
@@ -0,0 +1,948 @@
+# shares/services.py
+
+"""
+Shares Business Logic Services
+
+Contains complex business logic that shouldn't be in views or models:
+- Materialized member share holdings
+- Share register cumulative balances
+- Batch share certificate rendering
+- Bulk rebuilds from transaction history
+
+WHY SERVICES.PY?
+1. Separation of Concerns: Complex business logic separate from views
+2. Reusability: Can be called from views, management commands, celery tasks
+3. Testing: Easier to test business logic in isolation
+4. Transaction Management: Handle complex multi-step operations
+5. Clear API: Well-defined functions for each business operation
+"""
+
+from django.db import transaction
+from django.db.models import (
+    Case, DateTimeField, DecimalField, F, Max, Q, Sum, UUIDField, Value, When
+)
+from django.utils import timezone
+from decimal import Decimal
+import logging
+
+from .models import ShareHolding, ShareTransaction
+from .utils import SHARE_INFLOW_TYPES, SHARE_OUTFLOW_TYPES, share_register_q
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SHARE HOLDING SERVICES
+# =============================================================================
+
+class ShareHoldingService:
+    """Maintain the materialized ShareHolding table"""
+
+    @staticmethod
+    def _signed_sum(field):
+        """SUM of a transaction field with inflows added and outflows subtracted"""
+        return Sum(
+            Case(
+                When(transaction_type__in=SHARE_INFLOW_TYPES, then=F(field)),
+                When(transaction_type__in=SHARE_OUTFLOW_TYPES, then=-F(field)),
+                default=Value(Decimal('0.00')),
+                output_field=DecimalField(max_digits=15, decimal_places=2)
+            )
+        )
+
+    @staticmethod
+    def _history(member_ids=None):
+        """Grouped net shares, value and latest date per member from history"""
+        transactions = ShareTransaction.objects.filter(
+            status='COMPLETED',
+            is_reversed=False,
+            transaction_type__in=SHARE_INFLOW_TYPES + SHARE_OUTFLOW_TYPES
+        )
+        if member_ids is not None:
+            transactions = transactions.filter(member_id__in=member_ids)
+
+        return transactions.values('member_id').annotate(
+            net_shares=ShareHoldingService._signed_sum('shares_count'),
+            net_value=ShareHoldingService._signed_sum('total_amount'),
+            last_date=Max('transaction_date')
+        ).order_by()
+
+    @staticmethod
+    def apply_delta(member_id, shares_delta, value_delta, share_transaction=None):
+        """
+        Apply a signed change to a member's holding with one atomic UPDATE.
+
+        A member without a holding row is seeded from their full history
+        instead, which already includes the transaction being applied, and
+        their financial summary is recomputed from it. Otherwise the summary
+        receives the same value change.
+
+        Args:
+            member_id: Member primary key
+            shares_delta (Decimal): Change in shares
+            value_delta (Decimal): Change in share capital value
+            share_transaction: ShareTransaction that caused the change, recorded
+                as the holding's last transaction when it is the latest one
+
+        Returns:
+            bool: True when the holding was seeded rather than changed
+        """
+        now = timezone.now()
+
+        updated = ShareHolding.objects.filter(member_id=member_id).update(
+            shares_count=F('shares_count') + shares_delta,
+            total_value=F('total_value') + value_delta,
+            updated_at=now
+        )
+
+        if not updated:
+            ShareHoldingService.rebuild(member_ids=[member_id])
+        elif share_transaction is not None:
+            ShareHolding.objects.filter(
+                Q(last_transaction_date__isnull=True) |
+                Q(last_transaction_date__lte=share_transaction.transaction_date),
+                member_id=member_id
+            ).update(
+                last_transaction=share_transaction,
+                last_transaction_date=share_transaction.transaction_date
+            )
+
+        from members.services import MemberFinancialSummaryService, MemberActivityService
+
+        if updated:
+            MemberFinancialSummaryService.apply_delta(member_id, total_shares=value_delta)
+        else:
+            MemberFinancialSummaryService.rebuild(member_ids=[member_id])
+
+        if (share_transaction is not None and
+                share_transaction.transaction_type in MemberActivityService.SHARE_ACTIVITY_TYPES):
+            MemberActivityService.record({member_id: share_transaction.transaction_date})
+
+        return not updated
+
+    @staticmethod
+    def lock_holdings(member_ids):
+        """
+        Lock holdings of several members, seeding any that are missing.
+
+        Rows are locked in member id order so concurrent settlements always
+        acquire locks in the same sequence and cannot deadlock. Must be
+        called inside transaction.atomic().
+
+        Args:
+            member_ids (iterable): Member primary keys
+
+        Returns:
+            dict: {member_id: (shares_count, total_value)}
+        """
+        member_ids = sorted(set(member_ids), key=str)
+
+        def locked():
+            return {
+                member_id: (shares_count, total_value)
+                for member_id, shares_count, total_value in ShareHolding.objects.select_for_update().filter(
+                    member_id__in=member_ids
+                ).order_by('member_id').values_list('member_id', 'shares_count', 'total_value')
+            }
+
+        holdings = locked()
+        missing = [member_id for member_id in member_ids if member_id not in holdings]
+
+        if missing:
+            ShareHoldingService.rebuild(member_ids=missing)
+            now = timezone.now()
+            ShareHolding.objects.bulk_create(
+                [ShareHolding(member_id=member_id, created_at=now, updated_at=now) for member_id in missing],
+                ignore_conflicts=True
+            )
+            holdings = locked()
+
+        return holdings
+
+    @staticmethod
+    def apply_deltas(deltas, last_transactions=None):
+        """
+        Apply signed changes to many holdings with one UPDATE.
+
+        The members' financial summaries receive the value changes with one
+        more UPDATE.
+
+        Args:
+            deltas (dict): {member_id: (shares_delta, value_delta)}
+            last_transactions (dict, optional): {member_id: ShareTransaction}
+                recorded as each holding's last transaction
+
+        Returns:
+            int: Number of holdings updated
+        """
+        if not deltas:
+            return 0
+
+        shares_field = DecimalField(max_digits=12, decimal_places=2)
+        value_field = DecimalField(max_digits=15, decimal_places=2)
+
+        extra = {}
+        if last_transactions:
+            extra['last_transaction'] = Case(
+                *[When(member_id=member_id, then=Value(txn.pk))
+                  for member_id, txn in last_transactions.items()],
+                default=F('last_transaction'),
+                output_field=UUIDField()
+            )
+            extra['last_transaction_date'] = Case(
+                *[When(member_id=member_id, then=Value(txn.transaction_date))
+                  for member_id, txn in last_transactions.items()],
+                default=F('last_transaction_date'),
+                output_field=DateTimeField()
+            )
+
+        updated = ShareHolding.objects.filter(member_id__in=list(deltas)).update(
+            shares_count=F('shares_count') + Case(
+                *[When(member_id=member_id, then=Value(shares)) for member_id, (shares, _value) in deltas.items()],
+                default=Value(Decimal('0.00')),
+                output_field=shares_field
+            ),
+            total_value=F('total_value') + Case(
+                *[When(member_id=member_id, then=Value(value)) for member_id, (_shares, value) in deltas.items()],
+                default=Value(Decimal('0.00')),
+                output_field=value_field
+            ),
+            updated_at=timezone.now(),
+            **extra
+        )
+
+        from members.services import MemberFinancialSummaryService, MemberActivityService
+
+        MemberFinancialSummaryService.apply_deltas(
+            {member_id: {'total_shares': value} for member_id, (_shares, value) in deltas.items()}
+        )
+
+        if last_transactions:
+            MemberActivityService.record({
+                member_id: txn.transaction_date
+                for member_id, txn in last_transactions.items()
+                if txn.transaction_type in MemberActivityService.SHARE_ACTIVITY_TYPES
+            })
+
+        return updated
+
+    @staticmethod
+    def rebuild(member_ids=None, batch_size=1000):
+        """
+        Recompute holdings from the transaction history.
+
+        One grouped query computes every member's position; rows are written
+        with chunked bulk upserts. Members whose history nets to nothing keep a
+        zeroed holding.
+
+        Args:
+            member_ids (list, optional): Limit the rebuild to these members
+            batch_size (int): Rows per INSERT statement
+
+        Returns:
+            int: Number of holdings written
+        """
+        from django.db.models import OuterRef, Subquery
+        from utils.utils import bulk_upsert, chunked
+
+        latest_transaction = ShareTransaction.objects.filter(
+            member_id=OuterRef('member_id'),
+            status='COMPLETED',
+            is_reversed=False,
+            transaction_type__in=SHARE_INFLOW_TYPES + SHARE_OUTFLOW_TYPES
+        ).order_by('-transaction_date').values('pk')[:1]
+
+        rows = ShareHoldingService._history(member_ids).annotate(
+            last_transaction_id=Subquery(latest_transaction)
+        ).values_list('member_id', 'net_shares', 'net_value', 'last_date', 'last_transaction_id')
+
+        now = timezone.now()
+        written = 0
+
+        with transaction.atomic():
+            stale = ShareHolding.objects.all()
+            if member_ids is not None:
+                stale = stale.filter(member_id__in=member_ids)
+            stale.update(
+                shares_count=Decimal('0.00'),
+                total_value=Decimal('0.00'),
+                last_transaction=None,
+                last_transaction_date=None,
+                updated_at=now
+            )
+
+            for batch in chunked(rows.iterator(), batch_size):
+                holdings = [
+                    ShareHolding(
+                        member_id=member_id,
+                        shares_count=net_shares or Decimal('0.00'),
+                        total_value=net_value or Decimal('0.00'),
+                        last_transaction_id=last_transaction_id,
+                        last_transaction_date=last_date,
+                        created_at=now,
+                        updated_at=now
+                    )
+                    for member_id, net_shares, net_value, last_date, last_transaction_id in batch
+                ]
+                written += bulk_upsert(
+                    ShareHolding,
+                    holdings,
+                    unique_fields=['member'],
+                    update_fields=[
+                        'shares_count', 'total_value', 'last_transaction',
+                        'last_transaction_date', 'updated_at',
+                    ],
+                    batch_size=batch_size
+                )
+
+        logger.info(f"Rebuilt {written} share holding(s)")
+        return written
+
+
+# =============================================================================
+# SHARE REGISTER SERVICES
+# =============================================================================
+
+class ShareRegisterService:
+    """Maintain cumulative balances on share register rows"""
+
+    REGISTER_ORDER = ('transaction_date', 'created_at', 'id')
+
+    @staticmethod
+    def _clear_non_register_rows(member_ids=None):
+        """Drop cumulative balances from rows that no longer move the balance"""
+        rows = ShareTransaction.objects.filter(
+            balance_after__isnull=False
+        ).exclude(share_register_q())
+        if member_ids is not None:
+            rows = rows.filter(member_id__in=member_ids)
+
+        return rows.update(balance_after=None, acquired_after=None)
+
+    @staticmethod
+    def _write_balances(rows, opening=None, batch_size=1000):
+        """
+        Accumulate balances over register rows ordered by member then
+        REGISTER_ORDER, writing only rows whose stored values changed.
+
+        Args:
+            rows: Iterable of (member_id, pk, transaction_type, shares_count,
+                balance_after, acquired_after)
+            opening (dict, optional): member_id -> (balance, acquired) to start from
+            batch_size (int): Rows per UPDATE batch
+
+        Returns:
+            int: Number of rows updated
+        """
+        from utils.utils import chunked
+
+        opening = opening or {}
+
+        def restated():
+            current = None
+            balance = acquired = Decimal('0.00')
+
+            for member_id, pk, transaction_type, shares_count, balance_after, acquired_after in rows:
+                if member_id != current:
+                    current = member_id
+                    balance, acquired = opening.get(
+                        member_id, (Decimal('0.00'), Decimal('0.00'))
+                    )
+
+                if transaction_type in SHARE_INFLOW_TYPES:
+                    balance += shares_count
+                    acquired += shares_count
+                else:
+                    balance -= shares_count
+
+                if balance_after != balance or acquired_after != acquired:
+                    yield ShareTransaction(pk=pk, balance_after=balance, acquired_after=acquired)
+
+        written = 0
+        for batch in chunked(restated(), batch_size):
+            written += ShareTransaction.objects.bulk_update(
+                batch, ['balance_after', 'acquired_after'], batch_size=batch_size
+            )
+        return written
+
+    @staticmethod
+    def restate(member_id, from_date=None, batch_size=1000):
+        """
+        Recompute a member's register balances from a date onwards.
+
+        Args:
+            member_id: Member primary key
+            from_date (datetime, optional): Earliest transaction_date affected
+                (defaults to the full history)
+            batch_size (int): Rows per UPDATE batch
+
+        Returns:
+            int: Number of register rows updated
+        """
+        if from_date is None:
+            return ShareRegisterService.rebuild(member_ids=[member_id], batch_size=batch_size)
+
+        return ShareRegisterService.restate_members([member_id], from_date, batch_size)
+
+    @staticmethod
+    def restate_members(member_ids, from_date, batch_size=1000):
+        """
+        Recompute register balances of several members from a date onwards.
+
+        Opening positions are each member's last register row before
+        `from_date`, read in one query; only rows on or after it are
+        re-accumulated, so appending transactions touches just the new rows.
+        Members whose earlier rows were never stated are rebuilt in full.
+
+        Args:
+            member_ids (iterable): Member primary keys
+            from_date (datetime): Earliest transaction_date affected
+            batch_size (int): Rows per UPDATE batch
+
+        Returns:
+            int: Number of register rows updated
+        """
+        from django.db.models import Exists, OuterRef, Subquery
+        from members.models import Member
+
+        member_ids = list(set(member_ids))
+        if not member_ids:
+            return 0
+
+        previous = ShareTransaction.objects.filter(
+            share_register_q(),
+            member_id=OuterRef('pk'),
+            transaction_date__lt=from_date
+        ).order_by('-transaction_date', '-created_at', '-id')
+
+        openings = Member.objects.filter(pk__in=member_ids).annotate(
+            has_previous=Exists(previous),
+            previous_balance=Subquery(previous.values('balance_after')[:1]),
+            previous_acquired=Subquery(previous.values('acquired_after')[:1])
+        ).values_list('pk', 'has_previous', 'previous_balance', 'previous_acquired')
+
+        opening = {}
+        unstated = []
+        for member_id, has_previous, balance, acquired in openings:
+            if not has_previous:
+                continue
+            if balance is None or acquired is None:
+                unstated.append(member_id)
+            else:
+                opening[member_id] = (balance, acquired)
+
+        stated = [member_id for member_id in member_ids if member_id not in unstated]
+
+        rows = ShareTransaction.objects.filter(
+            share_register_q(),
+            member_id__in=stated,
+            transaction_date__gte=from_date
+        ).order_by('member_id', *ShareRegisterService.REGISTER_ORDER).values_list(
+            'member_id', 'pk', 'transaction_type', 'shares_count', 'balance_after', 'acquired_after'
+        )
+
+        with transaction.atomic():
+            written = 0
+            if stated:
+                ShareRegisterService._clear_non_register_rows(stated)
+                written = ShareRegisterService._write_balances(rows, opening, batch_size)
+            if unstated:
+                written += ShareRegisterService.rebuild(member_ids=unstated, batch_size=batch_size)
+
+        return written
+
+    @staticmethod
+    def rebuild(member_ids=None, batch_size=1000):
+        """
+        Recompute register balances for every member in one ordered sweep.
+
+        Args:
+            member_ids (list, optional): Limit the rebuild to these members
+            batch_size (int): Rows per UPDATE batch
+
+        Returns:
+            int: Number of register rows updated
+        """
+        register = ShareTransaction.objects.filter(share_register_q())
+        if member_ids is not None:
+            register = register.filter(member_id__in=member_ids)
+
+        rows = register.order_by('member_id', *ShareRegisterService.REGISTER_ORDER).values_list(
+            'member_id', 'pk', 'transaction_type', 'shares_count', 'balance_after', 'acquired_after'
+        )
+
+        with transaction.atomic():
+            cleared = ShareRegisterService._clear_non_register_rows(member_ids)
+            written = ShareRegisterService._write_balances(
+                rows.iterator(chunk_size=batch_size), batch_size=batch_size
+            )
+
+        logger.info(f"Restated {written} share register row(s), cleared {cleared}")
+        return written
+
+
+# =============================================================================
+# SHARE TRANSFER SERVICES
+# =============================================================================
+
+class ShareTransferService:
+    """Settle approved share transfer requests"""
+
+    @staticmethod
+    def settle_transfers(request_ids, settled_at=None):
+        """
+        Settle a batch of share transfer requests in one database transaction.
+
+        Requests and both members' holdings are locked once, holdings in
+        member id order. Each transfer is validated against the running
+        balances of the batch, then both legs of every valid transfer are
+        written with a single INSERT, holdings with a single UPDATE and the
+        share register restated once for all affected members. No
+        ShareTransaction signals fire, so there is no cascade of linked
+        transactions or per-leg balance recomputation. The query count does
+        not grow with the batch size.
+
+        APPROVED requests are settled and marked COMPLETED. COMPLETED
+        requests without transactions (completed directly) are settled too.
+
+        Args:
+            request_ids (iterable): ShareTransferRequest primary keys
+            settled_at (datetime, optional): Transaction date of both legs
+
+        Returns:
+            dict: {
+                'settled': int,
+                'failed': int,
+                'errors': list,
+                'transactions': {request_id: (transfer_out, transfer_in)}
+            }
+        """
+        from core.utils import get_active_fiscal_period
+        from members.models import Member
+        from .models import ShareCapital, ShareTransferRequest
+        from .utils import generate_transaction_number_block
+
+        settled_at = settled_at or timezone.now()
+        results = {'settled': 0, 'failed': 0, 'errors': [], 'transactions': {}}
+
+        request_ids = list(request_ids)
+        if not request_ids:
+            return results
+
+        share_capital = ShareCapital.get_active_share_capital()
+        if not share_capital:
+            results['failed'] = len(request_ids)
+            results['errors'].append("No active share capital configured")
+            return results
+
+        if not share_capital.allow_transfers:
+            results['failed'] = len(request_ids)
+            results['errors'].append("Share transfers are not allowed")
+            return results
+
+        with transaction.atomic():
+            requests = list(
+                ShareTransferRequest.objects.select_for_update().filter(
+                    pk__in=request_ids,
+                    status__in=['APPROVED', 'COMPLETED'],
+                    transfer_out_transaction__isnull=True
+                ).order_by('approval_date', 'request_number').values_list(
+                    'pk', 'request_number', 'status', 'from_member_id', 'to_member_id',
+                    'shares_count', 'share_price', 'transfer_fee'
+                )
+            )
+
+            skipped = len(set(request_ids)) - len(requests)
+            if skipped:
+                results['errors'].append(f"{skipped} request(s) not approved or already settled")
+                results['failed'] += skipped
+
+            if not requests:
+                return results
+
+            member_ids = {row[3] for row in requests} | {row[4] for row in requests}
+            holdings = ShareHoldingService.lock_holdings(member_ids)
+            names = {
+                pk: f"{first_name} {last_name}".strip()
+                for pk, first_name, last_name in Member.objects.filter(
+                    pk__in=member_ids
+                ).values_list('pk', 'first_name', 'last_name')
+            }
+
+            balances = {member_id: shares for member_id, (shares, _value) in holdings.items()}
+            accepted = []
+
+            for request in requests:
+                request_id, request_number, _status, from_id, to_id, shares, _price, _fee = request
+
+                error = None
+                if from_id == to_id:
+                    error = "Cannot transfer shares to the same member"
+                elif shares > balances[from_id]:
+                    error = f"Insufficient shares. Current balance: {balances[from_id]}"
+                elif 0 < balances[from_id] - shares < share_capital.minimum_shares:
+                    error = (
+                        f"Transfer would leave sender below minimum required shares of "
+                        f"{share_capital.minimum_shares}"
+                    )
+                elif share_capital.maximum_shares and balances[to_id] + shares > share_capital.maximum_shares:
+                    error = (
+                        f"Transfer would put receiver above maximum shares limit of "
+                        f"{share_capital.maximum_shares}"
+                    )
+
+                if error:
+                    results['failed'] += 1
+                    results['errors'].append(f"{request_number}: {error}")
+                    continue
+
+                balances[from_id] -= shares
+                balances[to_id] += shares
+                accepted.append(request)
+
+            if not accepted:
+                return results
+
+            out_numbers = generate_transaction_number_block('TRANSFER_OUT', len(accepted))
+            in_numbers = generate_transaction_number_block('TRANSFER_IN', len(accepted))
+            financial_period = get_active_fiscal_period()
+            now = timezone.now()
+
+            legs = []
+            deltas = {}
+            last_transactions = {}
+            links = {}
+
+            for index, request in enumerate(accepted):
+                request_id, request_number, _status, from_id, to_id, shares, price, fee = request
+                amount = shares * price
+
+                common = {
+                    'share_capital': share_capital,
+                    'transaction_date': settled_at,
+                    'shares_count': shares,
+                    'price_per_share': price,
+                    'total_amount': amount,
+                    'transfer_from_id': from_id,
+                    'transfer_to_id': to_id,
+                    'status': 'COMPLETED',
+                    'financial_period': financial_period,
+                    'created_at': now,
+                    'updated_at': now,
+                }
+
+                transfer_out = ShareTransaction(
+                    transaction_number=out_numbers[index],
+                    member_id=from_id,
+                    transaction_type='TRANSFER_OUT',
+                    transfer_fee=fee or Decimal('0.00'),
+                    description=f"Transfer to {names.get(to_id, '')} via {request_number}",
+                    **common
+                )
+                transfer_in = ShareTransaction(
+                    transaction_number=in_numbers[index],
+                    member_id=to_id,
+                    transaction_type='TRANSFER_IN',
+                    linked_transaction=transfer_out,
+                    description=f"Transfer from {names.get(from_id, '')} via {request_number}",
+                    **common
+                )
+                legs.extend([transfer_out, transfer_in])
+                links[transfer_out.pk] = transfer_in.pk
+                results['transactions'][request_id] = (transfer_out, transfer_in)
+
+                for member_id, sign, leg in ((from_id, -1, transfer_out), (to_id, 1, transfer_in)):
+                    shares_delta, value_delta = deltas.get(member_id, (Decimal('0.00'), Decimal('0.00')))
+                    deltas[member_id] = (shares_delta + sign * shares, value_delta + sign * amount)
+                    last_transactions[member_id] = leg
+
+            # Outgoing legs come first, so incoming legs can reference them
+            ShareTransaction.objects.bulk_create(legs)
+
+            ShareTransaction.objects.filter(pk__in=list(links)).update(
+                linked_transaction=Case(
+                    *[When(pk=out_pk, then=Value(in_pk)) for out_pk, in_pk in links.items()],
+                    output_field=UUIDField()
+                )
+            )
+            for transfer_out, transfer_in in results['transactions'].values():
+                transfer_out.linked_transaction = transfer_in
+
+            ShareHoldingService.apply_deltas(deltas, last_transactions)
+            ShareRegisterService.restate_members(deltas.keys(), settled_at)
+
+            ShareTransferRequest.objects.filter(
+                pk__in=[request[0] for request in accepted]
+            ).update(
+                status='COMPLETED',
+                completion_date=Case(
+                    When(completion_date__isnull=True, then=Value(settled_at)),
+                    default=F('completion_date')
+                ),
+                transfer_out_transaction=Case(
+                    *[When(pk=request_id, then=Value(transfer_out.pk))
+                      for request_id, (transfer_out, _in) in results['transactions'].items()],
+                    output_field=UUIDField()
+                ),
+                transfer_in_transaction=Case(
+                    *[When(pk=request_id, then=Value(transfer_in.pk))
+                      for request_id, (_out, transfer_in) in results['transactions'].items()],
+                    output_field=UUIDField()
+                ),
+                updated_at=now
+            )
+
+            results['settled'] = len(accepted)
+
+        logger.info(
+            f"Settled {results['settled']} share transfer(s), {results['failed']} failed"
+        )
+        return results
+
+    @staticmethod
+    def settle_transfer(transfer_request, settled_at=None):
+        """
+        Settle a single share transfer request.
+
+        Args:
+            transfer_request: ShareTransferRequest instance
+            settled_at (datetime, optional): Transaction date of both legs
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            results = ShareTransferService.settle_transfers([transfer_request.pk], settled_at)
+        except Exception as e:
+            logger.error(f"Error settling transfer {transfer_request.request_number}: {e}", exc_info=True)
+            return False, f"Error settling transfer: {str(e)}"
+
+        if not results['settled']:
+            return False, results['errors'][0] if results['errors'] else "Transfer was not settled"
+
+        transfer_out, transfer_in = results['transactions'][transfer_request.pk]
+        transfer_request.status = 'COMPLETED'
+        transfer_request.transfer_out_transaction = transfer_out
+        transfer_request.transfer_in_transaction = transfer_in
+        if not transfer_request.completion_date:
+            transfer_request.completion_date = transfer_out.transaction_date
+
+        return True, f"Transfer {transfer_request.request_number} settled"
+
+
+# =============================================================================
+# SHARE CERTIFICATE SERVICES
+# =============================================================================
+
+class ShareCertificateService:
+    """Render share certificates to PDF in batches"""
+
+    CHUNK_SIZE = 500
+    BATCH_DIRECTORY = 'share_certificates/batches'
+
+    # Batches this small render in-process rather than starting a pool
+    IN_PROCESS_LIMIT = 20
+
+    @staticmethod
+    def get_resources():
+        """
+        Template resources for the current SACCO database: name and logo.
+
+        Returns:
+            dict: Resources for shares.certificates.init_worker()
+        """
+        from accounts.models import Sacco
+        from kojenasacco.managers import get_current_db
+
+        resources = {'sacco_name': '', 'logo': None, 'fonts': None}
+
+        sacco = Sacco.objects.filter(database_alias=get_current_db()).first()
+        if sacco:
+            resources['sacco_name'] = sacco.full_name
+            if sacco.sacco_logo:
+                try:
+                    with sacco.sacco_logo.open('rb') as logo:
+                        resources['logo'] = logo.read()
+                except Exception as e:
+                    logger.warning(f"Could not read logo for {sacco.full_name}: {e}")
+
+        return resources
+
+    @staticmethod
+    def _store(certificate, content_hash, pdf):
+        """Point a certificate at its content-hashed PDF, writing it if new"""
+        from django.core.files.base import ContentFile
+
+        field = certificate.certificate_file
+        name = field.field.generate_filename(
+            certificate, f"{certificate.certificate_number}-{content_hash[:12]}.pdf"
+        )
+        previous = field.name
+
+        if not field.storage.exists(name):
+            name = field.storage.save(name, ContentFile(pdf))
+
+        if previous and previous != name and field.storage.exists(previous):
+            field.storage.delete(previous)
+
+        certificate.certificate_file.name = name
+        certificate.certificate_hash = content_hash
+
+    @staticmethod
+    def _merge(label, entries):
+        """
+        Write the merged batch PDF, named by the hashes of its certificates.
+
+        Args:
+            label (str): Batch file name prefix
+            entries (list): (certificate_hash, file_name) in print order
+
+        Returns:
+            str: Storage name of the merged PDF
+        """
+        import hashlib
+        from django.core.files.base import ContentFile
+        from .certificates import merge_pdfs
+        from .models import ShareCertificate
+
+        storage = ShareCertificate._meta.get_field('certificate_file').storage
+
+        digest = hashlib.sha256(
+            ''.join(content_hash for content_hash, _ in entries).encode('utf-8')
+        ).hexdigest()
+        name = f"{ShareCertificateService.BATCH_DIRECTORY}/{label}-{digest[:16]}.pdf"
+
+        if storage.exists(name):
+            return name
+
+        def documents():
+            for _, file_name in entries:
+                with storage.open(file_name, 'rb') as document:
+                    yield document.read()
+
+        return storage.save(name, ContentFile(merge_pdfs(documents())))
+
+    @staticmethod
+    def render_batch(certificates=None, workers=None, force=False, merge=True,
+                     label='certificates', chunk_size=None, progress_callback=None):
+        """
+        Render certificates to per-certificate PDFs and a merged batch PDF.
+
+        Certificates whose content hash matches their stored file are
+        skipped. The rest are rendered in a process pool in chunks, each
+        chunk's files and hashes saved with one bulk update.
+
+        Args:
+            certificates (QuerySet, optional): Certificates to render
+                (defaults to all ACTIVE certificates)
+            workers (int, optional): Worker processes; 1 renders in-process
+            force (bool): Re-render even when the content hash is unchanged
+            merge (bool): Write a merged batch PDF
+            label (str): Merged batch file name prefix
+            chunk_size (int, optional): Certificates per chunk
+            progress_callback: Optional callable(done, total)
+
+        Returns:
+            dict: {'rendered', 'skipped', 'failed', 'errors', 'batch_file'}
+        """
+        from contextlib import nullcontext
+        from core.models import FinancialSettings
+        from core.utils import format_money
+        from utils.utils import chunked
+        from .certificates import (
+            build_certificate_payload, certificate_content_hash, certificate_pool,
+            render_certificates, resources_fingerprint
+        )
+        from .models import ShareCertificate
+
+        chunk_size = chunk_size or ShareCertificateService.CHUNK_SIZE
+        results = {'rendered': 0, 'skipped': 0, 'failed': 0, 'errors': [], 'batch_file': None}
+
+        if certificates is None:
+            certificates = ShareCertificate.objects.filter(status='ACTIVE', is_valid=True)
+
+        certificate_ids = list(
+            certificates.order_by('certificate_number').values_list('pk', flat=True)
+        )
+        total = len(certificate_ids)
+        if not total:
+            return results
+
+        resources = ShareCertificateService.get_resources()
+        fingerprint = resources_fingerprint(resources)
+
+        financial_settings = FinancialSettings.get_instance()
+        format_currency = financial_settings.format_currency if financial_settings else format_money
+
+        entries = []
+        done = 0
+
+        use_pool = workers != 1 and total > ShareCertificateService.IN_PROCESS_LIMIT
+        pool = certificate_pool(resources, workers) if use_pool else nullcontext()
+        with pool as executor:
+            for chunk in chunked(certificate_ids, chunk_size):
+                batch = {
+                    str(certificate.pk): certificate
+                    for certificate in ShareCertificate.objects.select_related(
+                        'member', 'share_capital'
+                    ).filter(pk__in=chunk).order_by('certificate_number')
+                }
+
+                pending = []
+                for certificate_id, certificate in batch.items():
+                    payload = build_certificate_payload(certificate, format_currency)
+                    content_hash = certificate_content_hash(payload, fingerprint)
+
+                    if (not force and certificate.certificate_file
+                            and certificate.certificate_hash == content_hash):
+                        results['skipped'] += 1
+                        entries.append((certificate_id, content_hash, certificate.certificate_file.name))
+                    else:
+                        pending.append(payload)
+
+                updated = []
+                processed = 0
+                try:
+                    for certificate_id, content_hash, pdf in render_certificates(
+                        pending, resources, executor=executor
+                    ):
+                        processed += 1
+                        certificate = batch[certificate_id]
+                        try:
+                            ShareCertificateService._store(certificate, content_hash, pdf)
+                            certificate.updated_at = timezone.now()
+                            updated.append(certificate)
+                            entries.append((certificate_id, content_hash, certificate.certificate_file.name))
+                        except Exception as e:
+                            results['failed'] += 1
+                            results['errors'].append(f"{certificate.certificate_number}: {e}")
+                except Exception as e:
+                    logger.error(f"Error rendering certificate chunk: {e}", exc_info=True)
+                    results['failed'] += len(pending) - processed
+                    results['errors'].append(f"Rendering failed: {e}")
+
+                ShareCertificate.objects.bulk_update(
+                    updated, ['certificate_file', 'certificate_hash', 'updated_at']
+                )
+                results['rendered'] += len(updated)
+
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, total)
+
+        if merge and entries:
+            order = {str(pk): index for index, pk in enumerate(certificate_ids)}
+            entries.sort(key=lambda entry: order[entry[0]])
+            try:
+                results['batch_file'] = ShareCertificateService._merge(
+                    label, [(content_hash, file_name) for _, content_hash, file_name in entries]
+                )
+            except Exception as e:
+                logger.error(f"Error merging certificate batch: {e}", exc_info=True)
+                results['errors'].append(f"Merge failed: {e}")
+
+        logger.info(
+            f"Certificate batch: {results['rendered']} rendered, "
+            f"{results['skipped']} unchanged, {results['failed']} failed"
+        )
+        return results
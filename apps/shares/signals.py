@@ -63,6 +63,19 @@ def deactivate_previous_share_capital(sender, instance, **kwargs):
         logger.info(f"Deactivated previous share capital configurations")
 
 
+@receiver(post_save, sender=ShareCapital)
+@receiver(post_delete, sender=ShareCapital)
+def invalidate_share_capital_index_on_change(sender, instance, **kwargs):
+    """
+    Drop the cached share price index of the tenant whose share capital changed.
+    """
+    from kojenasacco.managers import get_current_db
+    from .utils import invalidate_share_capital_index
+    
+    invalidate_share_capital_index(instance._state.db)
+    invalidate_share_capital_index(get_current_db())
+
+
 # =============================================================================
 # SHARE TRANSACTION SIGNALS
 # =============================================================================
@@ -184,34 +197,151 @@ def log_transaction_creation(sender, instance, created, **kwargs):
         )
 
 
+@receiver(pre_save, sender=ShareTransaction)
+def remember_share_balance_effect(sender, instance, **kwargs):
+    """
+    Remember what the stored version of the transaction contributed to the
+    member's holding and register, so post_save can apply only the difference.
+    
+    Register balances are maintained by queryset updates, so the stored
+    values are copied onto the instance to keep a stale copy from
+    overwriting them.
+    """
+    from .utils import get_share_balance_effect
+    
+    instance._previous_share_effect = None
+    
+    previous = ShareTransaction.objects.filter(pk=instance.pk).values(
+        'member_id', 'transaction_type', 'status', 'is_reversed', 'shares_count', 'total_amount',
+        'transaction_date', 'balance_after', 'acquired_after'
+    ).first()
+    
+    if previous:
+        instance._previous_share_effect = (
+            previous['member_id'],
+            get_share_balance_effect(
+                previous['transaction_type'],
+                previous['status'],
+                previous['is_reversed'],
+                previous['shares_count'],
+                previous['total_amount']
+            ),
+            previous['transaction_date']
+        )
+        instance.balance_after = previous['balance_after']
+        instance.acquired_after = previous['acquired_after']
+
+
 @receiver(post_save, sender=ShareTransaction)
 def update_member_share_balance_on_transaction(sender, instance, **kwargs):
     """
-    Update member's share balance summary when transaction is completed.
+    Keep the member's ShareHolding in step with completed transactions.
     
-    Note: This assumes you have a shares_balance field on Member model.
-    If not, this can be removed or adjusted.
+    Completing a transaction adds its effect, reversing (or otherwise
+    changing) it removes the old effect. Changes within one member are
+    netted into a single atomic F-expression UPDATE on the holding row, so
+    a holding seeded from history is never adjusted a second time.
     """
-    # Only update when transaction is completed and not reversed
-    if instance.status == 'COMPLETED' and not instance.is_reversed:
-        try:
-            from .utils import calculate_member_share_balance
+    from .utils import get_share_balance_effect
+    from .services import ShareHoldingService
+    
+    zero = (Decimal('0.00'), Decimal('0.00'))
+    previous_member_id, previous_effect, _ = (
+        getattr(instance, '_previous_share_effect', None) or (None, zero, None)
+    )
+    
+    current_effect = get_share_balance_effect(
+        instance.transaction_type,
+        instance.status,
+        instance.is_reversed,
+        instance.shares_count,
+        instance.total_amount
+    )
+    
+    if previous_member_id == instance.member_id and previous_effect == current_effect:
+        return
+    
+    try:
+        if previous_member_id == instance.member_id:
+            ShareHoldingService.apply_delta(
+                instance.member_id,
+                current_effect[0] - previous_effect[0],
+                current_effect[1] - previous_effect[1],
+                share_transaction=instance if current_effect != zero else None
+            )
             
-            # Recalculate balance
-            balance_info = calculate_member_share_balance(instance.member)
+            logger.debug(
+                f"Applied change to {instance.transaction_number} to share holding: "
+                f"{current_effect[0] - previous_effect[0]} shares"
+            )
+            return
+        
+        if previous_effect != zero:
+            ShareHoldingService.apply_delta(
+                previous_member_id, -previous_effect[0], -previous_effect[1]
+            )
+        
+        if current_effect != zero:
+            ShareHoldingService.apply_delta(
+                instance.member_id, current_effect[0], current_effect[1],
+                share_transaction=instance
+            )
             
-            # Update member's share balance (if field exists)
-            if hasattr(instance.member, 'shares_balance'):
-                instance.member.shares_balance = balance_info['net_shares']
-                instance.member.shares_value = balance_info['total_value']
-                instance.member.save(update_fields=['shares_balance', 'shares_value', 'updated_at'])
-                
-                logger.debug(
-                    f"Updated share balance for {instance.member.get_full_name()}: "
-                    f"{balance_info['net_shares']} shares"
-                )
-        except Exception as e:
-            logger.error(f"Error updating member share balance: {e}")
+            logger.debug(
+                f"Applied {instance.transaction_number} to share holding: "
+                f"{current_effect[0]} shares"
+            )
+    except Exception as e:
+        logger.error(f"Error updating member share balance: {e}")
+
+
+@receiver(post_save, sender=ShareTransaction)
+def update_share_register_on_transaction(sender, instance, **kwargs):
+    """
+    Restate cumulative register balances when a transaction enters, leaves
+    or moves within a member's share register.
+    
+    Balances are re-accumulated from the earliest affected date, so
+    appending a transaction only states its own row.
+    """
+    from .utils import get_share_balance_effect
+    from .services import ShareRegisterService
+    
+    zero = (Decimal('0.00'), Decimal('0.00'))
+    previous_member_id, previous_effect, previous_date = (
+        getattr(instance, '_previous_share_effect', None) or (None, zero, None)
+    )
+    
+    current_effect = get_share_balance_effect(
+        instance.transaction_type,
+        instance.status,
+        instance.is_reversed,
+        instance.shares_count,
+        instance.total_amount
+    )
+    
+    if (previous_member_id == instance.member_id and previous_effect == current_effect
+            and previous_date == instance.transaction_date):
+        return
+    
+    # member_id -> earliest transaction date to restate from
+    affected = {}
+    if previous_effect != zero:
+        affected[previous_member_id] = previous_date
+    if current_effect != zero:
+        earliest = affected.get(instance.member_id)
+        affected[instance.member_id] = (
+            min(earliest, instance.transaction_date) if earliest else instance.transaction_date
+        )
+    
+    try:
+        for member_id, from_date in affected.items():
+            ShareRegisterService.restate(member_id, from_date)
+        
+        if current_effect == zero:
+            instance.balance_after = instance.acquired_after = None
+    except Exception as e:
+        logger.error(f"Error updating share register: {e}")
 
 
 @receiver(post_save, sender=ShareTransaction)
@@ -447,72 +577,72 @@ def log_transfer_request_creation(sender, instance, created, **kwargs):
 @receiver(post_save, sender=ShareTransferRequest)
 def create_transactions_on_transfer_completion(sender, instance, **kwargs):
     """
-    Create share transactions when transfer request is completed.
+    Settle a transfer request that was marked COMPLETED directly.
+    
+    Delegates to ShareTransferService, which writes both legs and the
+    holding changes without firing ShareTransaction signals.
     """
-    if instance.status == 'COMPLETED':
-        # Check if transactions already created
-        if not instance.transfer_out_transaction or not instance.transfer_in_transaction:
-            try:
-                from shares.models import ShareCapital
-                
-                share_capital = ShareCapital.get_active_share_capital()
-                
-                # Create TRANSFER_OUT transaction
-                if not instance.transfer_out_transaction:
-                    transfer_out = ShareTransaction.objects.create(
-                        member=instance.from_member,
-                        share_capital=share_capital,
-                        transaction_type='TRANSFER_OUT',
-                        shares_count=instance.shares_count,
-                        price_per_share=instance.share_price,
-                        total_amount=instance.total_amount,
-                        transfer_from=instance.from_member,
-                        transfer_to=instance.to_member,
-                        transfer_fee=instance.transfer_fee,
-                        status='COMPLETED',
-                        description=f"Transfer to {instance.to_member.get_full_name()} via {instance.request_number}"
-                    )
-                    
-                    instance.transfer_out_transaction = transfer_out
-                
-                # Create TRANSFER_IN transaction
-                if not instance.transfer_in_transaction:
-                    transfer_in = ShareTransaction.objects.create(
-                        member=instance.to_member,
-                        share_capital=share_capital,
-                        transaction_type='TRANSFER_IN',
-                        shares_count=instance.shares_count,
-                        price_per_share=instance.share_price,
-                        total_amount=instance.total_amount,
-                        transfer_from=instance.from_member,
-                        transfer_to=instance.to_member,
-                        linked_transaction=instance.transfer_out_transaction,
-                        status='COMPLETED',
-                        description=f"Transfer from {instance.from_member.get_full_name()} via {instance.request_number}"
-                    )
-                    
-                    instance.transfer_in_transaction = transfer_in
-                    
-                    # Link transactions
-                    if instance.transfer_out_transaction:
-                        instance.transfer_out_transaction.linked_transaction = transfer_in
-                        instance.transfer_out_transaction.save(update_fields=['linked_transaction'])
-                
-                # Save request with transaction references
-                instance.save(update_fields=['transfer_out_transaction', 'transfer_in_transaction'])
-                
-                logger.info(
-                    f"Created share transfer transactions for request {instance.request_number}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error creating transfer transactions: {e}")
+    if instance.status == 'COMPLETED' and not instance.transfer_out_transaction_id:
+        from .services import ShareTransferService
+        
+        success, message = ShareTransferService.settle_transfer(instance)
+        
+        if success:
+            logger.info(f"Created share transfer transactions for request {instance.request_number}")
+        else:
+            logger.error(f"Error creating transfer transactions: {message}")
 
 
 # =============================================================================
 # CLEANUP SIGNALS
 # =============================================================================
 
+@receiver(post_delete, sender=ShareTransaction)
+def update_member_share_balance_on_deletion(sender, instance, **kwargs):
+    """
+    Remove a deleted transaction's effect from the member's holding.
+    """
+    from .utils import get_share_balance_effect
+    from .services import ShareHoldingService
+    
+    shares_delta, value_delta = get_share_balance_effect(
+        instance.transaction_type,
+        instance.status,
+        instance.is_reversed,
+        instance.shares_count,
+        instance.total_amount
+    )
+    
+    if shares_delta or value_delta:
+        try:
+            ShareHoldingService.apply_delta(instance.member_id, -shares_delta, -value_delta)
+        except Exception as e:
+            logger.error(f"Error updating member share balance after delete: {e}")
+
+
+@receiver(post_delete, sender=ShareTransaction)
+def update_share_register_on_deletion(sender, instance, **kwargs):
+    """
+    Restate the member's register after a register row is deleted.
+    """
+    from .utils import get_share_balance_effect
+    from .services import ShareRegisterService
+    
+    shares_delta, _ = get_share_balance_effect(
+        instance.transaction_type,
+        instance.status,
+        instance.is_reversed,
+        instance.shares_count,
+        instance.total_amount
+    )
+    
+    if shares_delta:
+        try:
+            ShareRegisterService.restate(instance.member_id, instance.transaction_date)
+        except Exception as e:
+            logger.error(f"Error updating share register after delete: {e}")
+
+
 @receiver(post_delete, sender=ShareTransaction)
 def log_transaction_deletion(sender, instance, **kwargs):
     """
@@ -559,6 +689,8 @@ def disable_share_signals():
         # Share capital signals
         (post_save, log_share_capital_creation, ShareCapital),
         (pre_save, deactivate_previous_share_capital, ShareCapital),
+        (post_save, invalidate_share_capital_index_on_change, ShareCapital),
+        (post_delete, invalidate_share_capital_index_on_change, ShareCapital),
         
         # Transaction signals
         (pre_save, generate_transaction_number, ShareTransaction),
@@ -567,7 +699,11 @@ def disable_share_signals():
         (pre_save, set_share_price_if_not_set, ShareTransaction),
         (pre_save, validate_transaction_before_save, ShareTransaction),
         (post_save, log_transaction_creation, ShareTransaction),
+        (pre_save, remember_share_balance_effect, ShareTransaction),
         (post_save, update_member_share_balance_on_transaction, ShareTransaction),
+        (post_delete, update_member_share_balance_on_deletion, ShareTransaction),
+        (post_save, update_share_register_on_transaction, ShareTransaction),
+        (post_delete, update_share_register_on_deletion, ShareTransaction),
         (post_save, auto_issue_certificate_on_purchase, ShareTransaction),
         (post_save, create_linked_transfer_transaction, ShareTransaction),
         
@@ -602,6 +738,8 @@ def enable_share_signals():
         # Share capital signals
         (post_save, log_share_capital_creation, ShareCapital),
         (pre_save, deactivate_previous_share_capital, ShareCapital),
+        (post_save, invalidate_share_capital_index_on_change, ShareCapital),
+        (post_delete, invalidate_share_capital_index_on_change, ShareCapital),
         
         # Transaction signals
         (pre_save, generate_transaction_number, ShareTransaction),
@@ -610,7 +748,11 @@ def enable_share_signals():
         (pre_save, set_share_price_if_not_set, ShareTransaction),
         (pre_save, validate_transaction_before_save, ShareTransaction),
         (post_save, log_transaction_creation, ShareTransaction),
+        (pre_save, remember_share_balance_effect, ShareTransaction),
         (post_save, update_member_share_balance_on_transaction, ShareTransaction),
+        (post_delete, update_member_share_balance_on_deletion, ShareTransaction),
+        (post_save, update_share_register_on_transaction, ShareTransaction),
+        (post_delete, update_share_register_on_deletion, ShareTransaction),
         (post_save, auto_issue_certificate_on_purchase, ShareTransaction),
         (post_save, create_linked_transfer_transaction, ShareTransaction),
         
@@ -1,3 +1,141 @@
+from datetime import date
+from decimal import Decimal
+
+from django.conf import settings
 from django.test import TestCase
+from django.utils import timezone
+
+from kojenasacco.managers import DatabaseContext
+
+from members.models import Member, MemberFinancialSummary
+
+from .models import ShareCapital, ShareHolding, ShareTransaction
+from .utils import get_share_price_at_date, invalidate_share_capital_index
+
+# First SACCO database: shares tables only exist outside 'default'
+SACCO_DB = next(alias for alias in settings.DATABASES if alias != 'default')
+
+
+class ShareHoldingSignalTests(TestCase):
+    """ShareHolding and summary upkeep when completed transactions change"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        self.member = Member.objects.create(
+            member_number='MEM0001',
+            id_number='ID0001',
+            first_name='Jane',
+            last_name='Doe',
+            date_of_birth=date(1990, 1, 1),
+            gender='FEMALE',
+            marital_status='SINGLE',
+            membership_date=date(2020, 1, 1),
+            employment_status='EMPLOYED',
+            phone_primary='0700000001',
+            physical_address='Kampala',
+        )
+        self.share_capital = ShareCapital.objects.create(
+            name='Ordinary Shares',
+            share_price=Decimal('100.00'),
+            effective_date=date(2020, 1, 1),
+        )
+
+    def buy(self, shares):
+        return ShareTransaction.objects.create(
+            transaction_number=f'SHT{ShareTransaction.objects.count() + 1:04d}',
+            member=self.member,
+            share_capital=self.share_capital,
+            transaction_type='BUY',
+            shares_count=Decimal(shares),
+            price_per_share=Decimal('100.00'),
+            status='COMPLETED',
+        )
+
+    def holding(self):
+        return ShareHolding.objects.filter(member=self.member).values_list(
+            'shares_count', 'total_value'
+        ).first()
+
+    def summary_shares(self):
+        return MemberFinancialSummary.objects.get(member=self.member).total_shares
+
+    def test_edit_updates_holding_once(self):
+        self.buy(5)
+        transaction = self.buy(10)
+
+        transaction.shares_count = Decimal('20')
+        transaction.save()
+
+        self.assertEqual(self.holding(), (Decimal('25.00'), Decimal('2500.00')))
+        self.assertEqual(self.summary_shares(), Decimal('2500.00'))
+
+    def test_summary_activity_matches_member_activity(self):
+        transaction = self.buy(5)
+
+        self.member.refresh_from_db()
+        summary = MemberFinancialSummary.objects.get(member=self.member)
+
+        self.assertEqual(self.member.last_financial_activity_at, transaction.transaction_date)
+        self.assertEqual(summary.last_activity_at, self.member.last_financial_activity_at)
+
+    def test_edit_seeds_missing_holding_once(self):
+        self.buy(5)
+        transaction = self.buy(10)
+        ShareHolding.objects.filter(member=self.member).delete()
+
+        transaction.shares_count = Decimal('20')
+        transaction.save()
+
+        self.assertEqual(self.holding(), (Decimal('25.00'), Decimal('2500.00')))
+        self.assertEqual(self.summary_shares(), Decimal('2500.00'))
+
+    def test_reverse_removes_transaction(self):
+        self.buy(5)
+        transaction = self.buy(10)
+
+        transaction.is_reversed = True
+        transaction.save()
+
+        self.assertEqual(self.holding(), (Decimal('5.00'), Decimal('500.00')))
+        self.assertEqual(self.summary_shares(), Decimal('500.00'))
+
+    def test_reverse_seeds_missing_holding_once(self):
+        self.buy(5)
+        transaction = self.buy(10)
+        ShareHolding.objects.filter(member=self.member).delete()
+
+        transaction.is_reversed = True
+        transaction.save()
+
+        self.assertEqual(self.holding(), (Decimal('5.00'), Decimal('500.00')))
+        self.assertEqual(self.summary_shares(), Decimal('500.00'))
+
+
+class SharePriceAtDateTests(TestCase):
+    """Effective share price lookups"""
+
+    databases = '__all__'
+
+    def setUp(self):
+        context = DatabaseContext(SACCO_DB)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+        ShareCapital.objects.create(
+            name='Ordinary Shares',
+            share_price=Decimal('100.00'),
+            effective_date=date(2020, 1, 1),
+        )
+        invalidate_share_capital_index()
+        self.addCleanup(invalidate_share_capital_index)
+
+    def test_price_at_date(self):
+        self.assertEqual(get_share_price_at_date(date(2024, 6, 30)), Decimal('100.00'))
 
-# Create your tests here.
+    def test_price_at_datetime(self):
+        self.assertEqual(get_share_price_at_date(timezone.now()), Decimal('100.00'))
@@ -6,7 +6,9 @@ Shares Utility Functions
 Pure utility functions with NO side effects (no database writes):
 - Share number generation logic
 - Share value calculations
-- Member share balance calculations
+- Member share balance calculations and holding lookups
+- Point-in-time share register queries
+- Effective-dated share price index
 - Validation functions
 - Transfer fee calculations
 - Certificate number generation
@@ -20,8 +22,11 @@ from django.db import transaction
 from django.db.models import Sum, Q
 from django.utils import timezone
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
-from datetime import timedelta, date
+from datetime import timedelta, date, datetime
+from bisect import bisect_right
+from typing import NamedTuple
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +93,63 @@ def generate_transaction_number(transaction_type):
         return transaction_number
 
 
+def generate_transaction_number_block(transaction_type, count=1):
+    """
+    Reserve a block of consecutive share transaction numbers in one query.
+    
+    Bulk posting paths use this instead of calling generate_transaction_number
+    once per row. Numbers share the PREFIX-YYYYMMDDHHMMSS base and continue
+    the counter after the highest one already used for that second.
+    
+    Args:
+        transaction_type (str): Transaction type (BUY, SELL, etc.)
+        count (int): Number of transaction numbers to reserve
+    
+    Returns:
+        list: Transaction numbers in ascending counter order
+    
+    Example:
+        >>> generate_transaction_number_block('TRANSFER_IN', 2)
+        ['STI-20250129143025-0001', 'STI-20250129143025-0002']
+    """
+    from shares.models import ShareTransaction
+    
+    if count <= 0:
+        return []
+    
+    type_prefixes = {
+        'BUY': 'SHB',
+        'SELL': 'SHS',
+        'TRANSFER_OUT': 'STO',
+        'TRANSFER_IN': 'STI',
+        'ADJUSTMENT': 'SHA',
+    }
+    
+    prefix = type_prefixes.get(transaction_type, 'SHT')
+    timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
+    base_id = f"{prefix}-{timestamp}"
+    
+    with transaction.atomic():
+        existing_numbers = ShareTransaction.objects.filter(
+            transaction_number__startswith=base_id
+        ).select_for_update().values_list('transaction_number', flat=True)
+        
+        max_counter = 0
+        for txn_num in existing_numbers:
+            try:
+                max_counter = max(max_counter, int(txn_num.split('-')[-1]))
+            except (ValueError, IndexError):
+                continue
+    
+    transaction_numbers = [
+        f"{base_id}-{counter:04d}"
+        for counter in range(max_counter + 1, max_counter + count + 1)
+    ]
+    
+    logger.info(f"Reserved {count} share transaction numbers from {transaction_numbers[0]}")
+    return transaction_numbers
+
+
 def generate_certificate_number(prefix='SC'):
     """
     Generate unique share certificate number.
@@ -181,6 +243,47 @@ def generate_transfer_request_number():
         return request_number
 
 
+# =============================================================================
+# SHARE BALANCE EFFECTS
+# =============================================================================
+
+# Transaction types that add to / take from a member's share balance
+SHARE_INFLOW_TYPES = ('BUY', 'TRANSFER_IN')
+SHARE_OUTFLOW_TYPES = ('SELL', 'TRANSFER_OUT')
+
+
+def get_share_balance_effect(transaction_type, status, is_reversed, shares_count, total_amount):
+    """
+    Signed effect of a share transaction on the member's holding.
+    
+    Only completed, non-reversed transactions affect the balance.
+    
+    Args:
+        transaction_type (str): BUY, SELL, TRANSFER_IN, TRANSFER_OUT, ...
+        status (str): Transaction status
+        is_reversed (bool): Whether the transaction was reversed
+        shares_count (Decimal): Shares in the transaction
+        total_amount (Decimal): Transaction amount
+    
+    Returns:
+        tuple: (shares_delta: Decimal, value_delta: Decimal)
+    
+    Example:
+        >>> get_share_balance_effect('SELL', 'COMPLETED', False, Decimal('5'), Decimal('5000'))
+        (Decimal('-5'), Decimal('-5000'))
+    """
+    if status != 'COMPLETED' or is_reversed:
+        return Decimal('0.00'), Decimal('0.00')
+    
+    if transaction_type in SHARE_INFLOW_TYPES:
+        return shares_count or Decimal('0.00'), total_amount or Decimal('0.00')
+    
+    if transaction_type in SHARE_OUTFLOW_TYPES:
+        return -(shares_count or Decimal('0.00')), -(total_amount or Decimal('0.00'))
+    
+    return Decimal('0.00'), Decimal('0.00')
+
+
 # =============================================================================
 # SHARE VALUE CALCULATIONS
 # =============================================================================
@@ -316,6 +419,9 @@ def calculate_member_share_balance(member, as_of_date=None):
     """
     Calculate member's current share balance.
     
+    Reads the member's share register row as of the date (one indexed
+    lookup) instead of re-aggregating the transaction history.
+    
     Args:
         member: Member instance
         as_of_date (date, optional): Calculate balance as of this date
@@ -334,37 +440,14 @@ def calculate_member_share_balance(member, as_of_date=None):
         >>> calculate_member_share_balance(member)
         {'shares_bought': Decimal('150'), 'shares_sold': Decimal('0'), ...}
     """
-    from shares.models import ShareTransaction, ShareCapital
+    from shares.models import ShareCapital
     
     try:
-        calculation_date = as_of_date or timezone.now().date()
-        
-        # Get completed, non-reversed transactions
-        transactions = ShareTransaction.objects.filter(
-            member=member,
-            status='COMPLETED',
-            is_reversed=False,
-            transaction_date__lte=timezone.make_aware(
-                timezone.datetime.combine(calculation_date, timezone.datetime.max.time())
-            )
-        )
-        
-        # Calculate shares bought
-        shares_bought = transactions.filter(
-            transaction_type__in=['BUY', 'TRANSFER_IN']
-        ).aggregate(
-            total=Sum('shares_count')
-        )['total'] or Decimal('0.00')
+        position = get_register_balance(member, as_of_date or timezone.now().date())
         
-        # Calculate shares sold
-        shares_sold = transactions.filter(
-            transaction_type__in=['SELL', 'TRANSFER_OUT']
-        ).aggregate(
-            total=Sum('shares_count')
-        )['total'] or Decimal('0.00')
-        
-        # Calculate net shares
-        net_shares = shares_bought - shares_sold
+        net_shares = position.shares_count
+        shares_bought = position.shares_acquired
+        shares_sold = shares_bought - net_shares
         
         # Get current share price
         share_capital = ShareCapital.get_active_share_capital()
@@ -392,6 +475,25 @@ def calculate_member_share_balance(member, as_of_date=None):
         }
 
 
+def get_member_holding(member):
+    """
+    Read a member's current share position from the ShareHolding table.
+    
+    Args:
+        member: Member instance or primary key
+    
+    Returns:
+        tuple: (shares_count: Decimal, total_value: Decimal)
+    """
+    from shares.models import ShareHolding
+    
+    holding = ShareHolding.objects.filter(member=member).values_list(
+        'shares_count', 'total_value'
+    ).first()
+    
+    return holding or (Decimal('0.00'), Decimal('0.00'))
+
+
 def get_member_share_history(member, start_date=None, end_date=None):
     """
     Get member's share transaction history.
@@ -434,6 +536,181 @@ def get_member_share_history(member, start_date=None, end_date=None):
         return ShareTransaction.objects.none()
 
 
+# =============================================================================
+# SHARE REGISTER
+# =============================================================================
+
+class RegisterPosition(NamedTuple):
+    """A member's share register position at a point in time."""
+    member_id: object
+    shares_count: Decimal
+    shares_acquired: Decimal
+
+
+def share_register_q():
+    """
+    Filter matching share register rows.
+    
+    Register rows are the transactions that move a member's balance:
+    completed, non-reversed BUY, SELL, TRANSFER_IN and TRANSFER_OUT. Each
+    carries the member's cumulative balance_after and acquired_after.
+    
+    Returns:
+        Q: Filter for ShareTransaction querysets
+    """
+    return Q(
+        status='COMPLETED',
+        is_reversed=False,
+        transaction_type__in=SHARE_INFLOW_TYPES + SHARE_OUTFLOW_TYPES
+    )
+
+
+def _end_of_day(as_of_date):
+    """Aware datetime at the very end of a date, for inclusive as-of filters"""
+    return timezone.make_aware(
+        timezone.datetime.combine(as_of_date, timezone.datetime.max.time())
+    )
+
+
+def _latest_register_row(as_of_date=None):
+    """
+    Latest register row of the outer member as of a date, newest first by
+    (transaction_date, created_at, id) - the order balances accumulate in.
+    """
+    from django.db.models import OuterRef
+    from shares.models import ShareTransaction
+    
+    rows = ShareTransaction.objects.filter(
+        share_register_q(),
+        member_id=OuterRef('pk')
+    )
+    if as_of_date is not None:
+        rows = rows.filter(transaction_date__lte=_end_of_day(as_of_date))
+    
+    return rows.order_by('-transaction_date', '-created_at', '-id')
+
+
+def get_register_balance(member, as_of_date=None):
+    """
+    Get a member's share position as of a date from the share register.
+    
+    Args:
+        member: Member instance or primary key
+        as_of_date (date, optional): Position at the end of this date
+            (defaults to the latest register row)
+    
+    Returns:
+        RegisterPosition: (member_id, shares_count, shares_acquired)
+    
+    Example:
+        >>> get_register_balance(member, date(2024, 12, 31)).shares_count
+        Decimal('150.00')
+    """
+    from shares.models import ShareTransaction
+    
+    member_id = getattr(member, 'pk', member)
+    
+    rows = ShareTransaction.objects.filter(share_register_q(), member_id=member_id)
+    if as_of_date is not None:
+        rows = rows.filter(transaction_date__lte=_end_of_day(as_of_date))
+    
+    row = rows.order_by('-transaction_date', '-created_at', '-id').values_list(
+        'balance_after', 'acquired_after'
+    ).first()
+    
+    if not row:
+        return RegisterPosition(member_id, Decimal('0.00'), Decimal('0.00'))
+    
+    return RegisterPosition(
+        member_id,
+        row[0] or Decimal('0.00'),
+        row[1] or Decimal('0.00')
+    )
+
+
+def get_register_snapshot_queryset(as_of_date=None, active_only=False):
+    """
+    Members annotated with their register position as of a date.
+    
+    Each member's latest register row is found with an index seek on
+    (member, transaction_date); members without register rows get NULLs.
+    
+    Args:
+        as_of_date (date, optional): Position at the end of this date
+        active_only (bool): Restrict to ACTIVE members
+    
+    Returns:
+        QuerySet: Members annotated with register_balance and register_acquired
+    """
+    from django.db.models import Subquery
+    from members.models import Member
+    
+    latest = _latest_register_row(as_of_date)
+    
+    members = Member.objects.all()
+    if active_only:
+        members = members.filter(status='ACTIVE')
+    
+    return members.annotate(
+        register_balance=Subquery(latest.values('balance_after')[:1]),
+        register_acquired=Subquery(latest.values('acquired_after')[:1])
+    ).order_by()
+
+
+def iter_register_snapshot(as_of_date, active_only=False, positive_only=True, chunk_size=2000):
+    """
+    Stream every member's register position at a record date.
+    
+    Used for dividend eligibility and AGM voting rights on a record date in
+    the past, without re-aggregating the transaction history.
+    
+    Args:
+        as_of_date (date): Record date (positions at the end of the day)
+        active_only (bool): Restrict to ACTIVE members
+        positive_only (bool): Skip members holding no shares
+        chunk_size (int): Rows fetched per database round trip
+    
+    Yields:
+        RegisterPosition: (member_id, shares_count, shares_acquired)
+    """
+    members = get_register_snapshot_queryset(as_of_date, active_only=active_only)
+    
+    if positive_only:
+        members = members.filter(register_balance__gt=0)
+    else:
+        members = members.filter(register_balance__isnull=False)
+    
+    rows = members.values_list('pk', 'register_balance', 'register_acquired')
+    
+    for member_id, shares_count, shares_acquired in rows.iterator(chunk_size=chunk_size):
+        yield RegisterPosition(member_id, shares_count, shares_acquired or Decimal('0.00'))
+
+
+def get_voting_register(record_date, minimum_shares=Decimal('0.01')):
+    """
+    Get members entitled to vote at an AGM held on the given record date.
+    
+    Voting rights follow the share register at the record date: ACTIVE
+    members holding at least `minimum_shares`.
+    
+    Args:
+        record_date (date): AGM record date
+        minimum_shares (Decimal): Shares required for a vote
+    
+    Returns:
+        list: RegisterPosition tuples of eligible voters
+    """
+    try:
+        return [
+            position
+            for position in iter_register_snapshot(record_date, active_only=True)
+            if position.shares_count >= minimum_shares
+        ]
+    except Exception as e:
+        logger.error(f"Error building voting register: {e}")
+        return []
+
+
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
@@ -474,8 +751,8 @@ def validate_share_purchase(member, shares_count, share_capital):
             return False, "Fractional shares are not allowed"
     
     # Check member's total shares after purchase
-    balance = calculate_member_share_balance(member)
-    total_after_purchase = balance['net_shares'] + shares
+    net_shares, _value = get_member_holding(member)
+    total_after_purchase = net_shares + shares
     
     # Check maximum shares per member
     if share_capital.maximum_shares:
@@ -510,13 +787,13 @@ def validate_share_sale(member, shares_count, share_capital):
         return False, "Share count must be greater than zero"
     
     # Check member's current balance
-    balance = calculate_member_share_balance(member)
+    net_shares, _value = get_member_holding(member)
     
-    if shares > balance['net_shares']:
-        return False, f"Insufficient shares. Current balance: {balance['net_shares']}"
+    if shares > net_shares:
+        return False, f"Insufficient shares. Current balance: {net_shares}"
     
     # Check minimum shares requirement
-    remaining_shares = balance['net_shares'] - shares
+    remaining_shares = net_shares - shares
     if remaining_shares < share_capital.minimum_shares and remaining_shares != 0:
         return False, f"Sale would leave balance below minimum required shares of {share_capital.minimum_shares}"
     
@@ -553,19 +830,19 @@ def validate_share_transfer(from_member, to_member, shares_count, share_capital)
         return False, "Share count must be greater than zero"
     
     # Check from_member's balance
-    from_balance = calculate_member_share_balance(from_member)
+    from_shares, _value = get_member_holding(from_member)
     
-    if shares > from_balance['net_shares']:
-        return False, f"Insufficient shares. Current balance: {from_balance['net_shares']}"
+    if shares > from_shares:
+        return False, f"Insufficient shares. Current balance: {from_shares}"
     
     # Check minimum shares requirement for from_member
-    remaining_shares = from_balance['net_shares'] - shares
+    remaining_shares = from_shares - shares
     if remaining_shares < share_capital.minimum_shares and remaining_shares != 0:
         return False, f"Transfer would leave sender below minimum required shares of {share_capital.minimum_shares}"
     
     # Check maximum shares for to_member
-    to_balance = calculate_member_share_balance(to_member)
-    total_after_transfer = to_balance['net_shares'] + shares
+    to_shares, _value = get_member_holding(to_member)
+    total_after_transfer = to_shares + shares
     
     if share_capital.maximum_shares:
         if total_after_transfer > share_capital.maximum_shares:
@@ -589,9 +866,9 @@ def can_issue_certificate(member):
         return False, "Member must be active to receive certificates"
     
     # Check share balance
-    balance = calculate_member_share_balance(member)
+    net_shares, _value = get_member_holding(member)
     
-    if balance['net_shares'] <= 0:
+    if net_shares <= 0:
         return False, "Member has no shares"
     
     return True, "Certificate can be issued"
@@ -627,6 +904,78 @@ def validate_holding_period(transaction_date, minimum_holding_days):
         return False, 0, str(e)
 
 
+# =============================================================================
+# SHARE PRICE INDEX
+# =============================================================================
+
+# Seconds an index is trusted before reloading. Save signals invalidate it in
+# the process that made the change; the TTL bounds staleness in the others.
+SHARE_PRICE_INDEX_TTL = 300
+
+# Active share capital per tenant database, ordered by effective date:
+# {db_alias: (loaded_at, [effective_date, ...], [ShareCapital, ...])}
+_share_capital_index = {}
+
+
+def _get_share_capital_index():
+    """Load (or reuse) the effective-dated share capital index of the current tenant"""
+    from kojenasacco.managers import get_current_db
+    from shares.models import ShareCapital
+    
+    db_alias = get_current_db()
+    entry = _share_capital_index.get(db_alias)
+    
+    if entry is None or time.monotonic() - entry[0] > SHARE_PRICE_INDEX_TTL:
+        capitals = list(
+            ShareCapital.objects.filter(is_active=True).order_by('effective_date', 'created_at')
+        )
+        entry = (time.monotonic(), [capital.effective_date for capital in capitals], capitals)
+        _share_capital_index[db_alias] = entry
+    
+    return entry
+
+
+def get_share_capital_at(as_of_date=None):
+    """
+    Get the share capital configuration effective on a date.
+    
+    Bisects an in-process index of active share capital, keyed by tenant
+    database, instead of querying on every call. Returned instances are
+    shared between callers and must be treated as read-only.
+    
+    Args:
+        as_of_date (date, optional): Date to look up (defaults to today). A
+            datetime is looked up by its local date.
+    
+    Returns:
+        ShareCapital or None
+    
+    Example:
+        >>> get_share_capital_at(date(2024, 6, 30)).share_price
+        Decimal('1000.00')
+    """
+    _loaded_at, effective_dates, capitals = _get_share_capital_index()
+    
+    if isinstance(as_of_date, datetime):
+        as_of_date = timezone.localtime(as_of_date).date() if timezone.is_aware(as_of_date) else as_of_date.date()
+    
+    position = bisect_right(effective_dates, as_of_date or timezone.now().date())
+    return capitals[position - 1] if position else None
+
+
+def invalidate_share_capital_index(db_alias=None):
+    """
+    Drop the cached share capital index.
+    
+    Args:
+        db_alias (str, optional): Tenant database to invalidate (defaults to all)
+    """
+    if db_alias is None:
+        _share_capital_index.clear()
+    else:
+        _share_capital_index.pop(db_alias, None)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -636,18 +985,13 @@ def get_share_price_at_date(transaction_date):
     Get share price that was effective at a given date.
     
     Args:
-        transaction_date (date): Date to get price for
+        transaction_date (date or datetime): Date to get price for
     
     Returns:
         Decimal: Share price at that date
     """
-    from shares.models import ShareCapital
-    
     try:
-        share_capital = ShareCapital.objects.filter(
-            is_active=True,
-            effective_date__lte=transaction_date
-        ).order_by('-effective_date').first()
+        share_capital = get_share_capital_at(transaction_date)
         
         if share_capital:
             return share_capital.share_price
@@ -664,6 +1008,8 @@ def calculate_total_shares_issued(as_of_date=None):
     """
     Calculate total shares issued to all members.
     
+    Sums every member's latest share register balance as of the date.
+    
     Args:
         as_of_date (date, optional): Calculate as of this date
     
@@ -675,37 +1021,18 @@ def calculate_total_shares_issued(as_of_date=None):
                 'member_count': int
             }
     """
-    from shares.models import ShareTransaction, ShareCapital
-    from members.models import Member
+    from django.db.models import Count
+    from shares.models import ShareCapital
     
     try:
         calculation_date = as_of_date or timezone.now().date()
         
-        # Get all completed transactions
-        transactions = ShareTransaction.objects.filter(
-            status='COMPLETED',
-            is_reversed=False,
-            transaction_date__lte=timezone.make_aware(
-                timezone.datetime.combine(calculation_date, timezone.datetime.max.time())
-            )
+        totals = get_register_snapshot_queryset(calculation_date).aggregate(
+            total_shares=Sum('register_balance'),
+            member_count=Count('pk', filter=Q(register_balance__gt=0))
         )
         
-        # Calculate total bought
-        total_bought = transactions.filter(
-            transaction_type__in=['BUY', 'TRANSFER_IN']
-        ).aggregate(
-            total=Sum('shares_count')
-        )['total'] or Decimal('0.00')
-        
-        # Calculate total sold
-        total_sold = transactions.filter(
-            transaction_type__in=['SELL', 'TRANSFER_OUT']
-        ).aggregate(
-            total=Sum('shares_count')
-        )['total'] or Decimal('0.00')
-        
-        # Net shares
-        total_shares = total_bought - total_sold
+        total_shares = totals['total_shares'] or Decimal('0.00')
         
         # Get current price
         share_capital = ShareCapital.get_active_share_capital()
@@ -714,16 +1041,10 @@ def calculate_total_shares_issued(as_of_date=None):
         # Calculate total value
         total_value = calculate_share_value(total_shares, current_price)
         
-        # Count members with shares
-        members_with_shares = Member.objects.filter(
-            share_transactions__status='COMPLETED',
-            share_transactions__is_reversed=False
-        ).distinct().count()
-        
         return {
             'total_shares': total_shares.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
             'total_value': total_value,
-            'member_count': members_with_shares
+            'member_count': totals['member_count'] or 0
         }
         
     except Exception as e:
@@ -264,28 +264,41 @@ class BaseModel(models.Model):
             return user.get_full_name() or user.username
         return "System"
     
+    @staticmethod
+    def _audit_context():
+        """User and request fields for an AuditLog entry from the request context"""
+        from utils.context import get_request_context
+        
+        # Get request context (user, IP, etc.)
+        context = get_request_context()
+        
+        # Prepare user information
+        user_id = None
+        user_email = ""
+        user_name = ""
+        
+        if context and context.get('user'):
+            user = context['user']
+            user_id = str(user.id) if hasattr(user, 'id') else str(user.pk)
+            user_email = getattr(user, 'email', '')
+            user_name = getattr(user, 'get_full_name', lambda: str(user))()
+        
+        return {
+            'user_id': user_id,
+            'user_email': user_email,
+            'user_name': user_name,
+            'ip_address': context.get('ip_address') if context else None,
+            'user_agent': context.get('user_agent', '')[:255] if context else '',
+            'session_key': context.get('session_key', '') if context else '',
+            'request_path': context.get('request_path', '') if context else '',
+        }
+    
     def _create_audit_log(self, action, changes):
         """Create an audit log entry for this change"""
         try:
-            from utils.context import get_request_context
-            
-            # Get request context (user, IP, etc.)
-            context = get_request_context()
-            
             # Get current database to ensure audit log goes to same DB
             current_db = get_current_db()
             
-            # Prepare user information
-            user_id = None
-            user_email = ""
-            user_name = ""
-            
-            if context and context.get('user'):
-                user = context['user']
-                user_id = str(user.id) if hasattr(user, 'id') else str(user.pk)
-                user_email = getattr(user, 'email', '')
-                user_name = getattr(user, 'get_full_name', lambda: str(user))()
-            
             # Create audit log entry
             audit_log = AuditLog(
                 content_type=f"{self._meta.app_label}.{self._meta.model_name}",
@@ -293,14 +306,8 @@ class BaseModel(models.Model):
                 object_repr=str(self)[:200],
                 action=action,
                 changes=changes,
-                user_id=user_id,
-                user_email=user_email,
-                user_name=user_name,
-                ip_address=context.get('ip_address') if context else None,
-                user_agent=context.get('user_agent', '')[:255] if context else '',
                 change_reason=self.change_reason or '',
-                session_key=context.get('session_key', '') if context else '',
-                request_path=context.get('request_path', '') if context else '',
+                **self._audit_context()
             )
             
             # Save to the same database as the model
@@ -315,6 +322,40 @@ class BaseModel(models.Model):
             # Don't fail the save/delete if audit logging fails
             logger.error(f"Failed to create audit log: {e}", exc_info=True)
     
+    @classmethod
+    def create_bulk_audit_log(cls, action, object_repr, changes, change_reason=''):
+        """
+        Create one audit log entry summarizing a bulk change.
+        
+        Bulk writes (queryset.update, bulk_update) bypass save() and its
+        per-row audit entries; record the batch as a whole with this instead.
+        
+        Args:
+            action (str): 'CREATE', 'UPDATE' or 'DELETE'
+            object_repr (str): What was changed, e.g. "Credit score recompute: 120 members"
+            changes (dict): {field: {'old': ..., 'new': ...}} summary values
+            change_reason (str): Why the batch ran
+        
+        Returns:
+            AuditLog or None: None if logging failed
+        """
+        try:
+            audit_log = AuditLog(
+                content_type=f"{cls._meta.app_label}.{cls._meta.model_name}",
+                object_id='BULK',
+                object_repr=object_repr[:200],
+                action=action,
+                changes=changes,
+                change_reason=change_reason[:255],
+                **cls._audit_context()
+            )
+            audit_log.save()
+            return audit_log
+        
+        except Exception as e:
+            logger.error(f"Failed to create bulk audit log: {e}", exc_info=True)
+            return None
+    
     def get_history(self, limit=10):
         """
         Get audit history for this object.
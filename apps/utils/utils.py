@@ -27,4 +27,145 @@ def parse_filters(request, filter_keys):
     for key in filter_keys:
         value = request.GET.get(key, '').strip()
         filters[key] = value if value else None
-    return filters
\ No newline at end of file
+    return filters
+
+# =============================================================================
+# BULK WRITE HELPERS
+# =============================================================================
+
+def chunked(iterable, size):
+    """
+    Yield successive lists of at most ``size`` items from any iterable.
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bulk_upsert(model, objs, unique_fields, update_fields, batch_size=1000):
+    """
+    Insert rows, updating the listed fields where a unique key already exists.
+
+    Uses INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE via bulk_create.
+    MySQL infers the conflict target from the table's unique keys and rejects
+    an explicit one, so unique_fields is only passed where it is supported.
+
+    Args:
+        model: Model class (its default manager picks the SACCO database)
+        objs: Unsaved model instances
+        unique_fields: Fields forming the unique key
+        update_fields: Fields to overwrite on conflict
+        batch_size: Rows per INSERT statement
+
+    Returns:
+        int: Number of rows written
+    """
+    from django.db import connections
+
+    if not objs:
+        return 0
+
+    queryset = model.objects.all()
+    features = connections[queryset.db].features
+
+    kwargs = {
+        'update_conflicts': True,
+        'update_fields': update_fields,
+        'batch_size': batch_size,
+    }
+    if features.supports_update_conflicts_with_target:
+        kwargs['unique_fields'] = unique_fields
+
+    queryset.bulk_create(objs, **kwargs)
+    return len(objs)
+
+
+# =============================================================================
+# FILE IMPORT HELPERS
+# =============================================================================
+
+def normalize_column_name(name):
+    """
+    Normalize a spreadsheet header to a lower_snake_case key.
+
+    Example:
+        >>> normalize_column_name(' Account Number ')
+        'account_number'
+    """
+    return '_'.join(str(name or '').strip().lower().replace('-', ' ').split())
+
+
+def iter_tabular_rows(uploaded_file, filename=None):
+    """
+    Stream rows from an uploaded CSV or XLSX file.
+
+    XLSX files are opened with openpyxl in read-only mode so large sheets are
+    never fully loaded into memory. The first row is treated as the header and
+    blank rows are skipped.
+
+    Args:
+        uploaded_file: File-like object (e.g. request.FILES['file'])
+        filename: Optional name used to detect the format
+
+    Yields:
+        tuple: (line_number, row_dict) keyed by normalized header names
+
+    Raises:
+        ValueError: If the file type is not supported, the file is corrupt
+            or it has no header row
+    """
+    import csv
+    import io
+    import zipfile
+
+    name = (filename or getattr(uploaded_file, 'name', '') or '').lower()
+
+    if name.endswith(('.xlsx', '.xlsm')):
+        from openpyxl import load_workbook
+        from openpyxl.utils.exceptions import InvalidFileException
+
+        try:
+            workbook = load_workbook(uploaded_file, read_only=True, data_only=True)
+        except (zipfile.BadZipFile, InvalidFileException, KeyError, OSError) as e:
+            raise ValueError(f"The uploaded file is not a valid Excel workbook ({e})")
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                raise ValueError("The uploaded file has no header row")
+            columns = [normalize_column_name(col) for col in header]
+
+            for line_number, values in enumerate(rows, start=2):
+                if not values or all(value in (None, '') for value in values):
+                    continue
+                yield line_number, dict(zip(columns, values))
+        finally:
+            workbook.close()
+
+    elif name.endswith('.csv'):
+        if hasattr(uploaded_file, 'seek'):
+            uploaded_file.seek(0)
+        text = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline='')
+        try:
+            reader = csv.reader(text)
+            header = next(reader, None)
+            if not header:
+                raise ValueError("The uploaded file has no header row")
+            columns = [normalize_column_name(col) for col in header]
+
+            for line_number, values in enumerate(reader, start=2):
+                if not any(value.strip() for value in values):
+                    continue
+                yield line_number, dict(zip(columns, values))
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"The uploaded file is not a valid UTF-8 CSV file ({e})")
+        finally:
+            text.detach()
+
+    else:
+        raise ValueError("Unsupported file type. Upload a .csv or .xlsx file")